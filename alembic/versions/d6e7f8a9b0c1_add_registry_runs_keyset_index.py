@@ -0,0 +1,39 @@
+"""Add composite (created_at, id) index for registry run keyset pagination.
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d6e7f8a9b0c1"
+down_revision = "c5d6e7f8a9b0"
+branch_labels = None
+depends_on = None
+
+
+def _index_names(table_name: str) -> set[str]:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    return {idx["name"] for idx in inspector.get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    if "ix_registry_runs_created_at_id" not in _index_names("registry_runs"):
+        op.create_index(
+            "ix_registry_runs_created_at_id",
+            "registry_runs",
+            ["created_at", "id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    if "ix_registry_runs_created_at_id" in _index_names("registry_runs"):
+        op.drop_index("ix_registry_runs_created_at_id", table_name="registry_runs")
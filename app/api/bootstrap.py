@@ -36,6 +36,17 @@ class StartupBootstrap:
 
         validate_startup_env()
 
+        router_import_ms = getattr(self.app.state, "router_import_ms", None)
+        if router_import_ms:
+            self.logger.info(
+                "Router import times (ms, total=%.0f): %s",
+                sum(router_import_ms.values()),
+                ", ".join(
+                    f"{name.rsplit('.', 1)[-1]}={ms:.0f}"
+                    for name, ms in sorted(router_import_ms.items(), key=lambda kv: -kv[1])
+                ),
+            )
+
         settings = get_infra_settings()
 
         self.app.state.model_ready = False
@@ -120,6 +131,18 @@ class StartupBootstrap:
             except Exception as exc:  # noqa: BLE001
                 self.logger.warning("UMLS store warmup failed: %s", exc)
 
+        def _warm_coding_tables() -> None:
+            # KB description/RVU table and cached CoderSettings for the process endpoints.
+            try:
+                from app.api.dependencies import get_coder_settings, get_kb_repo
+                from app.api.services.financials import warm_procedure_rate_table
+
+                get_coder_settings()
+                count = warm_procedure_rate_table(get_kb_repo())
+                self.logger.info("Procedure rate table warmed (%d codes)", count)
+            except Exception as exc:  # noqa: BLE001
+                self.logger.warning("Procedure rate table warmup failed: %s", exc)
+
         if settings.skip_warmup or _should_skip_warmup():
             self.logger.info("Skipping heavy NLP warmup (disabled via environment)")
             self.app.state.model_ready = True
@@ -144,8 +167,14 @@ class StartupBootstrap:
 
         loop.run_in_executor(self.app.state.cpu_executor, _bootstrap_registry_models)
         loop.run_in_executor(self.app.state.cpu_executor, _warm_umls_store)
+        loop.run_in_executor(self.app.state.cpu_executor, _warm_coding_tables)
 
     async def shutdown(self) -> None:
+        from app.registry_store.write_behind import shutdown_registry_run_writers
+
+        # Flush write-behind registry runs before the process exits.
+        await asyncio.to_thread(shutdown_registry_run_writers)
+
         llm_http = getattr(self.app.state, "llm_http", None)
         if llm_http is not None:
             await llm_http.aclose()
@@ -12,8 +12,10 @@ See AI_ASSISTANT_GUIDE.md for details.
 
 from __future__ import annotations
 
+import importlib
 import logging
 import os
+import time
 from contextlib import asynccontextmanager
 from functools import lru_cache
 from pathlib import Path
@@ -43,24 +45,7 @@ if not _truthy_env("PROCSUITE_SKIP_DOTENV"):
         )
 
 from app.api.bootstrap import StartupBootstrap
-from app.api.ml_advisor_router import router as ml_advisor_router
 from app.api.registry_payload import shape_registry_payload as _shape_registry_payload
-from app.api.routes.legacy_coder import router as legacy_coder_router
-from app.api.routes.legacy_registry import router as legacy_registry_router
-from app.api.routes.metrics import router as metrics_router
-from app.api.routes.phi import router as phi_router
-from app.api.routes.phi_demo_cases import router as phi_demo_router
-from app.api.routes.procedure_codes import router as procedure_codes_router
-from app.api.routes.process_bundle import router as process_bundle_router
-from app.api.routes.qa import router as qa_router
-from app.api.routes.registry_append import router as registry_append_router
-from app.api.routes.registry_case import router as registry_case_router
-from app.api.routes.registry_runs import router as registry_runs_router
-from app.api.routes.reporting import router as reporting_router
-from app.api.routes.umls import router as umls_router
-from app.api.routes.unified_process import router as unified_process_router
-from app.api.routes.vault import router as vault_router
-from app.api.routes_registry import router as registry_extract_router
 from app.api.schemas import KnowledgeMeta
 from app.common.knowledge import knowledge_hash, knowledge_version
 
@@ -126,37 +111,69 @@ async def _phi_redactor_headers(request: Request, call_next):
     return resp
 
 
-# Include ML Advisor router
-app.include_router(ml_advisor_router, prefix="/api/v1", tags=["ML Advisor"])
-# Include PHI router
-app.include_router(phi_router)
-# Include procedure codes router
-app.include_router(procedure_codes_router, prefix="/api/v1", tags=["procedure-codes"])
-# Metrics router
-app.include_router(metrics_router, tags=["metrics"])
-# PHI demo cases router (non-PHI metadata)
-app.include_router(phi_demo_router)
-# Registry extraction router (hybrid-first pipeline)
-app.include_router(registry_extract_router, tags=["registry"])
-# Registry run persistence router (Diamond Loop)
-app.include_router(registry_runs_router, prefix="/api", tags=["registry-runs"])
-# Registry case append router (pathology/additional docs)
-app.include_router(registry_append_router, prefix="/api", tags=["registry-append"])
-# Registry canonical case record router (GET/PATCH)
-app.include_router(registry_case_router, prefix="/api", tags=["registry-case"])
-# Unified process router (UI entry point)
-app.include_router(unified_process_router, prefix="/api")
-# UMLS term suggestion / concept lookup
-app.include_router(umls_router, prefix="/api")
-# Client-side encrypted vault (ciphertext-only persistence)
-app.include_router(vault_router, prefix="/api")
-# Bundle process router (multi-doc ZK ingestion)
-app.include_router(process_bundle_router, prefix="/api")
-# Legacy/API support routers split from this composition root.
-app.include_router(legacy_coder_router)
-app.include_router(legacy_registry_router)
-app.include_router(reporting_router)
-app.include_router(qa_router)
+# ============================================================================
+# Routers
+# ============================================================================
+# (module, include_router kwargs), in registration order. Route modules keep
+# torch/transformers/sklearn/spaCy/ONNX imports inside functions, so importing
+# them here is cheap; the models load in warmup (or the gunicorn master
+# preload) or on first use. Each import is timed so a router that starts
+# pulling a heavy dependency onto the boot path shows up in the startup log
+# (``app.state.router_import_ms``) and in
+# ``python ops/tools/bench_import_time.py --routers``.
+ROUTER_MODULES: tuple[tuple[str, dict[str, Any]], ...] = (
+    # ML Advisor
+    ("app.api.ml_advisor_router", {"prefix": "/api/v1", "tags": ["ML Advisor"]}),
+    # PHI
+    ("app.api.routes.phi", {}),
+    # Procedure codes
+    ("app.api.routes.procedure_codes", {"prefix": "/api/v1", "tags": ["procedure-codes"]}),
+    # Metrics
+    ("app.api.routes.metrics", {"tags": ["metrics"]}),
+    # PHI demo cases (non-PHI metadata)
+    ("app.api.routes.phi_demo_cases", {}),
+    # Registry extraction (hybrid-first pipeline)
+    ("app.api.routes_registry", {"tags": ["registry"]}),
+    # Registry run persistence (Diamond Loop)
+    ("app.api.routes.registry_runs", {"prefix": "/api", "tags": ["registry-runs"]}),
+    # Registry case append (pathology/additional docs)
+    ("app.api.routes.registry_append", {"prefix": "/api", "tags": ["registry-append"]}),
+    # Registry canonical case record (GET/PATCH)
+    ("app.api.routes.registry_case", {"prefix": "/api", "tags": ["registry-case"]}),
+    # Unified process (UI entry point)
+    ("app.api.routes.unified_process", {"prefix": "/api"}),
+    # UMLS term suggestion / concept lookup
+    ("app.api.routes.umls", {"prefix": "/api"}),
+    # Client-side encrypted vault (ciphertext-only persistence)
+    ("app.api.routes.vault", {"prefix": "/api"}),
+    # Bundle process (multi-doc ZK ingestion)
+    ("app.api.routes.process_bundle", {"prefix": "/api"}),
+    # Legacy/API support routers split from this composition root.
+    ("app.api.routes.legacy_coder", {}),
+    ("app.api.routes.legacy_registry", {}),
+    ("app.api.routes.reporting", {}),
+    ("app.api.routes.qa", {}),
+)
+
+
+def _include_routers(target: FastAPI) -> dict[str, float]:
+    """Import and mount every router, returning per-module import time (ms).
+
+    Times are incremental: a module that imports a dependency first is charged
+    for it. Use the bench tool for isolated cold-import numbers.
+    """
+
+    import_ms: dict[str, float] = {}
+    for module_name, kwargs in ROUTER_MODULES:
+        started = time.perf_counter()
+        module = importlib.import_module(module_name)
+        import_ms[module_name] = (time.perf_counter() - started) * 1000
+        target.include_router(module.router, **kwargs)
+    return import_ms
+
+
+router_import_ms = _include_routers(app)
+app.state.router_import_ms = router_import_ms
 
 
 def _phi_redactor_response(path: Path) -> FileResponse:
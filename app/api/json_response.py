@@ -0,0 +1,97 @@
+"""Pre-encoded JSON responses for the heavy process/registry endpoints.
+
+Returning a pydantic model from a route makes FastAPI validate it against
+``response_model`` again and then serialize it. The process endpoints
+already build a validated response model, so they encode it here once
+(``model_json_response``) and return the bytes directly. ``response_model``
+stays on the route for the OpenAPI schema.
+
+Plain dict payloads (e.g. ``shape_registry_payload``) are encoded with
+``orjson`` when it is installed, otherwise with the stdlib ``json`` module.
+"""
+
+from __future__ import annotations
+
+import json
+from enum import Enum
+from typing import Any, Mapping
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from starlette.responses import Response
+
+try:  # optional fast encoder
+    import orjson as _orjson
+except Exception:  # pragma: no cover - fallback path only
+    _orjson = None
+
+
+class PreEncodedJSONResponse(Response):
+    """A JSON response whose body is already encoded UTF-8 bytes."""
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        body: bytes,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        super().__init__(content=body, status_code=status_code, headers=headers)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    # Decimal, Path and similar: defer to FastAPI's encoder.
+    return jsonable_encoder(value)
+
+
+def dumps_json(content: Any) -> bytes:
+    """Encode *content* to compact UTF-8 JSON bytes."""
+    if _orjson is not None:
+        return _orjson.dumps(content, default=_default, option=_orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content,
+        default=_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def json_response(
+    content: Any,
+    *,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+) -> PreEncodedJSONResponse:
+    return PreEncodedJSONResponse(dumps_json(content), status_code=status_code, headers=headers)
+
+
+def model_json_response(
+    model: BaseModel,
+    *,
+    exclude_none: bool = True,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+) -> PreEncodedJSONResponse:
+    """Serialize an already-validated response model straight to bytes.
+
+    Same output as ``response_model_exclude_none=True`` on the route, without
+    the second validation pass.
+    """
+    body = model.__pydantic_serializer__.to_json(model, exclude_none=exclude_none)
+    return PreEncodedJSONResponse(body, status_code=status_code, headers=headers)
+
+
+__all__ = [
+    "PreEncodedJSONResponse",
+    "dumps_json",
+    "json_response",
+    "model_json_response",
+]
@@ -28,7 +28,6 @@ Environment Variables:
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import time
@@ -58,6 +57,7 @@ from app.proc_ml_advisor.schemas import (
     ProcedureCategory,
     StructuredProcedureReport,
 )
+from app.proc_ml_advisor.trace_store import get_trace_store
 
 logger = logging.getLogger(__name__)
 
@@ -299,15 +299,13 @@ def mock_ml_advisor(
 
 def log_trace(trace: CodingTrace, trace_path: Path) -> bool:
     """
-    Log coding trace to JSONL file.
+    Log coding trace to the segmented JSONL trace store.
 
     In production, replace with:
         from app.analysis.coding_trace import log_coding_trace
     """
     try:
-        trace_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(trace_path, "a", encoding="utf-8") as f:
-            f.write(trace.model_dump_json() + "\n")
+        get_trace_store(trace_path).append(trace)
         return True
     except Exception as e:
         logger.warning(f"Failed to log trace: {e}")
@@ -652,7 +650,7 @@ async def advisor_suggest(
     summary="List coding traces",
     description="Retrieve coding traces for analysis and debugging.",
 )
-async def list_traces(
+def list_traces(
     config: AdvisorConfig,
     limit: int = Query(
         default=100,
@@ -677,40 +675,17 @@ async def list_traces(
     """
     List coding traces for analysis.
 
-    Supports pagination and filtering.
+    Supports pagination and filtering. Served from the trace index, so only
+    the returned page is read from disk. Sync handler: FastAPI runs it in the
+    threadpool so file I/O never blocks the event loop.
     """
-    trace_path = config["trace_path"]
-
-    if not trace_path.exists():
-        return TraceListResponse(traces=[], total=0, limit=limit, offset=offset)
-
     try:
-        all_traces = []
-        with open(trace_path, encoding="utf-8") as f:
-            for line in f:
-                try:
-                    data = json.loads(line.strip())
-                    trace = CodingTrace(**data)
-
-                    # Apply filters
-                    if source and trace.source != source:
-                        continue
-                    if has_disagreements is not None:
-                        has_dis = bool(trace.advisor_disagreements)
-                        if has_disagreements != has_dis:
-                            continue
-
-                    all_traces.append(trace)
-                except (json.JSONDecodeError, Exception) as e:
-                    logger.warning(f"Skipping malformed trace: {e}")
-
-        # Sort by timestamp descending (most recent first)
-        all_traces.sort(key=lambda t: t.timestamp, reverse=True)
-
-        # Paginate
-        total = len(all_traces)
-        traces = all_traces[offset : offset + limit]
-
+        traces, total = get_trace_store(config["trace_path"]).list(
+            limit=limit,
+            offset=offset,
+            source=source,
+            has_disagreements=has_disagreements,
+        )
         return TraceListResponse(
             traces=traces,
             total=total,
@@ -726,83 +701,32 @@ async def list_traces(
         ) from e
 
 
-@router.get(
-    "/ml-advisor/traces/{trace_id}",
-    response_model=CodingTrace,
-    summary="Get a specific trace",
-    description="Retrieve a single coding trace by ID.",
-)
-async def get_trace(
-    trace_id: str,
-    config: AdvisorConfig,
-) -> CodingTrace:
-    """
-    Get a specific coding trace by ID.
-    """
-    trace_path = config["trace_path"]
-
-    if not trace_path.exists():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Trace {trace_id} not found",
-        )
-
-    try:
-        with open(trace_path, encoding="utf-8") as f:
-            for line in f:
-                try:
-                    data = json.loads(line.strip())
-                    if data.get("trace_id") == trace_id:
-                        return CodingTrace(**data)
-                except json.JSONDecodeError:
-                    continue
-
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Trace {trace_id} not found",
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error reading trace: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to read trace: {str(e)}",
-        ) from e
-
-
+# Registered before /traces/{trace_id} so "export" is not captured as a trace ID.
 @router.get(
     "/ml-advisor/traces/export",
     summary="Export traces as JSONL",
     description="Download all traces as a JSONL file.",
 )
-async def export_traces(
+def export_traces(
     config: AdvisorConfig,
     source: str | None = Query(default=None, description="Filter by source"),
 ) -> StreamingResponse:
     """
     Export traces as JSONL for offline analysis.
     """
-    trace_path = config["trace_path"]
-
-    if not trace_path.exists():
+    store = get_trace_store(config["trace_path"])
+    lines = store.export_lines(source=source)
+    try:
+        first = next(lines)
+    except StopIteration:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No traces found",
-        )
+        ) from None
 
     def generate():
-        with open(trace_path, encoding="utf-8") as f:
-            for line in f:
-                if source:
-                    try:
-                        data = json.loads(line.strip())
-                        if data.get("source") != source:
-                            continue
-                    except json.JSONDecodeError:
-                        continue
-                yield line
+        yield first
+        yield from lines
 
     filename = f"coding_traces_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
 
@@ -815,111 +739,54 @@ async def export_traces(
     )
 
 
+@router.get(
+    "/ml-advisor/traces/{trace_id}",
+    response_model=CodingTrace,
+    summary="Get a specific trace",
+    description="Retrieve a single coding trace by ID.",
+)
+def get_trace(
+    trace_id: str,
+    config: AdvisorConfig,
+) -> CodingTrace:
+    """
+    Get a specific coding trace by ID.
+    """
+    try:
+        trace = get_trace_store(config["trace_path"]).get(trace_id)
+    except Exception as e:
+        logger.error(f"Error reading trace: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to read trace: {str(e)}",
+        ) from e
+
+    if trace is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Trace {trace_id} not found",
+        )
+    return trace
+
+
 @router.get(
     "/ml-advisor/metrics",
     response_model=EvaluationMetrics,
     summary="Get evaluation metrics",
     description="Calculate evaluation metrics from coding traces.",
 )
-async def get_metrics(
+def get_metrics(
     config: AdvisorConfig,
 ) -> EvaluationMetrics:
     """
     Calculate evaluation metrics from coding traces.
 
     Returns agreement rates, code coverage, and accuracy metrics
-    (if human-reviewed codes are available).
+    (if human-reviewed codes are available). Totals are maintained
+    incrementally by the trace store as traces are indexed.
     """
-    trace_path = config["trace_path"]
-
-    if not trace_path.exists():
-        return EvaluationMetrics()
-
     try:
-        total_traces = 0
-        traces_with_advisor = 0
-        traces_with_final = 0
-        full_agreement = 0
-        advisor_suggested_extras = 0
-        advisor_suggested_removals = 0
-        unique_rule_codes: set[str] = set()
-        unique_advisor_codes: set[str] = set()
-
-        # For precision/recall
-        rule_tp, rule_fp, rule_fn = 0, 0, 0
-        advisor_tp, advisor_fp, advisor_fn = 0, 0, 0
-
-        with open(trace_path, encoding="utf-8") as f:
-            for line in f:
-                try:
-                    data = json.loads(line.strip())
-                    total_traces += 1
-
-                    rule_codes = set(data.get("autocode_codes", []))
-                    advisor_codes = set(data.get("advisor_candidate_codes", []))
-                    final_codes = data.get("final_codes")
-
-                    unique_rule_codes.update(rule_codes)
-
-                    if advisor_codes:
-                        traces_with_advisor += 1
-                        unique_advisor_codes.update(advisor_codes)
-
-                        if rule_codes == advisor_codes:
-                            full_agreement += 1
-
-                        if advisor_codes - rule_codes:
-                            advisor_suggested_extras += 1
-
-                        disagreements = data.get("advisor_disagreements", [])
-                        if any(c in rule_codes for c in disagreements):
-                            advisor_suggested_removals += 1
-
-                    if final_codes is not None:
-                        traces_with_final += 1
-                        final_set = set(final_codes)
-
-                        rule_tp += len(rule_codes & final_set)
-                        rule_fp += len(rule_codes - final_set)
-                        rule_fn += len(final_set - rule_codes)
-
-                        advisor_tp += len(advisor_codes & final_set)
-                        advisor_fp += len(advisor_codes - final_set)
-                        advisor_fn += len(final_set - advisor_codes)
-
-                except json.JSONDecodeError:
-                    continue
-
-        # Calculate precision/recall
-        rule_precision = None
-        rule_recall = None
-        advisor_precision = None
-        advisor_recall = None
-
-        if traces_with_final > 0:
-            if rule_tp + rule_fp > 0:
-                rule_precision = rule_tp / (rule_tp + rule_fp)
-            if rule_tp + rule_fn > 0:
-                rule_recall = rule_tp / (rule_tp + rule_fn)
-            if advisor_tp + advisor_fp > 0:
-                advisor_precision = advisor_tp / (advisor_tp + advisor_fp)
-            if advisor_tp + advisor_fn > 0:
-                advisor_recall = advisor_tp / (advisor_tp + advisor_fn)
-
-        return EvaluationMetrics(
-            total_traces=total_traces,
-            traces_with_advisor=traces_with_advisor,
-            traces_with_final=traces_with_final,
-            full_agreement=full_agreement,
-            advisor_suggested_extras=advisor_suggested_extras,
-            advisor_suggested_removals=advisor_suggested_removals,
-            unique_rule_codes=len(unique_rule_codes),
-            unique_advisor_codes=len(unique_advisor_codes),
-            rule_precision=rule_precision,
-            rule_recall=rule_recall,
-            advisor_precision=advisor_precision,
-            advisor_recall=advisor_recall,
-        )
+        return get_trace_store(config["trace_path"]).metrics()
 
     except Exception as e:
         logger.error(f"Error calculating metrics: {e}", exc_info=True)
@@ -12,10 +12,9 @@ from functools import lru_cache
 from typing import Iterator
 
 from fastapi import Depends
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
+from app.infra.db import create_tuned_engine
 from app.phi import PHIService
 from app.phi.adapters import (
     DatabaseAuditLogger,
@@ -35,19 +34,7 @@ def _default_db_url() -> str:
 DATABASE_URL = _default_db_url()
 
 
-def _engine_kwargs(url: str) -> dict:
-    """Configure engine options for SQLite vs Postgres."""
-
-    kwargs: dict = {}
-    if url.startswith("sqlite"):
-        kwargs["connect_args"] = {"check_same_thread": False}
-        # In-memory SQLite needs StaticPool to share state across connections
-        if ":memory:" in url:
-            kwargs["poolclass"] = StaticPool
-    return kwargs
-
-
-engine = create_engine(DATABASE_URL, **_engine_kwargs(DATABASE_URL))
+engine = create_tuned_engine(DATABASE_URL, name="phi")
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
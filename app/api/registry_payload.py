@@ -5,13 +5,35 @@ from __future__ import annotations
 from typing import Any
 
 from app.api.adapters.response_adapter import build_v3_evidence_payload
+from app.api.json_response import dumps_json
 from app.api.normalization import simplify_billing_cpt_codes
-from app.api.routes_registry import _prune_none
 from app.common.spans import Span
 from app.registry.schema import RegistryRecord
 from app.registry.summarize import add_procedure_summaries
 
 
+def _prune_none_in_place(obj: Any) -> Any:
+    """Drop None values from a freshly dumped dict/list tree without copying it.
+
+    Same result as ``routes_registry._prune_none``; safe only on containers the
+    caller owns (``model_dump`` output).
+    """
+    if isinstance(obj, dict):
+        empty = [key for key, value in obj.items() if value is None]
+        for key in empty:
+            del obj[key]
+        for value in obj.values():
+            if isinstance(value, (dict, list)):
+                _prune_none_in_place(value)
+    elif isinstance(obj, list):
+        if None in obj:
+            obj[:] = [item for item in obj if item is not None]
+        for item in obj:
+            if isinstance(item, (dict, list)):
+                _prune_none_in_place(item)
+    return obj
+
+
 def shape_registry_payload(
     record: RegistryRecord,
     evidence: dict[str, list[Span]] | None,
@@ -19,7 +41,7 @@ def shape_registry_payload(
     codes: list[str] | None = None,
 ) -> dict[str, Any]:
     """Convert a registry record + evidence into a JSON-safe, null-pruned payload."""
-    payload = _prune_none(record.model_dump(exclude_none=True))
+    payload = _prune_none_in_place(record.model_dump(exclude_none=True))
     simplify_billing_cpt_codes(payload)
     add_procedure_summaries(payload)
     payload["evidence"] = build_v3_evidence_payload(
@@ -30,4 +52,14 @@ def shape_registry_payload(
     return payload
 
 
-__all__ = ["shape_registry_payload"]
+def shape_registry_payload_json(
+    record: RegistryRecord,
+    evidence: dict[str, list[Span]] | None,
+    *,
+    codes: list[str] | None = None,
+) -> bytes:
+    """``shape_registry_payload`` encoded straight to JSON bytes."""
+    return dumps_json(shape_registry_payload(record, evidence, codes=codes))
+
+
+__all__ = ["shape_registry_payload", "shape_registry_payload_json"]
@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
 
 from app.api.dependencies import get_registry_service
+from app.api.json_response import PreEncodedJSONResponse
 from app.api.guards import enforce_legacy_endpoints_allowed, enforce_request_mode_override_allowed
 from app.api.phi_dependencies import get_phi_scrubber
 from app.api.phi_redaction import apply_phi_redaction
 from app.api.readiness import require_ready
-from app.api.registry_payload import shape_registry_payload
+from app.api.registry_payload import shape_registry_payload_json
 from app.api.schemas import RegistryRequest, RegistryResponse
 from app.infra.executors import run_cpu
 from app.registry.application.registry_service import RegistryService
@@ -48,8 +48,8 @@ async def registry_run(
             note_text,
             req.mode,
         )
-        payload = shape_registry_payload(result.record, {}, codes=result.cpt_codes)
-        return JSONResponse(content=payload)
+        body = shape_registry_payload_json(result.record, {}, codes=result.cpt_codes)
+        return PreEncodedJSONResponse(body)
 
     if mode_value in {"engine_only", "no_llm", "deterministic_only"}:
         result = await run_cpu(
@@ -58,8 +58,8 @@ async def registry_run(
             note_text,
             "parallel_ner",
         )
-        payload = shape_registry_payload(result.record, {}, codes=result.cpt_codes)
-        return JSONResponse(content=payload)
+        body = shape_registry_payload_json(result.record, {}, codes=result.cpt_codes)
+        return PreEncodedJSONResponse(body)
 
     eng = RegistryEngine()
     result = await run_cpu(request.app, eng.run, note_text, explain=req.explain)
@@ -68,8 +68,7 @@ async def registry_run(
     else:
         record, evidence = result, getattr(result, "evidence", {})
 
-    payload = shape_registry_payload(record, evidence)
-    return JSONResponse(content=payload)
+    return PreEncodedJSONResponse(shape_registry_payload_json(record, evidence))
 
 
 __all__ = ["router"]
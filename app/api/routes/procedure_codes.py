@@ -654,10 +654,11 @@ def get_coding_metrics(
         - Acceptance rate
         - Provenance info (kb_version, policy_version, model_version)
     """
-    suggestions = store.get_suggestions(proc_id)
-    reviews = store.get_reviews(proc_id)
-    finals = store.get_final_codes(proc_id)
-    coding_result = store.get_result(proc_id)
+    bundle = store.load_procedure_bundle(proc_id)
+    suggestions = bundle.suggestions
+    reviews = bundle.reviews
+    finals = bundle.final_codes
+    coding_result = bundle.result
 
     # Count reviews of AI suggestions (not manual additions which have empty suggestion_id)
     accepted = sum(1 for r in reviews if r.action == "accept" and r.suggestion_id)
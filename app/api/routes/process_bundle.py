@@ -11,12 +11,13 @@ import os
 import time
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi import APIRouter, Depends, HTTPException, Request
 
 from app.agents.aggregator.timeline_aggregator import BundleDocInput, aggregate_entity_ledger
 from app.agents.relation_extraction.llm_proposer import propose_relations_ml
 from app.agents.relation_extraction.shadow_mode import merge_relations_shadow_mode
 from app.api.dependencies import get_coding_service, get_registry_service
+from app.api.json_response import PreEncodedJSONResponse, model_json_response
 from app.api.phi_dependencies import get_phi_scrubber
 from app.api.readiness import require_ready
 from app.api.schemas import (
@@ -93,14 +94,12 @@ def _timeline_summary(docs: list[BundleDocResponse]) -> dict[str, Any]:
 async def process_bundle(
     payload: ProcessBundleRequest,
     request: Request,
-    response: Response,
     _ready: None = _ready_dep,
     registry_service: RegistryService = _registry_service_dep,
     coding_service: CodingService = _coding_service_dep,
     phi_scrubber=_phi_scrubber_dep,
-) -> ProcessBundleResponse:
+) -> PreEncodedJSONResponse:
     start_time = time.time()
-    response.headers["X-Process-Route"] = "bundle_router"
 
     # Guardrail: reject absolute date-like strings (PHI leak) in any document.
     for doc in payload.documents:
@@ -170,7 +169,7 @@ async def process_bundle(
         "ml": ml_result.metrics,
         "merge": shadow.metrics,
     }
-    return ProcessBundleResponse(
+    bundle = ProcessBundleResponse(
         zk_patient_id=payload.zk_patient_id,
         episode_id=payload.episode_id,
         documents=docs_out,
@@ -183,6 +182,7 @@ async def process_bundle(
         relations_metrics=relations_metrics,
         processing_time_ms=processing_time_ms,
     )
+    return model_json_response(bundle, headers={"X-Process-Route": "bundle_router"})
 
 
 __all__ = ["router"]
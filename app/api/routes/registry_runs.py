@@ -12,18 +12,22 @@ Non-negotiable: never persist raw PHI.
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
 import hashlib
 import json
 import os
 import uuid
+import zlib
 from datetime import UTC, datetime
 from typing import Any, Iterator
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import Select, and_, desc, select
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, and_, desc, or_, select
+from sqlalchemy.orm import Session, load_only
 
 from app.api.dependencies import get_coding_service, get_registry_service
 from app.api.phi_dependencies import get_phi_scrubber
@@ -32,9 +36,22 @@ from app.api.schemas import UnifiedProcessRequest, UnifiedProcessResponse
 from app.api.services.unified_pipeline import run_unified_pipeline_logic
 from app.coder.application.coding_service import CodingService
 from app.registry.application.registry_service import RegistryService
-from app.registry_store.dependencies import get_registry_store_db
-from app.registry_store.models import RegistryCaseRecord, RegistryRun
+from app.registry_store.dependencies import (
+    get_registry_store_db,
+    get_registry_store_sessionmaker,
+    resolve_registry_store_database_url,
+)
+from app.registry_store.models import RegistryRun
 from app.registry_store.phi_gate import scan_text_for_phi_risk
+from app.registry_store.write_behind import (
+    CaseRecordUpdate,
+    PendingRegistryRun,
+    RegistryRunQueueFull,
+    get_registry_run_writer,
+    persist_registry_runs,
+    registry_runs_enqueue_timeout_s,
+    resolve_registry_runs_write_mode,
+)
 
 
 def _truthy_env(name: str) -> bool:
@@ -115,6 +132,96 @@ def _parse_registry_uuid(value: str | None) -> uuid.UUID | None:
         return None
 
 
+# Columns needed to build RegistryRunListItem; everything else stays deferred.
+_LIST_COLUMNS = (
+    RegistryRun.id,
+    RegistryRun.created_at,
+    RegistryRun.submitter_name,
+    RegistryRun.schema_version,
+    RegistryRun.needs_manual_review,
+    RegistryRun.review_status,
+    RegistryRun.note_sha256,
+    RegistryRun.feedback_rating,
+    RegistryRun.feedback_submitted_at,
+    RegistryRun.corrected_at,
+)
+
+# Total order for keyset pagination: id breaks created_at ties.
+_NEWEST_FIRST = (desc(RegistryRun.created_at), desc(RegistryRun.id))
+
+_GZIP_CHUNK_BYTES = 64 * 1024
+
+
+def _run_filters(
+    *,
+    has_feedback: bool | None,
+    has_correction: bool | None,
+    created_from: datetime | None,
+    created_to: datetime | None,
+) -> list[Any]:
+    filters: list[Any] = []
+    if has_feedback is not None:
+        filters.append(
+            RegistryRun.feedback_submitted_at.is_not(None)
+            if has_feedback
+            else RegistryRun.feedback_submitted_at.is_(None)
+        )
+    if has_correction is not None:
+        filters.append(
+            RegistryRun.corrected_at.is_not(None)
+            if has_correction
+            else RegistryRun.corrected_at.is_(None)
+        )
+    if created_from is not None:
+        filters.append(RegistryRun.created_at >= created_from)
+    if created_to is not None:
+        filters.append(RegistryRun.created_at <= created_to)
+    return filters
+
+
+def _encode_cursor(run: RegistryRun) -> str:
+    raw = f"{run.created_at.isoformat()}|{run.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        created_at, run_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), uuid.UUID(run_id)
+    except (ValueError, UnicodeError, binascii.Error) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
+def _export_yield_per() -> int:
+    try:
+        return max(1, int(os.getenv("REGISTRY_EXPORT_YIELD_PER", "500")))
+    except ValueError:
+        return 500
+
+
+def _gzip_chunks(lines: Iterator[bytes]) -> Iterator[bytes]:
+    # wbits=31 -> gzip container, so the output is a standard .gz stream.
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    pending: list[bytes] = []
+    pending_bytes = 0
+    for line in lines:
+        pending.append(line)
+        pending_bytes += len(line)
+        if pending_bytes >= _GZIP_CHUNK_BYTES:
+            chunk = compressor.compress(b"".join(pending))
+            pending.clear()
+            pending_bytes = 0
+            if chunk:
+                yield chunk
+    if pending:
+        chunk = compressor.compress(b"".join(pending))
+        if chunk:
+            yield chunk
+    yield compressor.flush()
+
+
 router = APIRouter(tags=["registry-runs"])
 
 _ready_dep = Depends(require_ready)
@@ -194,12 +301,42 @@ class RegistryRunListResponse(BaseModel):
     items: list[RegistryRunListItem]
     limit: int
     offset: int
+    # Opaque keyset cursor for the next page; absent on the last page.
+    next_cursor: str | None = None
 
 
 class RegistryRunGetResponse(BaseModel):
     run: dict[str, Any]
 
 
+async def _persist_registry_run(pending: PendingRegistryRun, db: Session) -> None:
+    """Persist one run according to REGISTRY_RUNS_WRITE_MODE without blocking the event loop."""
+    mode = resolve_registry_runs_write_mode()
+    if mode == "sync":
+        await asyncio.to_thread(persist_registry_runs, db, [pending])
+        return
+
+    writer = get_registry_run_writer(
+        resolve_registry_store_database_url(), get_registry_store_sessionmaker()
+    )
+    try:
+        future = writer.submit(pending, block=False)
+    except RegistryRunQueueFull:
+        # Backpressure: wait (off-loop) for queue space, then reject.
+        try:
+            future = await asyncio.to_thread(
+                writer.submit_waiting, pending, timeout_s=registry_runs_enqueue_timeout_s()
+            )
+        except RegistryRunQueueFull as exc:
+            raise HTTPException(
+                status_code=503,
+                detail="Registry run persistence is saturated; retry shortly",
+                headers={"Retry-After": "1"},
+            ) from exc
+    if mode == "durable":
+        await asyncio.wrap_future(future)
+
+
 @router.post(
     "/v1/registry/runs",
     response_model=RegistryRunCreateResponse,
@@ -264,49 +401,35 @@ async def create_registry_run(
     if phi_risk_reasons:
         pipeline_cfg["phi_risk_reasons"] = phi_risk_reasons
 
-    run = RegistryRun(
-        id=uuid.uuid4(),
-        created_at=_utcnow(),
-        submitter_name=(payload.submitter_name or None),
-        note_text=scrubbed_note_text_used,
-        note_sha256=note_sha256,
-        schema_version=_schema_version(),
-        pipeline_config=pipeline_cfg,
-        raw_response_json=raw_response_json,
-        kb_version=str(meta.get("kb_version") or "") or None,
-        kb_hash=str(meta.get("kb_hash") or "") or None,
-        processing_time_ms=int(meta.get("processing_time_ms") or 0) or None,
-        needs_manual_review=needs_manual_review,
-        review_status=review_status,
+    run_id = uuid.uuid4()
+    pending = PendingRegistryRun(
+        run_values={
+            "id": run_id,
+            "created_at": _utcnow(),
+            "submitter_name": payload.submitter_name or None,
+            "note_text": scrubbed_note_text_used,
+            "note_sha256": note_sha256,
+            "schema_version": _schema_version(),
+            "pipeline_config": pipeline_cfg,
+            "raw_response_json": raw_response_json,
+            "kb_version": str(meta.get("kb_version") or "") or None,
+            "kb_hash": str(meta.get("kb_hash") or "") or None,
+            "processing_time_ms": int(meta.get("processing_time_ms") or 0) or None,
+            "needs_manual_review": needs_manual_review,
+            "review_status": review_status,
+        },
     )
-
-    db.add(run)
     case_registry_uuid = _parse_registry_uuid(payload.registry_uuid)
     if case_registry_uuid:
-        registry_json = result.registry if isinstance(result.registry, dict) else {}
-        case_record = db.get(RegistryCaseRecord, case_registry_uuid)
-        if case_record is None:
-            case_record = RegistryCaseRecord(
-                registry_uuid=case_registry_uuid,
-                registry_json=registry_json,
-                schema_version=_schema_version(),
-                version=1,
-                source_run_id=run.id,
-                manual_overrides={},
-                created_at=_utcnow(),
-                updated_at=_utcnow(),
-            )
-        else:
-            case_record.registry_json = registry_json
-            case_record.schema_version = _schema_version()
-            case_record.source_run_id = run.id
-            case_record.version = int(case_record.version or 1) + 1
-            case_record.updated_at = _utcnow()
-        db.add(case_record)
+        pending.case_update = CaseRecordUpdate(
+            registry_uuid=case_registry_uuid,
+            registry_json=result.registry if isinstance(result.registry, dict) else {},
+            schema_version=_schema_version(),
+        )
 
-    db.commit()
+    await _persist_registry_run(pending, db)
 
-    return RegistryRunCreateResponse(run_id=str(run.id), result=result)
+    return RegistryRunCreateResponse(run_id=str(run_id), result=result)
 
 
 @router.post(
@@ -381,6 +504,7 @@ def list_registry_runs(
     db: Session = _registry_store_db_dep,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
     submitter_name: str | None = None,
     review_status: str | None = None,
     needs_manual_review: bool | None = None,
@@ -389,13 +513,25 @@ def list_registry_runs(
     created_from: datetime | None = None,
     created_to: datetime | None = None,
 ) -> RegistryRunListResponse:
+    """List runs newest-first.
+
+    Pass the returned ``next_cursor`` back as ``cursor`` to page with a keyset
+    predicate on ``(created_at, id)``; ``offset`` is kept for existing callers
+    and ignored when a cursor is given.
+    """
     _enforce_registry_runs_enabled()
 
     limit = max(1, min(int(limit), 200))
     offset = max(0, int(offset))
 
-    query: Select[Any] = select(RegistryRun)
-    filters = []
+    # Listings only need the summary columns; skip the note text and JSON payloads.
+    query: Select[Any] = select(RegistryRun).options(load_only(*_LIST_COLUMNS))
+    filters = _run_filters(
+        has_feedback=has_feedback,
+        has_correction=has_correction,
+        created_from=created_from,
+        created_to=created_to,
+    )
 
     if submitter_name:
         filters.append(RegistryRun.submitter_name == submitter_name)
@@ -403,28 +539,23 @@ def list_registry_runs(
         filters.append(RegistryRun.review_status == review_status)
     if needs_manual_review is not None:
         filters.append(RegistryRun.needs_manual_review == needs_manual_review)
-    if has_feedback is not None:
+    if cursor:
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
         filters.append(
-            RegistryRun.feedback_submitted_at.is_not(None)
-            if has_feedback
-            else RegistryRun.feedback_submitted_at.is_(None)
-        )
-    if has_correction is not None:
-        filters.append(
-            RegistryRun.corrected_at.is_not(None)
-            if has_correction
-            else RegistryRun.corrected_at.is_(None)
+            or_(
+                RegistryRun.created_at < cursor_created_at,
+                and_(RegistryRun.created_at == cursor_created_at, RegistryRun.id < cursor_id),
+            )
         )
-    if created_from is not None:
-        filters.append(RegistryRun.created_at >= created_from)
-    if created_to is not None:
-        filters.append(RegistryRun.created_at <= created_to)
+        offset = 0
 
     if filters:
         query = query.where(and_(*filters))
 
-    query = query.order_by(desc(RegistryRun.created_at)).offset(offset).limit(limit)
+    query = query.order_by(*_NEWEST_FIRST).offset(offset).limit(limit + 1)
     rows = list(db.execute(query).scalars().all())
+    next_cursor = _encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    rows = rows[:limit]
 
     items = [
         RegistryRunListItem(
@@ -442,7 +573,9 @@ def list_registry_runs(
         for r in rows
     ]
 
-    return RegistryRunListResponse(items=items, limit=limit, offset=offset)
+    return RegistryRunListResponse(
+        items=items, limit=limit, offset=offset, next_cursor=next_cursor
+    )
 
 
 @router.get(
@@ -477,34 +610,42 @@ def export_registry_runs(
     has_correction: bool | None = None,
     created_from: datetime | None = None,
     created_to: datetime | None = None,
+    compression: str | None = None,
 ) -> StreamingResponse:
+    """Stream runs as NDJSON, optionally gzip-compressed (``compression=gzip``).
+
+    Rows are fetched in ``REGISTRY_EXPORT_YIELD_PER`` batches (server-side cursor
+    on PostgreSQL) so memory stays flat regardless of export size.
+    """
     _enforce_registry_runs_enabled()
 
-    query: Select[Any] = select(RegistryRun).order_by(desc(RegistryRun.created_at))
-    filters = []
-    if has_feedback is not None:
-        filters.append(
-            RegistryRun.feedback_submitted_at.is_not(None)
-            if has_feedback
-            else RegistryRun.feedback_submitted_at.is_(None)
-        )
-    if has_correction is not None:
-        filters.append(
-            RegistryRun.corrected_at.is_not(None)
-            if has_correction
-            else RegistryRun.corrected_at.is_(None)
-        )
-    if created_from is not None:
-        filters.append(RegistryRun.created_at >= created_from)
-    if created_to is not None:
-        filters.append(RegistryRun.created_at <= created_to)
+    compression = (compression or "").strip().lower() or None
+    if compression not in (None, "gzip"):
+        raise HTTPException(status_code=400, detail="compression must be 'gzip' or omitted")
+
+    query: Select[Any] = select(RegistryRun).order_by(*_NEWEST_FIRST)
+    filters = _run_filters(
+        has_feedback=has_feedback,
+        has_correction=has_correction,
+        created_from=created_from,
+        created_to=created_to,
+    )
     if filters:
         query = query.where(and_(*filters))
+    query = query.execution_options(yield_per=_export_yield_per())
 
     def _iter_jsonl() -> Iterator[bytes]:
         for run in db.execute(query).scalars():
             payload = _serialize_run(run)
             yield (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+            # Drop the row from the identity map; the export never revisits it.
+            db.expunge(run)
+
+    if compression == "gzip":
+        headers = {"Content-Disposition": "attachment; filename=registry_runs.jsonl.gz"}
+        return StreamingResponse(
+            _gzip_chunks(_iter_jsonl()), media_type="application/gzip", headers=headers
+        )
 
     headers = {"Content-Disposition": "attachment; filename=registry_runs.jsonl"}
     return StreamingResponse(_iter_jsonl(), media_type="application/x-ndjson", headers=headers)
@@ -56,6 +56,7 @@ from app.reporting.speech_support import (
     ReporterSpeechUnavailable,
     ReporterSpeechUnsafeInput,
     clean_scrubbed_reporter_transcript,
+    spool_reporter_audio_upload,
     transcribe_reporter_audio,
 )
 from app.reporting.validation import ValidationEngine
@@ -660,20 +661,25 @@ async def report_seed_from_text(
 
 @router.post("/report/transcribe_audio", response_model=ReporterSpeechTranscriptionResponse)
 async def report_transcribe_audio(
+    request: Request,
     audio_file: UploadFile = _report_audio_file,
     source: str = _report_audio_source,
     cloud_fallback_confirmed: bool = _report_audio_cloud_fallback_confirmed,
     _ready: None = _ready_dep,
 ) -> ReporterSpeechTranscriptionResponse:
     try:
-        payload = await audio_file.read()
-        result = await transcribe_reporter_audio(
-            audio_bytes=payload,
-            filename=audio_file.filename,
-            content_type=audio_file.content_type,
-            source=source,
-            cloud_fallback_confirmed=cloud_fallback_confirmed,
-        )
+        # Stream the upload through a temp file instead of `await audio_file.read()`
+        # so per-request memory stays flat for long dictations.
+        async with spool_reporter_audio_upload(audio_file) as (audio_stream, audio_size):
+            result = await transcribe_reporter_audio(
+                audio_stream=audio_stream,
+                audio_size=audio_size,
+                filename=audio_file.filename,
+                content_type=audio_file.content_type,
+                source=source,
+                cloud_fallback_confirmed=cloud_fallback_confirmed,
+                client=getattr(request.app.state, "llm_http", None),
+            )
     except ReporterSpeechUnavailable as exc:
         raise HTTPException(status_code=503, detail=str(exc)) from exc
 
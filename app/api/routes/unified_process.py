@@ -17,6 +17,7 @@ import httpx
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
 from app.api.dependencies import get_coding_service, get_registry_service
+from app.api.json_response import PreEncodedJSONResponse, model_json_response
 from app.api.phi_dependencies import get_phi_scrubber
 from app.api.readiness import require_ready
 from app.api.schemas import (
@@ -52,14 +53,12 @@ _phi_scrubber_dep = Depends(get_phi_scrubber)
 async def unified_process(
     payload: UnifiedProcessRequest,
     request: Request,
-    response: Response,
     _ready: None = _ready_dep,
     registry_service: RegistryService = _registry_service_dep,
     coding_service: CodingService = _coding_service_dep,
     phi_scrubber=_phi_scrubber_dep,
-) -> UnifiedProcessResponse:
+) -> PreEncodedJSONResponse:
     """Run the unified extraction pipeline."""
-    response.headers["X-Process-Route"] = "router"
     result, _, _ = await run_unified_pipeline_logic(
         payload=payload,
         request=request,
@@ -67,7 +66,8 @@ async def unified_process(
         coding_service=coding_service,
         phi_scrubber=phi_scrubber,
     )
-    return result
+    # Encoded once here; response_model above only documents the schema.
+    return model_json_response(result, headers={"X-Process-Route": "router"})
 
 
 @router.post(
@@ -280,6 +280,13 @@ class UnifiedProcessRequest(BaseModel):
             "before extraction."
         ),
     )
+    include_stage_timings: bool = Field(
+        False,
+        description=(
+            "If true, return the per-stage extraction timing breakdown under "
+            "`debug.stage_timings`."
+        ),
+    )
 
 
 class CameraOcrCorrectionRequest(BaseModel):
@@ -470,6 +477,10 @@ class UnifiedProcessResponse(BaseModel):
     kb_version: str = ""
     policy_version: str = ""
     processing_time_ms: float = 0.0
+    debug: dict[str, Any] | None = Field(
+        default=None,
+        description="Diagnostics requested by the client (e.g., `stage_timings`).",
+    )
 
 
 class BundleDocResponse(BaseModel):
@@ -4,29 +4,131 @@ Used by extraction-first endpoints to compute:
 - total work RVUs
 - per-code payment estimates
 - Multiple Endoscopy Rule (MER) reductions for bronchoscopy endoscopy families
+
+Per-code description/RVU lookups go through a ``ProcedureRateTable`` built once
+per KB repository (and version); ``warm_procedure_rate_table`` builds it at
+startup so requests only do dictionary lookups.
 """
 
 from __future__ import annotations
 
+import threading
 from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
-from app.common.knowledge import get_knowledge
+from app.common.knowledge import get_knowledge, knowledge_hash
 from app.domain.knowledge_base.repository import KnowledgeBaseRepository
 
 
-def _multiple_endoscopy_family_codes() -> set[str]:
+@dataclass(frozen=True)
+class ProcedureRate:
+    code: str
+    description: str
+    work_rvu: float
+    total_facility_rvu: float
+    is_addon: bool
+
+
+class ProcedureRateTable:
+    """Description/RVU lookup table for one KB repository snapshot.
+
+    Codes missing from the precomputed table fall back to
+    ``kb_repo.get_procedure_info`` (so ``PSUITE_KB_STRICT`` still applies) and
+    are remembered, including misses.
+    """
+
+    def __init__(self, kb_repo: KnowledgeBaseRepository) -> None:
+        self._kb_repo = kb_repo
+        self._lock = threading.Lock()
+        self._rates: dict[str, ProcedureRate | None] = {}
+        for code in kb_repo.get_all_codes():
+            self._rates[code] = self._load(code)
+
+    @staticmethod
+    def _normalize(code: str) -> str:
+        return str(code).strip().upper().lstrip("+")
+
+    def _load(self, code: str) -> ProcedureRate | None:
+        info = self._kb_repo.get_procedure_info(code)
+        if not info:
+            return None
+        return ProcedureRate(
+            code=info.code,
+            description=info.description,
+            work_rvu=float(info.work_rvu),
+            total_facility_rvu=float(info.total_facility_rvu),
+            is_addon=bool(self._kb_repo.is_addon_code(info.code)),
+        )
+
+    def get(self, code: str) -> ProcedureRate | None:
+        normalized = self._normalize(code)
+        if not normalized:
+            return None
+        try:
+            return self._rates[normalized]
+        except KeyError:
+            pass
+        rate = self._load(normalized)
+        with self._lock:
+            self._rates[normalized] = rate
+        return rate
+
+    def description(self, code: str) -> str:
+        rate = self.get(code)
+        return rate.description if rate else ""
+
+    def __len__(self) -> int:
+        return len(self._rates)
+
+
+_rate_tables: dict[int, tuple[KnowledgeBaseRepository, str, ProcedureRateTable]] = {}
+_rate_tables_lock = threading.Lock()
+
+
+def get_procedure_rate_table(kb_repo: KnowledgeBaseRepository) -> ProcedureRateTable:
+    """Return the cached rate table for *kb_repo*, rebuilding it when the KB version changes."""
+
+    version = str(getattr(kb_repo, "version", "") or "")
+    entry = _rate_tables.get(id(kb_repo))
+    if entry is not None and entry[0] is kb_repo and entry[1] == version:
+        return entry[2]
+    with _rate_tables_lock:
+        entry = _rate_tables.get(id(kb_repo))
+        if entry is not None and entry[0] is kb_repo and entry[1] == version:
+            return entry[2]
+        table = ProcedureRateTable(kb_repo)
+        # Holding the repo keeps id() stable; in practice there is one cached repo per process.
+        _rate_tables[id(kb_repo)] = (kb_repo, version, table)
+        return table
+
+
+def warm_procedure_rate_table(kb_repo: KnowledgeBaseRepository) -> int:
+    """Build the rate table (and MER family set) ahead of the first request."""
+
+    table = get_procedure_rate_table(kb_repo)
+    _multiple_endoscopy_family_codes()
+    return len(table)
+
+
+def _multiple_endoscopy_family_codes() -> frozenset[str]:
+    return _multiple_endoscopy_family_codes_for(knowledge_hash())
+
+
+@lru_cache(maxsize=4)
+def _multiple_endoscopy_family_codes_for(_kb_hash: str | None) -> frozenset[str]:
     kb = get_knowledge()
     policies = kb.get("policies")
     if not isinstance(policies, dict):
-        return set()
+        return frozenset()
     policy = policies.get("multiple_endoscopy_rule")
     if not isinstance(policy, dict):
-        return set()
+        return frozenset()
     applies = policy.get("applies_to_family")
     if not isinstance(applies, list):
-        return set()
-    return {str(code).strip().lstrip("+") for code in applies if str(code).strip()}
+        return frozenset()
+    return frozenset(str(code).strip().lstrip("+") for code in applies if str(code).strip())
 
 
 def calculate_financials(
@@ -49,19 +151,20 @@ def calculate_financials(
     total_work = 0.0
 
     unit_map = units_by_code or {}
+    rates = get_procedure_rate_table(kb_repo)
 
     # Build base line items.
     for code in codes:
-        proc_info = kb_repo.get_procedure_info(code)
-        if not proc_info:
+        rate = rates.get(code)
+        if not rate:
             continue
 
         normalized = str(code).strip().lstrip("+")
         units = int(unit_map.get(normalized, unit_map.get(str(code).strip(), 1)) or 1)
         units = max(units, 1)
 
-        work_rvu = float(proc_info.work_rvu) * units
-        total_rvu = float(proc_info.total_facility_rvu) * units
+        work_rvu = rate.work_rvu * units
+        total_rvu = rate.total_facility_rvu * units
         base_payment = total_rvu * float(conversion_factor)
 
         total_work += work_rvu
@@ -69,7 +172,7 @@ def calculate_financials(
         per_code_billing.append(
             {
                 "cpt_code": normalized,
-                "description": proc_info.description,
+                "description": rate.description,
                 "units": units,
                 "work_rvu": work_rvu,
                 "total_facility_rvu": total_rvu,
@@ -85,7 +188,10 @@ def calculate_financials(
 
     def in_family(item: dict[str, Any]) -> bool:
         code = str(item.get("cpt_code") or "").strip().lstrip("+")
-        return bool(code) and code in family and not kb_repo.is_addon_code(code)
+        if not code or code not in family:
+            return False
+        rate = rates.get(code)
+        return not (rate.is_addon if rate else kb_repo.is_addon_code(code))
 
     family_items = [item for item in per_code_billing if in_family(item)]
     if len(family_items) > 1:
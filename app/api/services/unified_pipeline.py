@@ -155,23 +155,30 @@ async def run_unified_pipeline_logic(
         logger.error("Unified process failed: %s", exc, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal processing error") from exc
 
-    from app.coder.domain_rules.registry_to_cpt.coding_rules import derive_all_codes_with_meta
+    from app.api.services.financials import get_procedure_rate_table
+    from app.coder.domain_rules.registry_to_cpt.coding_rules import (
+        derive_all_codes_with_meta_cached,
+    )
     from app.registry.schema import RegistryRecord
 
     record = getattr(result, "record", None)
     if record is None:
         record = RegistryRecord.model_validate(getattr(result, "mapped_fields", {}) or {})
 
-    derived_codes, derived_rationales, derivation_warnings = derive_all_codes_with_meta(record)
+    # Memoized on the record fingerprint: RegistryService already derived codes for this
+    # record, so this is normally a cache hit that still yields the derivation warnings.
+    derived_codes, derived_rationales, derivation_warnings = derive_all_codes_with_meta_cached(
+        record
+    )
     codes = list(getattr(result, "cpt_codes", None) or derived_codes)
     code_rationales = getattr(result, "code_rationales", None) or derived_rationales
 
+    rates = get_procedure_rate_table(coding_service.kb_repo)
     suggestions: list[CodeSuggestionSummary] = []
     base_confidence = 0.95 if result.coder_difficulty == "HIGH_CONF" else 0.80
 
     for code in codes:
-        proc_info = coding_service.kb_repo.get_procedure_info(code)
-        description = proc_info.description if proc_info else ""
+        description = rates.description(code)
         rationale = code_rationales.get(code, "")
 
         if result.needs_manual_review:
@@ -206,8 +213,7 @@ async def run_unified_pipeline_logic(
         for code in sorted(header_missing):
             if code in seen_codes:
                 continue
-            proc_info = coding_service.kb_repo.get_procedure_info(code)
-            description = proc_info.description if proc_info else ""
+            description = rates.description(code)
             suggestions.append(
                 CodeSuggestionSummary(
                     code=code,
@@ -226,11 +232,10 @@ async def run_unified_pipeline_logic(
     per_code_billing: list[dict[str, Any]] = []
 
     if payload.include_financials and codes:
+        from app.api.dependencies import get_coder_settings
         from app.api.services.financials import calculate_financials
-        from config.settings import CoderSettings
 
-        settings = CoderSettings()
-        conversion_factor = settings.cms_conversion_factor
+        conversion_factor = get_coder_settings().cms_conversion_factor
         units_by_code: dict[str, int] = {}
 
         billing = getattr(record, "billing", None)
@@ -376,6 +381,10 @@ async def run_unified_pipeline_logic(
 
     processing_time_ms = (time.time() - start_time) * 1000
 
+    debug_payload: dict[str, Any] | None = None
+    if payload.include_stage_timings:
+        debug_payload = {"stage_timings": list(getattr(result, "stage_timings", None) or [])}
+
     response_model = UnifiedProcessResponse(
         registry_uuid=payload.registry_uuid,
         registry=record.model_dump(exclude_none=True),
@@ -397,6 +406,7 @@ async def run_unified_pipeline_logic(
         policy_version="extraction_first_v1",
         processing_time_ms=round(processing_time_ms, 2),
         review_status=review_status,
+        debug=debug_payload,
     )
 
     meta = {
@@ -30,7 +30,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from observability.logging_config import get_logger
-from app.infra.cache import get_llm_memory_cache
+from app.infra.cache import get_llm_response_cache
 from app.infra.llm_control import backoff_seconds, llm_slot, make_llm_cache_key
 from app.infra.settings import get_infra_settings
 
@@ -145,15 +145,13 @@ Return ONLY the JSON array, no other text.
     MAX_TEXT_SIZE = 32000
 
     # Context-aware prompt template for ML-first hybrid policy
+    # Per-case ML context sits after the fixed instructions so the leading
+    # prompt prefix is identical across notes (provider prefix caching).
     CONTEXT_PROMPT_TEMPLATE = '''You are the final judge for CPT code assignment in an ML-assisted coding pipeline.
 
-The ML model predicted the following CPT codes with these confidence scores:
-{ml_predictions}
-
-ML Classification: {difficulty}
-Reason for LLM Review: {reason_for_fallback}
-
-Given the full procedure note below, evaluate whether you agree with the ML suggestions.
+An ML model has already predicted CPT codes for the procedure note below. Its predictions,
+case classification and the reason for LLM review are listed after these instructions.
+Evaluate whether you agree with the ML suggestions.
 If not, explain briefly and provide the corrected list of CPT codes.
 
 IMPORTANT CONSTRAINTS:
@@ -172,6 +170,12 @@ Example format:
   {{"code": "31652", "confidence": 0.85, "rationale": "EBUS-TBNA of 2 stations mentioned"}}
 ]
 
+ML predictions (CPT code: confidence):
+{ml_predictions}
+
+ML Classification: {difficulty}
+Reason for LLM Review: {reason_for_fallback}
+
 Procedure Note:
 {report_text}
 
@@ -206,12 +210,13 @@ Return ONLY the JSON array, no other text.
         if settings.enable_llm_cache:
             prompt_version = (os.getenv("LLM_PROMPT_VERSION") or "default").strip() or "default"
             cache_key = make_llm_cache_key(
+                provider="gemini_sdk",
                 model=self.model_name,
                 prompt=prompt,
                 prompt_version=prompt_version,
             )
-            cached = get_llm_memory_cache().get(cache_key)
-            if isinstance(cached, str) and cached:
+            cached = get_llm_response_cache().get(cache_key)
+            if cached:
                 return self._parse_response(cached)
 
         max_retries = 3
@@ -221,7 +226,7 @@ Return ONLY the JSON array, no other text.
                     response = client.generate_content(prompt)  # type: ignore
                 response_text = response.text
                 if cache_key is not None and response_text:
-                    get_llm_memory_cache().set(cache_key, response_text, ttl_s=3600)
+                    get_llm_response_cache().set(cache_key, response_text)
                 return self._parse_response(response_text)
             except Exception as e:  # noqa: BLE001
                 if attempt >= max_retries - 1 or time.monotonic() >= deadline:
@@ -286,12 +291,13 @@ Return ONLY the JSON array, no other text.
         if settings.enable_llm_cache:
             prompt_version = (os.getenv("LLM_PROMPT_VERSION") or "default").strip() or "default"
             cache_key = make_llm_cache_key(
+                provider="gemini_sdk",
                 model=self.model_name,
                 prompt=prompt,
                 prompt_version=prompt_version,
             )
-            cached = get_llm_memory_cache().get(cache_key)
-            if isinstance(cached, str) and cached:
+            cached = get_llm_response_cache().get(cache_key)
+            if cached:
                 return self._parse_response(cached)
 
         max_retries = 3
@@ -301,7 +307,7 @@ Return ONLY the JSON array, no other text.
                     response = client.generate_content(prompt)  # type: ignore
                 response_text = response.text
                 if cache_key is not None and response_text:
-                    get_llm_memory_cache().set(cache_key, response_text, ttl_s=3600)
+                    get_llm_response_cache().set(cache_key, response_text)
                 return self._parse_response(response_text)
             except Exception as e:  # noqa: BLE001
                 if attempt >= max_retries - 1 or time.monotonic() >= deadline:
@@ -22,7 +22,7 @@ import httpx
 from observability.logging_config import get_logger
 from app.common.model_capabilities import filter_payload_for_model
 from app.common.llm import _resolve_openai_timeout
-from app.infra.cache import get_llm_memory_cache
+from app.infra.cache import get_llm_response_cache
 from app.infra.llm_control import (
     backoff_seconds,
     llm_slot,
@@ -263,15 +263,12 @@ Procedure Note:
 Return ONLY the JSON array, no other text.
 '''
 
+    # ML context follows the fixed instructions to keep the prompt prefix stable.
     CONTEXT_PROMPT_TEMPLATE = '''You are the final judge for CPT code assignment in an ML-assisted coding pipeline.
 
-The ML model predicted the following CPT codes with these confidence scores:
-{ml_predictions}
-
-ML Classification: {difficulty}
-Reason for LLM Review: {reason_for_fallback}
-
-Given the full procedure note below, evaluate whether you agree with the ML suggestions.
+An ML model has already predicted CPT codes for the procedure note below. Its predictions,
+case classification and the reason for LLM review are listed after these instructions.
+Evaluate whether you agree with the ML suggestions.
 If not, explain briefly and provide the corrected list of CPT codes.
 
 IMPORTANT CONSTRAINTS:
@@ -290,6 +287,12 @@ Example format:
   {{"code": "31652", "confidence": 0.85, "rationale": "EBUS-TBNA of 2 stations mentioned"}}
 ]
 
+ML predictions (CPT code: confidence):
+{ml_predictions}
+
+ML Classification: {difficulty}
+Reason for LLM Review: {reason_for_fallback}
+
 Procedure Note:
 {report_text}
 
@@ -398,12 +401,14 @@ Return ONLY the JSON array, no other text.
         if settings.enable_llm_cache:
             prompt_version = (os.getenv("LLM_PROMPT_VERSION") or "default").strip() or "default"
             cache_key = make_llm_cache_key(
+                provider=f"openai_compat:{self.base_url}",
                 model=model_name,
                 prompt=prompt,
                 prompt_version=prompt_version,
+                params={"temperature": 0.0},
             )
-            cached = get_llm_memory_cache().get(cache_key)
-            if isinstance(cached, str) and cached:
+            cached = get_llm_response_cache().get(cache_key)
+            if cached:
                 return cached
 
         payload: dict = {
@@ -482,7 +487,7 @@ Return ONLY the JSON array, no other text.
         content = msg.get("content", "") if isinstance(msg, dict) else ""
         content = content or ""
         if cache_key is not None and content:
-            get_llm_memory_cache().set(cache_key, content, ttl_s=3600)
+            get_llm_response_cache().set(cache_key, content)
         return content
 
     def _offline_suggestions(self) -> list[LLMCodeSuggestion]:
@@ -10,7 +10,8 @@ import json
 import os
 import re
 from pathlib import Path
-from typing import Optional, Set
+from types import MappingProxyType
+from typing import Mapping, Optional, Set
 
 from app.domain.knowledge_base.models import ProcedureInfo, NCCIPair
 from app.domain.knowledge_base.repository import KnowledgeBaseRepository
@@ -67,8 +68,10 @@ class JsonKnowledgeBaseAdapter(KnowledgeBaseRepository):
         self._raw_data_provided = raw_data is not None
         self._procedures: dict[str, ProcedureInfo] = {}
         self._ncci_pairs: dict[str, list[NCCIPair]] = {}
+        self._ncci_index: Mapping[str, tuple[NCCIPair, ...]] = MappingProxyType({})
         self._mer_groups: dict[str, str] = {}
         self._addon_codes: set[str] = set()
+        self._addon_lookup: frozenset[str] = frozenset()
         self._all_codes: set[str] = set()
         self._version: str = ""
 
@@ -114,6 +117,18 @@ class JsonKnowledgeBaseAdapter(KnowledgeBaseRepository):
         # Load procedure code metadata / RVUs (needs add-on metadata)
         self._load_procedures()
 
+        self._freeze_lookups()
+
+    def _freeze_lookups(self) -> None:
+        """Publish immutable per-code lookup tables used on the request path."""
+        self._ncci_index = MappingProxyType(
+            {code: tuple(pairs) for code, pairs in self._ncci_pairs.items()}
+        )
+        # Both bare and '+'-prefixed forms so is_addon_code is a single membership test.
+        self._addon_lookup = frozenset(
+            self._addon_codes | {f"+{code}" for code in self._addon_codes if not code.startswith("+")}
+        )
+
     def _load_procedures(self) -> None:
         """Load procedure information from master_code_index when present."""
         master_index = self._raw_data.get("master_code_index")
@@ -446,14 +461,13 @@ class JsonKnowledgeBaseAdapter(KnowledgeBaseRepository):
     def get_ncci_pairs(self, code: str) -> list[NCCIPair]:
         """Get all NCCI pairs where this code is involved."""
         normalized = self._normalize_code(code)
-        return self._ncci_pairs.get(normalized, [])
+        return list(self._ncci_index.get(normalized, ()))
 
     def is_addon_code(self, code: str) -> bool:
         """Check if a code is an add-on code."""
         if str(code).startswith("+"):
             return True
-        normalized = self._normalize_code(code)
-        return normalized in self._addon_codes or f"+{normalized}" in self._addon_codes
+        return f"+{self._normalize_code(code)}" in self._addon_lookup
 
     def get_all_codes(self) -> Set[str]:
         """Get all valid CPT codes in the knowledge base."""
@@ -47,20 +47,34 @@ Environment Variables:
 ----------------------
 - SUPABASE_URL: The Supabase project URL
 - SUPABASE_SERVICE_ROLE_KEY: The service role key for server-side access
+- SUPABASE_STORE_CACHE_TTL_S: Read-through cache TTL in seconds (default: 5, 0 disables)
+
+Caching:
+--------
+Reads go through a short-TTL, per-process cache keyed by ``proc_id``; every
+write through this store invalidates that procedure's entries. Writes made by
+other instances become visible after at most the TTL.
 
 Usage:
 ------
     store = SupabaseProcedureStore()  # Uses env vars
     # or
     store = SupabaseProcedureStore(url="...", key="...")
+
+    # Review screens: suggestions, result, reviews and final codes in one call
+    bundle = store.load_procedure_bundle(proc_id)
 """
 
 from __future__ import annotations
 
 import os
-from typing import Any
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
 
-from app.domain.procedure_store.repository import ProcedureStore
+from app.domain.procedure_store.repository import ProcedureBundle, ProcedureStore
 from app.common.exceptions import PersistenceError
 from proc_schemas.coding import CodeSuggestion, FinalCode, ReviewAction, CodingResult
 from observability.logging_config import get_logger
@@ -75,6 +89,69 @@ TABLE_REVIEWS = "procedure_code_reviews"
 TABLE_FINAL_CODES = "procedure_final_codes"
 TABLE_REGISTRY_EXPORTS = "procedure_registry_exports"
 
+# Namespace for deterministic suggestion row ids (see _suggestion_row_id)
+_SUGGESTION_ID_NAMESPACE = uuid.UUID("7c0b6a52-2f1e-4f57-9a43-5d2b8e7c1f10")
+
+# Concurrent table reads issued by load_procedure_bundle
+_BUNDLE_FETCH_WORKERS = 4
+
+_MISS = object()
+
+
+def _cache_ttl_s() -> float:
+    try:
+        return float(os.getenv("SUPABASE_STORE_CACHE_TTL_S", "5"))
+    except ValueError:
+        return 5.0
+
+
+class _ReadCache:
+    """Thread-safe TTL cache of per-procedure reads, keyed by (kind, proc_id)."""
+
+    def __init__(self, ttl_s: float, max_entries: int = 2048):
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._entries: dict[tuple[str, str], tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, proc_id: str) -> Any:
+        if self.ttl_s <= 0:
+            return _MISS
+        with self._lock:
+            entry = self._entries.get((kind, proc_id))
+            if entry is None:
+                return _MISS
+            if entry[0] < time.monotonic():
+                del self._entries[(kind, proc_id)]
+                return _MISS
+            return entry[1]
+
+    def put(self, kind: str, proc_id: str, value: Any) -> None:
+        if self.ttl_s <= 0:
+            return
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                now = time.monotonic()
+                self._entries = {k: v for k, v in self._entries.items() if v[0] >= now}
+                if len(self._entries) >= self.max_entries:
+                    self._entries.pop(next(iter(self._entries)))
+            self._entries[(kind, proc_id)] = (time.monotonic() + self.ttl_s, value)
+
+    def invalidate(self, proc_id: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == proc_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _suggestion_row_id(proc_id: str, suggestion: CodeSuggestion, index: int) -> str:
+    """Stable row id so re-saving a procedure's suggestions upserts in place."""
+    key = suggestion.suggestion_id or f"#{index}:{suggestion.code}"
+    return str(uuid.uuid5(_SUGGESTION_ID_NAMESPACE, f"{proc_id}\x1f{key}"))
+
 
 class SupabaseClient:
     """Thin wrapper around supabase-py client.
@@ -136,14 +213,40 @@ class SupabaseProcedureStore(ProcedureStore):
     Supabase's connection pooling.
     """
 
-    def __init__(self, url: str | None = None, key: str | None = None):
+    def __init__(
+        self,
+        url: str | None = None,
+        key: str | None = None,
+        cache_ttl_s: float | None = None,
+    ):
         """Initialize the Supabase procedure store.
 
         Args:
             url: Supabase project URL (optional, uses env var if not provided)
             key: Supabase service role key (optional, uses env var if not provided)
+            cache_ttl_s: Read cache TTL (optional, uses SUPABASE_STORE_CACHE_TTL_S)
         """
         self._supabase = SupabaseClient(url, key)
+        self._cache = _ReadCache(_cache_ttl_s() if cache_ttl_s is None else cache_ttl_s)
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    def _read(self, kind: str, proc_id: str, fetch: Callable[[str], Any]) -> Any:
+        """Read-through: serve *kind* for *proc_id* from the cache or *fetch* it."""
+        value = self._cache.get(kind, proc_id)
+        if value is _MISS:
+            value = fetch(proc_id)
+            self._cache.put(kind, proc_id, value)
+        return value
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=_BUNDLE_FETCH_WORKERS,
+                    thread_name_prefix="supabase-bundle",
+                )
+            return self._executor
 
     def _handle_error(self, operation: str, proc_id: str | None, error: Exception) -> None:
         """Convert Supabase errors to PersistenceError."""
@@ -161,8 +264,7 @@ class SupabaseProcedureStore(ProcedureStore):
     # ProcedureCodeSuggestionRepository
     # =========================================================================
 
-    def get_suggestions(self, proc_id: str) -> list[CodeSuggestion]:
-        """Get all code suggestions for a procedure."""
+    def _fetch_suggestions(self, proc_id: str) -> list[CodeSuggestion]:
         try:
             response = (
                 self._supabase.table(TABLE_SUGGESTIONS)
@@ -181,19 +283,35 @@ class SupabaseProcedureStore(ProcedureStore):
             self._handle_error("get_suggestions", proc_id, e)
             return []  # unreachable
 
+    def get_suggestions(self, proc_id: str) -> list[CodeSuggestion]:
+        """Get all code suggestions for a procedure."""
+        return list(self._read("suggestions", proc_id, self._fetch_suggestions))
+
     def save_suggestions(self, proc_id: str, suggestions: list[CodeSuggestion]) -> None:
-        """Save code suggestions for a procedure (replaces existing)."""
+        """Save code suggestions for a procedure (replaces existing).
+
+        Rows are upserted on a deterministic id, so readers never observe an
+        empty set mid-save. Rows left over from a previous, larger save are
+        pruned afterwards. The prune always runs: another instance may have
+        saved rows this process has never read.
+        """
         try:
-            # Delete existing suggestions for this procedure
-            self._supabase.table(TABLE_SUGGESTIONS).delete().eq("proc_id", proc_id).execute()
+            rows = [
+                {
+                    "id": _suggestion_row_id(proc_id, s, index),
+                    "proc_id": proc_id,
+                    "suggestion_json": s.model_dump(mode="json"),
+                }
+                for index, s in enumerate(suggestions)
+            ]
+            row_ids = [row["id"] for row in rows]
+            if rows:
+                self._supabase.table(TABLE_SUGGESTIONS).upsert(rows, on_conflict="id").execute()
 
-            # Insert new suggestions
-            if suggestions:
-                rows = [
-                    {"proc_id": proc_id, "suggestion_json": s.model_dump(mode="json")}
-                    for s in suggestions
-                ]
-                self._supabase.table(TABLE_SUGGESTIONS).insert(rows).execute()
+            prune = self._supabase.table(TABLE_SUGGESTIONS).delete().eq("proc_id", proc_id)
+            if row_ids:
+                prune = prune.not_.in_("id", row_ids)
+            prune.execute()
 
             logger.debug(
                 f"Saved {len(suggestions)} suggestions",
@@ -203,6 +321,9 @@ class SupabaseProcedureStore(ProcedureStore):
             raise
         except Exception as e:
             self._handle_error("save_suggestions", proc_id, e)
+        finally:
+            self._cache.invalidate(proc_id)
+        self._cache.put("suggestions", proc_id, list(suggestions))
 
     def delete_suggestions(self, proc_id: str) -> None:
         """Delete all suggestions for a procedure."""
@@ -212,6 +333,8 @@ class SupabaseProcedureStore(ProcedureStore):
             raise
         except Exception as e:
             self._handle_error("delete_suggestions", proc_id, e)
+        finally:
+            self._cache.invalidate(proc_id)
 
     def exists(self, proc_id: str) -> bool:
         """Check if suggestions exist for a procedure."""
@@ -234,8 +357,7 @@ class SupabaseProcedureStore(ProcedureStore):
     # ProcedureCodingResultRepository
     # =========================================================================
 
-    def get_result(self, proc_id: str) -> CodingResult | None:
-        """Get the coding result for a procedure."""
+    def _fetch_result(self, proc_id: str) -> CodingResult | None:
         try:
             response = (
                 self._supabase.table(TABLE_CODING_RESULTS)
@@ -253,6 +375,10 @@ class SupabaseProcedureStore(ProcedureStore):
             self._handle_error("get_result", proc_id, e)
             return None  # unreachable
 
+    def get_result(self, proc_id: str) -> CodingResult | None:
+        """Get the coding result for a procedure."""
+        return self._read("result", proc_id, self._fetch_result)
+
     def save_result(self, proc_id: str, result: CodingResult) -> None:
         """Save the coding result for a procedure (upsert)."""
         try:
@@ -270,6 +396,8 @@ class SupabaseProcedureStore(ProcedureStore):
             raise
         except Exception as e:
             self._handle_error("save_result", proc_id, e)
+        finally:
+            self._cache.invalidate(proc_id)
 
     def delete_result(self, proc_id: str) -> None:
         """Delete the coding result for a procedure."""
@@ -279,13 +407,14 @@ class SupabaseProcedureStore(ProcedureStore):
             raise
         except Exception as e:
             self._handle_error("delete_result", proc_id, e)
+        finally:
+            self._cache.invalidate(proc_id)
 
     # =========================================================================
     # ProcedureCodeReviewRepository
     # =========================================================================
 
-    def get_reviews(self, proc_id: str) -> list[ReviewAction]:
-        """Get all review actions for a procedure."""
+    def _fetch_reviews(self, proc_id: str) -> list[ReviewAction]:
         try:
             response = (
                 self._supabase.table(TABLE_REVIEWS)
@@ -304,6 +433,10 @@ class SupabaseProcedureStore(ProcedureStore):
             self._handle_error("get_reviews", proc_id, e)
             return []  # unreachable
 
+    def get_reviews(self, proc_id: str) -> list[ReviewAction]:
+        """Get all review actions for a procedure."""
+        return list(self._read("reviews", proc_id, self._fetch_reviews))
+
     def add_review(self, proc_id: str, review: ReviewAction) -> None:
         """Add a review action for a procedure."""
         try:
@@ -321,6 +454,8 @@ class SupabaseProcedureStore(ProcedureStore):
             raise
         except Exception as e:
             self._handle_error("add_review", proc_id, e)
+        finally:
+            self._cache.invalidate(proc_id)
 
     def delete_reviews(self, proc_id: str) -> None:
         """Delete all reviews for a procedure."""
@@ -330,13 +465,14 @@ class SupabaseProcedureStore(ProcedureStore):
             raise
         except Exception as e:
             self._handle_error("delete_reviews", proc_id, e)
+        finally:
+            self._cache.invalidate(proc_id)
 
     # =========================================================================
     # ProcedureFinalCodeRepository
     # =========================================================================
 
-    def get_final_codes(self, proc_id: str) -> list[FinalCode]:
-        """Get all final approved codes for a procedure."""
+    def _fetch_final_codes(self, proc_id: str) -> list[FinalCode]:
         try:
             response = (
                 self._supabase.table(TABLE_FINAL_CODES)
@@ -355,6 +491,10 @@ class SupabaseProcedureStore(ProcedureStore):
             self._handle_error("get_final_codes", proc_id, e)
             return []  # unreachable
 
+    def get_final_codes(self, proc_id: str) -> list[FinalCode]:
+        """Get all final approved codes for a procedure."""
+        return list(self._read("final_codes", proc_id, self._fetch_final_codes))
+
     def add_final_code(self, proc_id: str, final_code: FinalCode) -> None:
         """Add a final approved code for a procedure."""
         try:
@@ -373,6 +513,8 @@ class SupabaseProcedureStore(ProcedureStore):
             raise
         except Exception as e:
             self._handle_error("add_final_code", proc_id, e)
+        finally:
+            self._cache.invalidate(proc_id)
 
     def delete_final_codes(self, proc_id: str) -> None:
         """Delete all final codes for a procedure."""
@@ -382,13 +524,14 @@ class SupabaseProcedureStore(ProcedureStore):
             raise
         except Exception as e:
             self._handle_error("delete_final_codes", proc_id, e)
+        finally:
+            self._cache.invalidate(proc_id)
 
     # =========================================================================
     # ProcedureRegistryExportRepository
     # =========================================================================
 
-    def get_export(self, proc_id: str) -> dict[str, Any] | None:
-        """Get the registry export for a procedure."""
+    def _fetch_export(self, proc_id: str) -> dict[str, Any] | None:
         try:
             response = (
                 self._supabase.table(TABLE_REGISTRY_EXPORTS)
@@ -406,6 +549,10 @@ class SupabaseProcedureStore(ProcedureStore):
             self._handle_error("get_export", proc_id, e)
             return None  # unreachable
 
+    def get_export(self, proc_id: str) -> dict[str, Any] | None:
+        """Get the registry export for a procedure."""
+        return self._read("export", proc_id, self._fetch_export)
+
     def save_export(self, proc_id: str, export: dict[str, Any]) -> None:
         """Save a registry export for a procedure (upsert)."""
         try:
@@ -429,6 +576,8 @@ class SupabaseProcedureStore(ProcedureStore):
             raise
         except Exception as e:
             self._handle_error("save_export", proc_id, e)
+        finally:
+            self._cache.invalidate(proc_id)
 
     def delete_export(self, proc_id: str) -> None:
         """Delete the registry export for a procedure."""
@@ -438,6 +587,8 @@ class SupabaseProcedureStore(ProcedureStore):
             raise
         except Exception as e:
             self._handle_error("delete_export", proc_id, e)
+        finally:
+            self._cache.invalidate(proc_id)
 
     def export_exists(self, proc_id: str) -> bool:
         """Check if an export exists for a procedure."""
@@ -460,6 +611,41 @@ class SupabaseProcedureStore(ProcedureStore):
     # ProcedureStore composite methods
     # =========================================================================
 
+    def load_procedure_bundle(self, proc_id: str) -> ProcedureBundle:
+        """Load suggestions, result, reviews and final codes concurrently.
+
+        Cached parts are served locally; the rest are fetched in parallel over
+        the shared client, so a cold load costs one round-trip of latency
+        instead of four.
+        """
+        fetchers: dict[str, Callable[[str], Any]] = {
+            "suggestions": self._fetch_suggestions,
+            "result": self._fetch_result,
+            "reviews": self._fetch_reviews,
+            "final_codes": self._fetch_final_codes,
+        }
+        values = {kind: self._cache.get(kind, proc_id) for kind in fetchers}
+        missing = [kind for kind, value in values.items() if value is _MISS]
+        if len(missing) == 1:
+            values[missing[0]] = fetchers[missing[0]](proc_id)
+        elif missing:
+            # Create the client here; its lazy init is not safe to race.
+            _ = self._supabase.client
+            executor = self._get_executor()
+            futures = {kind: executor.submit(fetchers[kind], proc_id) for kind in missing}
+            for kind, future in futures.items():
+                values[kind] = future.result()
+        for kind in missing:
+            self._cache.put(kind, proc_id, values[kind])
+
+        return ProcedureBundle(
+            proc_id=proc_id,
+            suggestions=list(values["suggestions"]),
+            result=values["result"],
+            reviews=list(values["reviews"]),
+            final_codes=list(values["final_codes"]),
+        )
+
     def clear_all(self, proc_id: str | None = None) -> None:
         """Clear all data for a procedure or all procedures."""
         try:
@@ -489,6 +675,11 @@ class SupabaseProcedureStore(ProcedureStore):
             raise
         except Exception as e:
             self._handle_error("clear_all", proc_id, e)
+        finally:
+            if proc_id:
+                self._cache.invalidate(proc_id)
+            else:
+                self._cache.clear()
 
     # =========================================================================
     # Debug/inspection helpers
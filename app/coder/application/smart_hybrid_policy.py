@@ -10,14 +10,19 @@ Includes:
 
 from __future__ import annotations
 
+import contextvars
 import os
 import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set
 
 from config.settings import CoderSettings
 from app.common.logger import get_logger
+from observability.metrics import get_metrics_client
 from app.domain.knowledge_base.repository import KnowledgeBaseRepository
 from app.coder.adapters.nlp.keyword_mapping_loader import KeywordMappingRepository
 from app.coder.adapters.nlp.simple_negation_detector import SimpleNegationDetector
@@ -25,6 +30,31 @@ from ml.lib.ml_coder.thresholds import CaseDifficulty
 
 logger = get_logger("smart_hybrid_policy")
 
+SPECULATIVE_LLM_ENV_VAR = "CODER_SPECULATIVE_LLM"
+SPECULATIVE_LLM_WORKERS_ENV_VAR = "CODER_SPECULATIVE_LLM_WORKERS"
+
+_speculation_executor: ThreadPoolExecutor | None = None
+_speculation_executor_lock = threading.Lock()
+
+
+def _truthy_env(name: str) -> bool:
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes")
+
+
+def _get_speculation_executor() -> ThreadPoolExecutor:
+    """Shared pool for speculative advisor calls (they block on network I/O)."""
+    global _speculation_executor
+    with _speculation_executor_lock:
+        if _speculation_executor is None:
+            try:
+                workers = int(os.getenv(SPECULATIVE_LLM_WORKERS_ENV_VAR, "4"))
+            except ValueError:
+                workers = 4
+            _speculation_executor = ThreadPoolExecutor(
+                max_workers=max(1, workers), thread_name_prefix="hybrid-llm-spec"
+            )
+        return _speculation_executor
+
 
 class HybridDecision(str, Enum):
     """Decision outcomes from the hybrid merge process."""
@@ -350,6 +380,49 @@ class HybridCoderResult:
 OrchestratorResult = HybridCoderResult
 
 
+class _SpeculativeLLMCall:
+    """An advisor request started before rules validation has finished.
+
+    The request is keyed by the exact LLM context it was launched with; the
+    orchestrator only consumes it when the post-rules context is identical, so
+    speculation never changes what the advisor is asked.
+
+    The price is a second advisor call when rules validation fails (the
+    fallback reason becomes ``rule_conflict``). A request that was still
+    queued is cancelled. One that had already started runs to completion and
+    is billed, so it is reported as ``wasted_llm_call`` in the result metadata
+    and counted in ``hybrid_llm_speculation_wasted_calls_total``.
+    """
+
+    future: Future
+
+    def __init__(self, context: Dict[str, Any], started_at: float) -> None:
+        self.context = context
+        self.started_at = started_at
+        self.finished_at: Optional[float] = None
+
+    @classmethod
+    def launch(
+        cls, orchestrator: "SmartHybridOrchestrator", note_text: str, context: Dict[str, Any]
+    ) -> "_SpeculativeLLMCall":
+        # Built before submitting: a fast advisor may finish before submit() returns.
+        call = cls(dict(context), time.perf_counter())
+
+        def _run() -> List[str]:
+            try:
+                return orchestrator._call_llm_with_context(note_text, context)
+            finally:
+                call.finished_at = time.perf_counter()
+
+        # Carry request-scoped context (e.g. derived-text memo) into the worker.
+        call.future = _get_speculation_executor().submit(contextvars.copy_context().run, _run)
+        return call
+
+    def cancel(self) -> bool:
+        """Cancel if not yet running; a running request is abandoned and its result dropped."""
+        return self.future.cancel()
+
+
 class SmartHybridOrchestrator:
     """ML-first hybrid orchestrator with ternary case difficulty classification.
 
@@ -371,6 +444,8 @@ class SmartHybridOrchestrator:
         ml_predictor: Any,  # MLCoderPredictor
         rules_engine: Any,  # CodingRulesEngine
         llm_advisor: Any,  # LLMAdvisorPort
+        *,
+        speculative_llm: bool | None = None,
     ):
         """
         Initialize the orchestrator.
@@ -379,10 +454,17 @@ class SmartHybridOrchestrator:
             ml_predictor: MLCoderPredictor instance for ML predictions
             rules_engine: CodingRulesEngine instance for validation/veto
             llm_advisor: LLMAdvisorPort instance for LLM fallback
+            speculative_llm: Start the advisor call for GRAY_ZONE/LOW_CONF cases
+                while rules validation runs (default: CODER_SPECULATIVE_LLM env).
+                A rule conflict discards that call and asks again, so those
+                cases may cost two advisor calls.
         """
         self._ml = ml_predictor
         self._rules = rules_engine
         self._llm = llm_advisor
+        self._speculative_llm = (
+            _truthy_env(SPECULATIVE_LLM_ENV_VAR) if speculative_llm is None else speculative_llm
+        )
 
     def get_codes(self, note_text: str) -> HybridCoderResult:
         """
@@ -416,6 +498,17 @@ class SmartHybridOrchestrator:
             ml_candidates,
         )
 
+        # Non-HIGH_CONF cases always reach the LLM; optionally start it now so the
+        # request overlaps rules validation instead of following it.
+        speculative: Optional[_SpeculativeLLMCall] = None
+        if self._speculative_llm and difficulty != CaseDifficulty.HIGH_CONF.value:
+            speculative = _SpeculativeLLMCall.launch(
+                self,
+                note_text,
+                self._build_llm_context(ml_candidates, difficulty, None, preds),
+            )
+        rules_started_at = time.perf_counter()
+
         # 2. Try rules validation on ML candidates
         rules_cleaned_ml: List[str] = []
         rules_error: Optional[str] = None
@@ -442,6 +535,7 @@ class SmartHybridOrchestrator:
                     rules_error_type,
                     rules_error,
                 )
+        rules_finished_at = time.perf_counter()
 
         # 3. Decision gate
         if difficulty == CaseDifficulty.HIGH_CONF.value and rules_cleaned_ml:
@@ -470,26 +564,40 @@ class SmartHybridOrchestrator:
             )
 
         # 4. LLM fallback — LLM is the final judge
-        reason_for_fallback = "low_confidence"
-        if difficulty == CaseDifficulty.GRAY_ZONE.value:
-            reason_for_fallback = "gray_zone"
-        if rules_error:
-            reason_for_fallback = f"rule_conflict: {rules_error}"
+        llm_context = self._build_llm_context(ml_candidates, difficulty, rules_error, preds)
+        reason_for_fallback = llm_context["reason_for_fallback"]
 
         logger.info(
             "LLM fallback triggered: reason=%s",
             reason_for_fallback,
         )
 
-        # Build context for LLM
-        llm_context = {
-            "ml_suggestion": ml_candidates,
-            "difficulty": difficulty,
-            "reason_for_fallback": reason_for_fallback,
-            "ml_predictions": preds[:10],  # Top 10 predictions as context
-        }
-
-        llm_codes = self._call_llm_with_context(note_text, llm_context)
+        speculation: Optional[Dict[str, Any]] = None
+        if speculative is not None and speculative.context == llm_context:
+            llm_codes = speculative.future.result()
+            speculation = self._speculation_stats(
+                speculative, rules_started_at, rules_finished_at, used=True
+            )
+        else:
+            if speculative is not None:
+                # Rules changed the fallback reason, so the in-flight request asked
+                # the wrong question; drop it and ask again.
+                cancelled = speculative.cancel()
+                speculation = {
+                    "launched": True,
+                    "used": False,
+                    "cancelled": cancelled,
+                    # Already running: the provider completes (and bills) it anyway.
+                    "wasted_llm_call": not cancelled,
+                }
+                if not cancelled:
+                    logger.info(
+                        "Speculative LLM call discarded after it started (reason=%s)",
+                        reason_for_fallback,
+                    )
+            llm_codes = self._call_llm_with_context(note_text, llm_context)
+        if speculation is not None:
+            self._record_speculation(speculation, difficulty)
 
         if not llm_codes:
             fallback_codes = rules_cleaned_ml or candidates_for_rules or ml_candidates
@@ -504,6 +612,7 @@ class SmartHybridOrchestrator:
                 llm_raw_count=0,
                 rules_modified_llm=False,
                 fallback_reason=f"{reason_for_fallback} (llm_empty)",
+                speculation=speculation,
             )
             return HybridCoderResult(
                 codes=fallback_codes,
@@ -520,6 +629,7 @@ class SmartHybridOrchestrator:
                     "llm_raw_codes": [],
                     "reason_for_fallback": reason_for_fallback,
                     "rules_modified_llm": False,
+                    "llm_speculation": speculation,
                 },
             )
 
@@ -541,6 +651,7 @@ class SmartHybridOrchestrator:
             llm_raw_count=len(llm_codes),
             rules_modified_llm=rules_modified_llm,
             fallback_reason=reason_for_fallback,
+            speculation=speculation,
         )
 
         return HybridCoderResult(
@@ -557,9 +668,65 @@ class SmartHybridOrchestrator:
                 "llm_raw_codes": llm_codes,
                 "reason_for_fallback": reason_for_fallback,
                 "rules_modified_llm": rules_modified_llm,
+                "llm_speculation": speculation,
             },
         )
 
+    @staticmethod
+    def _build_llm_context(
+        ml_candidates: List[str],
+        difficulty: str,
+        rules_error: Optional[str],
+        preds: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build the advisor context (ML hints + why the LLM is being consulted)."""
+        reason_for_fallback = "low_confidence"
+        if difficulty == CaseDifficulty.GRAY_ZONE.value:
+            reason_for_fallback = "gray_zone"
+        if rules_error:
+            reason_for_fallback = f"rule_conflict: {rules_error}"
+
+        return {
+            "ml_suggestion": ml_candidates,
+            "difficulty": difficulty,
+            "reason_for_fallback": reason_for_fallback,
+            "ml_predictions": preds[:10],  # Top 10 predictions as context
+        }
+
+    @staticmethod
+    def _speculation_stats(
+        speculative: _SpeculativeLLMCall,
+        rules_started_at: float,
+        rules_finished_at: float,
+        *,
+        used: bool,
+    ) -> Dict[str, Any]:
+        """Compare the overlapped timeline with running rules then LLM back to back."""
+        llm_finished_at = speculative.finished_at or time.perf_counter()
+        rules_ms = (rules_finished_at - rules_started_at) * 1000
+        llm_ms = (llm_finished_at - speculative.started_at) * 1000
+        overlapped_ms = (max(rules_finished_at, llm_finished_at) - speculative.started_at) * 1000
+        return {
+            "launched": True,
+            "used": used,
+            "cancelled": False,
+            "wasted_llm_call": False,
+            "rules_ms": round(rules_ms, 2),
+            "llm_ms": round(llm_ms, 2),
+            "saved_ms": round(max(0.0, rules_ms + llm_ms - overlapped_ms), 2),
+        }
+
+    @staticmethod
+    def _record_speculation(speculation: Dict[str, Any], difficulty: str) -> None:
+        metrics = get_metrics_client()
+        outcome = "used" if speculation.get("used") else "discarded"
+        tags = {"difficulty": difficulty, "outcome": outcome}
+        metrics.incr("hybrid_llm_speculation_total", tags)
+        if speculation.get("wasted_llm_call"):
+            metrics.incr("hybrid_llm_speculation_wasted_calls_total", {"difficulty": difficulty})
+        if "saved_ms" in speculation:
+            metrics.timing("hybrid_llm_speculation_saved_ms", speculation["saved_ms"], tags)
+
     def _call_llm_with_context(
         self, note_text: str, context: Dict[str, Any]
     ) -> List[str]:
@@ -606,6 +773,7 @@ class SmartHybridOrchestrator:
         llm_raw_count: int = 0,
         rules_modified_llm: bool = False,
         fallback_reason: Optional[str] = None,
+        speculation: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Emit structured telemetry for monitoring and debugging.
@@ -624,6 +792,7 @@ class SmartHybridOrchestrator:
             llm_raw_count: Number of codes returned by LLM (before rules)
             rules_modified_llm: Whether rules modified LLM output
             fallback_reason: Why LLM fallback was triggered
+            speculation: Speculative advisor launch outcome and latency saved, if any
         """
         telemetry = {
             "event": "hybrid_orchestrator_decision",
@@ -638,6 +807,8 @@ class SmartHybridOrchestrator:
             telemetry["llm_raw_count"] = llm_raw_count
             telemetry["rules_modified_llm"] = rules_modified_llm
             telemetry["fallback_reason"] = fallback_reason
+            if speculation is not None:
+                telemetry["llm_speculation"] = speculation
 
         if rules_error:
             telemetry["rules_error"] = rules_error
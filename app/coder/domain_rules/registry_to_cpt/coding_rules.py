@@ -9,10 +9,12 @@ Rules here must accept ONLY RegistryRecord and must not parse raw note text.
 
 from __future__ import annotations
 
+import hashlib
 import re
 from datetime import date
 from typing import Any
 
+from app.infra.cache import MemoryCache
 from app.registry.quality_signals import make_quality_signal_warning
 from app.registry.schema import RegistryRecord
 
@@ -1909,12 +1911,13 @@ def _apply_ncci_hard_bundles(
     For modifier_allowed=false pairs, drop the lower-valued code (RVU-based tie-breaker)
     to guard against occasional primary/secondary ordering drift in KB data.
     """
-    from app.common.knowledge import ncci_pairs, total_rvu
+    from app.common.knowledge import ncci_pairs_involving, total_rvu
 
     active = list(codes)
     active_set = set(active)
 
-    for pair in ncci_pairs() or []:
+    # Pairs touching no active code can never fire; the index keeps KB order.
+    for pair in ncci_pairs_involving(active_set):
         if not isinstance(pair, dict):
             continue
         if bool(pair.get("modifier_allowed")):
@@ -1963,6 +1966,48 @@ def derive_all_codes(record: RegistryRecord) -> list[str]:
     return codes
 
 
+# Derivation is a pure function of the record and the KB (NCCI pairs/RVUs), so
+# results are memoized on a record fingerprint. Entries hold only codes and
+# rationales/warnings derived from structured fields, never note text.
+_derivation_cache = MemoryCache(max_size=512)
+
+
+def registry_record_fingerprint(record: RegistryRecord) -> str:
+    """Stable SHA256 of the record's JSON serialization."""
+
+    return hashlib.sha256(record.model_dump_json().encode("utf-8")).hexdigest()
+
+
+def derive_all_codes_with_meta_cached(
+    record: RegistryRecord,
+) -> tuple[list[str], dict[str, str], list[str]]:
+    """``derive_all_codes_with_meta`` memoized on (record fingerprint, KB hash).
+
+    The extraction-first pipeline derives codes for the final record inside
+    ``RegistryService`` and again when assembling the API response; the second
+    call is a cache hit. Callers get fresh containers they may mutate.
+    """
+
+    from app.common.knowledge import knowledge_hash
+
+    try:
+        key = f"{registry_record_fingerprint(record)}:{knowledge_hash() or ''}"
+    except Exception:  # noqa: BLE001 - unserializable record: derive uncached
+        return derive_all_codes_with_meta(record)
+
+    cached = _derivation_cache.get(key)
+    if cached is None:
+        codes, rationales, warnings = derive_all_codes_with_meta(record)
+        cached = (tuple(codes), dict(rationales), tuple(warnings))
+        _derivation_cache.set(key, cached)
+    codes, rationales, warnings = cached
+    return list(codes), dict(rationales), list(warnings)
+
+
+def clear_derivation_cache() -> None:
+    _derivation_cache.clear()
+
+
 def _ebus_elastography_target_count(record: RegistryRecord) -> int:
     linear = _proc(record, "linear_ebus")
     if linear is None:
@@ -2119,4 +2164,11 @@ def derive_units_for_codes(record: RegistryRecord, codes: list[str]) -> dict[str
     return units
 
 
-__all__ = ["derive_all_codes", "derive_all_codes_with_meta", "derive_units_for_codes"]
+__all__ = [
+    "clear_derivation_cache",
+    "derive_all_codes",
+    "derive_all_codes_with_meta",
+    "derive_all_codes_with_meta_cached",
+    "derive_units_for_codes",
+    "registry_record_fingerprint",
+]
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from app.coder.domain_rules.registry_to_cpt.coding_rules import derive_all_codes_with_meta
+from app.coder.domain_rules.registry_to_cpt.coding_rules import derive_all_codes_with_meta_cached
 from app.coder.domain_rules.registry_to_cpt.types import DerivedCode, RegistryCPTDerivation
 from app.registry.schema import RegistryRecord
 
 
 class RegistryToCPTDerivationEngine:
     def apply(self, record: RegistryRecord) -> RegistryCPTDerivation:
-        codes, rationales, warnings = derive_all_codes_with_meta(record)
+        codes, rationales, warnings = derive_all_codes_with_meta_cached(record)
 
         derived = [
             DerivedCode(
@@ -7,6 +7,7 @@ results with reconciliation and review flagging.
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import time
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Literal, Optional
@@ -508,9 +509,15 @@ class ParallelPathwayOrchestrator:
         start_time = time.time()
 
         # Run both pathways concurrently
+        # Each pathway runs in a copy of the caller's context so an active
+        # derived_text_scope (shared note tokenization) reaches both threads.
         loop = asyncio.get_event_loop()
-        path_a_task = loop.run_in_executor(None, self._run_path_a, note_text)
-        path_b_task = loop.run_in_executor(None, self._run_path_b, note_text, ml_predictor)
+        path_a_task = loop.run_in_executor(
+            None, contextvars.copy_context().run, self._run_path_a, note_text
+        )
+        path_b_task = loop.run_in_executor(
+            None, contextvars.copy_context().run, self._run_path_b, note_text, ml_predictor
+        )
 
         path_a_result, path_b_result = await asyncio.gather(path_a_task, path_b_task)
 
@@ -7,6 +7,8 @@ import re
 from dataclasses import dataclass
 from typing import List, Pattern, Tuple
 
+from app.common.derived_text import derived_text
+
 
 @dataclass
 class Section:
@@ -51,6 +53,7 @@ def max_llm_input_tokens() -> int:
         return 3000
 
 
+@derived_text("coder_sections", copy=list)
 def split_into_sections(text: str) -> List[Section]:
     if not text:
         return []
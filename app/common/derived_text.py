@@ -0,0 +1,128 @@
+"""Request-scoped memo for views derived from a note (masked, focused, sectioned).
+
+A single registry extraction masks, focuses and sectionizes the same note from
+several stages. Inside ``derived_text_scope()`` each transform runs once per
+distinct input text; later calls get the memoized result::
+
+    with derived_text_scope():
+        masked, meta = mask_extraction_noise(note)   # computed
+        ...
+        masked, meta = mask_extraction_noise(note)   # memo hit
+
+Outside a scope the transforms run uncached, so library callers and
+long-lived workers never hold on to note text. Scopes nest: an inner
+``derived_text_scope()`` reuses the active memo.
+
+The memo is keyed by ``(transform, text)``. ``str`` caches its hash, so a
+lookup on the same note object is a dict probe plus an identity check.
+"""
+
+from __future__ import annotations
+
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class DerivedTextContext:
+    """Memo of ``transform(text)`` results for one request."""
+
+    __slots__ = ("_memo", "hits", "misses")
+
+    def __init__(self) -> None:
+        self._memo: dict[tuple[Hashable, str], Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(
+        self,
+        transform: Hashable,
+        text: str,
+        compute: Callable[[str], T],
+        copy: Callable[[T], T] | None = None,
+    ) -> T:
+        key = (transform, text)
+        try:
+            value = self._memo[key]
+        except KeyError:
+            self.misses += 1
+            value = compute(text)
+            self._memo[key] = value
+        else:
+            self.hits += 1
+        # Hand out copies of mutable containers so one stage cannot edit another's view.
+        return copy(value) if copy is not None else value
+
+
+_CURRENT: ContextVar[DerivedTextContext | None] = ContextVar("derived_text_context", default=None)
+
+
+def current_derived_text_context() -> DerivedTextContext | None:
+    return _CURRENT.get()
+
+
+@contextmanager
+def derived_text_scope() -> Iterator[DerivedTextContext]:
+    """Activate a memo for the current request (reuses an already active one)."""
+    active = _CURRENT.get()
+    if active is not None:
+        yield active
+        return
+    context = DerivedTextContext()
+    token = _CURRENT.set(context)
+    try:
+        yield context
+    finally:
+        _CURRENT.reset(token)
+
+
+def derive(
+    transform: Hashable,
+    text: str,
+    compute: Callable[[str], T],
+    copy: Callable[[T], T] | None = None,
+) -> T:
+    """``compute(text)``, memoized under *transform* when a scope is active."""
+    context = _CURRENT.get()
+    if context is None or not isinstance(text, str):
+        return compute(text)
+    return context.get_or_compute(transform, text, compute, copy)
+
+
+def derived_text(
+    transform: str, *, copy: Callable[[Any], Any] | None = None
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorate a ``fn(text)`` transform so it is memoized inside a scope.
+
+    Calls with extra arguments bypass the memo (they are a different view).
+    """
+
+    def decorator(fn: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(fn)
+        def wrapper(text: str, *args: Any, **kwargs: Any) -> T:
+            if args or kwargs:
+                return fn(text, *args, **kwargs)
+            return derive(transform, text, fn, copy)
+
+        wrapper.uncached = fn  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def copy_text_and_meta(value: tuple[str, dict[str, Any]]) -> tuple[str, dict[str, Any]]:
+    text, meta = value
+    return text, dict(meta)
+
+
+__all__ = [
+    "DerivedTextContext",
+    "copy_text_and_meta",
+    "current_derived_text_context",
+    "derive",
+    "derived_text",
+    "derived_text_scope",
+]
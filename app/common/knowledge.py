@@ -11,7 +11,8 @@ import time
 from dataclasses import dataclass
 from pathlib import Path
 from threading import Lock, Thread
-from typing import Any, cast
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, cast
 
 from jsonschema import Draft7Validator
 
@@ -24,6 +25,8 @@ KNOWLEDGE_WATCH_ENV_VAR = "PSUITE_KNOWLEDGE_WATCH"
 KNOWLEDGE_ALLOW_VERSION_MISMATCH_ENV_VAR = "PSUITE_KNOWLEDGE_ALLOW_VERSION_MISMATCH"
 
 _WATCH_INTERVAL_SECONDS = 1.0
+# Lookup helpers (get_rvu, is_add_on_code, ...) re-check the file at most this often.
+_LOOKUP_REVALIDATE_SECONDS = 1.0
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +93,103 @@ class KnowledgeSnapshot:
     bundling_rules: list[str]
 
 
+@dataclass(frozen=True)
+class _LookupIndex:
+    """Immutable per-version lookup tables derived from the knowledge document.
+
+    Built once per (re)load and published with a single reference assignment so
+    readers always see one consistent KB version.
+    """
+
+    master_rvus: Mapping[str, tuple[float, float, float]]
+    legacy_rvus: Mapping[str, tuple[float, float, float]]
+    add_on_codes: frozenset[str]
+    ncci_pairs: tuple[dict[str, Any], ...]
+    ncci_positions_by_code: Mapping[str, tuple[int, ...]]
+    synonyms: Mapping[str, tuple[str, ...]]
+
+
+def _master_rvu_triple(entry: dict[str, Any]) -> tuple[float, float, float] | None:
+    simplified = entry.get("rvu_simplified")
+    if isinstance(simplified, dict):
+        return (
+            float(simplified.get("work", 0.0)),
+            float(simplified.get("pe", 0.0)),
+            float(simplified.get("mp", 0.0)),
+        )
+    financials = entry.get("financials")
+    if isinstance(financials, dict):
+        cms_2026 = financials.get("cms_pfs_2026")
+        if isinstance(cms_2026, dict):
+            work = cms_2026.get("work_rvu")
+            pe = cms_2026.get("facility_pe_rvu")
+            mp = cms_2026.get("mp_rvu")
+            if work is not None and pe is not None and mp is not None:
+                return float(work), float(pe), float(mp)
+    return None
+
+
+def _build_lookup_index(data: dict[str, Any]) -> _LookupIndex:
+    master_rvus: dict[str, tuple[float, float, float]] = {}
+    master = data.get("master_code_index")
+    if isinstance(master, dict):
+        for code, entry in master.items():
+            if not isinstance(code, str) or not isinstance(entry, dict):
+                continue
+            try:
+                triple = _master_rvu_triple(entry)
+            except (TypeError, ValueError):
+                logger.warning("Skipping non-numeric RVUs for %s in master_code_index", code)
+                continue
+            if triple is not None:
+                master_rvus[code] = triple
+
+    legacy_rvus: dict[str, tuple[float, float, float]] = {}
+    rvus = data.get("rvus", {})
+    if isinstance(rvus, dict):
+        for code, entry in rvus.items():
+            # Empty entries are skipped, matching the falsy fallthrough in get_rvu.
+            if isinstance(entry, dict) and entry:
+                legacy_rvus[code] = (
+                    float(entry.get("work", 0.0)),
+                    float(entry.get("pe", 0.0)),
+                    float(entry.get("mp", 0.0)),
+                )
+
+    pairs = tuple(data.get("ncci_pairs", []) or [])
+    positions: dict[str, list[int]] = {}
+    for position, pair in enumerate(pairs):
+        if not isinstance(pair, dict):
+            continue
+        for key in ("primary", "secondary"):
+            code = str(pair.get(key) or "").strip()
+            if code:
+                bucket = positions.setdefault(code, [])
+                if not bucket or bucket[-1] != position:
+                    bucket.append(position)
+
+    synonyms: dict[str, tuple[str, ...]] = {}
+    raw_synonyms = data.get("synonyms", {})
+    if isinstance(raw_synonyms, dict):
+        for key, values in raw_synonyms.items():
+            if isinstance(values, (list, dict)):
+                synonyms[key] = tuple(values)
+
+    return _LookupIndex(
+        master_rvus=MappingProxyType(master_rvus),
+        legacy_rvus=MappingProxyType(legacy_rvus),
+        add_on_codes=frozenset(data.get("add_on_codes", []) or []),
+        ncci_pairs=pairs,
+        ncci_positions_by_code=MappingProxyType(
+            {code: tuple(bucket) for code, bucket in positions.items()}
+        ),
+        synonyms=MappingProxyType(synonyms),
+    )
+
+
 _cache: dict[str, Any] | None = None
+_index: _LookupIndex | None = None
+_index_checked_at: float = 0.0
 _knowledge_path: Path | None = None
 _mtime: float | None = None
 _checksum: str | None = None
@@ -117,9 +216,10 @@ def get_knowledge(path: str | Path | None = None, *, force_reload: bool = False)
 def reset_cache() -> None:
     """Clear the cached knowledge data forcing a reload on next access."""
 
-    global _cache, _knowledge_path, _mtime, _checksum, _version
+    global _cache, _knowledge_path, _mtime, _checksum, _version, _index
     with _lock:
         _cache = None
+        _index = None
         _knowledge_path = None
         _mtime = None
         _checksum = None
@@ -129,62 +229,54 @@ def reset_cache() -> None:
 def knowledge_version() -> str | None:
     """Return the semantic version of the loaded knowledge file."""
 
-    get_knowledge()
+    _lookup_index()
     return _version
 
 
 def knowledge_hash() -> str | None:
     """Return the SHA256 hash of the current knowledge file contents."""
 
-    get_knowledge()
+    _lookup_index()
     return _checksum
 
 
+def _lookup_index() -> _LookupIndex:
+    """Return the current lookup index without a filesystem check on every call.
+
+    The KB file is re-validated (stat + reload on change) at most once per
+    ``_LOOKUP_REVALIDATE_SECONDS``; the watcher thread, when enabled, swaps in
+    a fresh index as soon as the file changes.
+    """
+
+    global _index_checked_at
+    index = _index
+    now = time.monotonic()
+    if index is not None and now - _index_checked_at < _LOOKUP_REVALIDATE_SECONDS:
+        return index
+    get_knowledge()
+    _index_checked_at = now
+    return _index if _index is not None else _build_lookup_index({})
+
+
 def get_rvu(cpt: str) -> dict[str, float] | None:
-    data = get_knowledge()
-    normalized = cpt.strip().lstrip("+")
+    index = _lookup_index()
 
     # Prefer the consolidated master index when present.
-    master = data.get("master_code_index")
-    if isinstance(master, dict):
-        entry = master.get(normalized)
-        if isinstance(entry, dict):
-            simplified = entry.get("rvu_simplified")
-            if isinstance(simplified, dict):
-                return {
-                    "work": float(simplified.get("work", 0.0)),
-                    "pe": float(simplified.get("pe", 0.0)),
-                    "mp": float(simplified.get("mp", 0.0)),
-                }
-
-            financials = entry.get("financials")
-            if isinstance(financials, dict):
-                cms_2026 = financials.get("cms_pfs_2026")
-                if isinstance(cms_2026, dict):
-                    work = cms_2026.get("work_rvu")
-                    pe = cms_2026.get("facility_pe_rvu")
-                    mp = cms_2026.get("mp_rvu")
-                    if work is not None and pe is not None and mp is not None:
-                        return {"work": float(work), "pe": float(pe), "mp": float(mp)}
+    triple = index.master_rvus.get(cpt.strip().lstrip("+"))
 
     # Legacy fallback: rvus map (some add-ons are stored with '+' prefixes).
-    rvus = data.get("rvus", {})
-    if not isinstance(rvus, dict):
+    if triple is None:
+        legacy = index.legacy_rvus
+        triple = legacy.get(cpt)
+        if triple is None and not cpt.startswith("+"):
+            triple = legacy.get(f"+{cpt}")
+        if triple is None and cpt.startswith("+"):
+            triple = legacy.get(cpt.lstrip("+"))
+    if triple is None:
         return None
 
-    entry = rvus.get(cpt)
-    if not entry and not cpt.startswith("+"):
-        entry = rvus.get(f"+{cpt}")
-    if not entry and cpt.startswith("+"):
-        entry = rvus.get(cpt.lstrip("+"))
-    if not isinstance(entry, dict):
-        return None
-
-    return {
-        "work": float(entry.get("work", 0.0)),
-        "pe": float(entry.get("pe", 0.0)),
-        "mp": float(entry.get("mp", 0.0)),
-    }
+    work, pe, mp = triple
+    return {"work": work, "pe": pe, "mp": mp}
 
 
 def total_rvu(cpt: str) -> float:
@@ -195,10 +287,9 @@ def total_rvu(cpt: str) -> float:
 
 
 def is_add_on_code(cpt: str) -> bool:
-    data = get_knowledge()
-    add_ons = set(data.get("add_on_codes", []))
     if cpt.startswith("+"):
         return True
+    add_ons = _lookup_index().add_on_codes
     if cpt in add_ons:
         return True
     return f"+{cpt}" in add_ons
@@ -212,9 +303,18 @@ def ncci_pairs() -> list[dict[str, Any]]:
     return cast(list[dict[str, Any]], get_knowledge().get("ncci_pairs", []))
 
 
+def ncci_pairs_involving(codes: Iterable[str]) -> list[dict[str, Any]]:
+    """Return NCCI pairs whose primary or secondary is in *codes*, in KB order."""
+
+    index = _lookup_index()
+    positions: set[int] = set()
+    for code in codes:
+        positions.update(index.ncci_positions_by_code.get(str(code).strip(), ()))
+    return [index.ncci_pairs[position] for position in sorted(positions)]
+
+
 def synonym_list(key: str) -> list[str]:
-    synonyms = cast(dict[str, list[str]], get_knowledge().get("synonyms", {}))
-    return list(synonyms.get(key, []))
+    return list(_lookup_index().synonyms.get(key, ()))
 
 
 def lobe_aliases() -> dict[str, list[str]]:
@@ -294,7 +394,9 @@ def _refresh_cache(target: Path, mtime: float | None = None) -> None:
     _validate_document(data)
     _validate_filename_semver_matches_version(data, target)
     resolved_mtime = mtime if mtime is not None else target.stat().st_mtime
-    global _cache, _knowledge_path, _mtime, _checksum, _version
+    index = _build_lookup_index(data)
+    global _cache, _knowledge_path, _mtime, _checksum, _version, _index
+    _index = index
     _cache = data
     _knowledge_path = target
     _mtime = resolved_mtime
@@ -358,6 +460,7 @@ __all__ = [
     "is_add_on_code",
     "bundling_rules",
     "ncci_pairs",
+    "ncci_pairs_involving",
     "synonym_list",
     "lobe_aliases",
     "station_aliases",
@@ -32,7 +32,7 @@ from app.common.openai_responses import (
     post_responses,
     ResponsesEndpointNotFound,
 )
-from app.infra.cache import get_llm_memory_cache
+from app.infra.cache import get_llm_response_cache
 from app.infra.llm_control import (
     backoff_seconds,
     llm_slot,
@@ -519,6 +519,7 @@ class OpenAILLM:
         response_schema: dict | None = None,
         *,
         task: str | None = None,
+        system_prompt: str | None = None,
         **kwargs,
     ) -> str:
         """Generate a response from OpenAI.
@@ -530,6 +531,8 @@ class OpenAILLM:
             prompt: The prompt text
             response_schema: Currently ignored (Gemini-only schema shape)
             task: Task identifier for timeout/capability selection
+            system_prompt: Stable instructions sent as the system/instructions
+                message ahead of ``prompt`` (eligible for provider prefix caching)
             **kwargs: Optional parameters (best-effort, capability-filtered)
         """
         if _truthy_env("OPENAI_OFFLINE") or not self.api_key:
@@ -546,12 +549,15 @@ class OpenAILLM:
             cacheable = temperature is None or float(temperature) == 0.0
             if cacheable:
                 cache_key = make_llm_cache_key(
+                    provider="openai",
                     model=self.model,
                     prompt=prompt,
                     prompt_version=prompt_version,
+                    params=kwargs,
+                    system_prompt=system_prompt,
                 )
-                cached = get_llm_memory_cache().get(cache_key)
-                if isinstance(cached, str) and cached:
+                cached = get_llm_response_cache().get(cache_key)
+                if cached:
                     return cached
 
         task_key = task if task is not None else self.task
@@ -562,23 +568,29 @@ class OpenAILLM:
         # Use Responses API for first-party OpenAI when configured
         if primary_api == "responses" and self._is_openai_endpoint():
             try:
-                response_text, usage = self._generate_via_responses(prompt, task=task_key, **kwargs)
+                response_text, usage = self._generate_via_responses(
+                    prompt, task=task_key, system_prompt=system_prompt, **kwargs
+                )
             except ResponsesEndpointNotFound:
                 if is_fallback_enabled():
                     logger.info(
                         "Responses API not available; falling back to Chat Completions model=%s",
                         self.model,
                     )
-                    response_text, usage = self._generate_via_chat(prompt, task=task_key, **kwargs)
+                    response_text, usage = self._generate_via_chat(
+                        prompt, task=task_key, system_prompt=system_prompt, **kwargs
+                    )
                 else:
                     raise
 
         else:
             # Use Chat Completions for compat endpoints or when configured
-            response_text, usage = self._generate_via_chat(prompt, task=task_key, **kwargs)
+            response_text, usage = self._generate_via_chat(
+                prompt, task=task_key, system_prompt=system_prompt, **kwargs
+            )
 
         if cache_key is not None and response_text:
-            get_llm_memory_cache().set(cache_key, response_text, ttl_s=3600)
+            get_llm_response_cache().set(cache_key, response_text)
 
         # Best-effort usage reporting (tokens are present only when upstream includes them)
         if isinstance(usage, dict):
@@ -611,6 +623,7 @@ class OpenAILLM:
         prompt: str,
         *,
         task: str | None = None,
+        system_prompt: str | None = None,
         **kwargs,
     ) -> tuple[str, dict[str, Any]]:
         """Generate using Responses API (POST /v1/responses)."""
@@ -633,6 +646,7 @@ class OpenAILLM:
             wants_json=True,
             task=task,
             extra=extra,
+            instructions=system_prompt,
         )
 
         # Apply capability filtering for responses API
@@ -671,6 +685,7 @@ class OpenAILLM:
         prompt: str,
         *,
         task: str | None = None,
+        system_prompt: str | None = None,
         **kwargs,
     ) -> tuple[str, dict[str, Any]]:
         """Generate using Chat Completions API (POST /v1/chat/completions)."""
@@ -681,9 +696,13 @@ class OpenAILLM:
         wants_json = True
         outgoing_prompt = _prepend_json_object_instruction(prompt) if is_gpt5(self.model) and wants_json else prompt
 
+        messages: list[dict[str, str]] = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": outgoing_prompt})
         payload: dict[str, Any] = {
             "model": self.model,
-            "messages": [{"role": "user", "content": outgoing_prompt}],
+            "messages": messages,
         }
 
         # Prefer native structured outputs where supported; GPT-5 rejects response_format.
@@ -882,6 +901,7 @@ class GeminiLLM:
         temperature: float | None = None,
         task: str | None = None,
         prompt_version: str | None = None,
+        system_prompt: str | None = None,
     ) -> str:
         settings = get_infra_settings()
         deadline = time.monotonic() + float(settings.llm_timeout_s)
@@ -892,12 +912,15 @@ class GeminiLLM:
             cacheable = temperature is None or float(temperature) == 0.0
             if cacheable:
                 cache_key = make_llm_cache_key(
+                    provider="gemini",
                     model=self.model,
                     prompt=prompt,
                     prompt_version=prompt_version_value,
+                    params={"temperature": temperature, "response_schema": response_schema},
+                    system_prompt=system_prompt,
                 )
-                cached = get_llm_memory_cache().get(cache_key)
-                if isinstance(cached, str) and cached:
+                cached = get_llm_response_cache().get(cache_key)
+                if cached:
                     return cached
 
         if self.use_oauth:
@@ -924,6 +947,9 @@ class GeminiLLM:
             "contents": [{"parts": [{"text": prompt}]}],
             "generationConfig": generation_config
         }
+        if system_prompt:
+            # Stable leading prefix: eligible for Gemini implicit context caching.
+            payload["systemInstruction"] = {"parts": [{"text": system_prompt}]}
 
         # Retry logic with exponential backoff
         last_error = None
@@ -960,7 +986,7 @@ class GeminiLLM:
 
                     text = candidates[0].get("content", {}).get("parts", [{}])[0].get("text", "")
                     if cache_key is not None and text:
-                        get_llm_memory_cache().set(cache_key, text, ttl_s=3600)
+                        get_llm_response_cache().set(cache_key, text)
                     return text
             except httpx.RequestError as e:
                 last_error = e
@@ -1082,11 +1108,9 @@ class LLMService:
         response_model: type[TModel],
         temperature: float = 0.0,
     ) -> TModel:
-        prompt = f"{system_prompt.strip()}\n\n{user_prompt.strip()}\n"
-
         # Prefer prompt-only enforcement for now; Gemini response_schema requires a
         # provider-specific schema shape (see LLMDetailedExtractor for conversion).
-        raw = self._generate(prompt, temperature=temperature)
+        raw = self._generate(system_prompt.strip(), user_prompt.strip(), temperature=temperature)
         cleaned = _strip_markdown_code_fences(raw)
 
         if cleaned.strip() in {"null", "None", ""}:
@@ -1095,11 +1119,17 @@ class LLMService:
         data = json.loads(cleaned)
         return response_model.model_validate(data)
 
-    def _generate(self, prompt: str, *, temperature: float) -> str:
+    def _generate(self, system_prompt: str, user_prompt: str, *, temperature: float) -> str:
         llm = self._llm
+        # The real clients send the system prompt as a separate leading message so
+        # the provider can reuse its cached prefix across notes.
         if isinstance(llm, GeminiLLM):
-            return llm.generate(prompt, temperature=temperature)
-        return llm.generate(prompt)
+            return llm.generate(
+                f"{user_prompt}\n", temperature=temperature, system_prompt=system_prompt
+            )
+        if isinstance(llm, OpenAILLM):
+            return llm.generate(f"{user_prompt}\n", system_prompt=system_prompt)
+        return llm.generate(f"{system_prompt}\n\n{user_prompt}\n")
 
 
 def _strip_markdown_code_fences(text: str) -> str:
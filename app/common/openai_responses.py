@@ -59,6 +59,7 @@ def build_responses_payload(
     wants_json: bool = True,
     task: str | None = None,
     extra: dict[str, Any] | None = None,
+    instructions: str | None = None,
 ) -> dict[str, Any]:
     """Build a payload for the Responses API.
 
@@ -68,6 +69,8 @@ def build_responses_payload(
         wants_json: Whether JSON output is desired
         task: Task identifier for capability/timeout selection
         extra: Additional parameters to include (capability-filtered)
+        instructions: Stable system prompt, sent ahead of the input so the
+            provider can reuse its cached prefix
 
     Returns:
         A dict suitable for POST /v1/responses
@@ -83,6 +86,8 @@ def build_responses_payload(
         "model": model,
         "input": outgoing_prompt,
     }
+    if instructions:
+        payload["instructions"] = instructions
 
     # Merge extra params if provided
     if extra:
@@ -7,6 +7,8 @@ import re
 from dataclasses import dataclass
 from typing import Any, Iterable, Sequence, TYPE_CHECKING
 
+from app.common.derived_text import derive
+
 if TYPE_CHECKING:  # pragma: no cover
     from spacy.language import Language
 else:  # pragma: no cover - runtime type alias
@@ -76,6 +78,11 @@ class SectionizerService:
     def sectionize(self, text: str) -> list[Section]:
         """Split *text* into logical sections."""
 
+        # Same headings + backend => same sections, whichever instance asks.
+        transform = ("sectionize", self.headings, self._sectionizer is not None)
+        return derive(transform, text, self._sectionize, copy=list)
+
+    def _sectionize(self, text: str) -> list[Section]:
         if self._sectionizer and self._nlp:  # pragma: no branch - runtime guard
             try:
                 doc = self._sectionizer(self._nlp(text))
@@ -0,0 +1,230 @@
+"""Request-scoped tokenization shared by the transformer predictors.
+
+``ONNXRegistryPredictor`` (via ``HeadTailTokenizer``) and
+``GranularNERPredictor`` each run a fast tokenizer over the full note.
+``tokenize_note`` tokenizes a note once per tokenizer fingerprint inside a
+``derived_text_scope`` and returns ids plus character offsets, without
+special tokens. Each predictor then applies its own truncation and special
+tokens. Tokenizers loaded from the same vocabulary/normalizer/pre-tokenizer
+share a fingerprint, so one model family tokenizes a note once per request.
+
+Outside a scope nothing is cached (see ``app.common.derived_text``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from app.common.derived_text import derive
+from app.common.logger import get_logger
+
+logger = get_logger("common.tokenization_cache")
+
+# Checked once per tokenizer: rebuilding the truncated encoding from cached
+# ids must match a direct tokenizer call on this text.
+_PROBE_TEXT = "Flexible bronchoscopy: EBUS-TBNA of stations 4R, 7 and 11L (x3 passes each)."
+
+
+@dataclass(frozen=True)
+class TokenizedText:
+    """Token ids and ``(start, end)`` character offsets, without special tokens."""
+
+    ids: np.ndarray
+    offsets: np.ndarray | None  # None for slow (Python) tokenizers
+
+
+@dataclass(frozen=True)
+class _SpecialLayout:
+    """Special tokens a tokenizer wraps around a single sequence (e.g. [CLS] ... [SEP])."""
+
+    prefix_ids: tuple[int, ...]
+    suffix_ids: tuple[int, ...]
+    prefix_offsets: tuple[tuple[int, int], ...]
+    suffix_offsets: tuple[tuple[int, int], ...]
+    input_names: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class _TokenizerInfo:
+    fingerprint: str
+    layout: _SpecialLayout | None  # None: rebuild unsupported, tokenize directly
+
+
+_infos: "weakref.WeakKeyDictionary[Any, _TokenizerInfo]" = weakref.WeakKeyDictionary()
+_infos_lock = threading.Lock()
+
+
+def _compute_fingerprint(tokenizer: Any) -> str:
+    backend = getattr(tokenizer, "backend_tokenizer", None)
+    if backend is not None:
+        # Full tokenizer.json: vocab, merges, normalizer, pre-tokenizer.
+        payload = backend.to_str()
+    else:
+        payload = "|".join(
+            [
+                type(tokenizer).__qualname__,
+                str(getattr(tokenizer, "name_or_path", "")),
+                str(len(tokenizer)),
+            ]
+        )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _info(tokenizer: Any) -> _TokenizerInfo:
+    try:
+        return _infos[tokenizer]
+    except (KeyError, TypeError):
+        pass
+    info = _TokenizerInfo(
+        fingerprint=_compute_fingerprint(tokenizer),
+        layout=_special_layout(tokenizer),
+    )
+    with _infos_lock:
+        try:
+            _infos[tokenizer] = info
+        except TypeError:  # not weak-referenceable: recompute next time
+            pass
+    return info
+
+
+def tokenizer_fingerprint(tokenizer: Any) -> str:
+    return _info(tokenizer).fingerprint
+
+
+def _tokenize(tokenizer: Any, text: str) -> TokenizedText:
+    is_fast = bool(getattr(tokenizer, "is_fast", False))
+    encoding = tokenizer(
+        text,
+        add_special_tokens=False,
+        truncation=False,
+        return_offsets_mapping=is_fast,
+        return_attention_mask=False,
+    )
+    ids = np.asarray(encoding["input_ids"], dtype=np.int64)
+    ids.setflags(write=False)
+    offsets = None
+    if is_fast:
+        offsets = np.asarray(encoding["offset_mapping"], dtype=np.int64).reshape(-1, 2)
+        offsets.setflags(write=False)
+    return TokenizedText(ids=ids, offsets=offsets)
+
+
+def tokenize_note(tokenizer: Any, text: str) -> TokenizedText:
+    """Tokenize *text* without special tokens or truncation (memoized per request)."""
+
+    fingerprint = tokenizer_fingerprint(tokenizer)
+    return derive(("tokenize", fingerprint), text, lambda value: _tokenize(tokenizer, value))
+
+
+def _rebuild(
+    layout: _SpecialLayout, tokenized: TokenizedText, max_length: int, left: bool
+) -> dict[str, np.ndarray]:
+    budget = max(0, max_length - len(layout.prefix_ids) - len(layout.suffix_ids))
+    total = len(tokenized.ids)
+    window = slice(max(0, total - budget), total) if left else slice(0, budget)
+
+    input_ids = np.concatenate(
+        [
+            np.asarray(layout.prefix_ids, dtype=np.int64),
+            tokenized.ids[window],
+            np.asarray(layout.suffix_ids, dtype=np.int64),
+        ]
+    )
+    offsets = np.concatenate(
+        [
+            np.asarray(layout.prefix_offsets, dtype=np.int64).reshape(-1, 2),
+            tokenized.offsets[window],
+            np.asarray(layout.suffix_offsets, dtype=np.int64).reshape(-1, 2),
+        ]
+    )
+    length = len(input_ids)
+    encoding = {
+        "input_ids": input_ids[np.newaxis, :],
+        "offset_mapping": offsets[np.newaxis, :, :],
+    }
+    if "attention_mask" in layout.input_names:
+        encoding["attention_mask"] = np.ones((1, length), dtype=np.int64)
+    if "token_type_ids" in layout.input_names:
+        encoding["token_type_ids"] = np.zeros((1, length), dtype=np.int64)
+    return encoding
+
+
+def _direct(tokenizer: Any, text: str, max_length: int) -> dict[str, np.ndarray]:
+    encoding = tokenizer(
+        text,
+        truncation=True,
+        max_length=max_length,
+        return_offsets_mapping=True,
+        return_tensors="np",
+    )
+    return {name: np.asarray(value) for name, value in encoding.items()}
+
+
+def _special_layout(tokenizer: Any) -> _SpecialLayout | None:
+    """Learn the special-token wrapping from a probe and check the rebuild reproduces it."""
+
+    if not getattr(tokenizer, "is_fast", False):
+        return None
+    try:
+        content = _tokenize(tokenizer, _PROBE_TEXT).ids.tolist()
+        full = _direct(tokenizer, _PROBE_TEXT, 512)
+        full_ids = full["input_ids"][0].tolist()
+        full_offsets = [tuple(pair) for pair in full["offset_mapping"][0].tolist()]
+        prefix_len = next(
+            (
+                i
+                for i in range(len(full_ids) - len(content) + 1)
+                if full_ids[i : i + len(content)] == content
+            ),
+            None,
+        )
+        if prefix_len is None:
+            raise ValueError("special tokens do not wrap the plain tokenization")
+        suffix_start = prefix_len + len(content)
+        layout = _SpecialLayout(
+            prefix_ids=tuple(full_ids[:prefix_len]),
+            suffix_ids=tuple(full_ids[suffix_start:]),
+            prefix_offsets=tuple(full_offsets[:prefix_len]),
+            suffix_offsets=tuple(full_offsets[suffix_start:]),
+            input_names=tuple(name for name in full if name != "offset_mapping"),
+        )
+        left = getattr(tokenizer, "truncation_side", "right") == "left"
+        # A short max_length also exercises truncation.
+        for max_length in (512, len(layout.prefix_ids) + len(layout.suffix_ids) + 3):
+            rebuilt = _rebuild(layout, _tokenize(tokenizer, _PROBE_TEXT), max_length, left)
+            direct = _direct(tokenizer, _PROBE_TEXT, max_length)
+            if set(rebuilt) != set(direct) or any(
+                not np.array_equal(rebuilt[name], direct[name]) for name in direct
+            ):
+                raise ValueError("rebuilt encoding differs from direct tokenization")
+    except Exception as exc:  # noqa: BLE001 - fall back to direct tokenization
+        logger.info("Shared tokenization disabled for %s: %s", type(tokenizer).__name__, exc)
+        return None
+    return layout
+
+
+def encode_with_offsets(tokenizer: Any, text: str, max_length: int) -> dict[str, np.ndarray]:
+    """``tokenizer(text, truncation=True, max_length=..., return_offsets_mapping=True,
+    return_tensors="np")``, built from the shared per-request tokenization when the
+    tokenizer supports it.
+    """
+
+    layout = _info(tokenizer).layout
+    if layout is None:
+        return _direct(tokenizer, text, max_length)
+    left = getattr(tokenizer, "truncation_side", "right") == "left"
+    return _rebuild(layout, tokenize_note(tokenizer, text), max_length, left)
+
+
+__all__ = [
+    "TokenizedText",
+    "encode_with_offsets",
+    "tokenize_note",
+    "tokenizer_fingerprint",
+]
@@ -10,6 +10,7 @@ The interfaces follow the Repository pattern from DDD.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from typing import Any
 
 from proc_schemas.coding import CodeSuggestion, FinalCode, ReviewAction, CodingResult
@@ -220,6 +221,17 @@ class ProcedureRegistryExportRepository(ABC):
         ...
 
 
+@dataclass
+class ProcedureBundle:
+    """Everything the review UI shows for one procedure, loaded together."""
+
+    proc_id: str
+    suggestions: list[CodeSuggestion] = field(default_factory=list)
+    result: CodingResult | None = None
+    reviews: list[ReviewAction] = field(default_factory=list)
+    final_codes: list[FinalCode] = field(default_factory=list)
+
+
 class ProcedureStore(
     ProcedureCodeSuggestionRepository,
     ProcedureCodingResultRepository,
@@ -243,3 +255,23 @@ class ProcedureStore(
                      If None, clear all procedure data.
         """
         ...
+
+    def load_procedure_bundle(self, proc_id: str) -> ProcedureBundle:
+        """Load suggestions, result, reviews and final codes for a procedure.
+
+        The default implementation calls the individual getters; remote
+        backends override it to fetch everything in one round-trip.
+
+        Args:
+            proc_id: Procedure identifier
+
+        Returns:
+            ProcedureBundle (empty lists / None result if nothing is stored)
+        """
+        return ProcedureBundle(
+            proc_id=proc_id,
+            suggestions=self.get_suggestions(proc_id),
+            result=self.get_result(proc_id),
+            reviews=self.get_reviews(proc_id),
+            final_codes=self.get_final_codes(proc_id),
+        )
@@ -2,18 +2,31 @@
 
 This module is intentionally lightweight and thread-safe. Callers should ensure
 cache keys never include raw note text (hash keys instead).
+
+``SQLiteCache`` persists entries in a local SQLite file. The LLM response
+cache (``get_llm_response_cache``) puts it behind the in-memory LRU when
+``LLM_CACHE_PATH`` is set, so reprocessing a corpus after a rules-only change
+replays identical LLM calls from disk instead of re-billing them. Cached
+responses may quote (scrubbed) note text: the file is created owner-only and
+the persistent tier is opt-in.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
+import sqlite3
 import threading
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
+from app.infra.settings import get_infra_settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -94,6 +107,173 @@ class RedisCache:
             self._client.set(key, payload)
 
 
+class SQLiteCache:
+    """Persistent JSON key/value cache in a local SQLite file.
+
+    Bounded by entry count and total value bytes (enforced every
+    ``_PRUNE_EVERY`` writes); the least recently used entries are evicted first. Safe to share between threads and between
+    worker processes pointing at the same file (WAL + busy timeout).
+    """
+
+    _PRUNE_EVERY = 64
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_entries: int = 50_000,
+        max_bytes: int = 256 * 1024 * 1024,
+        busy_timeout_ms: int = 5000,
+    ) -> None:
+        self._path = Path(path)
+        self._max_entries = max(1, int(max_entries))
+        self._max_bytes = max(1, int(max_bytes))
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # Create owner-only before sqlite opens it.
+        os.close(os.open(self._path, os.O_CREAT | os.O_RDWR, 0o600))
+        self._conn = sqlite3.connect(
+            str(self._path),
+            timeout=max(0, busy_timeout_ms) / 1000.0,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_cache_entries_accessed ON cache_entries (accessed_at)"
+        )
+
+    def get(self, key: str) -> Any | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            raw, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                "UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    def set(self, key: str, value: Any, *, ttl_s: float | None = None) -> None:
+        now = time.time()
+        expires_at = now + float(ttl_s) if ttl_s is not None and ttl_s > 0 else None
+        raw = json.dumps(value, ensure_ascii=False)
+        size = len(raw.encode("utf-8"))
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, size, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, raw, size, expires_at, now),
+            )
+            self._writes += 1
+            if self._writes % self._PRUNE_EVERY == 0:
+                self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        self._conn.execute(
+            "DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+        )
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries"
+        ).fetchone()
+        if count <= self._max_entries and total <= self._max_bytes:
+            return
+        # Walk from least recently used and drop entries until both limits hold.
+        drop_count = max(0, count - self._max_entries)
+        drop_bytes = max(0, total - self._max_bytes)
+        victims: list[str] = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM cache_entries ORDER BY accessed_at"
+        ):
+            if drop_count <= 0 and drop_bytes <= 0:
+                break
+            victims.append(key)
+            drop_count -= 1
+            drop_bytes -= size
+        self._conn.executemany("DELETE FROM cache_entries WHERE key = ?", [(k,) for k in victims])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class LLMResponseCache:
+    """In-memory LRU in front of an optional persistent ``SQLiteCache``.
+
+    TTLs come from ``InfraSettings``: memory entries expire after
+    ``llm_cache_ttl_s``; disk entries after ``llm_cache_disk_ttl_s``.
+    """
+
+    def __init__(
+        self,
+        memory: MemoryCache,
+        disk: SQLiteCache | None = None,
+        *,
+        memory_ttl_s: float | None = 3600.0,
+        disk_ttl_s: float | None = None,
+    ) -> None:
+        self.memory = memory
+        self.disk = disk
+        self._memory_ttl_s = memory_ttl_s
+        self._disk_ttl_s = disk_ttl_s
+
+    def get(self, key: str) -> str | None:
+        cached = self.memory.get(key)
+        if isinstance(cached, str) and cached:
+            return cached
+        if self.disk is None:
+            return None
+        try:
+            cached = self.disk.get(key)
+        except sqlite3.Error as exc:
+            logger.warning("LLM disk cache read failed: %s", exc)
+            return None
+        if not isinstance(cached, str) or not cached:
+            return None
+        self.memory.set(key, cached, ttl_s=self._memory_ttl_s)
+        return cached
+
+    def set(self, key: str, value: str) -> None:
+        if not value:
+            return
+        self.memory.set(key, value, ttl_s=self._memory_ttl_s)
+        if self.disk is None:
+            return
+        try:
+            self.disk.set(key, value, ttl_s=self._disk_ttl_s)
+        except sqlite3.Error as exc:
+            logger.warning("LLM disk cache write failed: %s", exc)
+
+
 _llm_memory_cache = MemoryCache(max_size=1024)
 _ml_memory_cache = MemoryCache(max_size=2048)
 
@@ -106,9 +286,36 @@ def get_ml_memory_cache() -> MemoryCache:
     return _ml_memory_cache
 
 
+@lru_cache(maxsize=1)
+def get_llm_response_cache() -> LLMResponseCache:
+    """Response cache used by the LLM clients when ``ENABLE_LLM_CACHE`` is on."""
+    settings = get_infra_settings()
+    disk: SQLiteCache | None = None
+    if settings.llm_cache_path:
+        try:
+            disk = SQLiteCache(
+                settings.llm_cache_path,
+                max_entries=settings.llm_cache_max_entries,
+                max_bytes=settings.llm_cache_max_mb * 1024 * 1024,
+                busy_timeout_ms=settings.sqlite_busy_timeout_ms,
+            )
+            logger.info("LLM disk cache enabled at %s", settings.llm_cache_path)
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("LLM disk cache unavailable (%s); using memory only", exc)
+    return LLMResponseCache(
+        _llm_memory_cache,
+        disk,
+        memory_ttl_s=settings.llm_cache_ttl_s,
+        disk_ttl_s=settings.llm_cache_disk_ttl_s,
+    )
+
+
 __all__ = [
+    "LLMResponseCache",
     "MemoryCache",
     "RedisCache",
+    "SQLiteCache",
     "get_llm_memory_cache",
+    "get_llm_response_cache",
     "get_ml_memory_cache",
 ]
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import random
 import threading
 import time
 from contextlib import contextmanager
 from functools import lru_cache
-from typing import Mapping
+from typing import Any, Mapping
 
 from app.infra.settings import get_infra_settings
 
@@ -29,9 +30,28 @@ def llm_slot() -> None:
         sem.release()
 
 
-def make_llm_cache_key(*, model: str, prompt: str, prompt_version: str) -> str:
-    payload = f"{model}\n{prompt_version}\n{prompt}"
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+def make_llm_cache_key(
+    *,
+    model: str,
+    prompt: str,
+    prompt_version: str,
+    provider: str = "",
+    params: Mapping[str, Any] | None = None,
+    system_prompt: str | None = None,
+) -> str:
+    """Hash of everything that determines an LLM response (never stores the prompt)."""
+    params_json = json.dumps(
+        {key: value for key, value in (params or {}).items() if value is not None},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    digest = hashlib.sha256()
+    for part in (provider, model, prompt_version, params_json, system_prompt or ""):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(prompt.encode("utf-8"))
+    return digest.hexdigest()
 
 
 def parse_retry_after_seconds(headers: Mapping[str, str]) -> float | None:
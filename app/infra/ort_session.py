@@ -0,0 +1,322 @@
+"""ONNX Runtime session construction from an ``OrtSessionProfile``.
+
+``create_inference_session`` applies the profile (thread pools, execution
+mode, graph optimization level, spinning). With ``ORT_OPTIMIZED_MODEL_DIR``
+set it also caches the optimized graph on disk. The first process to load a
+model writes ``<ORT_OPTIMIZED_MODEL_DIR>/<stem>.<key>.onnx``. Later workers and
+restarts load that file with optimizations disabled, which skips the graph
+transforms. The key covers the source model (path, size, mtime), the
+optimization level, the ORT version, the execution providers, and the CPU
+architecture and feature flags (graphs optimized at ``all`` are specific to
+the instruction set).
+
+A cached graph is executed as-is, so the directory must be private: it is
+created with mode 0700, and a directory or file that is not owned by this
+user, or that group/other can write to, disables the cache.
+
+``FixedShapeIOBinding`` binds per-thread, preallocated input/output buffers
+for sessions that always see the same input shapes (the registry classifier
+pads every note to ``max_length``). This avoids allocating new output arrays
+on each ``session.run``.
+
+Environment Variables (see ``app.infra.settings.OrtSessionProfile``):
+    ORT_INTRA_OP_NUM_THREADS: Intra-op threads (default: cpu_count // WEB_CONCURRENCY, max 4)
+    ORT_INTER_OP_NUM_THREADS: Inter-op threads for parallel execution mode (default: 1)
+    ORT_EXECUTION_MODE: "sequential" (default) or "parallel"
+    ORT_GRAPH_OPTIMIZATION_LEVEL: disable | basic | extended | all (default: all)
+    ORT_ALLOW_SPINNING: Busy-wait pool threads (default: on only with a single worker)
+    ORT_OPTIMIZED_MODEL_DIR: Private optimized-graph cache directory (default: unset, no cache)
+    ORT_IO_BINDING: Use IO binding where shapes are fixed (default: on)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import platform
+import stat
+import threading
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from app.common.logger import get_logger
+from app.infra.settings import OrtSessionProfile, get_ort_session_profile
+
+logger = get_logger("infra.ort_session")
+
+_CPU_PROVIDERS = ("CPUExecutionProvider",)
+
+_ORT_TENSOR_DTYPES: dict[str, Any] = {
+    "tensor(float)": np.float32,
+    "tensor(float16)": np.float16,
+    "tensor(double)": np.float64,
+    "tensor(int64)": np.int64,
+    "tensor(int32)": np.int32,
+    "tensor(bool)": np.bool_,
+}
+
+
+def session_options(profile: OrtSessionProfile, ort: Any | None = None) -> Any:
+    """Build ``onnxruntime.SessionOptions`` for *profile*."""
+
+    if ort is None:
+        import onnxruntime as ort
+
+    levels = {
+        "disable": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+        "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+        "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+        "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+    }
+    options = ort.SessionOptions()
+    options.graph_optimization_level = levels[profile.graph_optimization]
+    options.intra_op_num_threads = profile.intra_op_threads
+    options.inter_op_num_threads = profile.inter_op_threads
+    options.execution_mode = (
+        ort.ExecutionMode.ORT_PARALLEL
+        if profile.execution_mode == "parallel"
+        else ort.ExecutionMode.ORT_SEQUENTIAL
+    )
+    if not profile.allow_spinning:
+        options.add_session_config_entry("session.intra_op.allow_spinning", "0")
+        options.add_session_config_entry("session.inter_op.allow_spinning", "0")
+    return options
+
+
+@lru_cache(maxsize=1)
+def cpu_feature_fingerprint() -> str:
+    """Stable hash of the CPU model and instruction-set flags (``/proc/cpuinfo`` on Linux)."""
+
+    parts = [platform.machine(), platform.processor()]
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8", errors="replace") as fh:
+            for line in fh:
+                key, _, value = line.partition(":")
+                if key.strip() in {"flags", "Features", "model name", "CPU part"}:
+                    parts.append(f"{key.strip()}={' '.join(sorted(value.split()))}")
+                elif not line.strip() and len(parts) > 2:
+                    break  # first processor block is enough
+    except OSError:
+        pass
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def _is_private(path: Path) -> bool:
+    info = path.stat()
+    owner_ok = not hasattr(os, "geteuid") or info.st_uid == os.geteuid()
+    return owner_ok and not stat.S_IMODE(info.st_mode) & 0o022
+
+
+def _private_cache_dir(path: Path) -> bool:
+    """Create *path* as 0700, or check an existing one is ours and not writable by others."""
+
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not path.is_dir() or path.is_symlink():
+            raise OSError("not a directory")
+        if _is_private(path):
+            return True
+        logger.warning(
+            "ORT optimized-graph cache %s is not private (owner or group/other-writable); "
+            "cache disabled",
+            path,
+        )
+    except OSError as exc:
+        logger.warning("ORT optimized-graph cache %s unusable (%s); cache disabled", path, exc)
+    return False
+
+
+def optimized_model_path(
+    model_path: Path,
+    profile: OrtSessionProfile,
+    ort_version: str,
+    providers: Sequence[str] = _CPU_PROVIDERS,
+) -> Path | None:
+    """Cache location of the optimized graph for *model_path*, or None if disabled."""
+
+    if not profile.optimized_model_dir or profile.graph_optimization == "disable":
+        return None
+    model_stat = model_path.stat()
+    key = hashlib.sha256(
+        "|".join(
+            [
+                str(model_path.resolve()),
+                str(model_stat.st_size),
+                str(model_stat.st_mtime_ns),
+                profile.graph_optimization,
+                ort_version,
+                ",".join(providers),
+                cpu_feature_fingerprint(),
+            ]
+        ).encode("utf-8")
+    ).hexdigest()[:16]
+    return Path(profile.optimized_model_dir) / f"{model_path.stem}.{key}.onnx"
+
+
+def create_inference_session(
+    model_path: str | Path,
+    *,
+    profile: OrtSessionProfile | None = None,
+    providers: Sequence[str] = _CPU_PROVIDERS,
+) -> Any:
+    """Create an ``InferenceSession`` for *model_path* using the session profile."""
+
+    import onnxruntime as ort
+
+    profile = profile or get_ort_session_profile()
+    model_path = Path(model_path)
+    cached = optimized_model_path(model_path, profile, ort.__version__, providers)
+    if cached is not None and not _private_cache_dir(cached.parent):
+        cached = None
+
+    if cached is not None and cached.exists() and not _is_private(cached):
+        logger.warning("Ignoring optimized ONNX graph %s: not owned by us or writable by others", cached)
+        cached.unlink(missing_ok=True)
+    if cached is not None and cached.exists():
+        options = session_options(profile, ort)
+        # Already optimized at the profile's level; skip re-running the transforms.
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+        try:
+            session = ort.InferenceSession(
+                str(cached), sess_options=options, providers=list(providers)
+            )
+            logger.info("Loaded optimized ONNX graph %s", cached)
+            return session
+        except Exception as exc:  # noqa: BLE001 - corrupt/stale cache entry: rebuild it
+            logger.warning("Optimized ONNX graph %s unusable (%s); rebuilding", cached, exc)
+
+    options = session_options(profile, ort)
+    if cached is None:
+        return ort.InferenceSession(str(model_path), sess_options=options, providers=list(providers))
+
+    # Workers may race to write the same entry: write to a private temp file, then rename.
+    tmp = cached.with_name(f"{cached.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        options.optimized_model_filepath = str(tmp)
+        session = ort.InferenceSession(str(model_path), sess_options=options, providers=list(providers))
+        if tmp.exists():
+            os.replace(tmp, cached)
+            logger.info("Saved optimized ONNX graph %s", cached)
+        return session
+    except OSError as exc:
+        logger.warning("Could not cache optimized ONNX graph in %s: %s", cached.parent, exc)
+        return ort.InferenceSession(
+            str(model_path), sess_options=session_options(profile, ort), providers=list(providers)
+        )
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+class _BindingState:
+    __slots__ = ("binding", "inputs", "outputs")
+
+    def __init__(self, binding: Any, inputs: dict[str, np.ndarray], outputs: list[np.ndarray] | None):
+        self.binding = binding
+        self.inputs = inputs
+        self.outputs = outputs
+
+
+class FixedShapeIOBinding:
+    """IO binding over preallocated CPU buffers for fixed input shapes.
+
+    Each thread gets its own binding and buffers (an IOBinding is not safe to
+    share). ``run`` copies the feeds into the bound input buffers and returns
+    the bound output buffers. Those stay valid until the next ``run`` on the
+    same thread. Outputs with dimensions that cannot be resolved from the
+    input shapes are allocated by ORT and copied out instead.
+    """
+
+    def __init__(self, session: Any, input_shapes: Mapping[str, tuple[int, ...]]) -> None:
+        self._session = session
+        session_inputs = {node.name: node for node in session.get_inputs()}
+        if set(session_inputs) != set(input_shapes):
+            raise ValueError(
+                f"IO binding inputs {sorted(input_shapes)} do not match session inputs "
+                f"{sorted(session_inputs)}"
+            )
+
+        symbolic_dims: dict[str, int] = {}
+        self._input_specs: dict[str, tuple[tuple[int, ...], Any]] = {}
+        for name, shape in input_shapes.items():
+            node = session_inputs[name]
+            dtype = _ORT_TENSOR_DTYPES.get(node.type)
+            if dtype is None:
+                raise ValueError(f"Unsupported ONNX input type {node.type} for {name}")
+            for dim, size in zip(node.shape, shape):
+                if isinstance(dim, str):
+                    symbolic_dims[dim] = int(size)
+            self._input_specs[name] = (tuple(int(d) for d in shape), dtype)
+
+        self._output_specs: list[tuple[str, tuple[int, ...] | None, Any]] = []
+        for node in session.get_outputs():
+            dims: list[int] | None = []
+            for dim in node.shape:
+                if isinstance(dim, int) and dim > 0:
+                    dims.append(dim)
+                elif isinstance(dim, str) and dim in symbolic_dims:
+                    dims.append(symbolic_dims[dim])
+                else:
+                    dims = None
+                    break
+            dtype = _ORT_TENSOR_DTYPES.get(node.type)
+            shape = tuple(dims) if dims is not None and dtype is not None else None
+            self._output_specs.append((node.name, shape, dtype))
+
+        self._local = threading.local()
+
+    def matches(self, feeds: Mapping[str, np.ndarray]) -> bool:
+        return all(
+            name in feeds and tuple(feeds[name].shape) == shape
+            for name, (shape, _dtype) in self._input_specs.items()
+        )
+
+    def _state(self) -> _BindingState:
+        state = getattr(self._local, "state", None)
+        if state is not None:
+            return state
+
+        binding = self._session.io_binding()
+        inputs: dict[str, np.ndarray] = {}
+        for name, (shape, dtype) in self._input_specs.items():
+            buffer = np.zeros(shape, dtype=dtype)
+            binding.bind_input(name, "cpu", 0, dtype, shape, buffer.ctypes.data)
+            inputs[name] = buffer
+
+        outputs: list[np.ndarray] | None = []
+        for name, shape, dtype in self._output_specs:
+            if shape is None:
+                outputs = None
+                break
+            buffer = np.empty(shape, dtype=dtype)
+            binding.bind_output(name, "cpu", 0, dtype, shape, buffer.ctypes.data)
+            outputs.append(buffer)
+        if outputs is None:
+            binding.clear_binding_outputs()
+            for name, _shape, _dtype in self._output_specs:
+                binding.bind_output(name, "cpu")
+
+        state = _BindingState(binding, inputs, outputs)
+        self._local.state = state
+        return state
+
+    def run(self, feeds: Mapping[str, np.ndarray]) -> list[np.ndarray]:
+        state = self._state()
+        for name, buffer in state.inputs.items():
+            np.copyto(buffer, feeds[name], casting="same_kind")
+        self._session.run_with_iobinding(state.binding)
+        if state.outputs is not None:
+            return state.outputs
+        return state.binding.copy_outputs_to_cpu()
+
+
+__all__ = [
+    "FixedShapeIOBinding",
+    "cpu_feature_fingerprint",
+    "create_inference_session",
+    "optimized_model_path",
+    "session_options",
+]
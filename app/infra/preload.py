@@ -0,0 +1,147 @@
+"""Preload heavy model artifacts in a prefork master and report worker memory.
+
+With ``gunicorn --preload`` the app module is imported once in the master, but
+models are still loaded lazily after fork by each worker's warmup, so every
+worker holds a private copy. ``preload_shared_artifacts`` loads them in the
+master instead; ``freeze_for_fork`` then moves the heap into the GC's
+permanent generation so collections in the workers do not write to (and
+un-share) those pages.
+
+ONNX Runtime is only fork-safe when a session owns no thread pool, i.e.
+``intra_op_num_threads == 1`` (``ORT_INTRA_OP_NUM_THREADS=1``) and no parallel
+inter-op pool (``OrtSessionProfile.single_threaded``). Otherwise the
+ORT-backed predictors are skipped in the master and load in each worker
+after fork as before.
+
+Environment Variables:
+    PROCSUITE_PRELOAD_MODELS: Set to "0"/"false"/"no" to disable master preload (default: on)
+    ORT_INTRA_OP_NUM_THREADS: Must be 1 for ORT sessions to be preloaded
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import os
+import time
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+def preload_enabled() -> bool:
+    return os.getenv("PROCSUITE_PRELOAD_MODELS", "1").strip().lower() not in ("0", "false", "no")
+
+
+def ort_fork_safe() -> bool:
+    """True when ORT sessions are created without thread pools."""
+    from app.infra.settings import get_ort_session_profile
+
+    return get_ort_session_profile().single_threaded
+
+
+def _preload_nlp() -> None:
+    from app.infra.nlp_warmup import should_skip_warmup, warm_heavy_resources_sync
+
+    if not should_skip_warmup():
+        # spaCy model, sectionizer and the UMLS map/linker.
+        warm_heavy_resources_sync()
+
+
+def _preload_services() -> None:
+    from app.api.dependencies import get_coding_service, get_kb_repo, get_registry_service
+    from app.api.services.financials import warm_procedure_rate_table
+
+    # Builds RegistryService too, whose parallel orchestrator loads GranularNERPredictor.
+    get_coding_service()
+    warm_procedure_rate_table(get_kb_repo())
+    # ONNX/Torch/TF-IDF registry predictor (lazy on the service otherwise).
+    get_registry_service()._get_registry_ml_predictor()
+
+
+def _preload_ml_coder() -> None:
+    from ml.lib.ml_coder.predictor import load_model_artifacts
+    from ml.lib.ml_coder.paths import MLB_PATH, PIPELINE_PATH
+
+    if PIPELINE_PATH.exists() and MLB_PATH.exists():
+        load_model_artifacts(PIPELINE_PATH, MLB_PATH)
+
+
+def preload_shared_artifacts() -> dict[str, Any]:
+    """Load heavy artifacts in the current (master) process.
+
+    Each step is best-effort: a failure is logged and the worker falls back
+    to lazy loading. Returns per-step timings/status for logging.
+    """
+    steps: list[tuple[str, Callable[[], None], bool]] = [
+        ("nlp", _preload_nlp, False),
+        ("ml_coder", _preload_ml_coder, False),
+        # The registry and granular NER predictors may own ONNX Runtime sessions.
+        ("services", _preload_services, True),
+    ]
+    report: dict[str, Any] = {}
+    for name, step, uses_ort in steps:
+        if uses_ort and not ort_fork_safe():
+            report[name] = "skipped (ORT_INTRA_OP_NUM_THREADS != 1; loads after fork)"
+            continue
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception as exc:  # noqa: BLE001
+            report[name] = f"failed: {type(exc).__name__}: {exc}"
+            logger.warning("Preload step %s failed: %s", name, exc)
+        else:
+            report[name] = f"{time.perf_counter() - started:.2f}s"
+    return report
+
+
+def freeze_for_fork() -> None:
+    """Collect once, then exempt all surviving objects from future GC passes."""
+    gc.collect()
+    gc.freeze()
+
+
+def process_memory(pid: int | None = None) -> dict[str, float]:
+    """RSS/PSS/USS/shared (MiB) for *pid* from /proc (Linux); RSS only elsewhere.
+
+    PSS splits shared pages across the processes mapping them, so the sum of
+    worker PSS values is the real footprint of a prefork deployment.
+    """
+    target = "self" if pid is None else str(pid)
+    fields: dict[str, float] = {}
+    try:
+        with open(f"/proc/{target}/smaps_rollup", encoding="ascii") as fh:
+            for line in fh:
+                key, _, rest = line.partition(":")
+                parts = rest.split()
+                if len(parts) == 2 and parts[1] == "kB":
+                    fields[key] = int(parts[0]) / 1024
+    except OSError:
+        if pid is None:
+            import resource
+
+            # ru_maxrss is KiB on Linux; peak rather than current, but better than nothing.
+            return {"rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}
+        return {}
+    private = fields.get("Private_Clean", 0.0) + fields.get("Private_Dirty", 0.0)
+    shared = fields.get("Shared_Clean", 0.0) + fields.get("Shared_Dirty", 0.0)
+    return {
+        "rss_mb": round(fields.get("Rss", 0.0), 1),
+        "pss_mb": round(fields.get("Pss", 0.0), 1),
+        "uss_mb": round(private, 1),
+        "shared_mb": round(shared, 1),
+    }
+
+
+def format_memory(memory: dict[str, float]) -> str:
+    return " ".join(f"{key}={value:.1f}" for key, value in memory.items()) or "unavailable"
+
+
+__all__ = [
+    "format_memory",
+    "freeze_for_fork",
+    "ort_fork_safe",
+    "preload_enabled",
+    "preload_shared_artifacts",
+    "process_memory",
+]
@@ -72,6 +72,20 @@ class InfraSettings:
 
     redis_url: str | None
 
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_s: float = 30.0
+    db_pool_recycle_s: int = 1800
+    db_pool_pre_ping: bool = True
+    sqlite_wal: bool = True
+    sqlite_busy_timeout_ms: int = 5000
+
+    llm_cache_ttl_s: float = 3600.0
+    llm_cache_path: str | None = None
+    llm_cache_disk_ttl_s: float = 30 * 24 * 3600.0
+    llm_cache_max_entries: int = 50_000
+    llm_cache_max_mb: int = 256
+
     @staticmethod
     def from_env() -> "InfraSettings":
         skip_warmup = _truthy(_env_first("SKIP_WARMUP", "PROCSUITE_SKIP_WARMUP"))
@@ -92,6 +106,30 @@ class InfraSettings:
 
         redis_url = _env_first("REDIS_URL", "UPSTASH_REDIS_REST_URL", "UPSTASH_REDIS_URL")
 
+        db_pool_size = max(1, _get_int("DB_POOL_SIZE", "PROCSUITE_DB_POOL_SIZE", default=5))
+        db_max_overflow = max(0, _get_int("DB_MAX_OVERFLOW", "PROCSUITE_DB_MAX_OVERFLOW", default=10))
+        db_pool_timeout_s = _get_float("DB_POOL_TIMEOUT_S", "PROCSUITE_DB_POOL_TIMEOUT_S", default=30.0)
+        # Managed Postgres (Supabase/Railway) proxies drop idle connections; -1 disables.
+        db_pool_recycle_s = _get_int("DB_POOL_RECYCLE_S", "PROCSUITE_DB_POOL_RECYCLE_S", default=1800)
+        db_pool_pre_ping_raw = _env_first("DB_POOL_PRE_PING", "PROCSUITE_DB_POOL_PRE_PING")
+        db_pool_pre_ping = True if db_pool_pre_ping_raw is None else _truthy(db_pool_pre_ping_raw)
+        sqlite_wal_raw = _env_first("SQLITE_WAL", "PROCSUITE_SQLITE_WAL")
+        sqlite_wal = True if sqlite_wal_raw is None else _truthy(sqlite_wal_raw)
+        sqlite_busy_timeout_ms = max(
+            0, _get_int("SQLITE_BUSY_TIMEOUT_MS", "PROCSUITE_SQLITE_BUSY_TIMEOUT_MS", default=5000)
+        )
+
+        llm_cache_ttl_s = _get_float("LLM_CACHE_TTL_S", "PROCSUITE_LLM_CACHE_TTL_S", default=3600.0)
+        # Persistent tier for ENABLE_LLM_CACHE (opt-in; responses may quote scrubbed note text).
+        llm_cache_path = _env_first("LLM_CACHE_PATH", "PROCSUITE_LLM_CACHE_PATH")
+        llm_cache_disk_ttl_s = _get_float(
+            "LLM_CACHE_DISK_TTL_S", "PROCSUITE_LLM_CACHE_DISK_TTL_S", default=30 * 24 * 3600.0
+        )
+        llm_cache_max_entries = max(
+            1, _get_int("LLM_CACHE_MAX_ENTRIES", "PROCSUITE_LLM_CACHE_MAX_ENTRIES", default=50_000)
+        )
+        llm_cache_max_mb = max(1, _get_int("LLM_CACHE_MAX_MB", "PROCSUITE_LLM_CACHE_MAX_MB", default=256))
+
         return InfraSettings(
             skip_warmup=skip_warmup,
             background_warmup=background_warmup,
@@ -103,6 +141,18 @@ class InfraSettings:
             enable_llm_cache=enable_llm_cache,
             enable_ml_cache=enable_ml_cache,
             redis_url=redis_url,
+            db_pool_size=db_pool_size,
+            db_max_overflow=db_max_overflow,
+            db_pool_timeout_s=db_pool_timeout_s,
+            db_pool_recycle_s=db_pool_recycle_s,
+            db_pool_pre_ping=db_pool_pre_ping,
+            sqlite_wal=sqlite_wal,
+            sqlite_busy_timeout_ms=sqlite_busy_timeout_ms,
+            llm_cache_ttl_s=llm_cache_ttl_s,
+            llm_cache_path=llm_cache_path.strip() if llm_cache_path else None,
+            llm_cache_disk_ttl_s=llm_cache_disk_ttl_s,
+            llm_cache_max_entries=llm_cache_max_entries,
+            llm_cache_max_mb=llm_cache_max_mb,
         )
 
 
@@ -111,4 +161,102 @@ def get_infra_settings() -> InfraSettings:
     return InfraSettings.from_env()
 
 
-__all__ = ["InfraSettings", "get_infra_settings"]
+ORT_GRAPH_OPTIMIZATION_LEVELS = ("disable", "basic", "extended", "all")
+
+
+@dataclass(frozen=True)
+class OrtSessionProfile:
+    """ONNX Runtime session options for the registry and NER predictors.
+
+    Defaults size the intra-op pool to this worker's share of the CPU
+    (``cpu_count // WEB_CONCURRENCY``, capped at 4) instead of ORT's default
+    of one thread per core in every worker process.
+    """
+
+    intra_op_threads: int = 4
+    inter_op_threads: int = 1
+    execution_mode: str = "sequential"
+    graph_optimization: str = "all"
+    allow_spinning: bool = True
+    optimized_model_dir: str | None = None
+    io_binding: bool = True
+
+    @property
+    def single_threaded(self) -> bool:
+        """True when the session creates no thread pools (safe to create before fork)."""
+        return self.intra_op_threads == 1 and (
+            self.execution_mode == "sequential" or self.inter_op_threads == 1
+        )
+
+    @staticmethod
+    def from_env() -> "OrtSessionProfile":
+        workers = max(1, _get_int("WEB_CONCURRENCY", "WORKERS", default=1))
+        default_intra = min(4, max(1, (os.cpu_count() or 1) // workers))
+        intra_op_threads = max(
+            1,
+            _get_int(
+                "ORT_INTRA_OP_NUM_THREADS", "PROCSUITE_ORT_INTRA_OP_THREADS", default=default_intra
+            ),
+        )
+        inter_op_threads = max(
+            1, _get_int("ORT_INTER_OP_NUM_THREADS", "PROCSUITE_ORT_INTER_OP_THREADS", default=1)
+        )
+
+        execution_mode = (
+            _env_first("ORT_EXECUTION_MODE", "PROCSUITE_ORT_EXECUTION_MODE") or ""
+        ).strip().lower()
+        if execution_mode not in {"sequential", "parallel"}:
+            execution_mode = "sequential"
+
+        graph_optimization = (
+            _env_first("ORT_GRAPH_OPTIMIZATION_LEVEL", "PROCSUITE_ORT_GRAPH_OPTIMIZATION_LEVEL")
+            or ""
+        ).strip().lower()
+        if graph_optimization not in ORT_GRAPH_OPTIMIZATION_LEVELS:
+            graph_optimization = "all"
+
+        # Busy-waiting pool threads burn the CPU that sibling workers need.
+        allow_spinning_raw = _env_first("ORT_ALLOW_SPINNING", "PROCSUITE_ORT_ALLOW_SPINNING")
+        allow_spinning = workers <= 1 if allow_spinning_raw is None else _truthy(allow_spinning_raw)
+
+        # Opt-in: ORT loads whatever graph sits in this directory, so it must be
+        # a private path (ort_session refuses group/other-writable directories).
+        optimized_model_dir_raw = _env_first(
+            "ORT_OPTIMIZED_MODEL_DIR", "PROCSUITE_ORT_OPTIMIZED_MODEL_DIR"
+        )
+        optimized_model_dir: str | None = None
+        if optimized_model_dir_raw and optimized_model_dir_raw.strip().lower() not in {
+            "0",
+            "false",
+            "no",
+            "off",
+            "none",
+        }:
+            optimized_model_dir = os.path.expanduser(optimized_model_dir_raw.strip())
+
+        io_binding_raw = _env_first("ORT_IO_BINDING", "PROCSUITE_ORT_IO_BINDING")
+        io_binding = True if io_binding_raw is None else _truthy(io_binding_raw)
+
+        return OrtSessionProfile(
+            intra_op_threads=intra_op_threads,
+            inter_op_threads=inter_op_threads,
+            execution_mode=execution_mode,
+            graph_optimization=graph_optimization,
+            allow_spinning=allow_spinning,
+            optimized_model_dir=optimized_model_dir,
+            io_binding=io_binding,
+        )
+
+
+def get_ort_session_profile() -> OrtSessionProfile:
+    # Not cached: batch tools set ORT_* variables after import, before creating sessions.
+    return OrtSessionProfile.from_env()
+
+
+__all__ = [
+    "InfraSettings",
+    "ORT_GRAPH_OPTIMIZATION_LEVELS",
+    "OrtSessionProfile",
+    "get_infra_settings",
+    "get_ort_session_profile",
+]
@@ -14,10 +14,12 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import numpy as np
-import torch
-from transformers import AutoTokenizer, AutoModelForTokenClassification
 
 from app.common.logger import get_logger
+from app.common.tokenization_cache import encode_with_offsets
+
+# torch/transformers are imported inside the predictor (several seconds of
+# import time); importing this module must stay cheap for API worker boot.
 
 logger = get_logger("ner.inference")
 
@@ -131,16 +133,7 @@ class GranularNERPredictor:
         self._use_onnx = False
         self._onnx_session = None
         self._onnx_input_names: List[str] = []
-
-        # Determine device
-        if device:
-            self._device = torch.device(device)
-        elif torch.cuda.is_available():
-            self._device = torch.device("cuda")
-        elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
-            self._device = torch.device("mps")
-        else:
-            self._device = torch.device("cpu")
+        self._requested_device = device
 
         try:
             self._load_model()
@@ -198,24 +191,25 @@ class GranularNERPredictor:
 
         onnx_path = self._resolve_onnx_model_path()
         if onnx_path is not None:
+            from transformers import AutoTokenizer
+
             self._load_label_map(model_root)
             tokenizer_dir = model_root / "tokenizer" if (model_root / "tokenizer").exists() else model_root
             self._tokenizer = AutoTokenizer.from_pretrained(str(tokenizer_dir))
 
-            import onnxruntime as ort
+            from app.infra.ort_session import create_inference_session
 
-            sess_options = ort.SessionOptions()
-            sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
-            sess_options.intra_op_num_threads = 4
-            self._onnx_session = ort.InferenceSession(
-                str(onnx_path),
-                sess_options=sess_options,
-                providers=["CPUExecutionProvider"],
-            )
+            # Token sequences vary in length here, so no IO binding (see inference_onnx).
+            self._onnx_session = create_inference_session(onnx_path)
             self._onnx_input_names = [i.name for i in self._onnx_session.get_inputs()]
             self._use_onnx = True
+            self._device = "cpu"
             return
 
+        from transformers import AutoModelForTokenClassification, AutoTokenizer
+
+        self._device = self._resolve_torch_device(self._requested_device)
+
         # Load label map
         self._load_label_map(model_root)
 
@@ -227,6 +221,18 @@ class GranularNERPredictor:
         self._model.to(self._device)
         self._model.eval()
 
+    @staticmethod
+    def _resolve_torch_device(device: str | None):
+        import torch
+
+        if device:
+            return torch.device(device)
+        if torch.cuda.is_available():
+            return torch.device("cuda")
+        if hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
+            return torch.device("mps")
+        return torch.device("cpu")
+
     @property
     def labels(self) -> List[str]:
         """Get list of entity labels (without B-/I- prefixes)."""
@@ -256,15 +262,9 @@ class GranularNERPredictor:
 
         start_time = time.time()
 
-        # Tokenize with offset mapping
-        return_tensors = "np" if self._use_onnx else "pt"
-        encoding = self._tokenizer(
-            note_text,
-            truncation=True,
-            max_length=max_length,
-            return_offsets_mapping=True,
-            return_tensors=return_tensors,
-        )
+        # Tokenize with offset mapping (numpy; reuses the request's tokenization
+        # of this note when another predictor shares the vocabulary)
+        encoding = encode_with_offsets(self._tokenizer, note_text, max_length)
 
         truncated = len(note_text) > max_length * 4  # Rough estimate
 
@@ -293,9 +293,11 @@ class GranularNERPredictor:
             predictions = np.argmax(probs, axis=-1).tolist()
             confidence_scores = np.max(probs, axis=-1).tolist()
         else:
+            import torch
+
             # Move to device
-            input_ids = encoding["input_ids"].to(self._device)
-            attention_mask = encoding["attention_mask"].to(self._device)
+            input_ids = torch.from_numpy(encoding["input_ids"]).to(self._device)
+            attention_mask = torch.from_numpy(encoding["attention_mask"]).to(self._device)
 
             # Run inference
             with torch.no_grad():
@@ -0,0 +1,473 @@
+"""Segmented, indexed store for CodingTrace JSONL logs.
+
+Traces are appended to numbered segment files next to the configured trace
+path (``coding_traces.jsonl`` -> ``coding_traces.000001.jsonl``, ...). A new
+segment is started once the active one exceeds a size or age limit. Each
+append also writes a compact record to a sidecar index
+(``coding_traces.index.jsonl``) holding the segment, byte offset, timestamp,
+source, disagreement flag and the code sets needed for evaluation metrics.
+
+Readers keep the index in memory and follow the index file incrementally, so
+lookups and paginated listings only read the traces they return, and
+EvaluationMetrics is maintained as entries arrive instead of re-parsing every
+trace. Both files are append-only, which keeps multiple worker processes
+consistent without locking. A pre-existing unsegmented trace file is indexed
+once, in place, and treated as read-only.
+
+Environment Variables:
+    TRACE_SEGMENT_MAX_BYTES: Rotate after this many bytes (default: 64 MiB)
+    TRACE_SEGMENT_MAX_AGE_SECONDS: Rotate segments older than this (default: 0 = off)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from bisect import insort
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+from pydantic import ValidationError
+
+from app.proc_ml_advisor.schemas import CodingTrace, EvaluationMetrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True)
+class TraceIndexEntry:
+    """Location and filter fields for one stored trace."""
+
+    trace_id: str
+    segment: str
+    offset: int
+    length: int
+    timestamp: float
+    source: str | None
+    has_disagreements: bool
+    valid: bool = True
+
+
+class _MetricsAccumulator:
+    """Running totals behind EvaluationMetrics, fed one trace at a time."""
+
+    def __init__(self) -> None:
+        self.total_traces = 0
+        self.traces_with_advisor = 0
+        self.traces_with_final = 0
+        self.full_agreement = 0
+        self.advisor_suggested_extras = 0
+        self.advisor_suggested_removals = 0
+        self.unique_rule_codes: set[str] = set()
+        self.unique_advisor_codes: set[str] = set()
+        self.rule_tp = self.rule_fp = self.rule_fn = 0
+        self.advisor_tp = self.advisor_fp = self.advisor_fn = 0
+
+    def add(
+        self, rule: list[str], advisor: list[str], final: list[str] | None, removal: bool
+    ) -> None:
+        rule_codes = set(rule)
+        advisor_codes = set(advisor)
+        self.total_traces += 1
+        self.unique_rule_codes.update(rule_codes)
+
+        if advisor_codes:
+            self.traces_with_advisor += 1
+            self.unique_advisor_codes.update(advisor_codes)
+            if rule_codes == advisor_codes:
+                self.full_agreement += 1
+            if advisor_codes - rule_codes:
+                self.advisor_suggested_extras += 1
+            if removal:
+                self.advisor_suggested_removals += 1
+
+        if final is not None:
+            self.traces_with_final += 1
+            final_set = set(final)
+            self.rule_tp += len(rule_codes & final_set)
+            self.rule_fp += len(rule_codes - final_set)
+            self.rule_fn += len(final_set - rule_codes)
+            self.advisor_tp += len(advisor_codes & final_set)
+            self.advisor_fp += len(advisor_codes - final_set)
+            self.advisor_fn += len(final_set - advisor_codes)
+
+    def snapshot(self) -> EvaluationMetrics:
+        rule_precision = None
+        rule_recall = None
+        advisor_precision = None
+        advisor_recall = None
+
+        if self.traces_with_final > 0:
+            if self.rule_tp + self.rule_fp > 0:
+                rule_precision = self.rule_tp / (self.rule_tp + self.rule_fp)
+            if self.rule_tp + self.rule_fn > 0:
+                rule_recall = self.rule_tp / (self.rule_tp + self.rule_fn)
+            if self.advisor_tp + self.advisor_fp > 0:
+                advisor_precision = self.advisor_tp / (self.advisor_tp + self.advisor_fp)
+            if self.advisor_tp + self.advisor_fn > 0:
+                advisor_recall = self.advisor_tp / (self.advisor_tp + self.advisor_fn)
+
+        return EvaluationMetrics(
+            total_traces=self.total_traces,
+            traces_with_advisor=self.traces_with_advisor,
+            traces_with_final=self.traces_with_final,
+            full_agreement=self.full_agreement,
+            advisor_suggested_extras=self.advisor_suggested_extras,
+            advisor_suggested_removals=self.advisor_suggested_removals,
+            unique_rule_codes=len(self.unique_rule_codes),
+            unique_advisor_codes=len(self.unique_advisor_codes),
+            rule_precision=rule_precision,
+            rule_recall=rule_recall,
+            advisor_precision=advisor_precision,
+            advisor_recall=advisor_recall,
+        )
+
+
+def _index_record(
+    data: dict[str, Any],
+    segment: str,
+    offset: int,
+    length: int,
+    trace: CodingTrace | None = None,
+) -> dict[str, Any]:
+    """Build the sidecar index record for one raw trace dict."""
+    valid = True
+    timestamp = 0.0
+    try:
+        if trace is None:
+            trace = CodingTrace(**data)
+        timestamp = trace.timestamp.timestamp()
+    except (ValidationError, TypeError, ValueError, OverflowError):
+        valid = False
+
+    rule_codes = list(data.get("autocode_codes") or [])
+    disagreements = data.get("advisor_disagreements") or []
+    final_codes = data.get("final_codes")
+    return {
+        "id": str(data.get("trace_id") or ""),
+        "seg": segment,
+        "off": offset,
+        "len": length,
+        "t": timestamp,
+        "src": data.get("source"),
+        "dis": bool(disagreements),
+        "ok": valid,
+        "r": rule_codes,
+        "a": list(data.get("advisor_candidate_codes") or []),
+        "f": list(final_codes) if final_codes is not None else None,
+        "rm": any(code in rule_codes for code in disagreements),
+    }
+
+
+class TraceStore:
+    """Append-only, segment-rotated CodingTrace store with a sidecar index."""
+
+    def __init__(
+        self,
+        trace_path: Path,
+        *,
+        segment_max_bytes: int | None = None,
+        segment_max_age_seconds: float | None = None,
+    ) -> None:
+        self.trace_path = Path(trace_path)
+        self.directory = self.trace_path.parent
+        self.index_path = self.directory / f"{self.trace_path.stem}.index.jsonl"
+        self.segment_max_bytes = (
+            _env_int("TRACE_SEGMENT_MAX_BYTES", DEFAULT_SEGMENT_MAX_BYTES)
+            if segment_max_bytes is None
+            else segment_max_bytes
+        )
+        self.segment_max_age_seconds = (
+            float(_env_int("TRACE_SEGMENT_MAX_AGE_SECONDS", 0))
+            if segment_max_age_seconds is None
+            else segment_max_age_seconds
+        )
+        self._segment_re = re.compile(rf"^{re.escape(self.trace_path.stem)}\.(\d{{6}})\.jsonl$")
+
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._index_read_offset = 0
+        self._entries_by_id: dict[str, TraceIndexEntry] = {}
+        self._seen_locations: set[tuple[str, int]] = set()
+        # (timestamp, arrival) keys kept sorted for newest-first listing.
+        self._ordered: list[tuple[float, int, TraceIndexEntry]] = []
+        self._metrics = _MetricsAccumulator()
+        self._segment_started: dict[str, float] = {}
+        self._active_seq = 0
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, trace: CodingTrace) -> None:
+        """Append one trace and its index record."""
+        payload = (trace.model_dump_json() + "\n").encode("utf-8")
+        with self._lock:
+            self._ensure_loaded()
+            segment_path = self._active_segment_path()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd = os.open(segment_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, payload)
+                end = os.lseek(fd, 0, os.SEEK_CUR)
+            finally:
+                os.close(fd)
+
+            record = _index_record(
+                trace.model_dump(mode="json"),
+                segment_path.name,
+                end - len(payload),
+                len(payload),
+                trace=trace,
+            )
+            with open(self.index_path, "a", encoding="utf-8") as index_file:
+                index_file.write(json.dumps(record, separators=(",", ":")) + "\n")
+            self._refresh()
+
+    def _segment_seqs(self) -> list[int]:
+        if not self.directory.exists():
+            return []
+        seqs = []
+        for path in self.directory.iterdir():
+            match = self._segment_re.match(path.name)
+            if match:
+                seqs.append(int(match.group(1)))
+        return sorted(seqs)
+
+    def _segment_name(self, seq: int) -> str:
+        return f"{self.trace_path.stem}.{seq:06d}.jsonl"
+
+    def _active_segment_path(self) -> Path:
+        if self._active_seq == 0:
+            self._active_seq = max(self._segment_seqs(), default=0) or 1
+        path = self.directory / self._segment_name(self._active_seq)
+        if self._should_rotate(path):
+            # Another worker may already have rotated; join the newest segment.
+            self._active_seq = max([self._active_seq + 1, *self._segment_seqs()])
+            path = self.directory / self._segment_name(self._active_seq)
+        return path
+
+    def _should_rotate(self, path: Path) -> bool:
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return False
+        if self.segment_max_bytes > 0 and size >= self.segment_max_bytes:
+            return True
+        if self.segment_max_age_seconds > 0:
+            started = self._segment_started.get(path.name)
+            if started is not None and time.time() - started >= self.segment_max_age_seconds:
+                return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._refresh()
+        self._index_unindexed_tails()
+        self._loaded = True
+
+    def _refresh(self) -> None:
+        """Consume index records appended since the last read (by any process)."""
+        if not self.index_path.exists():
+            return
+        with open(self.index_path, "rb") as index_file:
+            index_file.seek(self._index_read_offset)
+            for raw in index_file:
+                if not raw.endswith(b"\n"):
+                    break  # partial write in progress; pick it up next time
+                self._index_read_offset += len(raw)
+                try:
+                    self._add_record(json.loads(raw))
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+
+    def _add_record(self, record: dict[str, Any]) -> None:
+        location = (record["seg"], int(record["off"]))
+        if location in self._seen_locations:
+            return
+        self._seen_locations.add(location)
+        timestamp = float(record.get("t") or 0.0)
+        self._segment_started.setdefault(record["seg"], timestamp or time.time())
+
+        entry = TraceIndexEntry(
+            trace_id=record["id"],
+            segment=record["seg"],
+            offset=int(record["off"]),
+            length=int(record["len"]),
+            timestamp=timestamp,
+            source=record.get("src"),
+            has_disagreements=bool(record.get("dis")),
+            valid=bool(record.get("ok", True)),
+        )
+        self._metrics.add(
+            record.get("r") or [], record.get("a") or [], record.get("f"), bool(record.get("rm"))
+        )
+        if not entry.valid:
+            return
+        self._entries_by_id.setdefault(entry.trace_id, entry)
+        insort(
+            self._ordered,
+            (-entry.timestamp, len(self._seen_locations), entry),
+            key=lambda item: item[:2],
+        )
+
+    def _index_unindexed_tails(self) -> None:
+        """Index the legacy trace file and any segment bytes the index does not cover."""
+        last_indexed: dict[str, int] = {}
+        for segment, offset in self._seen_locations:
+            last_indexed[segment] = max(last_indexed.get(segment, 0), offset)
+
+        segments = [self.trace_path] if self.trace_path.exists() else []
+        segments += [self.directory / self._segment_name(seq) for seq in self._segment_seqs()]
+        records: list[dict[str, Any]] = []
+        for path in segments:
+            start = last_indexed.get(path.name)
+            with open(path, "rb") as handle:
+                if start is not None:
+                    # Resume after the last indexed line.
+                    handle.seek(start)
+                    handle.readline()
+                offset = handle.tell()
+                for raw in handle:
+                    line_offset = offset
+                    offset += len(raw)
+                    if not raw.endswith(b"\n"):
+                        break
+                    try:
+                        data = json.loads(raw)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(data, dict):
+                        records.append(_index_record(data, path.name, line_offset, len(raw)))
+
+        if not records:
+            return
+        logger.info("Indexing %d unindexed coding traces under %s", len(records), self.directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.index_path, "a", encoding="utf-8") as index_file:
+            for record in records:
+                index_file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._refresh()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _read(self, entries: list[TraceIndexEntry]) -> list[CodingTrace]:
+        traces: list[CodingTrace] = []
+        handles: dict[str, Any] = {}
+        try:
+            for entry in entries:
+                handle = handles.get(entry.segment)
+                if handle is None:
+                    handle = handles[entry.segment] = open(self.directory / entry.segment, "rb")
+                handle.seek(entry.offset)
+                try:
+                    traces.append(CodingTrace(**json.loads(handle.read(entry.length))))
+                except (json.JSONDecodeError, ValidationError) as e:
+                    logger.warning(f"Skipping malformed trace: {e}")
+        finally:
+            for handle in handles.values():
+                handle.close()
+        return traces
+
+    def list(
+        self,
+        *,
+        limit: int,
+        offset: int = 0,
+        source: str | None = None,
+        has_disagreements: bool | None = None,
+    ) -> tuple[list[CodingTrace], int]:
+        """Return one page of traces, newest first, and the filtered total."""
+        with self._lock:
+            self._ensure_loaded()
+            self._refresh()
+            matched = [
+                entry
+                for _, _, entry in self._ordered
+                if (not source or entry.source == source)
+                and (has_disagreements is None or entry.has_disagreements == has_disagreements)
+            ]
+        return self._read(matched[offset : offset + limit]), len(matched)
+
+    def get(self, trace_id: str) -> CodingTrace | None:
+        with self._lock:
+            self._ensure_loaded()
+            self._refresh()
+            entry = self._entries_by_id.get(trace_id)
+        if entry is None:
+            return None
+        traces = self._read([entry])
+        return traces[0] if traces else None
+
+    def metrics(self) -> EvaluationMetrics:
+        with self._lock:
+            self._ensure_loaded()
+            self._refresh()
+            return self._metrics.snapshot()
+
+    def export_lines(self, source: str | None = None) -> Iterator[bytes]:
+        """Yield raw JSONL lines in write order, optionally filtered by source."""
+        with self._lock:
+            self._ensure_loaded()
+            self._refresh()
+            segments = [self.trace_path] if self.trace_path.exists() else []
+            segments += [self.directory / self._segment_name(seq) for seq in self._segment_seqs()]
+            wanted: dict[str, list[TraceIndexEntry]] | None = None
+            if source:
+                wanted = {}
+                for _, _, entry in self._ordered:
+                    if entry.source == source:
+                        wanted.setdefault(entry.segment, []).append(entry)
+                for entries in wanted.values():
+                    entries.sort(key=lambda entry: entry.offset)
+
+        for path in segments:
+            if wanted is None:
+                with open(path, "rb") as handle:
+                    yield from handle
+                continue
+            entries = wanted.get(path.name)
+            if not entries:
+                continue
+            with open(path, "rb") as handle:
+                for entry in entries:
+                    handle.seek(entry.offset)
+                    yield handle.read(entry.length)
+
+
+_stores: dict[Path, TraceStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_trace_store(trace_path: Path) -> TraceStore:
+    """Return the process-wide store for *trace_path*."""
+    key = Path(trace_path).resolve()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = TraceStore(key)
+        return store
+
+
+__all__ = ["TraceIndexEntry", "TraceStore", "get_trace_store"]
@@ -21,6 +21,7 @@ from typing import Any, Literal, TYPE_CHECKING
 import os
 from pydantic import BaseModel, ValidationError
 
+from app.common.derived_text import derived_text_scope
 from app.common.exceptions import RegistryError
 from app.common.logger import get_logger
 from app.registry.adapters.schema_registry import (
@@ -70,6 +71,7 @@ from app.coder.application.smart_hybrid_policy import (
 )
 from app.coder.parallel_pathway import ParallelPathwayOrchestrator
 from app.extraction.postprocessing.clinical_guardrails import ClinicalGuardrails
+from observability.stage_profiler import StageProfiler
 
 
 if TYPE_CHECKING:
@@ -269,6 +271,7 @@ class RegistryExtractionResult:
         needs_manual_review: Whether this case requires human review.
         validation_errors: List of validation errors found during reconciliation.
         audit_warnings: ML vs CPT discrepancy warnings requiring human review.
+        stage_timings: Per-stage wall time for the extraction-first pipeline.
     """
 
     record: RegistryRecord
@@ -284,6 +287,7 @@ class RegistryExtractionResult:
     audit_warnings: list[str] = field(default_factory=list)
     audit_report: AuditCompareReport | None = None
     self_correction: list["SelfCorrectionMetadata"] = field(default_factory=list)
+    stage_timings: list[dict[str, Any]] = field(default_factory=list)
 
 
 class RegistryService:
@@ -580,6 +584,7 @@ class RegistryService:
     # Hybrid-First Registry Extraction
     # -------------------------------------------------------------------------
 
+    @derived_text_scope()
     def extract_fields(self, note_text: str, mode: str = "default") -> RegistryExtractionResult:
         """Extract registry fields using hybrid-first flow.
 
@@ -693,6 +698,7 @@ class RegistryService:
             note_text=masked_note_text,
         )
 
+    @derived_text_scope()
     def extract_fields_extraction_first(self, note_text: str) -> RegistryExtractionResult:
         """Extract registry fields using extraction-first flow.
 
@@ -707,6 +713,7 @@ class RegistryService:
     # Extraction-First Registry → Deterministic CPT → RAW-ML Audit
     # -------------------------------------------------------------------------
 
+    @derived_text_scope()
     def extract_record(
         self,
         note_text: str,
@@ -884,9 +891,11 @@ class RegistryService:
                 return []
 
             try:
-                from app.coder.domain_rules.registry_to_cpt.coding_rules import derive_all_codes_with_meta
+                from app.coder.domain_rules.registry_to_cpt.coding_rules import (
+                    derive_all_codes_with_meta_cached,
+                )
 
-                derived_codes, _rationales, _warn = derive_all_codes_with_meta(record_in)
+                derived_codes, _rationales, _warn = derive_all_codes_with_meta_cached(record_in)
                 derived_set = {str(code).strip() for code in (derived_codes or []) if str(code).strip()}
             except Exception:
                 return reason_list
@@ -2668,7 +2677,10 @@ class RegistryService:
         # overwrite this variable with focused/summarized text.
         raw_text_for_audit = raw_note_text
 
-        masked_note_text, _mask_meta = mask_extraction_noise(raw_note_text)
+        profiler = StageProfiler("registry.extraction_first")
+        masked_note_text, _mask_meta = profiler.run(
+            "mask_extraction_noise", mask_extraction_noise, raw_note_text
+        )
 
         def _env_flag(name: str, default: str = "0") -> bool:
             return os.getenv(name, default).strip().lower() in {"1", "true", "yes", "y"}
@@ -2685,7 +2697,9 @@ class RegistryService:
             except ValueError:
                 return default
 
-        record, extraction_warnings, meta = self.extract_record(raw_note_text)
+        record, extraction_warnings, meta = profiler.run(
+            "extract_record", self.extract_record, raw_note_text
+        )
         extraction_text = meta.get("extraction_text") if isinstance(meta.get("extraction_text"), str) else None
         if isinstance(meta.get("masked_note_text"), str):
             masked_note_text = meta["masked_note_text"]
@@ -2702,7 +2716,11 @@ class RegistryService:
             from app.registry.deterministic_extractors import extract_navigation_imaging_equipment
             from app.registry.processing.masking import mask_offset_preserving
 
-            navigation_seed = extract_navigation_imaging_equipment(mask_offset_preserving(raw_note_text or ""))
+            navigation_seed = profiler.run(
+                "navigation_equipment_seed",
+                extract_navigation_imaging_equipment,
+                mask_offset_preserving(raw_note_text or ""),
+            )
             equipment_seed = navigation_seed.get("equipment") if isinstance(navigation_seed, dict) else None
             if isinstance(equipment_seed, dict):
                 navigation_equipment_seed = dict(equipment_seed)
@@ -2741,14 +2759,18 @@ class RegistryService:
             record_data["equipment"] = equipment
             return RegistryRecord(**record_data)
 
-        record, override_warnings = apply_required_overrides(masked_note_text, record)
+        record, override_warnings = profiler.run(
+            "keyword_required_overrides", apply_required_overrides, masked_note_text, record
+        )
         if override_warnings:
             extraction_warnings.extend(override_warnings)
 
         from app.registry.processing.masking import mask_offset_preserving
 
         nav_scan_text = mask_offset_preserving(raw_note_text or "")
-        record, nav_ebus_warnings = apply_heuristics(
+        record, nav_ebus_warnings = profiler.run(
+            "navigation_ebus_heuristics",
+            apply_heuristics,
             note_text=nav_scan_text,
             record=record,
             heuristics=(
@@ -2761,13 +2783,17 @@ class RegistryService:
 
         # Use the extraction-masked text so CAO/stent heuristics don't read non-procedural
         # plan/assessment sections (common source of "possible stent placement" false positives).
-        record, cao_detail_warnings = CaoDetailHeuristic().apply(masked_note_text, record)
+        record, cao_detail_warnings = profiler.run(
+            "cao_detail", CaoDetailHeuristic().apply, masked_note_text, record
+        )
         if cao_detail_warnings:
             extraction_warnings.extend(cao_detail_warnings)
 
         # Re-run granular→aggregate propagation after any heuristics/overrides that
         # update granular_data (e.g., navigation targets, cryobiopsy sites).
-        record, granular_warnings = _apply_granular_up_propagation(record)
+        record, granular_warnings = profiler.run(
+            "granular_up_propagation", _apply_granular_up_propagation, record
+        )
         if granular_warnings:
             extraction_warnings.extend(granular_warnings)
 
@@ -2794,92 +2820,179 @@ class RegistryService:
             suppress_conditional_pleural_and_stent_procedures,
         )
 
-        ebus_fallback_warnings = populate_ebus_node_events_fallback(record, masked_note_text)
+        ebus_fallback_warnings = profiler.run(
+            "populate_ebus_node_events_fallback",
+            populate_ebus_node_events_fallback,
+            record,
+            masked_note_text,
+        )
         if ebus_fallback_warnings:
             extraction_warnings.extend(ebus_fallback_warnings)
-        ebus_sanitize_warnings = sanitize_ebus_events(record, masked_note_text)
+        ebus_sanitize_warnings = profiler.run(
+            "sanitize_ebus_events", sanitize_ebus_events, record, masked_note_text
+        )
         if ebus_sanitize_warnings:
             extraction_warnings.extend(ebus_sanitize_warnings)
-        ebus_narrative_warnings = reconcile_ebus_sampling_from_narrative(record, masked_note_text)
+        ebus_narrative_warnings = profiler.run(
+            "reconcile_ebus_sampling_from_narrative",
+            reconcile_ebus_sampling_from_narrative,
+            record,
+            masked_note_text,
+        )
         if ebus_narrative_warnings:
             extraction_warnings.extend(ebus_narrative_warnings)
-        ebus_specimen_warnings = reconcile_ebus_sampling_from_specimen_log(record, masked_note_text)
+        ebus_specimen_warnings = profiler.run(
+            "reconcile_ebus_sampling_from_specimen_log",
+            reconcile_ebus_sampling_from_specimen_log,
+            record,
+            masked_note_text,
+        )
         if ebus_specimen_warnings:
             extraction_warnings.extend(ebus_specimen_warnings)
         # Re-sanitize after reconciliation steps that may add/merge stations_sampled.
-        ebus_resanitize_warnings = sanitize_ebus_events(record, masked_note_text)
+        ebus_resanitize_warnings = profiler.run(
+            "resanitize_ebus_events", sanitize_ebus_events, record, masked_note_text
+        )
         if ebus_resanitize_warnings:
             extraction_warnings.extend(ebus_resanitize_warnings)
-        ebus_inspection_warnings = reconcile_ebus_inspected_only_stations(record, masked_note_text)
+        ebus_inspection_warnings = profiler.run(
+            "reconcile_ebus_inspected_only_stations",
+            reconcile_ebus_inspected_only_stations,
+            record,
+            masked_note_text,
+        )
         if ebus_inspection_warnings:
             extraction_warnings.extend(ebus_inspection_warnings)
-        peripheral_tbna_reconcile_warnings = reconcile_peripheral_tbna_against_nodal_context(
-            record, masked_note_text
+        peripheral_tbna_reconcile_warnings = profiler.run(
+            "reconcile_peripheral_tbna_against_nodal_context",
+            reconcile_peripheral_tbna_against_nodal_context,
+            record,
+            masked_note_text,
         )
         if peripheral_tbna_reconcile_warnings:
             extraction_warnings.extend(peripheral_tbna_reconcile_warnings)
-        tbna_conventional_warnings = cull_tbna_conventional_against_ebus_sampling(record, masked_note_text)
+        tbna_conventional_warnings = profiler.run(
+            "cull_tbna_conventional_against_ebus_sampling",
+            cull_tbna_conventional_against_ebus_sampling,
+            record,
+            masked_note_text,
+        )
         if tbna_conventional_warnings:
             extraction_warnings.extend(tbna_conventional_warnings)
-        ebus_sampling_detail_warnings = enrich_ebus_node_event_sampling_details(record, masked_note_text)
+        ebus_sampling_detail_warnings = profiler.run(
+            "enrich_ebus_node_event_sampling_details",
+            enrich_ebus_node_event_sampling_details,
+            record,
+            masked_note_text,
+        )
         if ebus_sampling_detail_warnings:
             extraction_warnings.extend(ebus_sampling_detail_warnings)
-        ebus_outcome_warnings = enrich_ebus_node_event_outcomes(record, masked_note_text)
+        ebus_outcome_warnings = profiler.run(
+            "enrich_ebus_node_event_outcomes",
+            enrich_ebus_node_event_outcomes,
+            record,
+            masked_note_text,
+        )
         if ebus_outcome_warnings:
             extraction_warnings.extend(ebus_outcome_warnings)
-        ebus_gauge_warnings = enrich_linear_ebus_needle_gauge(record, masked_note_text)
+        ebus_gauge_warnings = profiler.run(
+            "enrich_linear_ebus_needle_gauge",
+            enrich_linear_ebus_needle_gauge,
+            record,
+            masked_note_text,
+        )
         if ebus_gauge_warnings:
             extraction_warnings.extend(ebus_gauge_warnings)
-        eus_b_detail_warnings = enrich_eus_b_sampling_details(record, masked_note_text)
+        eus_b_detail_warnings = profiler.run(
+            "enrich_eus_b_sampling_details", enrich_eus_b_sampling_details, record, masked_note_text
+        )
         if eus_b_detail_warnings:
             extraction_warnings.extend(eus_b_detail_warnings)
-        ebus_hollow_warnings = cull_hollow_ebus_claims(record, masked_note_text)
+        ebus_hollow_warnings = profiler.run(
+            "cull_hollow_ebus_claims", cull_hollow_ebus_claims, record, masked_note_text
+        )
         if ebus_hollow_warnings:
             extraction_warnings.extend(ebus_hollow_warnings)
 
-        try:
-            procedures = record.procedures_performed if record.procedures_performed else None
-            linear = procedures.linear_ebus if procedures is not None else None
-            node_events = getattr(linear, "node_events", None) if linear is not None else None
-            if linear is not None and isinstance(node_events, list):
-                sampling_actions = {"needle_aspiration", "core_biopsy", "forceps_biopsy"}
-                sampled_from_events = sort_ebus_stations(
-                    {
-                        str(getattr(event, "station", "")).strip().upper()
-                        for event in node_events
-                        if getattr(event, "action", None) in sampling_actions
-                        and str(getattr(event, "station", "")).strip()
-                    }
-                )
-                if hasattr(linear, "stations_sampled"):
-                    setattr(linear, "stations_sampled", sampled_from_events or None)
-        except Exception:
-            pass
+        with profiler.stage("sync_ebus_stations_sampled"):
+            try:
+                procedures = record.procedures_performed if record.procedures_performed else None
+                linear = procedures.linear_ebus if procedures is not None else None
+                node_events = getattr(linear, "node_events", None) if linear is not None else None
+                if linear is not None and isinstance(node_events, list):
+                    sampling_actions = {"needle_aspiration", "core_biopsy", "forceps_biopsy"}
+                    sampled_from_events = sort_ebus_stations(
+                        {
+                            str(getattr(event, "station", "")).strip().upper()
+                            for event in node_events
+                            if getattr(event, "action", None) in sampling_actions
+                            and str(getattr(event, "station", "")).strip()
+                        }
+                    )
+                    if hasattr(linear, "stations_sampled"):
+                        setattr(linear, "stations_sampled", sampled_from_events or None)
+            except Exception:
+                pass
 
-        pleural_biopsy_warnings = enrich_medical_thoracoscopy_biopsies_taken(record, masked_note_text)
+        pleural_biopsy_warnings = profiler.run(
+            "enrich_medical_thoracoscopy_biopsies_taken",
+            enrich_medical_thoracoscopy_biopsies_taken,
+            record,
+            masked_note_text,
+        )
         if pleural_biopsy_warnings:
             extraction_warnings.extend(pleural_biopsy_warnings)
-        bal_detail_warnings = enrich_bal_from_procedure_detail(record, masked_note_text)
+        bal_detail_warnings = profiler.run(
+            "enrich_bal_from_procedure_detail",
+            enrich_bal_from_procedure_detail,
+            record,
+            masked_note_text,
+        )
         if bal_detail_warnings:
             extraction_warnings.extend(bal_detail_warnings)
-        specimens_warnings = enrich_specimens_from_specimen_section(record, raw_note_text or "")
+        specimens_warnings = profiler.run(
+            "enrich_specimens_from_specimen_section",
+            enrich_specimens_from_specimen_section,
+            record,
+            raw_note_text or "",
+        )
         if specimens_warnings:
             extraction_warnings.extend(specimens_warnings)
-        aborted_target_warnings = reconcile_aborted_targets(record, masked_note_text)
+        aborted_target_warnings = profiler.run(
+            "reconcile_aborted_targets", reconcile_aborted_targets, record, masked_note_text
+        )
         if aborted_target_warnings:
             extraction_warnings.extend(aborted_target_warnings)
-        conditional_proc_warnings = suppress_conditional_pleural_and_stent_procedures(record, masked_note_text)
+        conditional_proc_warnings = profiler.run(
+            "suppress_conditional_pleural_and_stent_procedures",
+            suppress_conditional_pleural_and_stent_procedures,
+            record,
+            masked_note_text,
+        )
         if conditional_proc_warnings:
             extraction_warnings.extend(conditional_proc_warnings)
-        outcomes_status_warnings = enrich_procedure_success_status(record, masked_note_text)
+        outcomes_status_warnings = profiler.run(
+            "enrich_procedure_success_status",
+            enrich_procedure_success_status,
+            record,
+            masked_note_text,
+        )
         if outcomes_status_warnings:
             extraction_warnings.extend(outcomes_status_warnings)
-        complication_detail_warnings = enrich_outcomes_complication_details(record, masked_note_text)
+        complication_detail_warnings = profiler.run(
+            "enrich_outcomes_complication_details",
+            enrich_outcomes_complication_details,
+            record,
+            masked_note_text,
+        )
         if complication_detail_warnings:
             extraction_warnings.extend(complication_detail_warnings)
 
-        guardrail_outcome = self.clinical_guardrails.apply_record_guardrails(
-            masked_note_text, record
+        guardrail_outcome = profiler.run(
+            "record_guardrails",
+            self.clinical_guardrails.apply_record_guardrails,
+            masked_note_text,
+            record,
         )
         record = guardrail_outcome.record or record
         if guardrail_outcome.warnings:
@@ -2889,14 +3002,24 @@ class RegistryService:
         # so downstream omission scan + CPT derivation never build on template false-positives.
         from app.registry.postprocess.template_checkbox_negation import apply_template_checkbox_negation
 
-        record, checkbox_warnings = apply_template_checkbox_negation(raw_note_text or "", record)
+        record, checkbox_warnings = profiler.run(
+            "template_checkbox_negation",
+            apply_template_checkbox_negation,
+            raw_note_text or "",
+            record,
+        )
         if checkbox_warnings:
             extraction_warnings.extend(checkbox_warnings)
 
         # Evidence enforcement pass on the final record state (post-heuristics + checkbox negation).
         from app.registry.evidence.verifier import verify_evidence_integrity
 
-        record, verifier_warnings = verify_evidence_integrity(record, raw_note_text or masked_note_text)
+        record, verifier_warnings = profiler.run(
+            "verify_evidence_integrity",
+            verify_evidence_integrity,
+            record,
+            raw_note_text or masked_note_text,
+        )
         if verifier_warnings:
             extraction_warnings.extend(verifier_warnings)
 
@@ -2908,7 +3031,12 @@ class RegistryService:
             reconcile_complications_from_narrative,
         )
 
-        comp_warnings = reconcile_complications_from_narrative(record, masked_note_text)
+        comp_warnings = profiler.run(
+            "reconcile_complications_from_narrative",
+            reconcile_complications_from_narrative,
+            record,
+            masked_note_text,
+        )
         if comp_warnings:
             extraction_warnings.extend(comp_warnings)
 
@@ -2922,11 +3050,13 @@ class RegistryService:
         # Omission detection: flag "silent failures" where high-value terms are present
         # in the text but the corresponding registry fields are missing/false.
         # Run this late so deterministic/postprocess backfills don't create false alarms.
-        omission_warnings = scan_for_omissions(masked_note_text, record)
+        omission_warnings = profiler.run(
+            "scan_for_omissions", scan_for_omissions, masked_note_text, record
+        )
         if omission_warnings:
             extraction_warnings.extend(omission_warnings)
 
-        derivation = derive_registry_to_cpt(record)
+        derivation = profiler.run("derive_registry_to_cpt", derive_registry_to_cpt, record)
         derived_codes = [c.code for c in derivation.codes]
         base_warnings = list(extraction_warnings)
         self_correct_warnings: list[str] = []
@@ -2966,7 +3096,7 @@ class RegistryService:
                 needs_manual_review = True
                 baseline_needs_manual_review = True
 
-            ml_case = auditor.classify(raw_text_for_audit)
+            ml_case = profiler.run("raw_ml_classify", auditor.classify, raw_text_for_audit)
             coder_difficulty = ml_case.difficulty.value if auditor_loaded else "unavailable"
 
             audit_preds = auditor.audit_predictions(ml_case, cfg)
@@ -3597,6 +3727,7 @@ class RegistryService:
             audit_warnings=audit_warnings,
             audit_report=audit_report,
             self_correction=self_correction_meta,
+            stage_timings=profiler.summary(),
         )
 
     def _apply_guardrails_to_result(
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from app.common.derived_text import copy_text_and_meta, derived_text
 from app.registry.processing.focus import get_procedure_focus
 
 PREFERRED_SEGMENT_TYPES: tuple[str, ...] = (
@@ -23,6 +24,7 @@ PREFERRED_SEGMENT_TYPES: tuple[str, ...] = (
 )
 
 
+@derived_text("focus_note_for_extraction", copy=copy_text_and_meta)
 def focus_note_for_extraction(note_text: str) -> tuple[str, dict[str, Any]]:
     """Return (focused_text, meta) for deterministic extraction.
 
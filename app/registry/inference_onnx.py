@@ -27,9 +27,11 @@ from typing import Any
 import numpy as np
 
 from app.common.logger import get_logger
+from app.common.tokenization_cache import tokenize_note
 
 logger = get_logger("registry.inference_onnx")
 
+
 # Default paths for ONNX model artifacts
 MODELS_DIR = Path("models")
 ONNX_MODEL_PATH = MODELS_DIR / "registry_model_int8.onnx"
@@ -110,14 +112,9 @@ class HeadTailTokenizer:
         Returns:
             Dict with input_ids and attention_mask as numpy arrays
         """
-        # Tokenize without truncation first
-        tokens = self.tokenizer(
-            text,
-            add_special_tokens=False,
-            truncation=False,
-            return_tensors="np",
-        )
-        input_ids = tokens["input_ids"][0]
+        # Tokenize without truncation first (shared with other predictors that use
+        # the same vocabulary within a request; see app.common.tokenization_cache)
+        input_ids = tokenize_note(self.tokenizer, text).ids
 
         # Apply Head + Tail if too long
         content_max = self.max_length - 2  # Reserve for [CLS] and [SEP]
@@ -186,6 +183,7 @@ class ONNXRegistryPredictor:
         self.available = False
         self._max_length = max_length
         self._session = None
+        self._io_binding = None
         self._tokenizer = None
         self._head_tail_tokenizer = None
         self._label_names: list[str] = []
@@ -219,9 +217,11 @@ class ONNXRegistryPredictor:
         label_fields_path: Path,
     ) -> None:
         """Load ONNX model, tokenizer, thresholds, and label names."""
-        import onnxruntime as ort
         from transformers import AutoTokenizer
 
+        from app.infra.ort_session import FixedShapeIOBinding, create_inference_session
+        from app.infra.settings import get_ort_session_profile
+
         # Check paths exist
         if not model_path.exists():
             raise FileNotFoundError(f"ONNX model not found: {model_path}")
@@ -230,16 +230,23 @@ class ONNXRegistryPredictor:
         if not label_fields_path.exists():
             raise FileNotFoundError(f"Label fields not found: {label_fields_path}")
 
-        # Load ONNX model with CPU provider
-        sess_options = ort.SessionOptions()
-        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
-        sess_options.intra_op_num_threads = 4
-
-        self._session = ort.InferenceSession(
-            str(model_path),
-            sess_options=sess_options,
-            providers=["CPUExecutionProvider"],
-        )
+        # Load ONNX model with CPU provider (threads/optimization/graph cache from
+        # the ORT_* session profile; forked batch workers need 1 intra-op thread).
+        profile = get_ort_session_profile()
+        self._session = create_inference_session(model_path, profile=profile)
+
+        # Head + Tail tokenization pads every note to max_length, so input shapes
+        # are fixed and can be bound to preallocated buffers.
+        if profile.io_binding:
+            fixed_shape = (1, self._max_length)
+            try:
+                self._io_binding = FixedShapeIOBinding(
+                    self._session,
+                    {"input_ids": fixed_shape, "attention_mask": fixed_shape},
+                )
+            except Exception as exc:  # noqa: BLE001 - fall back to session.run
+                logger.info("ONNX IO binding disabled: %s", exc)
+                self._io_binding = None
 
         # Load tokenizer
         self._tokenizer = AutoTokenizer.from_pretrained(str(tokenizer_path))
@@ -375,7 +382,10 @@ class ONNXRegistryPredictor:
             inputs = self._head_tail_tokenizer(text)
 
             # Run inference
-            logits = self._session.run(None, inputs)[0]
+            if self._io_binding is not None and self._io_binding.matches(inputs):
+                logits = self._io_binding.run(inputs)[0]
+            else:
+                logits = self._session.run(None, inputs)[0]
             probs = self._sigmoid(logits[0])
 
         except Exception as e:
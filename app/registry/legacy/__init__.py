@@ -1,4 +1,16 @@
+from __future__ import annotations
+
+from typing import Any
+
 from .adapter import report_to_registry
-from .supabase_sink import upsert_bundle
 
 __all__ = ["report_to_registry", "upsert_bundle"]
+
+
+def __getattr__(name: str) -> Any:
+    # supabase_sink imports psycopg; load it only when a bundle is actually written.
+    if name == "upsert_bundle":
+        from .supabase_sink import upsert_bundle as _upsert_bundle
+
+        return _upsert_bundle
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 
+from app.common.derived_text import derived_text
 from app.common.sectionizer import SectionizerService
 
 
@@ -130,6 +131,38 @@ def _dedupe_bodies(bodies: list[str]) -> list[str]:
     return out
 
 
+_FOCUS_SECTION_HEADINGS: tuple[str, ...] = tuple(
+    sorted(
+        {
+            "PROCEDURE",
+            "PROCEDURE IN DETAIL",
+            "DESCRIPTION OF PROCEDURE",
+            "FINDINGS",
+            "EBUS-FINDINGS",
+            "EBUS FINDINGS",
+            "LYMPH NODES EVALUATED",
+            "AIRWAY INSPECTION",
+            "TECHNIQUE",
+            "OPERATIVE REPORT",
+            "SPECIMEN(S)",
+            "SPECIMENS",
+            "IMPRESSION",
+        }
+    )
+)
+
+_FOCUS_SECTIONIZER: SectionizerService | None = None
+
+
+def _get_focus_sectionizer() -> SectionizerService:
+    global _FOCUS_SECTIONIZER
+    if _FOCUS_SECTIONIZER is None:
+        # Building the medspaCy pipeline per call dominated short notes.
+        _FOCUS_SECTIONIZER = SectionizerService(headings=_FOCUS_SECTION_HEADINGS)
+    return _FOCUS_SECTIONIZER
+
+
+@derived_text("procedure_focus")
 def get_procedure_focus(note_text: str) -> str:
     """Return a focused view of the note for procedure extraction.
 
@@ -174,27 +207,7 @@ def get_procedure_focus(note_text: str) -> str:
     # 2) Sectionizer handles isolated headings and formatting quirks for a small
     # curated set. Include both narrative and supporting headings.
     try:
-        sectionizer = SectionizerService(
-            headings=tuple(
-                sorted(
-                    {
-                        "PROCEDURE",
-                        "PROCEDURE IN DETAIL",
-                        "DESCRIPTION OF PROCEDURE",
-                        "FINDINGS",
-                        "EBUS-FINDINGS",
-                        "EBUS FINDINGS",
-                        "LYMPH NODES EVALUATED",
-                        "AIRWAY INSPECTION",
-                        "TECHNIQUE",
-                        "OPERATIVE REPORT",
-                        "SPECIMEN(S)",
-                        "SPECIMENS",
-                        "IMPRESSION",
-                    }
-                )
-            )
-        )
+        sectionizer = _get_focus_sectionizer()
         sections = sectionizer.sectionize(original)
         for section in sections:
             title_raw = (section.title or "").strip()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 from typing import Iterable
 
+from app.common.derived_text import copy_text_and_meta, derived_text
 from app.common.text_cleaning import (
     DEFAULT_TABLE_TOOL_KEYWORDS,
     find_empty_table_row_spans,
@@ -81,6 +82,7 @@ def _find_template_checkbox_spans(text: str) -> tuple[list[tuple[int, int]], int
     return spans, len(spans)
 
 
+@derived_text("mask_offset_preserving")
 def mask_offset_preserving(text: str, patterns: Iterable[str] = PATTERNS) -> str:
     """Mask matched spans with spaces while preserving length and newlines."""
     raw = text or ""
@@ -108,6 +110,7 @@ def mask_offset_preserving(text: str, patterns: Iterable[str] = PATTERNS) -> str
     return masked
 
 
+@derived_text("mask_extraction_noise", copy=copy_text_and_meta)
 def mask_extraction_noise(text: str) -> tuple[str, dict[str, object]]:
     """Mask template noise and non-procedural sections for extraction."""
     base = mask_offset_preserving(text or "")
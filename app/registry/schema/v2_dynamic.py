@@ -6,7 +6,11 @@ type overrides. The stable public import surface remains `app.registry.schema`.
 
 from __future__ import annotations
 
+import hashlib
+import importlib
 import json
+import logging
+import os
 import re
 from uuid import UUID
 from typing import Any, Literal
@@ -37,6 +41,9 @@ from app.registry.schema_granular import (
 )
 
 _SCHEMA_PATH = KnowledgeSettings().registry_schema_path
+_GENERATED_MODULE = "app.registry.schema.v2_generated"
+
+logger = logging.getLogger(__name__)
 
 
 class LinearEBUSProcedure(BaseModel):
@@ -281,6 +288,58 @@ def _load_schema() -> dict[str, Any]:
     return json.loads(_SCHEMA_PATH.read_text())
 
 
+def _override_name(override: Any) -> str:
+    if isinstance(override, type):
+        return f"{override.__module__}.{override.__qualname__}"
+    return repr(override)
+
+
+def registry_schema_fingerprint(raw: bytes | None = None) -> str:
+    """Hash of the registry JSON schema plus the CUSTOM_FIELD_TYPES overrides.
+
+    The generated static models (`v2_generated`) embed this value; a mismatch
+    means they were generated from a different schema and must not be used.
+    """
+    if raw is None:
+        raw = _SCHEMA_PATH.read_bytes()
+    digest = hashlib.sha256(raw)
+    for path in sorted(CUSTOM_FIELD_TYPES):
+        override = _override_name(CUSTOM_FIELD_TYPES[path])
+        digest.update(f"\n{'.'.join(path)}={override}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _static_models_enabled() -> bool:
+    raw = os.getenv("REGISTRY_SCHEMA_STATIC_MODELS", "1").strip().lower()
+    return raw not in ("0", "false", "no")
+
+
+def _load_static_base_model() -> type[BaseModel] | None:
+    """Return the code-generated RegistryRecord base when it matches the schema.
+
+    Returns None (caller falls back to dynamic `create_model` building) when the
+    static models are disabled, missing, or were generated from another schema.
+    """
+    if not _static_models_enabled() or not _SCHEMA_PATH.exists():
+        return None
+    try:
+        generated = importlib.import_module(_GENERATED_MODULE)
+    except ImportError:
+        return None
+
+    fingerprint = registry_schema_fingerprint()
+    if getattr(generated, "SCHEMA_FINGERPRINT", None) != fingerprint:
+        logger.warning(
+            "Generated registry models are stale for %s; building models dynamically. "
+            "Regenerate with `python ops/tools/generate_registry_models.py`.",
+            _SCHEMA_PATH,
+        )
+        return None
+
+    _MODEL_CACHE.update(generated.MODELS_BY_PATH)
+    return generated.MODELS_BY_PATH[("RegistryRecord",)]
+
+
 def _pascal_case(parts: list[str]) -> str:
     tokens = []
     for part in parts:
@@ -349,8 +408,10 @@ def _build_submodel(path: tuple[str, ...], schema: dict[str, Any]) -> type[BaseM
 
 
 def _build_registry_model() -> type[BaseModel]:
-    schema = _load_schema()
-    base_model = _build_submodel(("RegistryRecord",), schema)
+    base_model = _load_static_base_model()
+    if base_model is None:
+        schema = _load_schema()
+        base_model = _build_submodel(("RegistryRecord",), schema)
 
     class RegistryRecord(base_model):  # type: ignore[misc,valid-type]
         """Concrete registry record model with evidence fields.
@@ -360,7 +421,8 @@ def _build_registry_model() -> type[BaseModel]:
         using derive_aggregate_fields() for backward compatibility.
         """
 
-        model_config = ConfigDict(extra="ignore")
+        # Generated base models defer schema building; the concrete record must not.
+        model_config = ConfigDict(extra="ignore", defer_build=False)
 
         evidence: dict[str, list[Span]] = Field(default_factory=dict)
         version: str | None = None
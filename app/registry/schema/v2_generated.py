@@ -0,0 +1,1227 @@
+"""Static registry models generated from the registry JSON schema.
+
+DO NOT EDIT: regenerate with `python ops/tools/generate_registry_models.py`.
+`app.registry.schema.v2_dynamic` only uses these classes when
+SCHEMA_FINGERPRINT matches the live schema; otherwise it builds the same
+models dynamically. Core schemas are deferred and built once as part of the
+concrete RegistryRecord instead of once per nested class.
+"""
+
+# ruff: noqa: E501
+
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict
+
+from app.registry.schema.granular_models import AirwayDeviceActionProcedure, AirwayStentProcedure, ClinicalContext, IPCProcedure, PatientDemographics
+from app.registry.schema.v2_dynamic import CaseTargets, ClinicalCourse, ImagingSummary, LinearEBUSProcedure, ThermalAblationProcedure
+
+
+SCHEMA_FINGERPRINT = "83763503e22d4a7ac5ee78ec2c4015412df6ce3ad781cbcb9fcbc60a315e4b16"
+
+
+class RegistryrecordProviders(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    attending_name: str | None = None
+    attending_npi: str | None = None
+    fellow_name: str | None = None
+    fellow_pgy_level: int | None = None
+    assistant_name: str | None = None
+    assistant_role: Literal["RN", "RT", "Tech", "Resident", "PA", "NP", "Medical Student"] | None = None
+    trainee_present: bool | None = None
+    rose_present: bool | None = None
+
+
+class RegistryrecordProvidersTeamItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    role: Literal["attending", "fellow", "assistant", "anesthesia", "other"] | None = None
+    name: str | None = None
+    npi: str | None = None
+    fellow_pgy_level: int | None = None
+    assistant_role: Literal["RN", "RT", "Tech", "Resident", "PA", "NP", "Medical Student"] | None = None
+
+
+class RegistryrecordPatient(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    age: int | None = None
+    sex: Literal["M", "F", "O"] | None = None
+
+
+class RegistryrecordProcedure(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    indication: str | None = None
+
+
+class RegistryrecordRiskAssessment(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    asa_class: int | None = None
+    anticoagulant_use: str | None = None
+    mallampati_score: int | None = None
+
+
+class RegistryrecordProcedureSetting(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    location: Literal["OR", "Bronchoscopy Suite", "Pleural Suite", "ICU", "Bedside", "IR Suite", "Hybrid OR"] | None = None
+    patient_position: Literal["Supine", "Lateral Decubitus - Left", "Lateral Decubitus - Right", "Prone", "Semi-Fowler"] | None = None
+    airway_type: Literal["Native", "ETT", "Tracheostomy", "LMA", "iGel"] | None = None
+    ett_size: float | None = None
+    airway_device_type: Literal["ETT", "DLT", "Rigid", "Tracheostomy", "LMA", "iGel", "Native", "Other"] | None = None
+    ett_size_mm: float | None = None
+    dlt_size_fr: int | None = None
+    rigid_barrel_size_mm: float | None = None
+
+
+class RegistryrecordSedationMedicationsItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    agent: str | None = None
+    total_dose: float | None = None
+    unit: Literal["mg", "mcg", "g", "mL", "units", "other"] | None = None
+    infusion_rate: float | None = None
+    infusion_unit: str | None = None
+    duration_minutes: int | None = None
+
+
+class RegistryrecordSedation(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    type: Literal["Moderate", "Deep", "General", "MAC", "Local Only", "Topical Only"] | None = None
+    anesthesia_provider: Literal["Anesthesiologist", "CRNA", "Proceduralist", "None"] | None = None
+    agents_used: list[str] | None = None
+    medications: list[RegistryrecordSedationMedicationsItem] | None = None
+    paralytic_used: bool | None = None
+    reversal_given: bool | None = None
+    reversal_agent: Literal["Flumazenil", "Naloxone", "Sugammadex", "Neostigmine", "Other"] | None = None
+    reversal_agent_other: str | None = None
+    start_time: str | None = None
+    end_time: str | None = None
+    intraservice_minutes: int | None = None
+
+
+class RegistryrecordEquipment(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    bronchoscope_type: Literal["Diagnostic", "Therapeutic", "Ultrathin", "EBUS", "Single-use"] | None = None
+    bronchoscope_model: str | None = None
+    bronchoscope_outer_diameter_mm: float | None = None
+    fluoroscopy_used: bool | None = None
+    fluoroscopy_time_seconds: float | None = None
+    fluoroscopy_dose_mgy: float | None = None
+    navigation_platform: Literal["Ion", "Monarch", "Galaxy", "superDimension", "ILLUMISITE", "SPiN", "LungVision", "ARCHIMEDES", "None"] | None = None
+    cbct_used: bool | None = None
+    augmented_fluoroscopy: bool | None = None
+
+
+class RegistryrecordProceduresPerformedDiagnosticBronchoscopy(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    inspection_findings: str | None = None
+    airway_abnormalities: list[Literal["Normal", "Endobronchial lesion", "Extrinsic compression", "Mucosal abnormality", "Secretions", "Blood", "Tracheomalacia", "Bronchomalacia", "Stenosis", "Vocal cord abnormality", "Fistula", "Other"]] | None = None
+
+
+class RegistryrecordProceduresPerformedIntubation(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    method: str | None = None
+    route: str | None = None
+    tube_size: str | None = None
+    notes: str | None = None
+
+
+class RegistryrecordProceduresPerformedBal(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    location: str | None = None
+    volume_instilled_ml: float | None = None
+    volume_recovered_ml: float | None = None
+    appearance: Literal["Clear", "Bloody", "Purulent", "Milky", "Other"] | None = None
+
+
+class RegistryrecordProceduresPerformedBronchialWash(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    location: str | None = None
+
+
+class RegistryrecordProceduresPerformedBrushings(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    locations: list[str] | None = None
+    brush_type: Literal["Standard", "Protected"] | None = None
+
+
+class RegistryrecordProceduresPerformedEndobronchialBiopsy(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    locations: list[str] | None = None
+    number_of_samples: int | None = None
+    forceps_type: Literal["Standard", "Cryoprobe"] | None = None
+
+
+class RegistryrecordProceduresPerformedTbnaConventional(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    stations_sampled: list[str] | None = None
+    needle_gauge: Literal[19, 21, 22, 25] | None = None
+    passes_per_station: int | None = None
+
+
+class RegistryrecordProceduresPerformedPeripheralTbna(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    targets_sampled: list[str] | None = None
+
+
+class RegistryrecordProceduresPerformedEusB(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    sites_sampled: list[str] | None = None
+    needle_gauge: Literal["19G", "21G", "22G", "25G"] | None = None
+    passes: int | None = None
+    rose_result: str | None = None
+    complications: str | None = None
+
+
+class RegistryrecordProceduresPerformedRadialEbus(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    probe_position: Literal["Concentric", "Eccentric", "Adjacent", "Not visualized"] | None = None
+    guide_sheath_used: bool | None = None
+    guide_sheath_size: Literal["Large (2.6mm)", "Small (1.95mm)"] | None = None
+
+
+class RegistryrecordProceduresPerformedNavigationalBronchoscopy(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    target_reached: bool | None = None
+    divergence_mm: float | None = None
+    tool_in_lesion_confirmed: bool | None = None
+    confirmation_method: Literal["Radial EBUS", "CBCT", "Fluoroscopy", "Augmented Fluoroscopy", "None"] | None = None
+    sampling_tools_used: list[Literal["Needle", "Forceps", "Brush", "Cryoprobe", "NeedleInNeedle"]] | None = None
+    number_of_biopsies: int | None = None
+
+
+class RegistryrecordProceduresPerformedFiducialPlacement(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+
+
+class RegistryrecordProceduresPerformedDyeMarkerPlacement(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    agent: Literal["Indocyanine green", "Methylene blue", "Isosulfan blue", "Other"] | None = None
+    volume_ml: float | None = None
+    target_location: str | None = None
+
+
+class RegistryrecordProceduresPerformedTransbronchialBiopsy(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    locations: list[str] | None = None
+    number_of_samples: int | None = None
+    forceps_type: Literal["Standard", "Cryoprobe"] | None = None
+    cryoprobe_size_mm: Literal[1.1, 1.7, 1.9, 2.4] | None = None
+
+
+class RegistryrecordProceduresPerformedTransbronchialCryobiopsy(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    indication: Literal["ILD", "Lung transplant rejection", "Peripheral nodule", "Other"] | None = None
+    probe_size_mm: Literal[1.1, 1.7, 1.9, 2.4] | None = None
+    freeze_time_seconds: float | None = None
+    locations_biopsied: list[str] | None = None
+    number_of_samples: int | None = None
+    blocker_used: bool | None = None
+    blocker_type: Literal["Fogarty", "Arndt", "Cohen", "Cryoprobe sheath"] | None = None
+
+
+class RegistryrecordProceduresPerformedTherapeuticAspiration(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    material: Literal["Mucus plug", "Mucus", "Blood/clot", "Purulent secretions", "Other"] | None = None
+    location: str | None = None
+
+
+class RegistryrecordProceduresPerformedForeignBodyRemoval(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    foreign_body_type: str | None = None
+    location: str | None = None
+    retrieval_tool: Literal["Forceps", "Basket", "Cryoprobe", "Snare", "Other"] | None = None
+    successful: bool | None = None
+    rigid_bronchoscopy_required: bool | None = None
+
+
+class RegistryrecordProceduresPerformedAirwayDilation(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    location: str | None = None
+    target_anatomy: Literal["Stent expansion", "Stenosis", "Other"] | None = None
+    etiology: Literal["Post-intubation", "Post-tracheostomy", "Malignant", "Inflammatory", "Anastomotic", "Idiopathic", "Other"] | None = None
+    method: Literal["Balloon", "Rigid bronchoscope", "Bougie"] | None = None
+    balloon_diameter_mm: float | None = None
+    pre_dilation_diameter_mm: float | None = None
+    post_dilation_diameter_mm: float | None = None
+
+
+class RegistryrecordProceduresPerformedMechanicalDebulking(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    method: Literal["Rigid coring", "Microdebrider", "Cryoextraction", "Forceps debulking"] | None = None
+    location: str | None = None
+    material_type: Literal["tumor", "granulation", "necrotic_inflammatory", "fungal_material", "hair", "foreign_body", "mucus", "other_non_tumor", "unknown"] | None = None
+
+
+class RegistryrecordProceduresPerformedTherapeuticOutcomes(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    pre_obstruction_pct: int | None = None
+    post_obstruction_pct: int | None = None
+    pre_diameter_mm: float | None = None
+    post_diameter_mm: float | None = None
+
+
+class RegistryrecordProceduresPerformedCryotherapy(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    indication: Literal["Tumor debulking", "Foreign body", "Clot extraction", "Granulation tissue", "Other"] | None = None
+    probe_size_mm: Literal[1.1, 1.7, 1.9, 2.4] | None = None
+    location: str | None = None
+    freeze_cycles: int | None = None
+
+
+class RegistryrecordProceduresPerformedPhotodynamicTherapy(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    photosensitizer: str | None = None
+    location: str | None = None
+    energy_delivered_joules: float | None = None
+
+
+class RegistryrecordProceduresPerformedBrachytherapyCatheter(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    location: str | None = None
+    catheter_placed: bool | None = None
+
+
+class RegistryrecordProceduresPerformedBlvr(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    procedure_type: Literal["Valve placement", "Valve removal", "Valve assessment", "Coil placement"] | None = None
+    target_lobe: Literal["RUL", "RML", "RLL", "LUL", "LLL", "Lingula"] | None = None
+    valve_type: Literal["Zephyr (Pulmonx)", "Spiration (Olympus)"] | None = None
+    valve_sizes: list[str] | None = None
+    number_of_valves: int | None = None
+    segments_treated: list[str] | None = None
+    collateral_ventilation_assessment: Literal["Chartis negative", "Chartis positive", "Chartis indeterminate", "Fissure integrity >90%", "Not assessed"] | None = None
+    target_lobe_volume_ml: float | None = None
+    heterogeneity_index: float | None = None
+
+
+class RegistryrecordProceduresPerformedBalloonOcclusion(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    occlusion_location: str | None = None
+    air_leak_result: str | None = None
+    device_size: str | None = None
+
+
+class RegistryrecordProceduresPerformedBpfSealant(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    sealant_type: str | None = None
+    location: str | None = None
+    notes: str | None = None
+
+
+class RegistryrecordProceduresPerformedPeripheralAblation(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    modality: Literal["Microwave", "Radiofrequency", "Cryoablation", "Photodynamic", "Steam/Vapor"] | None = None
+    device_name: str | None = None
+    device_manufacturer: str | None = None
+    target_location: str | None = None
+    lesion_size_mm: float | None = None
+    ablation_duration_seconds: float | None = None
+    power_setting: float | None = None
+    number_of_ablations: int | None = None
+    margin_assessed: bool | None = None
+    margin_assessment_method: Literal["CBCT", "Biopsy", "Fluoroscopy"] | None = None
+    immediate_imaging_result: str | None = None
+
+
+class RegistryrecordProceduresPerformedBronchialThermoplasty(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    session_number: Literal[1, 2, 3] | None = None
+    areas_treated: list[str] | None = None
+    number_of_activations: int | None = None
+
+
+class RegistryrecordProceduresPerformedWholeLungLavage(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    side: Literal["Right", "Left"] | None = None
+    total_volume_liters: float | None = None
+    cycles: int | None = None
+    indication: Literal["PAP", "Silicosis", "Other"] | None = None
+
+
+class RegistryrecordProceduresPerformedRigidBronchoscopy(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    rigid_scope_size: float | None = None
+    indication: str | None = None
+    jet_ventilation_used: bool | None = None
+
+
+class RegistryrecordProceduresPerformedPercutaneousTracheostomy(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    method: Literal["percutaneous", "open"] | None = None
+    device_name: str | None = None
+    size: str | None = None
+
+
+class RegistryrecordProceduresPerformedPegInsertion(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+
+
+class RegistryrecordProceduresPerformedNeckUltrasound(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    vessels_visualized: bool | None = None
+    findings: str | None = None
+
+
+class RegistryrecordProceduresPerformedChestUltrasound(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    image_documentation: bool | None = None
+    hemithorax: Literal["Right", "Left", "Bilateral"] | None = None
+    effusion_volume: Literal["None", "Minimal", "Small", "Moderate", "Large"] | None = None
+    effusion_echogenicity: Literal["Anechoic", "Hypoechoic", "Isoechoic", "Hyperechoic"] | None = None
+    effusion_loculations: Literal["None", "Thin", "Thick"] | None = None
+    diaphragmatic_motion: Literal["Normal", "Diminished", "Absent"] | None = None
+    lung_sliding_pre: Literal["Present", "Absent"] | None = None
+    lung_sliding_post: Literal["Present", "Absent"] | None = None
+    lung_consolidation_present: bool | None = None
+    pleura_characteristics: Literal["Normal", "Thick", "Nodular"] | None = None
+    impression_text: str | None = None
+    plan_text: str | None = None
+
+
+class RegistryrecordProceduresPerformedTherapeuticInjection(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    medication: str | None = None
+    dose: str | None = None
+    volume_ml: float | None = None
+    location: str | None = None
+    cpt31573_eligible: bool | None = None
+
+
+class RegistryrecordProceduresPerformed(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    diagnostic_bronchoscopy: RegistryrecordProceduresPerformedDiagnosticBronchoscopy | None = None
+    intubation: RegistryrecordProceduresPerformedIntubation | None = None
+    airway_device_action: AirwayDeviceActionProcedure | None = None
+    bal: RegistryrecordProceduresPerformedBal | None = None
+    bronchial_wash: RegistryrecordProceduresPerformedBronchialWash | None = None
+    brushings: RegistryrecordProceduresPerformedBrushings | None = None
+    endobronchial_biopsy: RegistryrecordProceduresPerformedEndobronchialBiopsy | None = None
+    tbna_conventional: RegistryrecordProceduresPerformedTbnaConventional | None = None
+    peripheral_tbna: RegistryrecordProceduresPerformedPeripheralTbna | None = None
+    linear_ebus: LinearEBUSProcedure | None = None
+    eus_b: RegistryrecordProceduresPerformedEusB | None = None
+    radial_ebus: RegistryrecordProceduresPerformedRadialEbus | None = None
+    navigational_bronchoscopy: RegistryrecordProceduresPerformedNavigationalBronchoscopy | None = None
+    fiducial_placement: RegistryrecordProceduresPerformedFiducialPlacement | None = None
+    dye_marker_placement: RegistryrecordProceduresPerformedDyeMarkerPlacement | None = None
+    transbronchial_biopsy: RegistryrecordProceduresPerformedTransbronchialBiopsy | None = None
+    transbronchial_cryobiopsy: RegistryrecordProceduresPerformedTransbronchialCryobiopsy | None = None
+    therapeutic_aspiration: RegistryrecordProceduresPerformedTherapeuticAspiration | None = None
+    foreign_body_removal: RegistryrecordProceduresPerformedForeignBodyRemoval | None = None
+    airway_dilation: RegistryrecordProceduresPerformedAirwayDilation | None = None
+    airway_stent: AirwayStentProcedure | None = None
+    airway_stent_revision: AirwayStentProcedure | None = None
+    thermal_ablation: ThermalAblationProcedure | None = None
+    mechanical_debulking: RegistryrecordProceduresPerformedMechanicalDebulking | None = None
+    therapeutic_outcomes: RegistryrecordProceduresPerformedTherapeuticOutcomes | None = None
+    cryotherapy: RegistryrecordProceduresPerformedCryotherapy | None = None
+    photodynamic_therapy: RegistryrecordProceduresPerformedPhotodynamicTherapy | None = None
+    brachytherapy_catheter: RegistryrecordProceduresPerformedBrachytherapyCatheter | None = None
+    blvr: RegistryrecordProceduresPerformedBlvr | None = None
+    balloon_occlusion: RegistryrecordProceduresPerformedBalloonOcclusion | None = None
+    bpf_sealant: RegistryrecordProceduresPerformedBpfSealant | None = None
+    peripheral_ablation: RegistryrecordProceduresPerformedPeripheralAblation | None = None
+    bronchial_thermoplasty: RegistryrecordProceduresPerformedBronchialThermoplasty | None = None
+    whole_lung_lavage: RegistryrecordProceduresPerformedWholeLungLavage | None = None
+    rigid_bronchoscopy: RegistryrecordProceduresPerformedRigidBronchoscopy | None = None
+    percutaneous_tracheostomy: RegistryrecordProceduresPerformedPercutaneousTracheostomy | None = None
+    peg_insertion: RegistryrecordProceduresPerformedPegInsertion | None = None
+    neck_ultrasound: RegistryrecordProceduresPerformedNeckUltrasound | None = None
+    chest_ultrasound: RegistryrecordProceduresPerformedChestUltrasound | None = None
+    therapeutic_injection: RegistryrecordProceduresPerformedTherapeuticInjection | None = None
+
+
+class RegistryrecordPleuralProceduresThoracentesis(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    side: Literal["Right", "Left", "Bilateral"] | None = None
+    guidance: Literal["Ultrasound", "CT", "None/Landmark"] | None = None
+    indication: Literal["Diagnostic", "Therapeutic", "Both"] | None = None
+    fluid_appearance: Literal["Serous/Clear", "Serosanguinous", "Bloody", "Purulent", "Milky/Chylous", "Turbid"] | None = None
+    volume_removed_ml: float | None = None
+    manometry_performed: bool | None = None
+    opening_pressure_cmh2o: float | None = None
+    closing_pressure_cmh2o: float | None = None
+
+
+class RegistryrecordPleuralProceduresChestTube(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    action: Literal["Insertion", "Removal", "Repositioning", "Exchange"] | None = None
+    side: Literal["Right", "Left", "Bilateral"] | None = None
+    indication: Literal["Pneumothorax", "Effusion drainage", "Empyema", "Hemothorax", "Post-procedural"] | None = None
+    tube_type: Literal["Pigtail", "Straight", "Surgical/Large bore"] | None = None
+    tube_size_fr: int | None = None
+    guidance: Literal["Ultrasound", "CT", "Fluoroscopy", "None"] | None = None
+
+
+class RegistryrecordPleuralProceduresMedicalThoracoscopy(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    side: Literal["Right", "Left"] | None = None
+    scope_type: Literal["Rigid", "Semi-rigid", "Flex-rigid"] | None = None
+    anesthesia_type: Literal["Local with sedation", "General"] | None = None
+    findings: str | None = None
+    biopsies_taken: bool | None = None
+    number_of_biopsies: int | None = None
+    adhesiolysis_performed: bool | None = None
+
+
+class RegistryrecordPleuralProceduresPleurodesis(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    method: Literal["Chemical - slurry", "Chemical - poudrage", "Mechanical", "IPC-related autopleurodesis"] | None = None
+    agent: Literal["Talc", "Doxycycline", "Bleomycin", "Povidone-iodine", "Silver nitrate", "Other"] | None = None
+    talc_dose_grams: float | None = None
+    indication: Literal["Malignant effusion", "Recurrent pneumothorax", "Recurrent benign effusion"] | None = None
+
+
+class RegistryrecordPleuralProceduresPleuralBiopsy(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    side: Literal["Right", "Left"] | None = None
+    guidance: Literal["Ultrasound", "CT"] | None = None
+    needle_type: Literal["Cutting needle", "Abrams needle", "Tru-cut"] | None = None
+    number_of_samples: int | None = None
+
+
+class RegistryrecordPleuralProceduresFibrinolyticTherapy(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    agents: list[Literal["tPA", "DNase", "Streptokinase", "Urokinase"]] | None = None
+    tpa_dose_mg: float | None = None
+    dnase_dose_mg: float | None = None
+    indication: Literal["Complex parapneumonic", "Empyema", "Hemothorax", "Malignant effusion"] | None = None
+    number_of_doses: int | None = None
+
+
+class RegistryrecordPleuralProceduresChestTubeRemoval(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    performed: bool | None = None
+    action: Literal["Insertion", "Removal", "Repositioning", "Exchange"] | None = None
+    side: Literal["Right", "Left"] | None = None
+    indication: Literal["Pneumothorax", "Effusion drainage", "Empyema", "Hemothorax", "Post-procedural"] | None = None
+    tube_type: Literal["Pigtail", "Straight", "Surgical/Large bore"] | None = None
+    tube_size_fr: int | None = None
+    guidance: Literal["Ultrasound", "CT", "Fluoroscopy", "None"] | None = None
+
+
+class RegistryrecordPleuralProcedures(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    thoracentesis: RegistryrecordPleuralProceduresThoracentesis | None = None
+    chest_tube: RegistryrecordPleuralProceduresChestTube | None = None
+    ipc: IPCProcedure | None = None
+    medical_thoracoscopy: RegistryrecordPleuralProceduresMedicalThoracoscopy | None = None
+    pleurodesis: RegistryrecordPleuralProceduresPleurodesis | None = None
+    pleural_biopsy: RegistryrecordPleuralProceduresPleuralBiopsy | None = None
+    fibrinolytic_therapy: RegistryrecordPleuralProceduresFibrinolyticTherapy | None = None
+    chest_tube_removal: RegistryrecordPleuralProceduresChestTubeRemoval | None = None
+
+
+class RegistryrecordSpecimensSpecimensCollectedItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    type: Literal["BAL", "Bronchial wash", "Brushing", "Endobronchial biopsy", "TBNA", "EBUS-TBNA", "Transbronchial biopsy", "Cryobiopsy", "Pleural fluid", "Pleural biopsy", "Other"] | None = None
+    location: str | None = None
+    source_target_id: str | None = None
+    container_count: int | None = None
+    sent_for: list[Literal["Cytology", "Cell block", "Histology", "Flow cytometry", "Microbiology", "AFB", "Fungal", "Molecular/NGS", "PD-L1", "Other"]] | None = None
+
+
+class RegistryrecordSpecimens(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    specimens_collected: list[RegistryrecordSpecimensSpecimensCollectedItem] | None = None
+    rose_result: Literal["Adequate - malignant", "Adequate - benign lymphocytes", "Adequate - granulomas", "Adequate - other", "Inadequate", "Not performed"] | None = None
+    specimen_adequacy: Literal["Adequate", "Inadequate", "Pending"] | None = None
+
+
+class RegistryrecordComplicationsEventsItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    type: str | None = None
+    ctcae_grade: int | None = None
+    interventions: list[str] | None = None
+    notes: str | None = None
+
+
+class RegistryrecordComplicationsBleeding(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    occurred: bool | None = None
+    severity: Literal["Mild (<50mL)", "Moderate (50-200mL)", "Severe (>200mL)"] | None = None
+    intervention_required: list[Literal["Cold saline", "Epinephrine", "Balloon tamponade", "Electrocautery", "APC", "Transfusion", "Embolization", "Surgery", "None"]] | None = None
+    bleeding_grade_nashville: int | None = None
+
+
+class RegistryrecordComplicationsPneumothorax(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    occurred: bool | None = None
+    size: Literal["Small (<2cm)", "Moderate (2-4cm)", "Large (>4cm)", "Tension"] | None = None
+    intervention: list[Literal["Observation", "Aspiration", "Pigtail catheter", "Chest tube", "Heimlich valve", "Surgery"]] | None = None
+
+
+class RegistryrecordComplicationsRespiratory(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    hypoxia_occurred: bool | None = None
+    lowest_spo2: int | None = None
+    supplemental_o2_increased: bool | None = None
+    intubation_required: bool | None = None
+    respiratory_failure: bool | None = None
+
+
+class RegistryrecordComplications(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    any_complication: bool | None = None
+    complication_list: list[Literal["Bleeding - Mild", "Bleeding - Moderate", "Bleeding - Severe", "Pneumothorax", "Hypoxia", "Respiratory failure", "Hypotension", "Arrhythmia", "Bronchospasm", "Laryngospasm", "Aspiration", "Infection", "Air embolism", "Cardiac arrest", "Death", "Other"]] | None = None
+    events: list[RegistryrecordComplicationsEventsItem] | None = None
+    bleeding: RegistryrecordComplicationsBleeding | None = None
+    pneumothorax: RegistryrecordComplicationsPneumothorax | None = None
+    respiratory: RegistryrecordComplicationsRespiratory | None = None
+    other_complication_details: str | None = None
+
+
+class RegistryrecordOutcomesFollowUpActionsItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    action_type: Literal["Clinic visit - IP", "Clinic visit - Pulmonology", "Clinic visit - Oncology", "Clinic visit - Thoracic surgery", "Clinic visit - Radiation oncology", "Clinic visit - Other", "CT chest", "CT chest with contrast", "PET-CT", "CXR", "Pulmonary function tests", "Pulmonary rehabilitation", "Repeat bronchoscopy", "Surgical consultation", "Tumor board", "ILD multidisciplinary conference", "Pathology follow-up", "Lab work", "Other"] | None = None
+    timeframe: str | None = None
+    notes: str | None = None
+
+
+class RegistryrecordOutcomes(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    procedure_completed: bool | None = None
+    procedure_aborted_reason: str | None = None
+    procedure_success_status: Literal["Success", "Partial success", "Failed", "Aborted", "Unknown"] | None = None
+    aborted_reason: str | None = None
+    complication_intervention: str | None = None
+    complication_duration: str | None = None
+    preliminary_diagnosis: str | None = None
+    preliminary_staging: str | None = None
+    disposition: Literal["Outpatient discharge", "Observation unit", "Floor admission", "ICU admission", "Already inpatient - return to floor", "Already inpatient - transfer to ICU", "Transfer to another facility", "OR", "Death"] | None = None
+    discharge_time: str | None = None
+    follow_up_imaging_ordered: bool | None = None
+    follow_up_imaging_type: str | None = None
+    follow_up_plan_text: str | None = None
+    follow_up_actions: list[RegistryrecordOutcomesFollowUpActionsItem] | None = None
+
+
+class RegistryrecordPathologyResults(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    final_diagnosis: str | None = None
+    final_staging: str | None = None
+    histology: str | None = None
+    molecular_markers: dict[str, Any] | None = None
+    pdl1_tps_percent: float | None = None
+    pdl1_tps_text: str | None = None
+    microbiology_results: str | None = None
+    pathology_result_date: str | None = None
+
+
+class RegistryrecordBillingCptCodesItemEvidenceItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    source: str | None = None
+    text: str | None = None
+    span: list[int] | None = None
+    confidence: float | None = None
+
+
+class RegistryrecordBillingCptCodesItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    code: str | None = None
+    description: str | None = None
+    modifier: str | None = None
+    modifiers: list[str] | None = None
+    units: int | None = None
+    derived_from: list[str] | None = None
+    evidence: list[RegistryrecordBillingCptCodesItemEvidenceItem] | None = None
+
+
+class RegistryrecordBilling(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    cpt_codes: list[RegistryrecordBillingCptCodesItem] | None = None
+    icd10_codes: list[str] | None = None
+    total_rvu: float | None = None
+    work_rvu: float | None = None
+    practice_expense_rvu: float | None = None
+    malpractice_rvu: float | None = None
+
+
+class RegistryrecordCodingSupportCodingSummaryLinesItemNoteSpansItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    start: int | None = None
+    end: int | None = None
+    snippet: str | None = None
+
+
+class RegistryrecordCodingSupportCodingSummaryLinesItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    sequence: int | None = None
+    code: str | None = None
+    modifier: str | None = None
+    modifiers: list[str] | None = None
+    description: str | None = None
+    units: int | None = None
+    role: Literal["primary", "add_on", "secondary", "bundled_only"] | None = None
+    selection_status: Literal["candidate", "selected", "dropped"] | None = None
+    selection_reason: str | None = None
+    family_key: str | None = None
+    is_add_on: bool | None = None
+    source: Literal["model", "human", "merged"] | None = None
+    note_spans: list[RegistryrecordCodingSupportCodingSummaryLinesItemNoteSpansItem] | None = None
+
+
+class RegistryrecordCodingSupportCodingSummary(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    primary_family: str | None = None
+    lines: list[RegistryrecordCodingSupportCodingSummaryLinesItem] | None = None
+
+
+class RegistryrecordCodingSupportFinancialAnalysisPerCodeItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    code: str | None = None
+    units: int | None = None
+    work_rvu: float | None = None
+    total_facility_rvu: float | None = None
+    total_nonfacility_rvu: float | None = None
+    mpfs_facility_payment: float | None = None
+    mpfs_nonfacility_payment: float | None = None
+    apc: str | None = None
+    opps_payment: float | None = None
+    asc_payment: float | None = None
+    mppi: int | None = None
+    is_add_on: bool | None = None
+    is_primary: bool | None = None
+    rvu_source_path: str | None = None
+
+
+class RegistryrecordCodingSupportFinancialAnalysisTotals(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    total_work_rvu: float | None = None
+    total_facility_rvu: float | None = None
+    total_nonfacility_rvu: float | None = None
+    estimated_facility_payment_unadjusted: float | None = None
+    estimated_nonfacility_payment_unadjusted: float | None = None
+    estimated_facility_payment_after_mppr: float | None = None
+    estimated_nonfacility_payment_after_mppr: float | None = None
+
+
+class RegistryrecordCodingSupportFinancialAnalysis(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    calendar_year: int | None = None
+    fee_schedule_name: str | None = None
+    rvu_source: str | None = None
+    conversion_factor: float | None = None
+    setting: Literal["facility", "nonfacility", "unknown"] | None = None
+    per_code: list[RegistryrecordCodingSupportFinancialAnalysisPerCodeItem] | None = None
+    totals: RegistryrecordCodingSupportFinancialAnalysisTotals | None = None
+    mppr_assumptions: str | None = None
+    notes: str | None = None
+
+
+class RegistryrecordCodingSupportCodingRationalePerCodeItemDocumentationEvidenceItemSpan(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    start: int | None = None
+    end: int | None = None
+
+
+class RegistryrecordCodingSupportCodingRationalePerCodeItemDocumentationEvidenceItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    snippet: str | None = None
+    span: RegistryrecordCodingSupportCodingRationalePerCodeItemDocumentationEvidenceItemSpan | None = None
+
+
+class RegistryrecordCodingSupportCodingRationalePerCodeItemQaFlagsItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    severity: Literal["info", "warning", "error"] | None = None
+    rule_id: str | None = None
+    message: str | None = None
+
+
+class RegistryrecordCodingSupportCodingRationalePerCodeItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    code: str | None = None
+    summary: str | None = None
+    documentation_evidence: list[RegistryrecordCodingSupportCodingRationalePerCodeItemDocumentationEvidenceItem] | None = None
+    rule_refs: list[str] | None = None
+    qa_flags: list[RegistryrecordCodingSupportCodingRationalePerCodeItemQaFlagsItem] | None = None
+
+
+class RegistryrecordCodingSupportCodingRationaleRulesAppliedItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    rule_id: str | None = None
+    rule_type: Literal["bundling", "qa", "documentation", "local"] | None = None
+    description: str | None = None
+    codes_affected: list[str] | None = None
+    outcome: Literal["kept", "dropped", "flagged", "informational"] | None = None
+    details: str | None = None
+
+
+class RegistryrecordCodingSupportCodingRationale(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    per_code: list[RegistryrecordCodingSupportCodingRationalePerCodeItem] | None = None
+    rules_applied: list[RegistryrecordCodingSupportCodingRationaleRulesAppliedItem] | None = None
+    global_comments: list[str] | None = None
+
+
+class RegistryrecordCodingSupport(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    version: str | None = None
+    generated_at: str | None = None
+    generator: str | None = None
+    knowledge_base_version: str | None = None
+    coding_summary: RegistryrecordCodingSupportCodingSummary | None = None
+    financial_analysis: RegistryrecordCodingSupportFinancialAnalysis | None = None
+    coding_rationale: RegistryrecordCodingSupportCodingRationale | None = None
+
+
+class RegistryrecordMetadata(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    schema_version: str | None = None
+    data_entry_status: Literal["Complete", "Incomplete", "Pending Review", "Pending Pathology"] | None = None
+    created_at: str | None = None
+    created_by: str | None = None
+    updated_at: str | None = None
+    updated_by: str | None = None
+    verified_by: str | None = None
+    verification_date: str | None = None
+    notes: str | None = None
+    evidence: dict[str, Any] | None = None
+
+
+class RegistryrecordGranularDataLinearEbusStationsDetailItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    station: Literal["2R", "2L", "3p", "4R", "4L", "7", "10R", "10L", "11R", "11L", "12R", "12L"] | None = None
+    target_id: str | None = None
+    short_axis_mm: float | None = None
+    long_axis_mm: float | None = None
+    shape: Literal["oval", "round", "irregular"] | None = None
+    margin: Literal["distinct", "indistinct", "irregular"] | None = None
+    echogenicity: Literal["homogeneous", "heterogeneous"] | None = None
+    chs_present: bool | None = None
+    necrosis_present: bool | None = None
+    calcification_present: bool | None = None
+    elastography_performed: bool | None = None
+    elastography_score: int | None = None
+    elastography_strain_ratio: float | None = None
+    elastography_pattern: Literal["predominantly_blue", "blue_green", "green", "predominantly_green"] | None = None
+    doppler_performed: bool | None = None
+    doppler_pattern: Literal["avascular", "hilar_vessel", "peripheral", "mixed"] | None = None
+    morphologic_impression: Literal["benign", "suspicious", "malignant", "indeterminate"] | None = None
+    sampled: bool | None = None
+    needle_gauge: Literal[19, 21, 22, 25] | None = None
+    needle_type: Literal["Standard FNA", "FNB/ProCore", "Acquire", "ViziShot Flex"] | None = None
+    number_of_passes: int | None = None
+    intranodal_forceps_used: bool | None = None
+    rose_performed: bool | None = None
+    rose_result: Literal["Adequate lymphocytes", "Malignant", "Suspicious for malignancy", "Atypical cells", "Granuloma", "Necrosis only", "Nondiagnostic", "Deferred"] | None = None
+    lymphocytes_present: bool | None = None
+    rose_adequacy: bool | None = None
+    specimen_sent_for: list[Literal["Cytology", "Cell block", "Flow cytometry", "Molecular/NGS", "Culture", "AFB", "Fungal", "Research"]] | None = None
+    final_pathology: str | None = None
+    n_stage_contribution: Literal["N0", "N1", "N2", "N3"] | None = None
+    notes: str | None = None
+
+
+class RegistryrecordGranularDataNavigationTargetsItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    target_number: int | None = None
+    target_id: str | None = None
+    target_location_text: str | None = None
+    target_lobe: Literal["RUL", "RML", "RLL", "LUL", "LLL", "Lingula"] | None = None
+    target_segment: str | None = None
+    lesion_size_mm: float | None = None
+    distance_from_pleura_mm: float | None = None
+    bronchus_sign: Literal["Positive", "Negative", "Not assessed"] | None = None
+    ct_characteristics: Literal["Solid", "Part-solid", "Ground-glass", "Cavitary", "Calcified"] | None = None
+    pet_suv_max: float | None = None
+    registration_error_mm: float | None = None
+    navigation_successful: bool | None = None
+    rebus_used: bool | None = None
+    rebus_view: Literal["Concentric", "Eccentric", "Adjacent", "Not visualized"] | None = None
+    rebus_lesion_appearance: str | None = None
+    tool_in_lesion_confirmed: bool | None = None
+    confirmation_method: Literal["CBCT", "Augmented fluoroscopy", "Fluoroscopy", "Radial EBUS", "None"] | None = None
+    cbct_til_confirmed: bool | None = None
+    sampling_tools_used: list[Literal["Forceps", "Needle (21G)", "Needle (19G)", "Brush", "Cryoprobe (1.1mm)", "Cryoprobe (1.7mm)", "Cryoprobe (1.9mm)", "NeedleInNeedle"]] | None = None
+    number_of_forceps_biopsies: int | None = None
+    number_of_needle_passes: int | None = None
+    number_of_cryo_biopsies: int | None = None
+    rose_performed: bool | None = None
+    rose_result: str | None = None
+    immediate_complication: Literal["None", "Bleeding - mild", "Bleeding - moderate", "Bleeding - severe", "Pneumothorax"] | None = None
+    bleeding_management: str | None = None
+    specimen_sent_for: list[str] | None = None
+    final_pathology: str | None = None
+    notes: str | None = None
+
+
+class RegistryrecordGranularDataCaoInterventionsDetailItemModalitiesAppliedItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    modality: Literal["APC", "Electrocautery - snare", "Electrocautery - knife", "Electrocautery - probe", "Cryotherapy - spray", "Cryotherapy - contact", "Cryoextraction", "Laser - Nd:YAG", "Laser - CO2", "Laser - diode", "Mechanical debulking", "Rigid coring", "Microdebrider", "Balloon dilation", "PDT"] | None = None
+    power_setting_watts: float | None = None
+    apc_flow_rate_lpm: float | None = None
+    balloon_diameter_mm: float | None = None
+    balloon_pressure_atm: float | None = None
+    freeze_time_seconds: int | None = None
+    number_of_applications: int | None = None
+    duration_seconds: int | None = None
+
+
+class RegistryrecordGranularDataCaoInterventionsDetailItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    location: Literal["Trachea - proximal", "Trachea - mid", "Trachea - distal", "Carina", "RMS", "LMS", "BI", "RUL", "RML", "RLL", "LUL", "LLL", "Other"] | None = None
+    obstruction_type: Literal["Intraluminal", "Extrinsic", "Mixed"] | None = None
+    etiology: Literal["Malignant - primary lung", "Malignant - metastatic", "Malignant - other", "Benign - post-intubation", "Benign - post-tracheostomy", "Benign - anastomotic", "Benign - inflammatory", "Benign - granulation", "Benign - web/stenosis", "Other"] | None = None
+    length_mm: float | None = None
+    lesion_morphology: str | None = None
+    lesion_count_text: str | None = None
+    pre_obstruction_pct: int | None = None
+    post_obstruction_pct: int | None = None
+    pre_diameter_mm: float | None = None
+    post_diameter_mm: float | None = None
+    modalities_applied: list[RegistryrecordGranularDataCaoInterventionsDetailItemModalitiesAppliedItem] | None = None
+    hemostasis_required: bool | None = None
+    hemostasis_methods: list[Literal["Cold saline", "Epinephrine", "APC", "Electrocautery", "Balloon tamponade", "Bronchial blocker", "Tranexamic acid"]] | None = None
+    secretions_present: bool | None = None
+    secretions_drained: bool | None = None
+    stent_placed_at_site: bool | None = None
+    notes: str | None = None
+
+
+class RegistryrecordGranularDataBlvrValvePlacementsItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    valve_number: int | None = None
+    target_lobe: Literal["RUL", "RML", "RLL", "LUL", "LLL", "Lingula"] | None = None
+    segment: str | None = None
+    airway_diameter_mm: float | None = None
+    valve_size: str | None = None
+    valve_type: Literal["Zephyr (Pulmonx)", "Spiration (Olympus)"] | None = None
+    deployment_method: Literal["Standard", "Retroflexed"] | None = None
+    deployment_successful: bool | None = None
+    seal_confirmed: bool | None = None
+    repositioned: bool | None = None
+    notes: str | None = None
+
+
+class RegistryrecordGranularDataBlvrChartisMeasurementsItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    lobe_assessed: Literal["RUL", "RML", "RLL", "LUL", "LLL", "Lingula"] | None = None
+    segment_assessed: str | None = None
+    measurement_duration_seconds: int | None = None
+    adequate_seal: bool | None = None
+    cv_result: Literal["CV Negative", "CV Positive", "Indeterminate", "Low flow", "No seal", "Aborted"] | None = None
+    flow_pattern_description: str | None = None
+    notes: str | None = None
+
+
+class RegistryrecordGranularDataCryobiopsySitesItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    site_number: int | None = None
+    lobe: Literal["RUL", "RML", "RLL", "LUL", "LLL", "Lingula"] | None = None
+    segment: str | None = None
+    distance_from_pleura: Literal[">2cm", "1-2cm", "<1cm", "Not documented"] | None = None
+    fluoroscopy_position: str | None = None
+    radial_ebus_used: bool | None = None
+    rebus_view: str | None = None
+    probe_size_mm: Literal[1.1, 1.7, 1.9, 2.4] | None = None
+    freeze_time_seconds: int | None = None
+    number_of_biopsies: int | None = None
+    specimen_size_mm: float | None = None
+    blocker_used: bool | None = None
+    blocker_type: Literal["Fogarty", "Arndt", "Cohen", "Cryoprobe sheath"] | None = None
+    bleeding_severity: Literal["None/Scant", "Mild", "Moderate", "Severe"] | None = None
+    bleeding_controlled_with: str | None = None
+    pneumothorax_after_site: bool | None = None
+    notes: str | None = None
+
+
+class RegistryrecordGranularDataThoracoscopyFindingsDetailItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    location: Literal["Parietal pleura - chest wall", "Parietal pleura - diaphragm", "Parietal pleura - mediastinum", "Visceral pleura", "Lung parenchyma", "Costophrenic angle", "Apex"] | None = None
+    finding_type: Literal["Normal", "Nodules", "Plaques", "Studding", "Mass", "Adhesions - filmy", "Adhesions - dense", "Inflammation", "Thickening", "Trapped lung", "Loculations", "Empyema", "Other"] | None = None
+    extent: Literal["Focal", "Multifocal", "Diffuse"] | None = None
+    size_description: str | None = None
+    biopsied: bool | None = None
+    number_of_biopsies: int | None = None
+    biopsy_tool: Literal["Rigid forceps", "Flexible forceps", "Cryoprobe"] | None = None
+    impression: Literal["Benign appearing", "Malignant appearing", "Infectious appearing", "Indeterminate"] | None = None
+    notes: str | None = None
+
+
+class RegistryrecordGranularDataSpecimensCollectedItem(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    specimen_number: int | None = None
+    source_procedure: Literal["EBUS-TBNA", "Navigation biopsy", "Endobronchial biopsy", "Transbronchial biopsy", "Transbronchial cryobiopsy", "BAL", "Bronchial wash", "Brushing", "Pleural biopsy", "Pleural fluid", "Other"] | None = None
+    source_location: str | None = None
+    source_target_id: str | None = None
+    collection_tool: str | None = None
+    specimen_count: int | None = None
+    specimen_adequacy: Literal["Adequate", "Limited", "Inadequate", "Pending"] | None = None
+    destinations: list[Literal["Histology/Surgical pathology", "Cytology", "Cell block", "Flow cytometry", "Molecular/NGS", "PD-L1", "Bacterial culture", "AFB culture", "Fungal culture", "Viral studies", "Research protocol", "Biobank"]] | None = None
+    rose_performed: bool | None = None
+    rose_result: str | None = None
+    final_pathology_diagnosis: str | None = None
+    molecular_markers: dict[str, Any] | None = None
+    notes: str | None = None
+
+
+class RegistryrecordGranularData(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    linear_ebus_stations_detail: list[RegistryrecordGranularDataLinearEbusStationsDetailItem] | None = None
+    navigation_targets: list[RegistryrecordGranularDataNavigationTargetsItem] | None = None
+    cao_interventions_detail: list[RegistryrecordGranularDataCaoInterventionsDetailItem] | None = None
+    blvr_valve_placements: list[RegistryrecordGranularDataBlvrValvePlacementsItem] | None = None
+    blvr_chartis_measurements: list[RegistryrecordGranularDataBlvrChartisMeasurementsItem] | None = None
+    cryobiopsy_sites: list[RegistryrecordGranularDataCryobiopsySitesItem] | None = None
+    thoracoscopy_findings_detail: list[RegistryrecordGranularDataThoracoscopyFindingsDetailItem] | None = None
+    specimens_collected: list[RegistryrecordGranularDataSpecimensCollectedItem] | None = None
+
+
+class Registryrecord(BaseModel):
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
+    patient_mrn: str | None = None
+    patient_linkage_id: str | None = None
+    procedure_date: str | None = None
+    procedure_start_datetime: str | None = None
+    procedure_end_datetime: str | None = None
+    procedure_start_time: str | None = None
+    procedure_end_time: str | None = None
+    procedure_duration_minutes: int | None = None
+    providers: RegistryrecordProviders | None = None
+    providers_team: list[RegistryrecordProvidersTeamItem] | None = None
+    patient_demographics: PatientDemographics | None = None
+    patient: RegistryrecordPatient | None = None
+    procedure: RegistryrecordProcedure | None = None
+    risk_assessment: RegistryrecordRiskAssessment | None = None
+    clinical_context: ClinicalContext | None = None
+    procedure_setting: RegistryrecordProcedureSetting | None = None
+    sedation: RegistryrecordSedation | None = None
+    equipment: RegistryrecordEquipment | None = None
+    procedures_performed: RegistryrecordProceduresPerformed | None = None
+    pleural_procedures: RegistryrecordPleuralProcedures | None = None
+    specimens: RegistryrecordSpecimens | None = None
+    complications: RegistryrecordComplications | None = None
+    outcomes: RegistryrecordOutcomes | None = None
+    pathology_results: RegistryrecordPathologyResults | None = None
+    billing: RegistryrecordBilling | None = None
+    coding_support: RegistryrecordCodingSupport | None = None
+    metadata: RegistryrecordMetadata | None = None
+    granular_data: RegistryrecordGranularData | None = None
+    targets: CaseTargets | None = None
+    imaging_summary: ImagingSummary | None = None
+    clinical_course: ClinicalCourse | None = None
+
+
+MODELS_BY_PATH: dict[tuple[str, ...], type[BaseModel]] = {
+    ("RegistryRecord", "providers"): RegistryrecordProviders,
+    ("RegistryRecord", "providers_team", "item"): RegistryrecordProvidersTeamItem,
+    ("RegistryRecord", "patient"): RegistryrecordPatient,
+    ("RegistryRecord", "procedure"): RegistryrecordProcedure,
+    ("RegistryRecord", "risk_assessment"): RegistryrecordRiskAssessment,
+    ("RegistryRecord", "procedure_setting"): RegistryrecordProcedureSetting,
+    ("RegistryRecord", "sedation", "medications", "item"): RegistryrecordSedationMedicationsItem,
+    ("RegistryRecord", "sedation"): RegistryrecordSedation,
+    ("RegistryRecord", "equipment"): RegistryrecordEquipment,
+    ("RegistryRecord", "procedures_performed", "diagnostic_bronchoscopy"): RegistryrecordProceduresPerformedDiagnosticBronchoscopy,
+    ("RegistryRecord", "procedures_performed", "intubation"): RegistryrecordProceduresPerformedIntubation,
+    ("RegistryRecord", "procedures_performed", "bal"): RegistryrecordProceduresPerformedBal,
+    ("RegistryRecord", "procedures_performed", "bronchial_wash"): RegistryrecordProceduresPerformedBronchialWash,
+    ("RegistryRecord", "procedures_performed", "brushings"): RegistryrecordProceduresPerformedBrushings,
+    ("RegistryRecord", "procedures_performed", "endobronchial_biopsy"): RegistryrecordProceduresPerformedEndobronchialBiopsy,
+    ("RegistryRecord", "procedures_performed", "tbna_conventional"): RegistryrecordProceduresPerformedTbnaConventional,
+    ("RegistryRecord", "procedures_performed", "peripheral_tbna"): RegistryrecordProceduresPerformedPeripheralTbna,
+    ("RegistryRecord", "procedures_performed", "eus_b"): RegistryrecordProceduresPerformedEusB,
+    ("RegistryRecord", "procedures_performed", "radial_ebus"): RegistryrecordProceduresPerformedRadialEbus,
+    ("RegistryRecord", "procedures_performed", "navigational_bronchoscopy"): RegistryrecordProceduresPerformedNavigationalBronchoscopy,
+    ("RegistryRecord", "procedures_performed", "fiducial_placement"): RegistryrecordProceduresPerformedFiducialPlacement,
+    ("RegistryRecord", "procedures_performed", "dye_marker_placement"): RegistryrecordProceduresPerformedDyeMarkerPlacement,
+    ("RegistryRecord", "procedures_performed", "transbronchial_biopsy"): RegistryrecordProceduresPerformedTransbronchialBiopsy,
+    ("RegistryRecord", "procedures_performed", "transbronchial_cryobiopsy"): RegistryrecordProceduresPerformedTransbronchialCryobiopsy,
+    ("RegistryRecord", "procedures_performed", "therapeutic_aspiration"): RegistryrecordProceduresPerformedTherapeuticAspiration,
+    ("RegistryRecord", "procedures_performed", "foreign_body_removal"): RegistryrecordProceduresPerformedForeignBodyRemoval,
+    ("RegistryRecord", "procedures_performed", "airway_dilation"): RegistryrecordProceduresPerformedAirwayDilation,
+    ("RegistryRecord", "procedures_performed", "mechanical_debulking"): RegistryrecordProceduresPerformedMechanicalDebulking,
+    ("RegistryRecord", "procedures_performed", "therapeutic_outcomes"): RegistryrecordProceduresPerformedTherapeuticOutcomes,
+    ("RegistryRecord", "procedures_performed", "cryotherapy"): RegistryrecordProceduresPerformedCryotherapy,
+    ("RegistryRecord", "procedures_performed", "photodynamic_therapy"): RegistryrecordProceduresPerformedPhotodynamicTherapy,
+    ("RegistryRecord", "procedures_performed", "brachytherapy_catheter"): RegistryrecordProceduresPerformedBrachytherapyCatheter,
+    ("RegistryRecord", "procedures_performed", "blvr"): RegistryrecordProceduresPerformedBlvr,
+    ("RegistryRecord", "procedures_performed", "balloon_occlusion"): RegistryrecordProceduresPerformedBalloonOcclusion,
+    ("RegistryRecord", "procedures_performed", "bpf_sealant"): RegistryrecordProceduresPerformedBpfSealant,
+    ("RegistryRecord", "procedures_performed", "peripheral_ablation"): RegistryrecordProceduresPerformedPeripheralAblation,
+    ("RegistryRecord", "procedures_performed", "bronchial_thermoplasty"): RegistryrecordProceduresPerformedBronchialThermoplasty,
+    ("RegistryRecord", "procedures_performed", "whole_lung_lavage"): RegistryrecordProceduresPerformedWholeLungLavage,
+    ("RegistryRecord", "procedures_performed", "rigid_bronchoscopy"): RegistryrecordProceduresPerformedRigidBronchoscopy,
+    ("RegistryRecord", "procedures_performed", "percutaneous_tracheostomy"): RegistryrecordProceduresPerformedPercutaneousTracheostomy,
+    ("RegistryRecord", "procedures_performed", "peg_insertion"): RegistryrecordProceduresPerformedPegInsertion,
+    ("RegistryRecord", "procedures_performed", "neck_ultrasound"): RegistryrecordProceduresPerformedNeckUltrasound,
+    ("RegistryRecord", "procedures_performed", "chest_ultrasound"): RegistryrecordProceduresPerformedChestUltrasound,
+    ("RegistryRecord", "procedures_performed", "therapeutic_injection"): RegistryrecordProceduresPerformedTherapeuticInjection,
+    ("RegistryRecord", "procedures_performed"): RegistryrecordProceduresPerformed,
+    ("RegistryRecord", "pleural_procedures", "thoracentesis"): RegistryrecordPleuralProceduresThoracentesis,
+    ("RegistryRecord", "pleural_procedures", "chest_tube"): RegistryrecordPleuralProceduresChestTube,
+    ("RegistryRecord", "pleural_procedures", "medical_thoracoscopy"): RegistryrecordPleuralProceduresMedicalThoracoscopy,
+    ("RegistryRecord", "pleural_procedures", "pleurodesis"): RegistryrecordPleuralProceduresPleurodesis,
+    ("RegistryRecord", "pleural_procedures", "pleural_biopsy"): RegistryrecordPleuralProceduresPleuralBiopsy,
+    ("RegistryRecord", "pleural_procedures", "fibrinolytic_therapy"): RegistryrecordPleuralProceduresFibrinolyticTherapy,
+    ("RegistryRecord", "pleural_procedures", "chest_tube_removal"): RegistryrecordPleuralProceduresChestTubeRemoval,
+    ("RegistryRecord", "pleural_procedures"): RegistryrecordPleuralProcedures,
+    ("RegistryRecord", "specimens", "specimens_collected", "item"): RegistryrecordSpecimensSpecimensCollectedItem,
+    ("RegistryRecord", "specimens"): RegistryrecordSpecimens,
+    ("RegistryRecord", "complications", "events", "item"): RegistryrecordComplicationsEventsItem,
+    ("RegistryRecord", "complications", "bleeding"): RegistryrecordComplicationsBleeding,
+    ("RegistryRecord", "complications", "pneumothorax"): RegistryrecordComplicationsPneumothorax,
+    ("RegistryRecord", "complications", "respiratory"): RegistryrecordComplicationsRespiratory,
+    ("RegistryRecord", "complications"): RegistryrecordComplications,
+    ("RegistryRecord", "outcomes", "follow_up_actions", "item"): RegistryrecordOutcomesFollowUpActionsItem,
+    ("RegistryRecord", "outcomes"): RegistryrecordOutcomes,
+    ("RegistryRecord", "pathology_results"): RegistryrecordPathologyResults,
+    ("RegistryRecord", "billing", "cpt_codes", "item", "evidence", "item"): RegistryrecordBillingCptCodesItemEvidenceItem,
+    ("RegistryRecord", "billing", "cpt_codes", "item"): RegistryrecordBillingCptCodesItem,
+    ("RegistryRecord", "billing"): RegistryrecordBilling,
+    ("RegistryRecord", "coding_support", "coding_summary", "lines", "item", "note_spans", "item"): RegistryrecordCodingSupportCodingSummaryLinesItemNoteSpansItem,
+    ("RegistryRecord", "coding_support", "coding_summary", "lines", "item"): RegistryrecordCodingSupportCodingSummaryLinesItem,
+    ("RegistryRecord", "coding_support", "coding_summary"): RegistryrecordCodingSupportCodingSummary,
+    ("RegistryRecord", "coding_support", "financial_analysis", "per_code", "item"): RegistryrecordCodingSupportFinancialAnalysisPerCodeItem,
+    ("RegistryRecord", "coding_support", "financial_analysis", "totals"): RegistryrecordCodingSupportFinancialAnalysisTotals,
+    ("RegistryRecord", "coding_support", "financial_analysis"): RegistryrecordCodingSupportFinancialAnalysis,
+    ("RegistryRecord", "coding_support", "coding_rationale", "per_code", "item", "documentation_evidence", "item", "span"): RegistryrecordCodingSupportCodingRationalePerCodeItemDocumentationEvidenceItemSpan,
+    ("RegistryRecord", "coding_support", "coding_rationale", "per_code", "item", "documentation_evidence", "item"): RegistryrecordCodingSupportCodingRationalePerCodeItemDocumentationEvidenceItem,
+    ("RegistryRecord", "coding_support", "coding_rationale", "per_code", "item", "qa_flags", "item"): RegistryrecordCodingSupportCodingRationalePerCodeItemQaFlagsItem,
+    ("RegistryRecord", "coding_support", "coding_rationale", "per_code", "item"): RegistryrecordCodingSupportCodingRationalePerCodeItem,
+    ("RegistryRecord", "coding_support", "coding_rationale", "rules_applied", "item"): RegistryrecordCodingSupportCodingRationaleRulesAppliedItem,
+    ("RegistryRecord", "coding_support", "coding_rationale"): RegistryrecordCodingSupportCodingRationale,
+    ("RegistryRecord", "coding_support"): RegistryrecordCodingSupport,
+    ("RegistryRecord", "metadata"): RegistryrecordMetadata,
+    ("RegistryRecord", "granular_data", "linear_ebus_stations_detail", "item"): RegistryrecordGranularDataLinearEbusStationsDetailItem,
+    ("RegistryRecord", "granular_data", "navigation_targets", "item"): RegistryrecordGranularDataNavigationTargetsItem,
+    ("RegistryRecord", "granular_data", "cao_interventions_detail", "item", "modalities_applied", "item"): RegistryrecordGranularDataCaoInterventionsDetailItemModalitiesAppliedItem,
+    ("RegistryRecord", "granular_data", "cao_interventions_detail", "item"): RegistryrecordGranularDataCaoInterventionsDetailItem,
+    ("RegistryRecord", "granular_data", "blvr_valve_placements", "item"): RegistryrecordGranularDataBlvrValvePlacementsItem,
+    ("RegistryRecord", "granular_data", "blvr_chartis_measurements", "item"): RegistryrecordGranularDataBlvrChartisMeasurementsItem,
+    ("RegistryRecord", "granular_data", "cryobiopsy_sites", "item"): RegistryrecordGranularDataCryobiopsySitesItem,
+    ("RegistryRecord", "granular_data", "thoracoscopy_findings_detail", "item"): RegistryrecordGranularDataThoracoscopyFindingsDetailItem,
+    ("RegistryRecord", "granular_data", "specimens_collected", "item"): RegistryrecordGranularDataSpecimensCollectedItem,
+    ("RegistryRecord", "granular_data"): RegistryrecordGranularData,
+    ("RegistryRecord",): Registryrecord,
+}
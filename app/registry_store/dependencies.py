@@ -6,9 +6,10 @@ import os
 from functools import lru_cache
 from typing import Iterator
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+
+from app.infra.db import create_tuned_engine
 
 
 def resolve_registry_store_database_url() -> str:
@@ -29,18 +30,10 @@ def resolve_registry_store_database_url() -> str:
     )
 
 
-def _engine_kwargs(url: str) -> dict:
-    kwargs: dict = {}
-    if url.startswith("sqlite"):
-        kwargs["connect_args"] = {"check_same_thread": False}
-        if ":memory:" in url:
-            kwargs["poolclass"] = StaticPool
-    return kwargs
-
-
 @lru_cache(maxsize=4)
 def _engine_for_url(url: str) -> Engine:
-    return create_engine(url, **_engine_kwargs(url))
+    # Pool sizing/pre-ping/recycle and SQLite WAL come from InfraSettings (app.infra.db).
+    return create_tuned_engine(url, name="registry_store")
 
 
 def get_registry_store_engine() -> Engine:
@@ -53,6 +46,12 @@ def _sessionmaker_for_url(url: str):
     return sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def get_registry_store_sessionmaker():
+    """Session factory for the configured registry store (used off-request)."""
+
+    return _sessionmaker_for_url(resolve_registry_store_database_url())
+
+
 def get_registry_store_db() -> Iterator[Session]:
     """FastAPI dependency that yields a registry store Session."""
 
@@ -68,6 +67,7 @@ def get_registry_store_db() -> Iterator[Session]:
 __all__ = [
     "get_registry_store_db",
     "get_registry_store_engine",
+    "get_registry_store_sessionmaker",
     "resolve_registry_store_database_url",
 ]
 
@@ -19,6 +19,10 @@ def _utcnow() -> datetime:
 
 class RegistryRun(Base):
     __tablename__ = "registry_runs"
+    __table_args__ = (
+        # Keyset pagination / export order (created_at DESC, id DESC).
+        Index("ix_registry_runs_created_at_id", "created_at", "id"),
+    )
 
     id = Column(UUIDType, primary_key=True, default=uuid.uuid4)
     created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False, index=True)
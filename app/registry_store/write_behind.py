@@ -0,0 +1,369 @@
+"""Write-behind persistence for registry runs.
+
+`POST /v1/registry/runs` produces one `registry_runs` row (with a large
+`raw_response_json` payload) and optionally upserts a `registry_case_records`
+row. This module moves those writes off the request path:
+
+- ``persist_registry_runs`` writes a batch of pending runs in one transaction
+  (executemany INSERT for runs, ordered upserts for case records).
+- ``RegistryRunWriter`` owns a bounded queue and a background thread that
+  drains it in batches. Callers get a future that resolves on commit, so
+  durable mode can still wait for the write while sharing a group commit.
+
+Write modes (``REGISTRY_RUNS_WRITE_MODE``):
+    sync        Persist in a worker thread and wait for the commit (default).
+    durable     Enqueue to the writer and wait for the batch commit.
+    async       Enqueue and return immediately; the run becomes readable once
+                the batch commits (typically within the flush interval).
+
+Other environment variables:
+    REGISTRY_RUNS_WRITE_QUEUE_SIZE: Max pending runs before backpressure (default: 256)
+    REGISTRY_RUNS_WRITE_BATCH_SIZE: Max runs per transaction (default: 32)
+    REGISTRY_RUNS_WRITE_FLUSH_MS: Max time to wait while filling a batch (default: 50)
+    REGISTRY_RUNS_WRITE_ENQUEUE_TIMEOUT_S: How long a full queue may block a
+        request before it is rejected (default: 5)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Callable
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.registry_store.models import RegistryCaseRecord, RegistryRun
+from observability.metrics import get_metrics_client
+
+logger = logging.getLogger(__name__)
+
+WRITE_MODES = ("sync", "durable", "async")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def resolve_registry_runs_write_mode() -> str:
+    mode = (os.getenv("REGISTRY_RUNS_WRITE_MODE") or "sync").strip().lower()
+    return mode if mode in WRITE_MODES else "sync"
+
+
+class RegistryRunQueueFull(RuntimeError):
+    """Raised when the write-behind queue stays full past the enqueue timeout."""
+
+
+@dataclass
+class CaseRecordUpdate:
+    registry_uuid: uuid.UUID
+    registry_json: dict[str, Any]
+    schema_version: str
+
+
+@dataclass
+class PendingRegistryRun:
+    """Column values for one run plus its optional case-record upsert."""
+
+    run_values: dict[str, Any]
+    case_update: CaseRecordUpdate | None = None
+    enqueued_at: float = field(default_factory=time.perf_counter)
+    future: Future = field(default_factory=Future)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+def _apply_case_update(db: Session, run_id: uuid.UUID, update: CaseRecordUpdate) -> None:
+    case_record = db.get(RegistryCaseRecord, update.registry_uuid)
+    if case_record is None:
+        case_record = RegistryCaseRecord(
+            registry_uuid=update.registry_uuid,
+            registry_json=update.registry_json,
+            schema_version=update.schema_version,
+            version=1,
+            source_run_id=run_id,
+            manual_overrides={},
+            created_at=_utcnow(),
+            updated_at=_utcnow(),
+        )
+    else:
+        case_record.registry_json = update.registry_json
+        case_record.schema_version = update.schema_version
+        case_record.source_run_id = run_id
+        case_record.version = int(case_record.version or 1) + 1
+        case_record.updated_at = _utcnow()
+    db.add(case_record)
+    # Flush so a later update for the same case in this batch sees this version.
+    db.flush()
+
+
+def persist_registry_runs(db: Session, items: list[PendingRegistryRun]) -> None:
+    """Insert *items* and apply their case-record upserts in one transaction."""
+    if not items:
+        return
+    try:
+        db.execute(insert(RegistryRun), [item.run_values for item in items])
+        for item in items:
+            if item.case_update is not None:
+                _apply_case_update(db, item.run_values["id"], item.case_update)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+
+class RegistryRunWriter:
+    """Bounded queue + background thread that batches registry run writes."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        max_queue: int | None = None,
+        batch_size: int | None = None,
+        flush_interval_s: float | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._queue: queue.Queue[PendingRegistryRun | None] = queue.Queue(
+            maxsize=max(1, max_queue or _env_int("REGISTRY_RUNS_WRITE_QUEUE_SIZE", 256))
+        )
+        self.batch_size = max(1, batch_size or _env_int("REGISTRY_RUNS_WRITE_BATCH_SIZE", 32))
+        self.flush_interval_s = (
+            flush_interval_s
+            if flush_interval_s is not None
+            else _env_int("REGISTRY_RUNS_WRITE_FLUSH_MS", 50) / 1000
+        )
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._stopping = False
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run, name="registry-run-writer", daemon=True
+            )
+            self._thread.start()
+
+    def submit(
+        self,
+        item: PendingRegistryRun,
+        *,
+        block: bool = True,
+        timeout_s: float | None = None,
+    ) -> Future:
+        """Enqueue *item*; blocks up to *timeout_s* while the queue is full.
+
+        With ``block=False`` a full queue raises ``RegistryRunQueueFull`` at
+        once and only counts the queue-full event. The caller can then wait
+        for space with ``submit_waiting`` (e.g. off the event loop); that
+        counts the rejection if the wait times out.
+        """
+        self._ensure_running()
+        metrics = get_metrics_client()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full as exc:
+            metrics.incr("registry_runs_write_queue_full_total")
+            if not block:
+                raise RegistryRunQueueFull(
+                    f"Registry run write queue full ({self._queue.maxsize} pending)"
+                ) from exc
+            self._put_waiting(item, timeout_s)
+        metrics.observe("registry_runs_write_queue_depth", float(self.depth))
+        return item.future
+
+    def submit_waiting(self, item: PendingRegistryRun, *, timeout_s: float | None = None) -> Future:
+        """Second step after ``submit(block=False)`` raised: wait up to *timeout_s* for space."""
+        self._ensure_running()
+        self._put_waiting(item, timeout_s)
+        get_metrics_client().observe("registry_runs_write_queue_depth", float(self.depth))
+        return item.future
+
+    def _ensure_running(self) -> None:
+        if self._stopping:
+            raise RegistryRunQueueFull("Registry run writer is shutting down")
+        self.start()
+
+    def _put_waiting(self, item: PendingRegistryRun, timeout_s: float | None) -> None:
+        metrics = get_metrics_client()
+        started = time.perf_counter()
+        try:
+            self._queue.put(item, timeout=timeout_s)
+        except queue.Full as exc:
+            metrics.incr("registry_runs_write_rejected_total")
+            raise RegistryRunQueueFull(
+                f"Registry run write queue full ({self._queue.maxsize} pending)"
+            ) from exc
+        finally:
+            metrics.timing(
+                "registry_runs_write_enqueue_wait_ms", (time.perf_counter() - started) * 1000
+            )
+
+    def shutdown(self, timeout_s: float = 10.0) -> None:
+        """Flush pending writes and stop the writer thread."""
+        self._stopping = True
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        deadline = time.monotonic() + timeout_s
+        try:
+            self._queue.put(None, timeout=timeout_s)
+        except queue.Full:
+            pass
+        thread.join(max(0.0, deadline - time.monotonic()))
+        if thread.is_alive():
+            logger.warning(
+                "Registry run writer did not drain within %.1fs (%d pending)", timeout_s, self.depth
+            )
+
+    def _next_batch(self) -> tuple[list[PendingRegistryRun], bool]:
+        first = self._queue.get()
+        if first is None:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval_s
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    item = self._queue.get(timeout=remaining)
+                else:
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        while True:
+            batch, stop = self._next_batch()
+            if batch:
+                self._write(batch)
+            if stop:
+                # Drain whatever arrived before the stop sentinel was queued.
+                leftovers: list[PendingRegistryRun] = []
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        leftovers.append(item)
+                for start in range(0, len(leftovers), self.batch_size):
+                    self._write(leftovers[start : start + self.batch_size])
+                return
+
+    def _write(self, batch: list[PendingRegistryRun]) -> None:
+        metrics = get_metrics_client()
+        started = time.perf_counter()
+        try:
+            self._commit(batch)
+        except Exception as exc:  # noqa: BLE001
+            if len(batch) == 1:
+                self._fail(batch[0], exc)
+            else:
+                # Isolate the bad row(s) so one failure does not drop the batch.
+                logger.warning("Registry run batch write failed (%s); retrying per run", exc)
+                for item in batch:
+                    try:
+                        self._commit([item])
+                    except Exception as item_exc:  # noqa: BLE001
+                        self._fail(item, item_exc)
+                    else:
+                        self._resolve(item)
+            return
+        finally:
+            metrics.timing("registry_runs_write_commit_ms", (time.perf_counter() - started) * 1000)
+            metrics.observe("registry_runs_write_batch_size", float(len(batch)))
+        for item in batch:
+            self._resolve(item)
+
+    def _commit(self, batch: list[PendingRegistryRun]) -> None:
+        db = self._session_factory()
+        try:
+            persist_registry_runs(db, batch)
+        finally:
+            db.close()
+
+    @staticmethod
+    def _resolve(item: PendingRegistryRun) -> None:
+        get_metrics_client().timing(
+            "registry_runs_write_lag_ms", (time.perf_counter() - item.enqueued_at) * 1000
+        )
+        if not item.future.done():
+            item.future.set_result(item.run_values["id"])
+
+    @staticmethod
+    def _fail(item: PendingRegistryRun, exc: BaseException) -> None:
+        get_metrics_client().incr("registry_runs_write_failed_total")
+        logger.error(
+            "Registry run %s could not be persisted: %s", item.run_values.get("id"), exc
+        )
+        if not item.future.done():
+            item.future.set_exception(exc)
+
+
+_writers: dict[str, RegistryRunWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_registry_run_writer(url: str, session_factory: Callable[[], Session]) -> RegistryRunWriter:
+    """Return the process-wide writer for the registry store at *url*."""
+    with _writers_lock:
+        writer = _writers.get(url)
+        if writer is None:
+            writer = _writers[url] = RegistryRunWriter(session_factory)
+        return writer
+
+
+def shutdown_registry_run_writers(timeout_s: float = 10.0) -> None:
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.shutdown(timeout_s)
+
+
+def registry_runs_enqueue_timeout_s() -> float:
+    return _env_float("REGISTRY_RUNS_WRITE_ENQUEUE_TIMEOUT_S", 5.0)
+
+
+__all__ = [
+    "CaseRecordUpdate",
+    "PendingRegistryRun",
+    "RegistryRunQueueFull",
+    "RegistryRunWriter",
+    "get_registry_run_writer",
+    "persist_registry_runs",
+    "registry_runs_enqueue_timeout_s",
+    "resolve_registry_runs_write_mode",
+    "shutdown_registry_run_writers",
+]
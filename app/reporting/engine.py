@@ -64,7 +64,6 @@ from app.reporting.macro_engine import (
     render_macro,
     render_procedure_bundle as _render_bundle_macros,
     get_base_utilities,
-    CATEGORY_MACROS,
 )
 from app.reporting.partial_schemas import (
     AirwayDilationPartial,
@@ -5366,6 +5365,15 @@ def render_procedure_bundle_combined(
     return "\n\n".join(sections)
 
 
+def __getattr__(name: str) -> Any:
+    # Re-exported lazily; see app.reporting.macro_engine.__getattr__.
+    if name == "CATEGORY_MACROS":
+        from app.reporting import macro_engine
+
+        return macro_engine.CATEGORY_MACROS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "compose_report_from_text",
     "compose_report_from_form",
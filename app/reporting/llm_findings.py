@@ -22,6 +22,7 @@ import json
 import os
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -166,7 +167,9 @@ def _contains_any_keyword(text: str, proc_key: str) -> bool:
     return False
 
 
-def _build_findings_prompt(masked_prompt_text: str) -> str:
+@lru_cache(maxsize=1)
+def _findings_instructions() -> str:
+    """Fixed extraction instructions, sent as the system prompt (same prefix for every note)."""
     keys = ", ".join(sorted(ALLOWED_PROCEDURE_KEYS))
     schema_hint = {
         "version": "reporter_findings_v1",
@@ -249,12 +252,16 @@ def _build_findings_prompt(masked_prompt_text: str) -> str:
         "*** CRITICAL CLINICAL GUARDRAILS (ANTI-HALLUCINATION) ***\n"
         "1. TOOLS DO NOT EQUAL INTENT: The mere mention of a tool (cryoprobe, snare, forceps) does NOT mean a therapeutic intervention was performed.\n"
         "2. ACTION-ON-TISSUE REQUIRED: DO NOT output tags for ablation, debulking, or therapeutic aspiration unless there is explicit 'action-on-tissue' language (e.g., 'tissue was destroyed', 'secretions were aspirated' to clear obstruction).\n"
-        "3. INSPECTION IS NOT INTERVENTION: Visualizing a stent or patent airway is NOT a stent placement or mechanical dilation.\n\n"
-        "PROMPT TEXT (use evidence_quote from here):\n"
-        f"{masked_prompt_text.strip()}\n"
+        "3. INSPECTION IS NOT INTERVENTION: Visualizing a stent or patent airway is NOT a stent placement or mechanical dilation.\n"
     )
 
 
+def _build_findings_prompt(masked_prompt_text: str) -> tuple[str, str]:
+    """Return ``(system_prompt, user_prompt)`` for the findings extraction call."""
+    user_prompt = f"PROMPT TEXT (use evidence_quote from here):\n{masked_prompt_text.strip()}\n"
+    return _findings_instructions(), user_prompt
+
+
 def _resolve_openai_llm() -> OpenAILLM:
     provider = os.getenv("LLM_PROVIDER", "gemini").strip().lower()
     if provider != "openai_compat":
@@ -269,8 +276,8 @@ def _resolve_openai_llm() -> OpenAILLM:
 
 def extract_reporter_findings_v1(masked_prompt_text: str, *, llm: OpenAILLM | None = None) -> ReporterFindingsV1:
     llm = llm or _resolve_openai_llm()
-    prompt = _build_findings_prompt(masked_prompt_text)
-    raw = llm.generate(prompt, task="structurer")
+    system_prompt, prompt = _build_findings_prompt(masked_prompt_text)
+    raw = llm.generate(prompt, task="structurer", system_prompt=system_prompt)
     cleaned = _strip_markdown_code_fences(raw)
     try:
         data = json.loads(cleaned)
@@ -606,7 +606,14 @@ def get_category_macros(category: str, *, registry: MacroRegistry | None = None)
     return resolved.get_category_macros(category)
 
 
-CATEGORY_MACROS = get_macro_registry().category_macros
+def __getattr__(name: str) -> Any:
+    # CATEGORY_MACROS loads every macro template; resolve it on first access
+    # instead of at import so API workers do not pay for it during boot.
+    if name == "CATEGORY_MACROS":
+        value = get_macro_registry().category_macros
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -6,8 +6,11 @@ import json
 import logging
 import os
 import re
+import tempfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from typing import Final
+from typing import IO, Final, Protocol
 
 import httpx
 
@@ -73,6 +76,7 @@ _ALLOWED_AUDIO_EXTENSIONS: Final[tuple[str, ...]] = (
     ".m4a",
 )
 _RETRYABLE_TRANSCRIBE_STATUS_CODES: Final[frozenset[int]] = frozenset({400, 404, 415, 422})
+_AUDIO_UPLOAD_CHUNK_BYTES: Final[int] = 256 * 1024
 
 
 def _truthy_env(name: str, *, default: bool = False) -> bool:
@@ -185,12 +189,12 @@ def _safe_error_preview(text: str, *, limit: int = 500) -> str:
 def _validate_audio_input(
     filename: str | None,
     content_type: str | None,
-    audio_bytes: bytes,
+    audio_size: int,
 ) -> None:
-    if not audio_bytes:
+    if audio_size <= 0:
         raise ReporterSpeechUnavailable("Audio upload was empty")
 
-    if len(audio_bytes) > _resolve_audio_max_bytes():
+    if audio_size > _resolve_audio_max_bytes():
         raise ReporterSpeechUnavailable("Audio upload exceeded the configured size limit")
 
     name = (filename or "").strip().lower()
@@ -230,6 +234,38 @@ class ReporterSpeechUnsafeInput(RuntimeError):
     """Raised when speech cleanup receives text that appears unsanitized."""
 
 
+class _AsyncAudioReader(Protocol):
+    async def read(self, size: int = -1) -> bytes: ...
+
+
+@asynccontextmanager
+async def spool_reporter_audio_upload(
+    upload: _AsyncAudioReader,
+    *,
+    chunk_size: int = _AUDIO_UPLOAD_CHUNK_BYTES,
+) -> AsyncIterator[tuple[IO[bytes], int]]:
+    """Copy an audio upload into a temp file chunk by chunk.
+
+    Yields ``(file, size)`` with the file rewound to the start. The configured
+    size limit is enforced while reading, so an oversized upload is rejected
+    after at most one chunk past the limit and memory use stays at one chunk
+    regardless of recording length. The temp file is removed on exit.
+    """
+    max_bytes = _resolve_audio_max_bytes()
+    with tempfile.TemporaryFile(prefix="reporter_audio_") as spool:
+        size = 0
+        while True:
+            chunk = await upload.read(chunk_size)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise ReporterSpeechUnavailable("Audio upload exceeded the configured size limit")
+            spool.write(chunk)
+        spool.seek(0)
+        yield spool, size
+
+
 @dataclass(frozen=True)
 class _ReporterSpeechTranscribeAttempt:
     model: str
@@ -401,14 +437,42 @@ def _build_transcribe_failure_message(provider_message: str) -> str:
     return "Reporter cloud transcription was rejected by the transcription provider"
 
 
+@asynccontextmanager
+async def _transcribe_client(
+    client: httpx.AsyncClient | None,
+    timeout: httpx.Timeout,
+) -> AsyncIterator[httpx.AsyncClient]:
+    if client is not None and not client.is_closed:
+        yield client
+        return
+    async with httpx.AsyncClient(timeout=timeout) as owned:
+        yield owned
+
+
 async def transcribe_reporter_audio(
     *,
-    audio_bytes: bytes,
+    audio_bytes: bytes | None = None,
+    audio_stream: IO[bytes] | None = None,
+    audio_size: int | None = None,
     filename: str | None,
     content_type: str | None,
     source: str | None,
     cloud_fallback_confirmed: bool,
+    client: httpx.AsyncClient | None = None,
 ) -> ReporterSpeechTranscriptionResult:
+    """Transcribe reporter dictation through the OpenAI-compatible audio API.
+
+    Pass either ``audio_bytes`` or a seekable ``audio_stream`` with its
+    ``audio_size`` (see :func:`spool_reporter_audio_upload`); a stream is sent
+    to the provider in chunks and rewound for each retry attempt. When
+    ``client`` is given (the app's pooled ``llm_http`` client) its connections
+    are reused instead of opening a new client per upload.
+    """
+    if (audio_bytes is None) == (audio_stream is None):
+        raise ValueError("Provide exactly one of audio_bytes or audio_stream")
+    if audio_stream is not None and audio_size is None:
+        raise ValueError("audio_size is required with audio_stream")
+
     if not _resolve_reporter_speech_enabled():
         raise ReporterSpeechUnavailable("Reporter speech support is disabled")
 
@@ -427,7 +491,8 @@ async def transcribe_reporter_audio(
     if _truthy_env("OPENAI_OFFLINE") or not api_key:
         raise ReporterSpeechUnavailable("Reporter cloud transcription unavailable in offline mode")
 
-    _validate_audio_input(filename=filename, content_type=content_type, audio_bytes=audio_bytes)
+    payload_size = len(audio_bytes) if audio_bytes is not None else int(audio_size or 0)
+    _validate_audio_input(filename=filename, content_type=content_type, audio_size=payload_size)
 
     models = _resolve_transcribe_models()
     primary_model = models[0]
@@ -437,7 +502,7 @@ async def transcribe_reporter_audio(
     files = {
         "file": (
             filename or "reporter_dictation.webm",
-            audio_bytes,
+            audio_bytes if audio_bytes is not None else audio_stream,
             content_type or "audio/webm",
         )
     }
@@ -445,12 +510,14 @@ async def transcribe_reporter_audio(
     last_status_code = 0
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        async with _transcribe_client(client, timeout) as http:
             for model_index, model in enumerate(models):
                 attempts = _build_transcribe_attempts_for_model(model)
                 for attempt_index, attempt in enumerate(attempts):
                     data = _build_transcribe_form_data(attempt)
-                    response = await client.post(url, headers=headers, data=data, files=files)
+                    response = await http.post(
+                        url, headers=headers, data=data, files=files, timeout=timeout
+                    )
 
                     if response.status_code >= 400:
                         request_id = (
@@ -623,5 +690,6 @@ __all__ = [
     "ReporterSpeechUnsafeInput",
     "clean_scrubbed_reporter_transcript",
     "contains_potential_phi",
+    "spool_reporter_audio_upload",
     "transcribe_reporter_audio",
 ]
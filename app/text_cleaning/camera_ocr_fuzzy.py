@@ -1,7 +1,16 @@
-"""Narrow fuzzy normalization for camera OCR extraction."""
+"""Narrow fuzzy normalization for camera OCR extraction.
+
+Each canonical phrase is compared against every token window of the same
+token count. Most windows cannot reach a phrase's thresholds on length
+alone: a ratio of ``2*M / (len_a + len_b)`` is bounded by
+``2*min(len_a, len_b) / (len_a + len_b)``. Those windows are dropped before
+any string is built or scored, so only plausible windows reach the scorer.
+The bound is exact, so the output is the same as scoring every window.
+"""
 
 from __future__ import annotations
 
+import bisect
 import difflib
 import functools
 import json
@@ -31,6 +40,18 @@ def _ratio(left: str, right: str) -> float:
     return float(difflib.SequenceMatcher(a=left, b=right).ratio() * 100.0)
 
 
+# Float slack so the length bound never rejects a window the scorer would accept.
+_BOUND_EPSILON = 1e-6
+
+
+def _length_bound(left_len: int, right_len: int) -> float:
+    """Upper bound of ``_ratio`` for strings of these lengths."""
+    total = left_len + right_len
+    if not left_len or not right_len:
+        return 0.0
+    return 200.0 * min(left_len, right_len) / total
+
+
 @dataclass(frozen=True)
 class _PhraseSpec:
     phrase: str
@@ -47,6 +68,32 @@ class _PhraseSpec:
         return _normalize_token(self.phrase)
 
 
+@dataclass(frozen=True)
+class _PhraseBlock:
+    """Per-phrase data precomputed once for candidate blocking."""
+
+    spec: _PhraseSpec
+    normalized: str
+    normalized_tokens: tuple[str, ...]
+
+    @property
+    def size(self) -> int:
+        return len(self.normalized_tokens)
+
+    def admits(self, window_tokens: list[str], window_len: int) -> bool:
+        """False when no scoring of this window can pass the phrase thresholds."""
+        spec = self.spec
+        if _length_bound(window_len, len(self.normalized)) + _BOUND_EPSILON < spec.threshold_full:
+            return False
+        bounds = [
+            _length_bound(len(left), len(right))
+            for left, right in zip(window_tokens, self.normalized_tokens)
+        ]
+        if min(bounds) + _BOUND_EPSILON < spec.threshold_token_min:
+            return False
+        return sum(bounds) / len(bounds) + _BOUND_EPSILON >= spec.threshold_token_avg
+
+
 _DEFAULT_PHRASE_SPECS: tuple[_PhraseSpec, ...] = (
     _PhraseSpec("therapeutic aspiration", threshold_full=88.0, threshold_token_avg=74.0, threshold_token_min=58.0),
     _PhraseSpec("bronchoalveolar lavage", threshold_full=86.0, threshold_token_avg=72.0, threshold_token_min=55.0),
@@ -163,8 +210,19 @@ def _get_phrase_specs() -> tuple[_PhraseSpec, ...]:
     return _load_phrase_specs_from_env()
 
 
+@functools.lru_cache(maxsize=1)
+def _get_phrase_blocks() -> tuple[_PhraseBlock, ...]:
+    blocks: list[_PhraseBlock] = []
+    for spec in _get_phrase_specs():
+        normalized_tokens = tuple(_normalize_token(token) for token in spec.tokens)
+        if normalized_tokens:
+            blocks.append(_PhraseBlock(spec, spec.normalized, normalized_tokens))
+    return tuple(blocks)
+
+
 def clear_camera_ocr_fuzzy_phrase_cache() -> None:
     _get_phrase_specs.cache_clear()
+    _get_phrase_blocks.cache_clear()
 
 
 @dataclass(frozen=True)
@@ -210,31 +268,47 @@ def normalize_camera_ocr_for_extraction(
     if not token_matches:
         return CameraOcrFuzzyResult(text=source)
 
+    # Token-level views are shared by every phrase, so build them once.
+    token_count = len(token_matches)
+    token_starts = [match.start() for match in token_matches]
+    token_ends = [match.end() for match in token_matches]
+    raw_tokens = [match.group(0) for match in token_matches]
+    norm_tokens = [_normalize_token(token) for token in raw_tokens]
+    # norm_offsets[i] = total normalized length of tokens[:i]; the normalized
+    # window is the concatenation of its normalized tokens.
+    norm_offsets = [0]
+    for token in norm_tokens:
+        norm_offsets.append(norm_offsets[-1] + len(token))
+    # Windows containing an empty normalized token are never scored.
+    empty_before = [0]
+    for token in norm_tokens:
+        empty_before.append(empty_before[-1] + (0 if token else 1))
+
     candidates: list[CameraOcrFuzzyReplacement] = []
-    for spec in _get_phrase_specs():
-        phrase_tokens = spec.tokens
-        n = len(phrase_tokens)
-        if n <= 0 or len(token_matches) < n:
+    for block in _get_phrase_blocks():
+        spec = block.spec
+        n = block.size
+        if token_count < n:
             continue
 
-        normalized_phrase_tokens = [_normalize_token(token) for token in phrase_tokens]
-        normalized_phrase = spec.normalized
-        for idx in range(0, len(token_matches) - n + 1):
-            window = token_matches[idx : idx + n]
-            start = int(window[0].start())
-            end = int(window[-1].end())
+        normalized_phrase = block.normalized
+        for idx in range(0, token_count - n + 1):
+            stop = idx + n
+            if empty_before[stop] != empty_before[idx]:
+                continue
+            window_tokens = norm_tokens[idx:stop]
+            if not block.admits(window_tokens, norm_offsets[stop] - norm_offsets[idx]):
+                continue
+
+            start = token_starts[idx]
+            end = token_ends[stop - 1]
             candidate_span = source[start:end]
 
             # Never rewrite bracketed tokens like [REDACTED], [DATE: ...], [SYSTEM: ...].
             if "[" in candidate_span or "]" in candidate_span:
                 continue
 
-            candidate_tokens = [match.group(0) for match in window]
-            normalized_candidate_tokens = [_normalize_token(tok) for tok in candidate_tokens]
-            if any(not tok for tok in normalized_candidate_tokens):
-                continue
-
-            normalized_candidate = _normalize_token(" ".join(candidate_tokens))
+            normalized_candidate = "".join(window_tokens)
             if normalized_candidate == normalized_phrase:
                 continue
 
@@ -244,11 +318,8 @@ def normalize_camera_ocr_for_extraction(
 
             token_scores = [
                 _ratio(left, right)
-                for left, right in zip(normalized_candidate_tokens, normalized_phrase_tokens, strict=True)
+                for left, right in zip(window_tokens, block.normalized_tokens, strict=True)
             ]
-            if not token_scores:
-                continue
-
             token_avg = sum(token_scores) / float(len(token_scores))
             token_min = min(token_scores)
             if token_avg < spec.threshold_token_avg or token_min < spec.threshold_token_min:
@@ -268,25 +339,33 @@ def normalize_camera_ocr_for_extraction(
     if not candidates:
         return CameraOcrFuzzyResult(text=source, replacements=[])
 
-    # Keep highest-confidence non-overlapping replacements.
+    # Keep highest-confidence non-overlapping replacements: one pass in score
+    # order, with taken spans kept sorted by start for a bisect overlap check.
     candidates.sort(key=lambda item: (item.score, item.end - item.start), reverse=True)
     selected: list[CameraOcrFuzzyReplacement] = []
+    taken_starts: list[int] = []
     for candidate in candidates:
         if len(selected) >= int(max_replacements):
             break
-        if any(not (candidate.end <= taken.start or candidate.start >= taken.end) for taken in selected):
+        pos = bisect.bisect_left(taken_starts, candidate.start)
+        if pos < len(selected) and selected[pos].start < candidate.end:
+            continue
+        if pos > 0 and selected[pos - 1].end > candidate.start:
             continue
-        selected.append(candidate)
+        taken_starts.insert(pos, candidate.start)
+        selected.insert(pos, candidate)
 
     if not selected:
         return CameraOcrFuzzyResult(text=source, replacements=[])
 
-    out = source
-    for candidate in sorted(selected, key=lambda item: item.start, reverse=True):
-        out = f"{out[:candidate.start]}{candidate.replacement}{out[candidate.end:]}"
-
-    selected_sorted = sorted(selected, key=lambda item: item.start)
-    return CameraOcrFuzzyResult(text=out, replacements=selected_sorted)
+    pieces: list[str] = []
+    cursor = 0
+    for candidate in selected:
+        pieces.append(source[cursor : candidate.start])
+        pieces.append(candidate.replacement)
+        cursor = candidate.end
+    pieces.append(source[cursor:])
+    return CameraOcrFuzzyResult(text="".join(pieces), replacements=selected)
 
 
 __all__ = [
@@ -1,27 +1,41 @@
-"""Machine learning utilities for the CPT coder and registry predictor."""
-
-from .predictor import MLCoderService, MLCoderPredictor
-from .registry_predictor import (
-    RegistryMLPredictor,
-    RegistryFieldPrediction,
-    RegistryCaseClassification,
-)
-from .registry_training import (
-    train_registry_model,
-    evaluate_registry_model,
-    train_and_evaluate as train_and_evaluate_registry,
-)
-
-__all__ = [
+"""Machine learning utilities for the CPT coder and registry predictor.
+
+Exports are resolved lazily: the API imports light submodules such as
+``ml.lib.ml_coder.thresholds`` on its boot path, and importing the package must
+not drag in scikit-learn/pandas through the predictor and training modules.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_EXPORTS: dict[str, tuple[str, str]] = {
     # CPT predictor
-    "MLCoderService",
-    "MLCoderPredictor",
+    "MLCoderService": (".predictor", "MLCoderService"),
+    "MLCoderPredictor": (".predictor", "MLCoderPredictor"),
     # Registry predictor
-    "RegistryMLPredictor",
-    "RegistryFieldPrediction",
-    "RegistryCaseClassification",
+    "RegistryMLPredictor": (".registry_predictor", "RegistryMLPredictor"),
+    "RegistryFieldPrediction": (".registry_predictor", "RegistryFieldPrediction"),
+    "RegistryCaseClassification": (".registry_predictor", "RegistryCaseClassification"),
     # Registry training
-    "train_registry_model",
-    "evaluate_registry_model",
-    "train_and_evaluate_registry",
-]
+    "train_registry_model": (".registry_training", "train_registry_model"),
+    "evaluate_registry_model": (".registry_training", "evaluate_registry_model"),
+    "train_and_evaluate_registry": (".registry_training", "train_and_evaluate"),
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:  # pragma: no cover
+    return sorted(set(globals().keys()) | set(__all__))
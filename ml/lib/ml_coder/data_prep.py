@@ -655,4 +655,6 @@ from .registry_data_prep import (  # noqa: E402, F401, I001
     extract_records_from_golden_dir,
     stratified_split as registry_stratified_split,
     filter_rare_labels,
+    hydrate_golden_label_matrix,
+    HydratedLabelMatrix,
 )
@@ -22,12 +22,18 @@ from .data_prep import derive_booleans_from_json
 from .registry_label_constraints import apply_label_constraints
 
 __all__ = [
+    "HYDRATOR_VERSION",
     "HydratedLabels",
     "hydrate_labels_from_text",
     "extract_labels_with_hydration",
     "KEYWORD_TO_PROCEDURE_MAP",
 ]
 
+# Part of the registry data-prep cache key. Source edits to the hydration
+# modules already invalidate the cache; bump this for changes that live
+# elsewhere (e.g. data files read by the hydrators).
+HYDRATOR_VERSION = "1"
+
 # =============================================================================
 # Keyword-to-Procedure Mapping
 # =============================================================================
@@ -0,0 +1,15 @@
+"""Default artifact locations for the CPT classifier.
+
+Kept separate from ``training`` so the predictor (and the API process) can
+resolve model paths without importing scikit-learn/pandas.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+MODELS_DIR = Path("data/models")
+PIPELINE_PATH = MODELS_DIR / "cpt_classifier.pkl"
+MLB_PATH = MODELS_DIR / "mlb.pkl"
+
+__all__ = ["MLB_PATH", "MODELS_DIR", "PIPELINE_PATH"]
@@ -9,19 +9,22 @@ from __future__ import annotations
 
 import hashlib
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import joblib
 import re
-from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import MultiLabelBinarizer
 
 from app.common.logger import get_logger
 from app.infra.cache import get_ml_memory_cache
 from app.infra.settings import get_infra_settings
+from ml.lib.ml_coder.paths import MLB_PATH, PIPELINE_PATH
 from ml.lib.ml_coder.thresholds import CaseDifficulty, Thresholds, load_thresholds
-from ml.lib.ml_coder.training import MLB_PATH, PIPELINE_PATH
+
+if TYPE_CHECKING:  # pragma: no cover - sklearn is loaded by joblib when unpickling
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import MultiLabelBinarizer
 
 logger = get_logger("ml_coder.predictor")
 
@@ -38,6 +41,29 @@ def _ml_cache_key(prefix: str, text: str) -> str:
     return f"{prefix}:{digest}"
 
 
+@lru_cache(maxsize=4)
+def _load_model_artifacts_cached(
+    model_path: str, mlb_path: str, _model_mtime_ns: int, _mlb_mtime_ns: int
+) -> tuple[Pipeline, MultiLabelBinarizer]:
+    logger.info("Loading model from %s", model_path)
+    return joblib.load(model_path), joblib.load(mlb_path)
+
+
+def load_model_artifacts(model_path: Path, mlb_path: Path) -> tuple[Pipeline, MultiLabelBinarizer]:
+    """Load (pipeline, mlb) once per process and file version.
+
+    The artifacts are only read at prediction time, so every predictor built
+    from the same files shares them; loading them before a prefork server
+    forks lets workers share the pages copy-on-write.
+    """
+    return _load_model_artifacts_cached(
+        str(model_path.resolve()),
+        str(mlb_path.resolve()),
+        model_path.stat().st_mtime_ns,
+        mlb_path.stat().st_mtime_ns,
+    )
+
+
 class MLCoderService:
     """Thin wrapper around the trained classifier pipeline and binarizer."""
 
@@ -172,9 +198,7 @@ class MLCoderPredictor:
         model_path = Path(model_path) if model_path else PIPELINE_PATH
         mlb_path = Path(mlb_path) if mlb_path else MLB_PATH
 
-        logger.info("Loading model from %s", model_path)
-        self._pipeline = joblib.load(model_path)
-        self._mlb = joblib.load(mlb_path)
+        self._pipeline, self._mlb = load_model_artifacts(model_path, mlb_path)
         self._labels: list[str] = list(self._mlb.classes_)
 
         if thresholds:
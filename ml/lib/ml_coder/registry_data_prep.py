@@ -28,6 +28,7 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import os
 from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -35,6 +36,7 @@ from typing import Any
 
 import numpy as np
 import pandas as pd
+from scipy import sparse
 
 from config.settings import KnowledgeSettings
 from ml.lib.ml_coder.registry_label_schema import REGISTRY_LABELS, compute_encounter_id
@@ -288,54 +290,55 @@ def _load_human_labels_csv(path: Path, labels: list[str]) -> list[dict[str, Any]
     if "note_text" not in df.columns:
         raise ValueError(f"Human labels CSV missing required column 'note_text': {path}")
 
+    df["note_text"] = df["note_text"].fillna("").astype(str).str.strip()
+    df = df[df["note_text"].str.len() > 0]
+    if df.empty:
+        return []
+
     # Normalize/ensure label columns exist and are {0,1}.
-    for label in labels:
-        if label not in df.columns:
-            df[label] = 0
-        df[label] = pd.to_numeric(df[label], errors="coerce").fillna(0).clip(0, 1).astype(int)
+    label_frame = (
+        df.reindex(columns=labels, fill_value=0)
+        .apply(pd.to_numeric, errors="coerce")
+        .fillna(0)
+        .clip(0, 1)
+        .astype(int)
+    )
 
     if "label_confidence" not in df.columns:
-        df["label_confidence"] = 1.0
+        confidence = pd.Series(1.0, index=df.index)
     else:
-        df["label_confidence"] = (
-            pd.to_numeric(df["label_confidence"], errors="coerce").fillna(1.0).clip(0.0, 1.0)
-        )
-
-    if "label_source" not in df.columns:
-        df["label_source"] = "human"
-    else:
-        df["label_source"] = df["label_source"].fillna("human").astype(str)
+        confidence = pd.to_numeric(df["label_confidence"], errors="coerce").fillna(1.0).clip(0.0, 1.0)
+        # A zero confidence is treated as unset.
+        confidence = confidence.where(confidence != 0, 1.0)
 
     if "encounter_id" not in df.columns:
-        df["encounter_id"] = df["note_text"].fillna("").astype(str).map(_generate_encounter_id)
+        encounter_id = df["note_text"].map(_generate_encounter_id)
     else:
-        df["encounter_id"] = df["encounter_id"].fillna("").astype(str)
-        missing = df["encounter_id"].str.len() == 0
+        encounter_id = df["encounter_id"].fillna("").astype(str)
+        missing = encounter_id.str.len() == 0
         if missing.any():
-            df.loc[missing, "encounter_id"] = (
-                df.loc[missing, "note_text"].fillna("").astype(str).map(_generate_encounter_id)
-            )
+            encounter_id = encounter_id.copy()
+            encounter_id[missing] = df.loc[missing, "note_text"].map(_generate_encounter_id)
 
     if "source_file" not in df.columns:
-        df["source_file"] = path.name
+        source_file = pd.Series(path.name, index=df.index)
     else:
-        df["source_file"] = df["source_file"].fillna(path.name).astype(str)
-
-    records: list[dict[str, Any]] = []
-    for _, row in df.iterrows():
-        note_text = str(row.get("note_text") or "").strip()
-        if not note_text:
-            continue
-        record: dict[str, Any] = {
-            "note_text": note_text,
-            "encounter_id": str(row.get("encounter_id") or _generate_encounter_id(note_text)),
-            "source_file": str(row.get("source_file") or path.name),
+        source_file = df["source_file"].fillna(path.name).astype(str)
+        source_file = source_file.where(source_file.str.len() > 0, path.name)
+
+    meta = pd.DataFrame(
+        {
+            "note_text": df["note_text"],
+            "encounter_id": encounter_id,
+            "source_file": source_file,
             "label_source": "human",
-            "label_confidence": float(row.get("label_confidence") or 1.0),
-        }
-        record.update({label: int(row.get(label, 0)) for label in labels})
+            "label_confidence": confidence.astype(float),
+        },
+        index=df.index,
+    )
+    records: list[dict[str, Any]] = pd.concat([meta, label_frame], axis=1).to_dict("records")
+    for record in records:
         apply_label_constraints(record)
-        records.append(record)
     return records
 
 
@@ -360,11 +363,500 @@ def _load_golden_json(path: Path) -> list[dict] | None:
         return None
 
 
+# =============================================================================
+# Per-file extraction, cache and process pool
+# =============================================================================
+# Extraction of one golden file is reduced to a list of per-entry "outcomes"
+# (a record, or the reason the entry was skipped). Outcomes are what the
+# process pool returns and what the cache stores; stats and records are then
+# rebuilt by replaying them in file order, so results match a serial run.
+
+DEFAULT_PREP_CACHE_DIR = Path("data/ml_training/.prep_cache")
+
+# Layout of cached per-file outcomes and assembled label matrices; bump on change.
+_PREP_CACHE_FORMAT = "sparse-1"
+
+# Modules whose source determines hydrated labels; any edit invalidates the cache.
+_HYDRATION_SOURCE_MODULES = (
+    "ml.lib.ml_coder.label_hydrator",
+    "ml.lib.ml_coder.registry_label_constraints",
+    "ml.lib.ml_coder.registry_label_schema",
+    "ml.lib.ml_coder.data_prep",
+    "app.registry.v2_booleans",
+    "app.registry.processing.masking",
+)
+
+
+def hydration_cache_key(min_text_length: int = 50) -> str:
+    """Fingerprint of everything that affects hydrated labels for a given file."""
+    import importlib
+
+    from .label_hydrator import HYDRATOR_VERSION
+
+    digest = hashlib.sha256()
+    digest.update(
+        f"hydrator={HYDRATOR_VERSION};format={_PREP_CACHE_FORMAT};min_len={min_text_length};".encode()
+    )
+    digest.update(json.dumps(ALL_PROCEDURE_LABELS).encode())
+    for module_name in _HYDRATION_SOURCE_MODULES:
+        module_file = getattr(importlib.import_module(module_name), "__file__", None)
+        if module_file:
+            digest.update(module_name.encode())
+            digest.update(Path(module_file).read_bytes())
+    return digest.hexdigest()[:24]
+
+
+def _file_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _hydrated_file_outcomes(path: Path, min_text_length: int) -> list[dict[str, Any]] | None:
+    """Run 3-tier hydration over one golden file (process-pool worker)."""
+    from .label_hydrator import extract_labels_with_hydration
+
+    entries = _load_golden_json(path)
+    if entries is None:
+        return None
+
+    outcomes: list[dict[str, Any]] = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            outcomes.append({"skip": "non_dict"})
+            continue
+
+        note_text = entry.get("note_text") or entry.get("text") or entry.get("note")
+        if not note_text or not isinstance(note_text, str):
+            outcomes.append({"skip": "no_text"})
+            continue
+        note_text = note_text.strip()
+        if len(note_text) < min_text_length:
+            outcomes.append({"skip": "no_text"})
+            continue
+
+        result = extract_labels_with_hydration(entry, note_text)
+        labels = result.labels
+        apply_label_constraints(labels, note_text=note_text)
+        if not any(v == 1 for v in labels.values()):
+            outcomes.append({"skip": "empty_labels", "tier": result.source})
+            continue
+
+        outcomes.append(
+            {
+                "tier": result.source,
+                # No source_file: outcomes are cached by content hash and identical
+                # files share an entry; the name is filled in when replaying.
+                "record": {
+                    "note_text": note_text,
+                    "encounter_id": _generate_encounter_id(note_text),
+                    "label_source": result.source,
+                    "label_confidence": result.confidence,
+                },
+                # Sparse labels: column indices into ALL_PROCEDURE_LABELS that are 1.
+                "positives": [
+                    i for i, label in enumerate(ALL_PROCEDURE_LABELS) if labels.get(label) == 1
+                ],
+            }
+        )
+    return outcomes
+
+
+def _hydrated_file_outcomes_worker(
+    args: tuple[str, int],
+) -> list[dict[str, Any]] | None:
+    path_str, min_text_length = args
+    return _hydrated_file_outcomes(Path(path_str), min_text_length)
+
+
+class _PrepCache:
+    """On-disk outcomes per golden file, keyed by file content hash.
+
+    Layout: ``<cache_dir>/<hydration_cache_key>/<file sha256>.json`` plus a
+    ``manifest.json`` of ``{file name: [size, mtime_ns, sha256]}`` used by
+    incremental mode to skip re-hashing files whose stat is unchanged.
+    Assembled label matrices for a whole corpus live under ``matrix/``, keyed
+    by the corpus fingerprint (see ``hydrate_golden_label_matrix``).
+    """
+
+    def __init__(self, cache_dir: Path, key: str) -> None:
+        self.root = cache_dir / key
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._manifest_path = self.root / "manifest.json"
+        try:
+            self.manifest: dict[str, list[Any]] = json.loads(
+                self._manifest_path.read_text(encoding="utf-8")
+            )
+        except (OSError, json.JSONDecodeError):
+            self.manifest = {}
+
+    def content_hash(self, path: Path, *, trust_stat: bool) -> str:
+        stat = path.stat()
+        known = self.manifest.get(str(path.resolve()))
+        if trust_stat and known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            return known[2]
+        digest = _file_sha256(path)
+        self.manifest[str(path.resolve())] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+    def get(self, digest: str) -> list[dict[str, Any]] | None:
+        try:
+            data = json.loads((self.root / f"{digest}.json").read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        return data.get("outcomes")
+
+    def put(self, digest: str, outcomes: list[dict[str, Any]]) -> None:
+        target = self.root / f"{digest}.json"
+        tmp = target.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"outcomes": outcomes}), encoding="utf-8")
+        tmp.replace(target)
+
+    def save_manifest(self) -> None:
+        tmp = self._manifest_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.manifest), encoding="utf-8")
+        tmp.replace(self._manifest_path)
+
+    def get_matrix(self, fingerprint: str) -> "HydratedLabelMatrix | None":
+        base = self.root / "matrix" / fingerprint
+        try:
+            with np.load(base.with_suffix(".npz")) as arrays:
+                labels = sparse.csr_matrix(
+                    (arrays["data"], arrays["indices"], arrays["indptr"]),
+                    shape=tuple(arrays["shape"]),
+                )
+            payload = json.loads(base.with_suffix(".json").read_text(encoding="utf-8"))
+        except (OSError, ValueError, KeyError):
+            return None
+        stats = payload["stats"]
+        stats["label_counts"] = Counter(stats["label_counts"])
+        return HydratedLabelMatrix(
+            meta=pd.DataFrame(payload["meta"], columns=list(_MATRIX_META_COLUMNS)),
+            labels=labels,
+            label_names=payload["label_names"],
+            stats=stats,
+        )
+
+    def put_matrix(self, fingerprint: str, matrix: "HydratedLabelMatrix") -> None:
+        base = self.root / "matrix" / fingerprint
+        base.parent.mkdir(parents=True, exist_ok=True)
+        labels = matrix.labels.tocsr()
+        # np.savez appends ".npz" to names that lack it, so the temp name keeps the suffix.
+        tmp_npz = base.with_name(f"{fingerprint}.tmp.npz")
+        np.savez(
+            tmp_npz,
+            data=labels.data,
+            indices=labels.indices,
+            indptr=labels.indptr,
+            shape=np.asarray(labels.shape, dtype=np.int64),
+        )
+        payload = {
+            "label_names": matrix.label_names,
+            "meta": matrix.meta.to_dict("list"),
+            "stats": {**matrix.stats, "label_counts": dict(matrix.stats["label_counts"])},
+        }
+        tmp_json = base.with_name(f"{fingerprint}.tmp.json")
+        tmp_json.write_text(json.dumps(payload), encoding="utf-8")
+        tmp_npz.replace(base.with_suffix(".npz"))
+        tmp_json.replace(base.with_suffix(".json"))
+
+
+def _collect_hydrated_outcomes(
+    json_files: list[Path],
+    min_text_length: int,
+    *,
+    workers: int | None,
+    cache: _PrepCache | None,
+    digests: list[str] | None,
+    stats: dict[str, Any],
+) -> list[list[dict[str, Any]] | None]:
+    """Return per-file outcomes in file order, from cache or a process pool."""
+    outcomes: list[list[dict[str, Any]] | None] = [None] * len(json_files)
+    todo: list[int] = []
+
+    for idx in range(len(json_files)):
+        cached = cache.get(digests[idx]) if cache is not None and digests is not None else None
+        if cached is None:
+            todo.append(idx)
+        else:
+            outcomes[idx] = cached
+    stats["cache_hits"] = len(json_files) - len(todo)
+    stats["files_processed"] = len(todo)
+
+    workers = (os.cpu_count() or 1) if workers is None else max(1, workers)
+    if len(todo) > 1 and workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        jobs = [(str(json_files[idx]), min_text_length) for idx in todo]
+        with ProcessPoolExecutor(max_workers=min(workers, len(todo))) as pool:
+            results = list(pool.map(_hydrated_file_outcomes_worker, jobs, chunksize=4))
+    else:
+        results = [_hydrated_file_outcomes(json_files[idx], min_text_length) for idx in todo]
+
+    for idx, result in zip(todo, results):
+        outcomes[idx] = result
+        # Parse errors are not cached so a fixed file is picked up next run.
+        if cache is not None and digests is not None and result is not None:
+            cache.put(digests[idx], result)
+
+    logger.info(
+        "Golden prep: %d files from cache, %d processed (workers=%d)",
+        stats["cache_hits"],
+        stats["files_processed"],
+        workers,
+    )
+    return outcomes
+
+
+# =============================================================================
+# Columnar label matrix
+# =============================================================================
+# Hydrated records are assembled column-wise: one metadata frame plus a CSR
+# matrix of the positive labels, built straight from the per-file sparse
+# outcomes. Counting, deduplication and the DataFrame/CSV view are vectorized
+# over those columns instead of walking a 32-key dict per record.
+
+_MATRIX_META_COLUMNS = ("note_text", "encounter_id", "source_file", "label_source", "label_confidence")
+
+
+@dataclass
+class HydratedLabelMatrix:
+    """Hydrated training records in columnar form.
+
+    Attributes:
+        meta: One row per record with ``_MATRIX_META_COLUMNS``.
+        labels: ``(n_records, len(label_names))`` CSR matrix of 0/1 labels.
+        label_names: Column names for ``labels`` (``ALL_PROCEDURE_LABELS`` order).
+        stats: Extraction statistics (same keys as ``extract_records_from_golden_dir``).
+    """
+
+    meta: pd.DataFrame
+    labels: sparse.csr_matrix
+    label_names: list[str]
+    stats: dict[str, Any] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.meta)
+
+    @classmethod
+    def from_records(
+        cls, records: list[dict[str, Any]], label_names: list[str]
+    ) -> "HydratedLabelMatrix":
+        """Build from record dicts (e.g. human-labeled CSV rows)."""
+        meta = pd.DataFrame(
+            [[record.get(col) for col in _MATRIX_META_COLUMNS] for record in records],
+            columns=list(_MATRIX_META_COLUMNS),
+        )
+        dense = np.array(
+            [[int(record.get(label, 0) or 0) for label in label_names] for record in records],
+            dtype=np.int8,
+        ).reshape(len(records), len(label_names))
+        return cls(meta=meta, labels=sparse.csr_matrix(dense), label_names=list(label_names))
+
+    @classmethod
+    def concat(cls, parts: list["HydratedLabelMatrix"]) -> "HydratedLabelMatrix":
+        label_names = parts[0].label_names
+        if any(part.label_names != label_names for part in parts):
+            raise ValueError("Cannot concatenate label matrices with different label columns")
+        return cls(
+            meta=pd.concat([part.meta for part in parts], ignore_index=True),
+            labels=sparse.vstack([part.labels for part in parts], format="csr"),
+            label_names=list(label_names),
+        )
+
+    def take(self, rows: np.ndarray) -> "HydratedLabelMatrix":
+        return HydratedLabelMatrix(
+            meta=self.meta.iloc[rows].reset_index(drop=True),
+            labels=self.labels[rows],
+            label_names=self.label_names,
+            stats=self.stats,
+        )
+
+    def label_counts(self) -> Counter:
+        counts = np.asarray(self.labels.sum(axis=0)).ravel()
+        return Counter({name: int(n) for name, n in zip(self.label_names, counts) if n})
+
+    def deduplicate(self) -> tuple["HydratedLabelMatrix", dict[str, Any]]:
+        """Vectorized ``deduplicate_records``: same winners, order and stats."""
+        texts = self.meta["note_text"].fillna("").astype(str)
+        group, uniques = pd.factorize(texts, sort=False)
+        priority = self.meta["label_source"].map(SOURCE_PRIORITY).fillna(0).to_numpy(float)
+        confidence = self.meta["label_confidence"].fillna(0).to_numpy(float)
+        position = np.arange(len(group))
+        # Group (first-appearance order), then best priority/confidence, ties -> earliest row.
+        order = np.lexsort((position, -confidence, -priority, group))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = group[order][1:] != group[order][:-1]
+        keep = order[first]
+
+        sizes = np.bincount(group, minlength=len(uniques))
+        conflicts: Counter = Counter()
+        duplicated = sizes[group] > 1
+        if duplicated.any():
+            sources = self.meta["label_source"].fillna("unknown")[duplicated]
+            for source_set in sources.groupby(group[duplicated], sort=False).agg(frozenset):
+                if len(source_set) > 1:
+                    conflicts[" vs ".join(sorted(source_set))] += 1
+
+        stats = {
+            "total_input": len(group),
+            "unique_texts": len(uniques),
+            "duplicates_removed": int(len(group) - len(uniques)),
+            "conflicts_by_source": dict(conflicts),
+            "total_output": len(keep),
+        }
+        return self.take(keep), stats
+
+    def to_frame(self) -> pd.DataFrame:
+        """Dense DataFrame: metadata columns followed by int label columns."""
+        labels = pd.DataFrame(
+            self.labels.toarray().astype(np.int64), columns=self.label_names, index=self.meta.index
+        )
+        return pd.concat([self.meta, labels], axis=1)
+
+    def to_records(self) -> list[dict[str, Any]]:
+        meta_rows = self.meta.to_dict("records")
+        dense = self.labels.toarray().tolist()
+        return [{**meta, **dict(zip(self.label_names, row))} for meta, row in zip(meta_rows, dense)]
+
+
+def _matrix_from_outcomes(
+    json_files: list[Path],
+    file_outcomes: list[list[dict[str, Any]] | None],
+    stats: dict[str, Any],
+) -> HydratedLabelMatrix:
+    """Replay per-file outcomes into stats and a CSR label matrix (file order)."""
+    meta_columns: dict[str, list[Any]] = {col: [] for col in _MATRIX_META_COLUMNS}
+    indices: list[int] = []
+    indptr = [0]
+    for path, outcomes in zip(json_files, file_outcomes):
+        stats["total_files"] += 1
+        if outcomes is None:
+            stats["parse_errors"] += 1
+            continue
+        for outcome in outcomes:
+            stats["total_entries"] += 1
+            if "tier" in outcome:
+                stats[f"tier_{outcome['tier']}"] += 1
+            skip = outcome.get("skip")
+            if skip == "no_text":
+                stats["skipped_no_text"] += 1
+            elif skip == "empty_labels":
+                stats["skipped_empty_labels"] += 1
+            if skip:
+                continue
+            record = {**outcome["record"], "source_file": path.name}
+            for col in _MATRIX_META_COLUMNS:
+                meta_columns[col].append(record[col])
+            indices.extend(outcome["positives"])
+            indptr.append(len(indices))
+            stats["successful"] += 1
+
+    n_labels = len(ALL_PROCEDURE_LABELS)
+    index_array = np.asarray(indices, dtype=np.int32)
+    labels = sparse.csr_matrix(
+        (np.ones(len(index_array), dtype=np.int8), index_array, np.asarray(indptr, dtype=np.int64)),
+        shape=(len(indptr) - 1, n_labels),
+    )
+    counts = np.bincount(index_array, minlength=n_labels)
+    stats["label_counts"] = Counter(
+        {label: int(n) for label, n in zip(ALL_PROCEDURE_LABELS, counts) if n}
+    )
+    return HydratedLabelMatrix(
+        meta=pd.DataFrame(meta_columns, columns=list(_MATRIX_META_COLUMNS)),
+        labels=labels,
+        label_names=list(ALL_PROCEDURE_LABELS),
+        stats=stats,
+    )
+
+
+def _new_extraction_stats() -> dict[str, Any]:
+    return {
+        "total_files": 0,
+        "total_entries": 0,
+        "successful": 0,
+        "skipped_no_text": 0,
+        "skipped_no_registry": 0,
+        "skipped_empty_labels": 0,
+        "parse_errors": 0,
+        "label_counts": Counter(),
+        # Hydration tier statistics
+        "tier_structured": 0,
+        "tier_cpt": 0,
+        "tier_keyword": 0,
+        "tier_empty": 0,
+    }
+
+
+def hydrate_golden_label_matrix(
+    golden_dir: Path,
+    min_text_length: int = 50,
+    workers: int | None = None,
+    cache_dir: Path | None = None,
+    incremental: bool = False,
+) -> HydratedLabelMatrix:
+    """3-tier hydration of every golden file into a deduplicated label matrix.
+
+    With ``cache_dir``, per-file outcomes are cached by content hash and the
+    assembled (deduplicated) matrix is cached under a fingerprint of the
+    hydration key plus every file's name and content hash, so an unchanged
+    corpus loads one ``.npz`` instead of replaying each file.
+    """
+    json_files = sorted(Path(golden_dir).glob("golden_*.json"))
+    key = hydration_cache_key(min_text_length)
+    cache = _PrepCache(Path(cache_dir), key) if cache_dir else None
+
+    digests: list[str] | None = None
+    fingerprint: str | None = None
+    if cache is not None:
+        digests = [cache.content_hash(path, trust_stat=incremental) for path in json_files]
+        cache.save_manifest()
+        corpus = hashlib.sha256(key.encode())
+        for path, digest in zip(json_files, digests):
+            corpus.update(f"\n{path.name}\t{digest}".encode())
+        fingerprint = corpus.hexdigest()[:24]
+        cached = cache.get_matrix(fingerprint)
+        if cached is not None:
+            cached.stats["cache_hits"] = len(json_files)
+            cached.stats["files_processed"] = 0
+            logger.info("Golden prep: label matrix for %d files loaded from cache", len(json_files))
+            return cached
+
+    stats = _new_extraction_stats()
+    file_outcomes = _collect_hydrated_outcomes(
+        json_files,
+        min_text_length,
+        workers=workers,
+        cache=cache,
+        digests=digests,
+        stats=stats,
+    )
+    matrix = _matrix_from_outcomes(json_files, file_outcomes, stats)
+
+    if len(matrix):
+        matrix, dedup_stats = matrix.deduplicate()
+        stats["dedup"] = dedup_stats
+        if dedup_stats["duplicates_removed"] > 0:
+            logger.info(
+                f"Deduplication: {dedup_stats['duplicates_removed']} duplicates removed, "
+                f"{dedup_stats['total_output']} unique records"
+            )
+    matrix.stats = stats
+
+    if cache is not None and fingerprint is not None:
+        try:
+            cache.put_matrix(fingerprint, matrix)
+        except OSError as exc:
+            logger.warning("Could not cache label matrix in %s: %s", cache.root, exc)
+    return matrix
+
+
 def extract_records_from_golden_dir(
     golden_dir: Path,
     extractor: RegistryLabelExtractor = None,
     min_text_length: int = 50,
     use_hydration: bool = True,
+    workers: int | None = None,
+    cache_dir: Path | None = None,
+    incremental: bool = False,
 ) -> tuple[list[dict], dict[str, Any]]:
     """Extract training records from all golden JSONs in a directory.
 
@@ -379,32 +871,29 @@ def extract_records_from_golden_dir(
         min_text_length: Minimum note text length to include
         use_hydration: If True, use 3-tier hydration (default). If False, use
                        legacy RegistryLabelExtractor.
+        workers: Process-pool size for hydration (default: CPU count; 1 = serial)
+        cache_dir: If set, cache per-file hydration outcomes here, keyed by file
+                   content hash under a hydrator/label-schema fingerprint
+        incremental: With cache_dir, trust the cached hash of files whose size
+                     and mtime are unchanged (only changed files are read)
 
     Returns:
-        Tuple of (records list, statistics dict)
+        Tuple of (records list, statistics dict). With hydration the records are
+        the dict view of ``hydrate_golden_label_matrix`` (already deduplicated).
     """
-    # Import hydration function here to avoid circular imports
-    from .label_hydrator import extract_labels_with_hydration
+    if use_hydration:
+        matrix = hydrate_golden_label_matrix(
+            golden_dir,
+            min_text_length,
+            workers=workers,
+            cache_dir=Path(cache_dir) if cache_dir else None,
+            incremental=incremental,
+        )
+        return matrix.to_records(), matrix.stats
 
-    # Legacy extractor as fallback
+    # Legacy extractor (deprecated)
     extractor = extractor or RegistryLabelExtractor()
-
-    stats = {
-        "total_files": 0,
-        "total_entries": 0,
-        "successful": 0,
-        "skipped_no_text": 0,
-        "skipped_no_registry": 0,
-        "skipped_empty_labels": 0,
-        "parse_errors": 0,
-        "label_counts": Counter(),
-        # Hydration tier statistics
-        "tier_structured": 0,
-        "tier_cpt": 0,
-        "tier_keyword": 0,
-        "tier_empty": 0,
-    }
-
+    stats = _new_extraction_stats()
     records = []
     json_files = sorted(golden_dir.glob("golden_*.json"))
 
@@ -434,30 +923,17 @@ def extract_records_from_golden_dir(
                 stats["skipped_no_text"] += 1
                 continue
 
-            # Extract labels using hydration or legacy extractor
-            if use_hydration:
-                result = extract_labels_with_hydration(entry, note_text)
-                labels = result.labels
-                label_source = result.source
-                label_confidence = result.confidence
-
-                # Track tier statistics
-                stats[f"tier_{label_source}"] += 1
-            else:
-                # Legacy extraction (deprecated)
-                registry = (
-                    entry.get("registry_entry")
-                    or entry.get("registry")
-                    or entry.get("extraction")
-                )
-                if not registry or not isinstance(registry, dict):
-                    stats["skipped_no_registry"] += 1
-                    continue
-
-                labels = extractor.extract(registry)
-                label_source = "legacy"
-                label_confidence = 0.5
+            # Legacy extraction (deprecated)
+            registry = (
+                entry.get("registry_entry")
+                or entry.get("registry")
+                or entry.get("extraction")
+            )
+            if not registry or not isinstance(registry, dict):
+                stats["skipped_no_registry"] += 1
+                continue
 
+            labels = extractor.extract(registry)
             apply_label_constraints(labels, note_text=note_text)
 
             # Require at least one positive label
@@ -470,8 +946,8 @@ def extract_records_from_golden_dir(
                 "note_text": note_text,
                 "encounter_id": _generate_encounter_id(note_text),
                 "source_file": path.name,
-                "label_source": label_source,
-                "label_confidence": label_confidence,
+                "label_source": "legacy",
+                "label_confidence": 0.5,
                 **labels,
             }
             records.append(record)
@@ -482,16 +958,6 @@ def extract_records_from_golden_dir(
                 if value == 1:
                     stats["label_counts"][label] += 1
 
-    # Deduplicate records when using hydration pipeline
-    if use_hydration and records:
-        records, dedup_stats = deduplicate_records(records)
-        stats["dedup"] = dedup_stats
-        if dedup_stats["duplicates_removed"] > 0:
-            logger.info(
-                f"Deduplication: {dedup_stats['duplicates_removed']} duplicates removed, "
-                f"{dedup_stats['total_output']} unique records"
-            )
-
     return records, stats
 
 
@@ -523,19 +989,12 @@ def stratified_split(
     """
     np.random.seed(random_state)
 
-    # Get unique encounters
-    encounters = df[group_column].unique()
-    n_encounters = len(encounters)
+    n_encounters = df[group_column].nunique()
 
-    # Build encounter-level label matrix
-    enc_to_labels = {}
-    for enc_id in encounters:
-        mask = df[group_column] == enc_id
-        label_vec = tuple(int(df.loc[mask, col].max()) for col in label_columns)
-        enc_to_labels[enc_id] = label_vec
-
-    enc_array = np.array(encounters)
-    label_matrix = np.array([enc_to_labels[e] for e in encounters])
+    # Build encounter-level label matrix (max over each encounter's rows)
+    enc_labels = df.groupby(group_column, sort=False)[label_columns].max()
+    enc_array = np.array(enc_labels.index.tolist())
+    label_matrix = enc_labels.to_numpy(dtype=int)
 
     # Try skmultilearn for proper stratification
     try:
@@ -601,14 +1060,9 @@ def filter_rare_labels(
     Returns:
         Tuple of (filtered_df, remaining_labels, dropped_labels)
     """
-    remaining = []
-    dropped = []
-
-    for col in label_columns:
-        if df[col].sum() >= min_count:
-            remaining.append(col)
-        else:
-            dropped.append(col)
+    counts = df[label_columns].sum()
+    remaining = [col for col in label_columns if counts[col] >= min_count]
+    dropped = [col for col in label_columns if counts[col] < min_count]
 
     if dropped:
         df = df.drop(columns=dropped)
@@ -625,6 +1079,9 @@ def prepare_registry_training_splits(
     val_ratio: float = 0.15,
     test_ratio: float = 0.15,
     random_state: int = 42,
+    workers: int | None = None,
+    cache_dir: Path | str | None = None,
+    incremental: bool = False,
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """Main entry point for registry-first training data preparation.
 
@@ -644,6 +1101,9 @@ def prepare_registry_training_splits(
         val_ratio: Validation set fraction (default 0.15)
         test_ratio: Test set fraction (default 0.15)
         random_state: Random seed for reproducibility
+        workers: Process-pool size for label hydration (default: CPU count)
+        cache_dir: Optional per-file hydration cache (see extract_records_from_golden_dir)
+        incremental: With cache_dir, only read golden files whose size/mtime changed
 
     Returns:
         Tuple of (train_df, val_df, test_df) DataFrames
@@ -681,8 +1141,14 @@ def prepare_registry_training_splits(
 
     logger.info(f"Loading golden JSONs from: {golden_dir}")
 
-    # Extract records with hydration
-    records, stats = extract_records_from_golden_dir(golden_dir, use_hydration=True)
+    # Hydrate labels into a columnar (sparse) label matrix
+    matrix = hydrate_golden_label_matrix(
+        golden_dir,
+        workers=workers,
+        cache_dir=Path(cache_dir) if cache_dir else None,
+        incremental=incremental,
+    )
+    stats = matrix.stats
 
     # Tier-0 merge: human labels (highest priority).
     if human_labels_csv:
@@ -698,13 +1164,13 @@ def prepare_registry_training_splits(
                     len(human_records),
                     human_path,
                 )
-                records = [*human_records, *records]
-                records, dedup_stats = deduplicate_records(records)
+                human = HydratedLabelMatrix.from_records(human_records, ALL_PROCEDURE_LABELS)
+                matrix, dedup_stats = HydratedLabelMatrix.concat([human, matrix]).deduplicate()
                 stats["dedup_with_human"] = dedup_stats
         else:
             logger.warning("Human labels CSV not found (skipping): %s", human_path)
 
-    if not records:
+    if not len(matrix):
         raise ValueError(
             f"No valid records extracted. Stats: "
             f"total={stats['total_files']}, "
@@ -714,7 +1180,7 @@ def prepare_registry_training_splits(
         )
 
     logger.info(
-        f"Extracted {len(records)} records from {stats['total_files']} files "
+        f"Extracted {len(matrix)} records from {stats['total_files']} files "
         f"({stats.get('total_entries', 0)} total entries)"
     )
 
@@ -751,8 +1217,8 @@ def prepare_registry_training_splits(
         if dedup.get("conflicts_by_source"):
             logger.info(f"  Conflicts: {dedup['conflicts_by_source']}")
 
-    # Create DataFrame
-    df = pd.DataFrame(records)
+    # Dense DataFrame view (metadata + int label columns) for splitting and CSV export
+    df = matrix.to_frame()
 
     # Filter rare labels
     df, remaining_labels, dropped = filter_rare_labels(
@@ -831,6 +1297,28 @@ def main():
         default=42,
         help="Random seed",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes for label hydration (default: CPU count; 1 = serial)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_PREP_CACHE_DIR,
+        help=f"Per-file hydration cache (default: {DEFAULT_PREP_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the hydration cache",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only read golden files whose size/mtime changed since the last cached run",
+    )
 
     args = parser.parse_args()
 
@@ -839,6 +1327,9 @@ def main():
         human_labels_csv=args.human_labels_csv,
         min_label_count=args.min_count,
         random_state=args.seed,
+        workers=args.workers,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        incremental=args.incremental,
     )
 
     args.output_dir.mkdir(parents=True, exist_ok=True)
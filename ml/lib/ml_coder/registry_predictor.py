@@ -17,7 +17,11 @@ import joblib
 import numpy as np
 
 from app.common.logger import get_logger
-from ml.lib.ml_coder.data_prep import REGISTRY_TARGET_FIELDS
+from app.registry.v2_booleans import PROCEDURE_BOOLEAN_FIELDS
+
+# Same list as ml.lib.ml_coder.data_prep.REGISTRY_TARGET_FIELDS, taken from the
+# canonical source so inference does not import the (sklearn/pandas) data prep module.
+REGISTRY_TARGET_FIELDS = list(PROCEDURE_BOOLEAN_FIELDS)
 
 logger = get_logger("ml_coder.registry_predictor")
 
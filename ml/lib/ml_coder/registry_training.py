@@ -20,7 +20,7 @@ import pandas as pd
 from sklearn.calibration import CalibratedClassifierCV
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import f1_score, precision_recall_fscore_support
+from sklearn.metrics import precision_recall_fscore_support
 from sklearn.model_selection import train_test_split
 from sklearn.multiclass import OneVsRestClassifier
 from sklearn.pipeline import Pipeline
@@ -137,69 +137,132 @@ def build_registry_pipeline() -> Pipeline:
     )
 
 
+THRESHOLD_MODES = ("grid", "exact")
+
+
+def _label_probability_matrix(proba: Any, n_labels: int) -> np.ndarray:
+    """Normalize predict_proba output to a (n_samples, n_labels) float matrix."""
+    # OneVsRestClassifier with CalibratedClassifierCV returns (n_samples, n_labels);
+    # some estimators return a list of (n_samples, 2) arrays instead.
+    if isinstance(proba, list):
+        columns = [p[:, 1] if p.shape[1] > 1 else p[:, 0] for p in proba[:n_labels]]
+        return np.column_stack(columns).astype(np.float64, copy=False)
+    return np.asarray(proba, dtype=np.float64)[:, :n_labels]
+
+
+def _grid_f1_thresholds(
+    proba: np.ndarray, y_true: np.ndarray, grid: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Best grid threshold and F1 per label, lowest threshold winning ties.
+
+    Counts at each grid point come from one column-wise sort: with ascending
+    probabilities, the number of samples at or above ``t`` is ``n - rank(t)``.
+    """
+    n_samples, n_labels = proba.shape
+    positives = y_true.sum(axis=0)
+    pos_proba = np.where(y_true, proba, -np.inf)
+
+    sorted_all = np.sort(proba, axis=0)
+    sorted_pos = np.sort(pos_proba, axis=0)
+
+    best_f1 = np.full(n_labels, -1.0)
+    best_thresh = np.full(n_labels, 0.5)
+    for t in grid:
+        predicted = n_samples - (sorted_all < t).sum(axis=0)
+        tp = n_samples - (sorted_pos < t).sum(axis=0)
+        denom = predicted + positives
+        f1 = np.divide(2.0 * tp, denom, out=np.zeros(n_labels), where=denom > 0)
+        improved = f1 > best_f1
+        best_f1 = np.where(improved, f1, best_f1)
+        best_thresh = np.where(improved, float(t), best_thresh)
+    return best_thresh, best_f1
+
+
+def _exact_f1_thresholds(proba: np.ndarray, y_true: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Best threshold over every distinct probability per label.
+
+    Each column is sorted once (descending); cumulative sums give TP and the
+    predicted-positive count for "predict p >= sorted[i]" at every position,
+    and only the last position of each run of tied scores is a valid cut.
+    Ties in F1 resolve to the lowest threshold, as in grid mode.
+    """
+    n_samples, n_labels = proba.shape
+    positives = y_true.sum(axis=0)
+
+    order = np.argsort(-proba, axis=0, kind="stable")
+    sorted_proba = np.take_along_axis(proba, order, axis=0)
+    sorted_true = np.take_along_axis(y_true, order, axis=0)
+
+    tp = np.cumsum(sorted_true, axis=0, dtype=np.float64)
+    predicted = np.arange(1, n_samples + 1, dtype=np.float64)[:, None]
+    f1 = 2.0 * tp / (predicted + positives)
+
+    is_cut = np.ones_like(sorted_proba, dtype=bool)
+    is_cut[:-1] = sorted_proba[:-1] != sorted_proba[1:]
+    f1 = np.where(is_cut, f1, -1.0)
+
+    # Reverse so argmax (first max) lands on the lowest threshold among ties.
+    best_from_end = np.argmax(f1[::-1], axis=0)
+    best_pos = n_samples - 1 - best_from_end
+    columns = np.arange(n_labels)
+    return sorted_proba[best_pos, columns], f1[best_pos, columns]
+
+
 def optimize_label_thresholds(
     model: Pipeline,
     texts: Sequence[str],
     y_true: np.ndarray,
     label_names: Sequence[str],
     grid_points: int = 17,
+    mode: str = "grid",
 ) -> dict[str, float]:
     """Find F1-optimal threshold per label on a validation set.
 
-    Searches a coarse grid of thresholds [0.1, 0.9] for each label
-    and selects the threshold that maximizes F1 score.
+    In ``grid`` mode, searches a coarse grid of thresholds [0.1, 0.9] for
+    each label and selects the threshold that maximizes F1 score. In
+    ``exact`` mode every distinct predicted probability is a candidate cut
+    point. Both modes evaluate all labels at once from sorted probabilities
+    and cumulative TP/FP counts.
 
     Args:
         model: Fitted Pipeline with predict_proba method
         texts: Validation texts
         y_true: True labels matrix (n_samples, n_labels)
         label_names: List of label names (in column order)
-        grid_points: Number of threshold points to search
+        grid_points: Number of threshold points to search (grid mode)
+        mode: "grid" (default) or "exact"
 
     Returns:
         Dict mapping label name to optimal threshold
     """
-    logger.info("Optimizing thresholds on %d validation samples", len(texts))
+    if mode not in THRESHOLD_MODES:
+        raise ValueError(f"mode must be one of {THRESHOLD_MODES}, got {mode!r}")
+
+    logger.info("Optimizing thresholds (%s) on %d validation samples", mode, len(texts))
 
     # Get probability predictions
-    proba = model.predict_proba(list(texts))
+    proba = _label_probability_matrix(model.predict_proba(list(texts)), len(label_names))
+    y_bool = np.asarray(y_true)[:, : len(label_names)].astype(bool)
 
-    thresholds: dict[str, float] = {}
-    threshold_grid = np.linspace(0.1, 0.9, grid_points)
+    if mode == "exact":
+        best_thresh, best_f1 = _exact_f1_thresholds(proba, y_bool)
+    else:
+        best_thresh, best_f1 = _grid_f1_thresholds(
+            proba, y_bool, np.linspace(0.1, 0.9, grid_points)
+        )
 
+    thresholds: dict[str, float] = {}
+    has_positive = y_bool.any(axis=0)
     for idx, label in enumerate(label_names):
-        # Handle different predict_proba output formats
-        # OneVsRestClassifier with CalibratedClassifierCV returns (n_samples, n_labels)
-        if isinstance(proba, list):
-            # proba is list of (n_samples, 2) arrays
-            if proba[idx].shape[1] > 1:
-                label_proba = proba[idx][:, 1]
-            else:
-                label_proba = proba[idx][:, 0]
-        else:
-            # proba is (n_samples, n_labels)
-            label_proba = proba[:, idx]
-
-        y_label_true = y_true[:, idx]
-
         # Skip threshold optimization if no positive samples
-        if y_label_true.sum() == 0:
+        if not has_positive[idx]:
             thresholds[label] = 0.5
             logger.warning("Label '%s' has no positive samples in validation; using default 0.5", label)
             continue
-
-        best_thresh = 0.5
-        best_f1 = -1.0
-
-        for t in threshold_grid:
-            y_pred = (label_proba >= t).astype(int)
-            f1 = f1_score(y_label_true, y_pred, zero_division=0)
-            if f1 > best_f1:
-                best_f1 = f1
-                best_thresh = float(t)
-
-        thresholds[label] = best_thresh
-        logger.debug("Label '%s': optimal threshold=%.2f, F1=%.3f", label, best_thresh, best_f1)
+        thresholds[label] = float(best_thresh[idx])
+        logger.debug(
+            "Label '%s': optimal threshold=%.2f, F1=%.3f", label, thresholds[label], best_f1[idx]
+        )
 
     # Log summary statistics
     thresh_values = list(thresholds.values())
@@ -218,6 +281,7 @@ def train_registry_model(
     models_dir: Path | str = MODELS_DIR,
     val_size: float = 0.2,
     random_state: int = 42,
+    threshold_mode: str = "grid",
 ) -> tuple[Pipeline, MultiLabelBinarizer, dict[str, float]]:
     """Train registry classifier and persist artifacts.
 
@@ -226,6 +290,7 @@ def train_registry_model(
         models_dir: Directory to save model artifacts
         val_size: Fraction of training data for validation (threshold tuning)
         random_state: Random seed for reproducibility
+        threshold_mode: "grid" or "exact" (see optimize_label_thresholds)
 
     Returns:
         Tuple of (fitted_pipeline, label_binarizer, thresholds)
@@ -259,7 +324,7 @@ def train_registry_model(
     model.fit(X_train, y_train)
 
     # Optimize thresholds on validation set
-    thresholds = optimize_label_thresholds(model, X_val, y_val, label_names)
+    thresholds = optimize_label_thresholds(model, X_val, y_val, label_names, mode=threshold_mode)
 
     # Create MLB for label ordering
     mlb = MultiLabelBinarizer(classes=label_names)
@@ -390,6 +455,7 @@ def train_and_evaluate(
     test_csv: Path | str = TEST_CSV_PATH,
     models_dir: Path | str = MODELS_DIR,
     metrics_path: Path | str = REGISTRY_METRICS_PATH,
+    threshold_mode: str = "grid",
 ) -> dict[str, Any]:
     """Train model and evaluate on test set.
 
@@ -400,11 +466,12 @@ def train_and_evaluate(
         test_csv: Path to test CSV
         models_dir: Directory for model artifacts
         metrics_path: Path to save evaluation metrics
+        threshold_mode: "grid" or "exact" (see optimize_label_thresholds)
 
     Returns:
         Evaluation metrics dictionary
     """
-    train_registry_model(train_csv=train_csv, models_dir=models_dir)
+    train_registry_model(train_csv=train_csv, models_dir=models_dir, threshold_mode=threshold_mode)
     return evaluate_registry_model(test_csv=test_csv, output_path=metrics_path)
 
 
@@ -448,6 +515,12 @@ if __name__ == "__main__":
         action="store_true",
         help="Evaluate model after training",
     )
+    parser.add_argument(
+        "--threshold-mode",
+        choices=THRESHOLD_MODES,
+        default="grid",
+        help="Threshold search: 17-point grid (default) or every distinct probability",
+    )
 
     args = parser.parse_args()
 
@@ -460,6 +533,7 @@ if __name__ == "__main__":
             train_csv=args.train_csv,
             test_csv=args.test_csv,
             models_dir=args.models_dir,
+            threshold_mode=args.threshold_mode,
         )
         print("\n" + "=" * 60)
         print("Evaluation Results")
@@ -473,6 +547,7 @@ if __name__ == "__main__":
         model, mlb, thresholds = train_registry_model(
             train_csv=args.train_csv,
             models_dir=args.models_dir,
+            threshold_mode=args.threshold_mode,
         )
         print("\nTraining complete!")
         print(f"Model saved to: {args.models_dir / 'registry_classifier.pkl'}")
@@ -18,15 +18,12 @@ from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import MultiLabelBinarizer
 
 from app.common.logger import get_logger
+from ml.lib.ml_coder.paths import MLB_PATH, MODELS_DIR, PIPELINE_PATH
 from ml.lib.ml_coder.preprocessing import NoteTextCleaner
 from ml.lib.ml_coder.utils import clean_cpt_codes
 
 logger = get_logger("ml_coder.training")
 
-MODELS_DIR = Path("data/models")
-PIPELINE_PATH = MODELS_DIR / "cpt_classifier.pkl"
-MLB_PATH = MODELS_DIR / "mlb.pkl"
-
 
 def _load_training_rows(csv_path: Path) -> tuple[list[str], list[list[str]]]:
     """Load and clean note/cpt rows from the provided CSV file."""
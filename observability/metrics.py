@@ -44,6 +44,19 @@ class MetricsClient(ABC):
         """Record a timing value in milliseconds."""
         ...
 
+    def histogram(
+        self,
+        name: str,
+        value: float,
+        tags: dict[str, str] | None = None,
+        buckets: tuple[float, ...] | None = None,
+    ) -> None:
+        """Record a value into a histogram with explicit bucket bounds.
+
+        Clients without native histogram support fall back to ``observe``.
+        """
+        self.observe(name, value, tags)
+
 
 class StdoutMetricsClient(MetricsClient):
     """Emit metrics as JSON to stdout for development/debugging."""
@@ -70,6 +83,15 @@ class StdoutMetricsClient(MetricsClient):
     def timing(self, name: str, value_ms: float, tags: dict[str, str] | None = None) -> None:
         self._emit("timing", name, value_ms, tags)
 
+    def histogram(
+        self,
+        name: str,
+        value: float,
+        tags: dict[str, str] | None = None,
+        buckets: tuple[float, ...] | None = None,
+    ) -> None:
+        self._emit("histogram", name, value, tags)
+
 
 class NullMetricsClient(MetricsClient):
     """No-op metrics client for when metrics are disabled."""
@@ -241,11 +263,15 @@ class RegistryMetricsClient(MetricsClient):
                 self._gauges[name] = GaugeMetric(name=name)
             return self._gauges[name]
 
-    def _get_histogram(self, name: str) -> HistogramMetric:
-        """Get or create a histogram metric."""
+    def _get_histogram(
+        self, name: str, buckets: tuple[float, ...] | None = None
+    ) -> HistogramMetric:
+        """Get or create a histogram metric (buckets apply on first creation)."""
         with self._lock:
             if name not in self._histograms:
-                self._histograms[name] = HistogramMetric(name=name)
+                self._histograms[name] = HistogramMetric(
+                    name=name, buckets=buckets or DEFAULT_TIMING_BUCKETS
+                )
             return self._histograms[name]
 
     def incr(self, name: str, tags: dict[str, str] | None = None, value: int = 1) -> None:
@@ -263,6 +289,17 @@ class RegistryMetricsClient(MetricsClient):
         histogram = self._get_histogram(name)
         histogram.observe(value_ms, tags)
 
+    def histogram(
+        self,
+        name: str,
+        value: float,
+        tags: dict[str, str] | None = None,
+        buckets: tuple[float, ...] | None = None,
+    ) -> None:
+        """Record a value into a histogram with custom buckets."""
+        histogram = self._get_histogram(name, buckets)
+        histogram.observe(value, tags)
+
     def export_prometheus(self) -> str:
         """Export all metrics in Prometheus text format.
 
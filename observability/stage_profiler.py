@@ -0,0 +1,129 @@
+"""Per-stage wall time and allocation profiling for multi-pass pipelines.
+
+Wrap each pass of a sequential pipeline in a stage so its cost is emitted as
+metrics histograms and, optionally, returned to the caller:
+
+    profiler = StageProfiler("registry.extraction_first")
+    warnings = profiler.run("sanitize_ebus_events", sanitize_ebus_events, record, text)
+    with profiler.stage("merge_equipment_seed"):
+        record = merge(record)
+    breakdown = profiler.summary()
+
+Allocation tracking uses ``tracemalloc`` and is opt-in
+(``PIPELINE_STAGE_PROFILE_ALLOCATIONS=1``) because tracing slows every
+allocation in the process. Allocation figures are process-wide, so with
+concurrent requests they are approximate.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Generator, TypeVar
+
+from .metrics import get_metrics_client
+
+T = TypeVar("T")
+
+STAGE_DURATION_METRIC = "pipeline_stage_duration_ms"
+STAGE_ALLOC_METRIC = "pipeline_stage_alloc_kb"
+
+# Postprocess passes are mostly sub-10ms; keep resolution at the low end.
+STAGE_DURATION_BUCKETS = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+STAGE_ALLOC_BUCKETS = (16, 64, 256, 1024, 4096, 16384, 65536)
+
+
+def stage_allocation_tracking_enabled() -> bool:
+    return os.getenv("PIPELINE_STAGE_PROFILE_ALLOCATIONS", "").strip().lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+
+@dataclass
+class StageTiming:
+    """Cost of one executed stage."""
+
+    name: str
+    wall_ms: float
+    alloc_peak_kb: float | None = None
+    alloc_net_kb: float | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {"stage": self.name, "wall_ms": round(self.wall_ms, 3)}
+        if self.alloc_peak_kb is not None:
+            data["alloc_peak_kb"] = round(self.alloc_peak_kb, 1)
+            data["alloc_net_kb"] = round(self.alloc_net_kb or 0.0, 1)
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+class StageProfiler:
+    """Record per-stage wall time (and optionally allocations) for one pipeline run."""
+
+    def __init__(
+        self,
+        pipeline: str,
+        *,
+        track_allocations: bool | None = None,
+        emit_metrics: bool = True,
+    ) -> None:
+        self.pipeline = pipeline
+        self.track_allocations = (
+            stage_allocation_tracking_enabled() if track_allocations is None else track_allocations
+        )
+        self.emit_metrics = emit_metrics
+        self.stages: list[StageTiming] = []
+        if self.track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name: str) -> Generator[None, None, None]:
+        """Time the enclosed block as stage *name*."""
+        alloc_before = 0
+        if self.track_allocations:
+            alloc_before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        error: str | None = None
+        try:
+            yield
+        except BaseException as exc:
+            error = type(exc).__name__
+            raise
+        finally:
+            wall_ms = (time.perf_counter() - start) * 1000
+            timing = StageTiming(name=name, wall_ms=wall_ms, error=error)
+            if self.track_allocations:
+                current, peak = tracemalloc.get_traced_memory()
+                timing.alloc_peak_kb = max(0, peak - alloc_before) / 1024
+                timing.alloc_net_kb = (current - alloc_before) / 1024
+            self.stages.append(timing)
+            if self.emit_metrics:
+                self._emit(timing)
+
+    def run(self, name: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Call ``fn(*args, **kwargs)`` as stage *name* and return its result."""
+        with self.stage(name):
+            return fn(*args, **kwargs)
+
+    def _emit(self, timing: StageTiming) -> None:
+        client = get_metrics_client()
+        tags = {"pipeline": self.pipeline, "stage": timing.name}
+        client.histogram(STAGE_DURATION_METRIC, timing.wall_ms, tags, STAGE_DURATION_BUCKETS)
+        if timing.alloc_peak_kb is not None:
+            client.histogram(STAGE_ALLOC_METRIC, timing.alloc_peak_kb, tags, STAGE_ALLOC_BUCKETS)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(stage.wall_ms for stage in self.stages)
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Per-stage breakdown in execution order (repeated stage names are kept)."""
+        return [stage.to_dict() for stage in self.stages]
@@ -0,0 +1,335 @@
+"""Prewarmed multi-process batch runner for note corpora.
+
+Batch tools (``ops/tools/unified_pipeline_batch.py``,
+``ops/tools/registry_pipeline_smoke_batch.py``) hand this module a *warm*
+callable and a per-note *work* callable:
+
+    stats = run_batch(
+        items,
+        work,
+        warm=warm,
+        workers=8,
+        output=Path("results.jsonl"),
+    )
+    print(stats.report())
+
+``warm`` runs once in the parent (load services, KB, ONNX sessions, run one
+note through the pipeline). With the default ``fork`` start method the
+workers are forked afterwards and share the loaded models copy-on-write;
+``gc.freeze()`` moves the warmed heap out of the collector's view so the
+children do not dirty those pages just by running a GC pass. With ``spawn``
+each worker runs ``warm`` itself.
+
+Results stream to JSONL, one line per note, flushed as they arrive. Re-running
+with the same output skips notes whose ``note_sha256`` already has an ``ok``
+line, so an interrupted corpus run resumes where it stopped.
+
+ONNX Runtime intra-op thread pools do not survive ``fork``; callers that fork
+after creating sessions should set ``ORT_INTRA_OP_NUM_THREADS=1`` before
+warming (the batch tools do this when ``--workers > 1``).
+"""
+
+from __future__ import annotations
+
+import gc
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+WorkFn = Callable[[str, str], dict[str, Any]]
+
+PERCENTILES = (50, 95, 99)
+
+
+def note_sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    note_id: str
+    text: str
+
+    @property
+    def note_sha256(self) -> str:
+        return note_sha256(self.text)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Linear-interpolated percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+@dataclass
+class BatchStats:
+    """Throughput and latency summary for one batch run."""
+
+    workers: int
+    start_method: str
+    warm_s: float = 0.0
+    elapsed_s: float = 0.0
+    ok: int = 0
+    failed: int = 0
+    skipped: int = 0
+    note_ms: list[float] = field(default_factory=list)
+    stage_ms: dict[str, list[float]] = field(default_factory=dict)
+
+    def add(self, record: dict[str, Any]) -> None:
+        if record.get("status") == "ok":
+            self.ok += 1
+        else:
+            self.failed += 1
+        self.note_ms.append(float(record.get("wall_ms") or 0.0))
+        for stage in record.get("stage_timings") or []:
+            name = stage.get("stage")
+            if name:
+                self.stage_ms.setdefault(name, []).append(float(stage.get("wall_ms") or 0.0))
+
+    @property
+    def processed(self) -> int:
+        return self.ok + self.failed
+
+    @property
+    def notes_per_s(self) -> float:
+        return self.processed / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @staticmethod
+    def _summarize(values: list[float]) -> dict[str, float]:
+        ordered = sorted(values)
+        summary = {f"p{pct}": round(percentile(ordered, pct), 3) for pct in PERCENTILES}
+        summary["mean"] = round(sum(ordered) / len(ordered), 3) if ordered else 0.0
+        summary["count"] = len(ordered)
+        return summary
+
+    def to_dict(self) -> dict[str, Any]:
+        stages = {
+            name: self._summarize(values)
+            for name, values in sorted(
+                self.stage_ms.items(), key=lambda kv: sum(kv[1]), reverse=True
+            )
+        }
+        return {
+            "workers": self.workers,
+            "start_method": self.start_method,
+            "warm_s": round(self.warm_s, 3),
+            "elapsed_s": round(self.elapsed_s, 3),
+            "ok": self.ok,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "notes_per_s": round(self.notes_per_s, 3),
+            "note_ms": self._summarize(self.note_ms),
+            "stages": stages,
+        }
+
+    def report(self, top: int = 25) -> str:
+        data = self.to_dict()
+        note = data["note_ms"]
+        lines = [
+            f"Workers: {self.workers} ({self.start_method}), warm-up {self.warm_s:.1f}s",
+            f"Processed: {self.processed} (ok={self.ok}, failed={self.failed}, "
+            f"skipped={self.skipped}) in {self.elapsed_s:.1f}s -> {self.notes_per_s:.2f} notes/s",
+            f"Per-note ms: p50={note['p50']:.1f} p95={note['p95']:.1f} p99={note['p99']:.1f}",
+        ]
+        if data["stages"]:
+            lines.append(f"{'stage':<44} {'n':>6} {'p50':>9} {'p95':>9} {'p99':>9}")
+            for name, summary in list(data["stages"].items())[:top]:
+                lines.append(
+                    f"{name[:44]:<44} {summary['count']:>6} {summary['p50']:>9.2f} "
+                    f"{summary['p95']:>9.2f} {summary['p99']:>9.2f}"
+                )
+        return "\n".join(lines)
+
+
+def load_completed_hashes(path: Path) -> set[str]:
+    """Return note hashes that already have an ``ok`` line in *path*."""
+    done: set[str] = set()
+    if not path.exists():
+        return done
+    with path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from an interrupted run; the note is redone.
+                continue
+            if record.get("status") == "ok" and record.get("note_sha256"):
+                done.add(record["note_sha256"])
+    return done
+
+
+def truncate_torn_tail(path: Path) -> None:
+    """Drop a partial last line (an interrupted write) so appends start on a fresh line."""
+    if not path.exists():
+        return
+    with path.open("r+b") as fh:
+        size = fh.seek(0, os.SEEK_END)
+        end = size
+        while end > 0:
+            step = min(64 * 1024, end)
+            fh.seek(end - step)
+            chunk = fh.read(step)
+            newline = chunk.rfind(b"\n")
+            if newline >= 0:
+                end = end - step + newline + 1
+                break
+            end -= step
+        if end != size:
+            fh.truncate(end)
+
+
+# Set in the parent before forking (or by _init_worker under spawn).
+_WORK_FN: WorkFn | None = None
+
+
+def _init_worker(work: WorkFn, warm: Callable[[], None] | None) -> None:
+    global _WORK_FN
+    if _WORK_FN is None:
+        if warm is not None:
+            warm()
+        _WORK_FN = work
+
+
+def _process(item: BatchItem) -> dict[str, Any]:
+    assert _WORK_FN is not None
+    record: dict[str, Any] = {
+        "note_id": item.note_id,
+        "note_sha256": item.note_sha256,
+        "pid": os.getpid(),
+    }
+    started = time.perf_counter()
+    try:
+        payload = dict(_WORK_FN(item.note_id, item.text) or {})
+    except Exception as exc:  # noqa: BLE001
+        record["status"] = "error"
+        record["error"] = f"{type(exc).__name__}: {exc}"
+        payload = {}
+    else:
+        record["status"] = payload.pop("status", "ok")
+    record["wall_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    record["stage_timings"] = payload.pop("stage_timings", [])
+    record.update(payload)
+    return record
+
+
+def _iter_records(
+    items: list[BatchItem],
+    work: WorkFn,
+    warm: Callable[[], None] | None,
+    workers: int,
+    start_method: str,
+) -> Iterator[dict[str, Any]]:
+    global _WORK_FN
+    if workers <= 1:
+        _WORK_FN = work
+        for item in items:
+            yield _process(item)
+        return
+
+    ctx = multiprocessing.get_context(start_method)
+    if start_method == "fork":
+        # Children inherit the warmed state; keep it out of the GC's reach so
+        # collections in the workers do not touch (and copy) shared pages.
+        _WORK_FN = work
+        gc.collect()
+        gc.freeze()
+        initargs: tuple[Any, ...] = (work, None)
+    else:
+        initargs = (work, warm)
+    try:
+        with ctx.Pool(processes=workers, initializer=_init_worker, initargs=initargs) as pool:
+            yield from pool.imap_unordered(_process, items, chunksize=1)
+    finally:
+        if start_method == "fork":
+            gc.unfreeze()
+
+
+def run_batch(
+    items: Iterable[BatchItem],
+    work: WorkFn,
+    *,
+    warm: Callable[[], None] | None = None,
+    workers: int = 1,
+    output: Path | None = None,
+    resume: bool = True,
+    start_method: str = "fork",
+    on_record: Callable[[dict[str, Any]], None] | None = None,
+    progress: bool = True,
+) -> BatchStats:
+    """Run *work* over *items* and stream one JSON line per note to *output*.
+
+    *work* receives ``(note_id, text)`` and returns a JSON-serialisable dict.
+    Optional keys: ``status`` (default ``"ok"``) and ``stage_timings`` (a list
+    of ``{"stage", "wall_ms"}`` dicts, e.g. ``StageProfiler.summary()``).
+    """
+    if start_method not in multiprocessing.get_all_start_methods():
+        raise ValueError(f"Unsupported start method on this platform: {start_method}")
+    workers = max(1, int(workers))
+    stats = BatchStats(workers=workers, start_method=start_method if workers > 1 else "inline")
+
+    pending = list(items)
+    if output is not None and resume:
+        done = load_completed_hashes(output)
+        if done:
+            before = len(pending)
+            pending = [item for item in pending if item.note_sha256 not in done]
+            stats.skipped = before - len(pending)
+
+    if warm is not None and (workers <= 1 or start_method == "fork"):
+        warm_started = time.perf_counter()
+        warm()
+        stats.warm_s = time.perf_counter() - warm_started
+
+    out_fh = None
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        if resume:
+            # The torn line was skipped above, so its note is redone and re-appended.
+            truncate_torn_tail(output)
+        out_fh = output.open("a" if resume else "w", encoding="utf-8")
+
+    started = time.perf_counter()
+    try:
+        for index, record in enumerate(
+            _iter_records(pending, work, warm, workers, start_method), 1
+        ):
+            stats.add(record)
+            if out_fh is not None:
+                out_fh.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                out_fh.flush()
+            if on_record is not None:
+                on_record(record)
+            if progress:
+                print(
+                    f"[{index}/{len(pending)}] {record['note_id']} {record['status']} "
+                    f"({record['wall_ms']:.0f} ms)",
+                    file=sys.stderr,
+                )
+    finally:
+        stats.elapsed_s = time.perf_counter() - started
+        if out_fh is not None:
+            out_fh.close()
+    return stats
+
+
+__all__ = [
+    "BatchItem",
+    "BatchStats",
+    "load_completed_hashes",
+    "note_sha256",
+    "percentile",
+    "run_batch",
+    "truncate_torn_tail",
+]
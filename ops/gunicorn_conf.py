@@ -0,0 +1,62 @@
+"""Gunicorn server hooks for prefork deployments (used by ops/railway_start_gunicorn.sh).
+
+With ``preload_app`` the master imports the app; ``when_ready`` then loads the
+heavy model artifacts (``app.infra.preload``) and freezes the heap before any
+worker is forked, so workers share them copy-on-write instead of each loading
+a private copy in its lifespan warmup (which then finds everything cached).
+
+Each worker logs its RSS/PSS/USS after init. For a live per-worker table run
+``python ops/tools/gunicorn_worker_memory.py`` (reads ``pidfile``).
+
+Environment Variables:
+    PROCSUITE_PRELOAD_MODELS: "0" disables the master preload (default: on)
+    GUNICORN_PID_FILE: Master pid file (default: /tmp/procsuite-gunicorn.pid)
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import sys
+
+preload_app = True
+pidfile = os.getenv("GUNICORN_PID_FILE", "/tmp/procsuite-gunicorn.pid")
+
+
+def when_ready(server) -> None:
+    from app.infra.preload import (
+        format_memory,
+        freeze_for_fork,
+        preload_enabled,
+        preload_shared_artifacts,
+        process_memory,
+    )
+
+    if preload_enabled():
+        report = preload_shared_artifacts()
+        for step, status in report.items():
+            server.log.info("[preload] %s: %s", step, status)
+    else:
+        server.log.info("[preload] disabled (PROCSUITE_PRELOAD_MODELS)")
+    freeze_for_fork()
+    server.log.info("[preload] master memory: %s", format_memory(process_memory()))
+
+
+def pre_fork(server, worker) -> None:
+    # Anything allocated since when_ready (e.g. before a worker respawn) is frozen too.
+    gc.freeze()
+
+
+def post_fork(server, worker) -> None:
+    # Pooled DB connections opened in the master must not be shared with workers.
+    # Covers the PHI engine and the registry store's lru_cached per-URL engines.
+    db = sys.modules.get("app.infra.db")
+    if db is not None:
+        disposed = db.dispose_engines_after_fork()
+        server.log.debug("[post_fork] disposed %d inherited DB engine(s)", disposed)
+
+
+def post_worker_init(worker) -> None:
+    from app.infra.preload import format_memory, process_memory
+
+    worker.log.info("[memory] worker pid=%s %s", worker.pid, format_memory(process_memory()))
@@ -5,6 +5,10 @@
 # - Gunicorn is not included by default in this repo; install it before using.
 # - Prefork workers increase memory usage; use only on higher-RAM plans.
 # - Avoid starting background threads *before* prefork.
+# - ops/gunicorn_conf.py loads models in the master and gc.freeze()s them so workers
+#   share them copy-on-write (PROCSUITE_PRELOAD_MODELS=0 disables). ONNX Runtime
+#   sessions are only preloaded with ORT_INTRA_OP_NUM_THREADS=1 (the default here).
+# - Per-worker RSS/PSS/USS: python ops/tools/gunicorn_worker_memory.py
 #
 # Suggested Railway Start Command (optional):
 #   ops/railway_start_gunicorn.sh
@@ -25,6 +29,7 @@ export MKL_NUM_THREADS="${MKL_NUM_THREADS:-1}"
 export OPENBLAS_NUM_THREADS="${OPENBLAS_NUM_THREADS:-1}"
 export NUMEXPR_NUM_THREADS="${NUMEXPR_NUM_THREADS:-1}"
 export VECLIB_MAXIMUM_THREADS="${VECLIB_MAXIMUM_THREADS:-1}"
+export ORT_INTRA_OP_NUM_THREADS="${ORT_INTRA_OP_NUM_THREADS:-1}"
 
 PORT="${PORT:-8000}"
 WORKERS="${WORKERS:-2}"
@@ -76,4 +81,5 @@ exec gunicorn "app.api.fastapi_app:app" \
   --workers "${WORKERS}" \
   --worker-class "uvicorn.workers.UvicornWorker" \
   --preload \
+  --config "ops/gunicorn_conf.py" \
   --timeout "${TIMEOUT}"
@@ -0,0 +1,513 @@
+"""End-to-end throughput benchmark over a note corpus (golden extractions).
+
+``ops/tools/bench_throughput.py`` drives this module. Each target runs in its
+own interpreter, so peak RSS and warm-up cost belong to that target alone:
+
+    corpus = load_bench_corpus(corpus_dir)
+    result = run_target("registry_extract", corpus.items, warmup=2)
+
+Targets:
+
+- ``api_process``: ``POST /api/v1/process`` through a FastAPI ``TestClient``
+  (routing, validation, coding and serialization included).
+- ``registry_extract``: ``RegistryService().extract_fields`` only.
+
+The LLM is replaced by ``DeterministicStubLLM`` (see
+``configure_bench_env``), so a run measures local CPU work and does not
+depend on network latency or provider output. Notes are replayed in a fixed
+order. The first ``warmup`` notes are run once beforehand to load models and
+fill process-wide caches; the measured pass then replays the whole corpus.
+
+Per-stage timings come from the ``pipeline_stage_duration_ms`` histograms
+emitted by ``observability.stage_profiler.StageProfiler``: a capturing
+metrics client is installed for the run and drained after every note. With
+``allocations=True`` the profiler also traces allocations per stage. Tracing
+slows every allocation, so throughput figures from such a run are not
+comparable with a normal run.
+
+``compare_results`` checks a result against a stored baseline and lists the
+metrics that regressed by more than the allowed percentage.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import platform
+import resource
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable
+
+from app.common.logger import get_logger
+from observability.metrics import MetricsClient, get_metrics_client, set_metrics_client
+from observability.stage_profiler import STAGE_ALLOC_METRIC, STAGE_DURATION_METRIC
+from ops.batch_runner import PERCENTILES, BatchItem, BatchStats, percentile
+
+logger = get_logger("ops.throughput_bench")
+
+ROOT = Path(__file__).resolve().parents[1]
+
+BENCH_SCHEMA_VERSION = "procedure_suite.throughput_bench.v1"
+
+TARGETS = ("api_process", "registry_extract")
+
+_KNOWLEDGE_DIR = ROOT / "data" / "knowledge"
+
+# Same preference order as registry training prep, then the curated vNext subset.
+CORPUS_CANDIDATES = (
+    _KNOWLEDGE_DIR / "golden_extractions_final",
+    _KNOWLEDGE_DIR / "golden_extractions_scrubbed",
+    _KNOWLEDGE_DIR / "golden_extractions",
+    _KNOWLEDGE_DIR / "golden_extractions_vNext" / "approved",
+)
+
+_NOTE_KEYS = ("note_text", "text", "note")
+
+# Stages faster than this at p50 in the baseline are too noisy to gate on.
+STAGE_GATE_MIN_MS = 5.0
+
+
+def configure_bench_env(*, allocations: bool = False) -> None:
+    """Offline, deterministic pipeline configuration (stub LLM, no network)."""
+
+    from app.common.quality_eval import configure_offline_quality_eval_env
+
+    configure_offline_quality_eval_env()
+    # A persistent LLM response cache would make runs depend on earlier runs.
+    os.environ.pop("LLM_CACHE_PATH", None)
+    os.environ.pop("PROCSUITE_LLM_CACHE_PATH", None)
+    os.environ["PIPELINE_STAGE_PROFILE_ALLOCATIONS"] = "1" if allocations else "0"
+
+
+def default_corpus_dir() -> Path | None:
+    for candidate in CORPUS_CANDIDATES:
+        if candidate.is_dir() and any(candidate.glob("*.json")):
+            return candidate
+    return None
+
+
+@dataclass
+class BenchCorpus:
+    """Notes to replay, plus the files that could not be read."""
+
+    items: list[BatchItem]
+    skipped_files: list[str] = field(default_factory=list)
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of the note texts and of any skipped file names (a partial corpus differs)."""
+        digest = hashlib.sha256()
+        for item in self.items:
+            digest.update(item.note_sha256.encode("ascii"))
+        for name in self.skipped_files:
+            digest.update(f"skipped:{name}".encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+
+def _notes_from_json(path: Path) -> list[tuple[str, str]]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if isinstance(payload, dict):
+        entries = payload.get("entries") or payload.get("records") or [payload]
+    elif isinstance(payload, list):
+        entries = payload
+    else:
+        return []
+    notes: list[tuple[str, str]] = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            continue
+        text = next(
+            (entry[key] for key in _NOTE_KEYS if isinstance(entry.get(key), str)), ""
+        ).strip()
+        if text:
+            notes.append((f"{path.stem}#{index}", text))
+    return notes
+
+
+def load_bench_corpus(path: Path, *, limit: int | None = None) -> BenchCorpus:
+    """Notes from golden JSON files (``note_text``/``text``/``note``) or ``*.txt`` files.
+
+    Duplicate note texts are replayed once. Order is by note id, so the same
+    corpus always replays in the same order. Unreadable or malformed files
+    are logged and listed in ``skipped_files``.
+    """
+
+    files = [path] if path.is_file() else sorted([*path.glob("*.json"), *path.glob("*.txt")])
+    items: list[BatchItem] = []
+    skipped: list[str] = []
+    seen: set[str] = set()
+    for file in files:
+        try:
+            if file.suffix == ".txt":
+                notes = [(file.stem, file.read_text(encoding="utf-8").strip())]
+            else:
+                notes = _notes_from_json(file)
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
+            logger.warning("Skipping unreadable corpus file %s: %s", file.name, exc)
+            skipped.append(file.name)
+            continue
+        for note_id, text in notes:
+            item = BatchItem(note_id=note_id, text=text)
+            if text and item.note_sha256 not in seen:
+                seen.add(item.note_sha256)
+                items.append(item)
+    items.sort(key=lambda item: item.note_id)
+    return BenchCorpus(items=items[:limit] if limit else items, skipped_files=skipped)
+
+
+class StageCaptureClient(MetricsClient):
+    """Metrics client that keeps stage histograms for the note being replayed.
+
+    Everything is forwarded to the previously configured client, so a run with
+    ``METRICS_BACKEND`` set still exports as usual.
+    """
+
+    def __init__(self, inner: MetricsClient) -> None:
+        self._inner = inner
+        self._lock = threading.Lock()
+        self._timings: dict[str, dict[str, float]] = {}
+
+    def incr(self, name: str, tags: dict[str, str] | None = None, value: int = 1) -> None:
+        self._inner.incr(name, tags, value)
+
+    def observe(self, name: str, value: float, tags: dict[str, str] | None = None) -> None:
+        self._inner.observe(name, value, tags)
+
+    def timing(self, name: str, value_ms: float, tags: dict[str, str] | None = None) -> None:
+        self._inner.timing(name, value_ms, tags)
+
+    def histogram(
+        self,
+        name: str,
+        value: float,
+        tags: dict[str, str] | None = None,
+        buckets: tuple[float, ...] | None = None,
+    ) -> None:
+        self._inner.histogram(name, value, tags, buckets)
+        if name not in (STAGE_DURATION_METRIC, STAGE_ALLOC_METRIC) or not tags:
+            return
+        key = "wall_ms" if name == STAGE_DURATION_METRIC else "alloc_peak_kb"
+        with self._lock:
+            # Repeated stages within one note are summed, like a per-note total.
+            entry = self._timings.setdefault(tags.get("stage", "?"), {})
+            entry[key] = entry.get(key, 0.0) + float(value)
+
+    def drain(self) -> list[dict[str, Any]]:
+        with self._lock:
+            timings, self._timings = self._timings, {}
+        return [{"stage": name, **values} for name, values in timings.items()]
+
+
+def _api_runner() -> tuple[Callable[[str], None], Callable[[], None]]:
+    from fastapi.testclient import TestClient
+
+    from app.api.fastapi_app import app
+
+    client = TestClient(app)
+    client.__enter__()  # run startup (bootstrap) once for the whole replay
+
+    def run(text: str) -> None:
+        response = client.post(
+            "/api/v1/process",
+            json={"note": text, "already_scrubbed": True, "include_financials": True},
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}: {response.text[:200]}")
+
+    return run, lambda: client.__exit__(None, None, None)
+
+
+def _registry_runner() -> tuple[Callable[[str], None], Callable[[], None]]:
+    from app.registry.application.registry_service import RegistryService
+
+    service = RegistryService()
+
+    def run(text: str) -> None:
+        service.extract_fields(text)
+
+    return run, lambda: None
+
+
+_RUNNERS = {"api_process": _api_runner, "registry_extract": _registry_runner}
+
+
+def _rss_mb() -> float:
+    from app.infra.preload import process_memory
+
+    return float(process_memory().get("rss_mb", 0.0))
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if platform.system() == "Darwin" else peak / 1024
+
+
+def _summarize_kb(values: list[float]) -> dict[str, float]:
+    ordered = sorted(values)
+    return {f"p{pct}": round(percentile(ordered, pct), 1) for pct in PERCENTILES}
+
+
+def run_target(
+    target: str,
+    items: list[BatchItem],
+    *,
+    warmup: int = 2,
+    repeat: int = 1,
+) -> dict[str, Any]:
+    """Replay *items* through *target* in this process and summarize the run."""
+
+    if target not in _RUNNERS:
+        raise ValueError(f"Unknown benchmark target {target!r} (expected one of {TARGETS})")
+    if not items:
+        raise ValueError("Benchmark corpus is empty")
+
+    capture = StageCaptureClient(get_metrics_client())
+    set_metrics_client(capture)
+    rss_start = _rss_mb()
+
+    warm_started = time.perf_counter()
+    run, close = _RUNNERS[target]()
+    try:
+        for item in items[: max(0, warmup)]:
+            run(item.text)
+        warm_s = time.perf_counter() - warm_started
+        capture.drain()
+        rss_warm = _rss_mb()
+
+        stats = BatchStats(workers=1, start_method="inline", warm_s=warm_s)
+        stage_alloc_kb: dict[str, list[float]] = {}
+        errors: list[dict[str, str]] = []
+        started = time.perf_counter()
+        for _ in range(max(1, repeat)):
+            for item in items:
+                note_started = time.perf_counter()
+                record: dict[str, Any] = {"status": "ok"}
+                try:
+                    run(item.text)
+                except Exception as exc:  # noqa: BLE001 - counted, not fatal
+                    record["status"] = "error"
+                    errors.append({"note_id": item.note_id, "error": f"{type(exc).__name__}: {exc}"})
+                record["wall_ms"] = (time.perf_counter() - note_started) * 1000
+                record["stage_timings"] = capture.drain()
+                stats.add(record)
+                for stage in record["stage_timings"]:
+                    if "alloc_peak_kb" in stage:
+                        stage_alloc_kb.setdefault(stage["stage"], []).append(stage["alloc_peak_kb"])
+        stats.elapsed_s = time.perf_counter() - started
+    finally:
+        close()
+
+    result = stats.to_dict()
+    result.pop("workers")
+    result.pop("start_method")
+    result["target"] = target
+    result["memory"] = {
+        "rss_start_mb": round(rss_start, 1),
+        "rss_after_warmup_mb": round(rss_warm, 1),
+        "rss_end_mb": round(_rss_mb(), 1),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+    if stage_alloc_kb:
+        result["stage_alloc_peak_kb"] = {
+            name: _summarize_kb(values) for name, values in sorted(stage_alloc_kb.items())
+        }
+    result["errors"] = errors[:20]
+    return result
+
+
+def _package_version(name: str) -> str | None:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _git(*args: str) -> str | None:
+    try:
+        proc = subprocess.run(
+            ["git", *args], cwd=ROOT, capture_output=True, text=True, check=False, timeout=30
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return proc.stdout.strip() if proc.returncode == 0 else None
+
+
+def environment_info() -> dict[str, Any]:
+    """Where a result was measured; results from different hosts are not comparable."""
+
+    commit = _git("rev-parse", "--short=12", "HEAD")
+    dirty = _git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "git_commit": commit,
+        "git_dirty": bool(dirty) if dirty is not None else None,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "packages": {
+            name: _package_version(name)
+            for name in ("onnxruntime", "transformers", "fastapi", "pydantic", "numpy")
+        },
+    }
+
+
+def _regression(
+    metric: str, baseline: float, current: float, *, higher_is_better: bool, limit_pct: float
+) -> dict[str, Any] | None:
+    if baseline <= 0:
+        return None
+    change_pct = (current - baseline) / baseline * 100.0
+    worse_pct = -change_pct if higher_is_better else change_pct
+    if worse_pct <= limit_pct:
+        return None
+    return {
+        "metric": metric,
+        "baseline": round(baseline, 3),
+        "current": round(current, 3),
+        "change_pct": round(change_pct, 1),
+    }
+
+
+def compare_results(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    max_regression_pct: float = 10.0,
+    max_rss_regression_pct: float = 10.0,
+) -> dict[str, Any]:
+    """Metrics in *current* that are worse than *baseline* beyond the allowed margin.
+
+    Gated: notes/s, p50/p95 note latency and peak RSS per target, plus the p50
+    of every stage that took at least ``STAGE_GATE_MIN_MS`` in the baseline.
+    p99 is reported but not gated (a few notes per corpus decide it).
+    """
+
+    regressions: list[dict[str, Any]] = []
+    warnings: list[str] = []
+    if current.get("corpus", {}).get("fingerprint") != baseline.get("corpus", {}).get("fingerprint"):
+        warnings.append("corpus differs from the baseline corpus; figures are not comparable")
+    if current.get("corpus", {}).get("skipped_files"):
+        warnings.append(
+            f"partial corpus: {current['corpus']['skipped_files']} unreadable file(s) skipped"
+        )
+    current_env = current.get("environment", {})
+    baseline_env = baseline.get("environment", {})
+    for key in ("machine", "cpu_count", "python"):
+        if current_env.get(key) != baseline_env.get(key):
+            warnings.append(
+                f"{key} differs from the baseline ({baseline_env.get(key)} -> {current_env.get(key)})"
+            )
+
+    for target, now in (current.get("targets") or {}).items():
+        then = (baseline.get("targets") or {}).get(target)
+        if not then:
+            warnings.append(f"{target}: no baseline")
+            continue
+        if bool(now.get("stage_alloc_peak_kb")) != bool(then.get("stage_alloc_peak_kb")):
+            warnings.append(f"{target}: allocation tracing differs from the baseline run")
+        checks = [
+            (f"{target}.notes_per_s", then["notes_per_s"], now["notes_per_s"], True, max_regression_pct),
+            (f"{target}.note_ms.p50", then["note_ms"]["p50"], now["note_ms"]["p50"], False, max_regression_pct),
+            (f"{target}.note_ms.p95", then["note_ms"]["p95"], now["note_ms"]["p95"], False, max_regression_pct),
+            (
+                f"{target}.memory.peak_rss_mb",
+                then["memory"]["peak_rss_mb"],
+                now["memory"]["peak_rss_mb"],
+                False,
+                max_rss_regression_pct,
+            ),
+        ]
+        for stage, summary in (then.get("stages") or {}).items():
+            if summary.get("p50", 0.0) < STAGE_GATE_MIN_MS:
+                continue
+            current_stage = (now.get("stages") or {}).get(stage)
+            if current_stage is None:
+                continue
+            checks.append(
+                (f"{target}.stages.{stage}.p50", summary["p50"], current_stage["p50"], False, max_regression_pct)
+            )
+        for metric, before, after, higher_is_better, limit in checks:
+            found = _regression(
+                metric, float(before), float(after), higher_is_better=higher_is_better, limit_pct=limit
+            )
+            if found:
+                regressions.append(found)
+
+    return {
+        "baseline_commit": baseline_env.get("git_commit"),
+        "current_commit": current_env.get("git_commit"),
+        "max_regression_pct": max_regression_pct,
+        "max_rss_regression_pct": max_rss_regression_pct,
+        "regressions": regressions,
+        "warnings": warnings,
+    }
+
+
+def format_target(result: dict[str, Any], top: int = 15) -> str:
+    note = result["note_ms"]
+    memory = result["memory"]
+    lines = [
+        f"[{result['target']}] {result['ok']} ok / {result['failed']} failed in "
+        f"{result['elapsed_s']:.1f}s -> {result['notes_per_s']:.2f} notes/s "
+        f"(warm-up {result['warm_s']:.1f}s)",
+        f"  note ms: p50={note['p50']:.1f} p95={note['p95']:.1f} p99={note['p99']:.1f} "
+        f"mean={note['mean']:.1f}",
+        f"  rss MiB: start={memory['rss_start_mb']:.0f} warm={memory['rss_after_warmup_mb']:.0f} "
+        f"end={memory['rss_end_mb']:.0f} peak={memory['peak_rss_mb']:.0f}",
+    ]
+    stages = list((result.get("stages") or {}).items())[:top]
+    if stages:
+        allocs = result.get("stage_alloc_peak_kb") or {}
+        header = f"  {'stage':<42} {'p50':>8} {'p95':>8} {'p99':>8}"
+        lines.append(header + (f" {'alloc p95 KiB':>14}" if allocs else ""))
+        for name, summary in stages:
+            line = (
+                f"  {name[:42]:<42} {summary['p50']:>8.2f} {summary['p95']:>8.2f} "
+                f"{summary['p99']:>8.2f}"
+            )
+            if allocs:
+                line += f" {allocs.get(name, {}).get('p95', 0.0):>14.1f}"
+            lines.append(line)
+    for error in result.get("errors") or []:
+        lines.append(f"  error {error['note_id']}: {error['error'][:160]}")
+    return "\n".join(lines)
+
+
+def format_comparison(comparison: dict[str, Any]) -> str:
+    lines = [
+        f"Baseline {comparison.get('baseline_commit')} -> current {comparison.get('current_commit')} "
+        f"(limit {comparison['max_regression_pct']:.0f}%, rss {comparison['max_rss_regression_pct']:.0f}%)"
+    ]
+    lines.extend(f"  warning: {warning}" for warning in comparison["warnings"])
+    if not comparison["regressions"]:
+        lines.append("  no regressions")
+    for item in comparison["regressions"]:
+        lines.append(
+            f"  REGRESSION {item['metric']}: {item['baseline']} -> {item['current']} "
+            f"({item['change_pct']:+.1f}%)"
+        )
+    return "\n".join(lines)
+
+
+__all__ = [
+    "BENCH_SCHEMA_VERSION",
+    "BenchCorpus",
+    "CORPUS_CANDIDATES",
+    "StageCaptureClient",
+    "TARGETS",
+    "compare_results",
+    "configure_bench_env",
+    "default_corpus_dir",
+    "environment_info",
+    "format_comparison",
+    "format_target",
+    "load_bench_corpus",
+    "run_target",
+]
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Benchmark cold import time of a module under different environment settings.
+
+Each sample runs in a fresh interpreter so module caches and pydantic-core
+schemas are rebuilt exactly as they would be in a new worker or CLI process.
+
+Usage
+-----
+    # Static (code-generated) vs dynamic registry models for the API app
+    python ops/tools/bench_import_time.py
+
+    # Another module, more samples
+    python ops/tools/bench_import_time.py --module app.registry.schema --runs 20
+
+    # Isolated cold import of every API router, and which heavy libraries each pulls in
+    python ops/tools/bench_import_time.py --routers
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+_SNIPPET = (
+    "import importlib, time\n"
+    "t0 = time.perf_counter()\n"
+    "importlib.import_module({module!r})\n"
+    "print(time.perf_counter() - t0)\n"
+)
+
+# Libraries that must load in warmup / on first use, never on the API boot path.
+HEAVY_MODULES = ("torch", "transformers", "onnxruntime", "sklearn", "spacy", "pandas", "scipy")
+
+_ROUTER_SNIPPET = (
+    "import importlib, json, sys, time\n"
+    "t0 = time.perf_counter()\n"
+    "importlib.import_module({module!r})\n"
+    "elapsed = time.perf_counter() - t0\n"
+    "heavy = [m for m in {heavy!r} if m in sys.modules]\n"
+    "print(json.dumps({{'seconds': elapsed, 'heavy': heavy}}))\n"
+)
+
+# Variant label -> environment overrides.
+VARIANTS: dict[str, dict[str, str]] = {
+    "dynamic (create_model)": {"REGISTRY_SCHEMA_STATIC_MODELS": "0"},
+    "static (v2_generated)": {"REGISTRY_SCHEMA_STATIC_MODELS": "1"},
+}
+
+
+def _run_snippet(code: str, module: str, env_overrides: dict[str, str]) -> str:
+    env = dict(os.environ)
+    env.update(env_overrides)
+    env.setdefault("PROCSUITE_SKIP_DOTENV", "1")
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Import of {module} failed:\n{proc.stderr.strip()}")
+    return proc.stdout.strip().splitlines()[-1]
+
+
+def _sample(module: str, env_overrides: dict[str, str]) -> float:
+    return float(_run_snippet(_SNIPPET.format(module=module), module, env_overrides))
+
+
+def _router_modules() -> list[str]:
+    # Read the table without importing the app (and therefore every router).
+    source = (ROOT / "app" / "api" / "fastapi_app.py").read_text(encoding="utf-8")
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.AnnAssign) and getattr(node.target, "id", None) == "ROUTER_MODULES":
+            return [elt.elts[0].value for elt in node.value.elts]  # type: ignore[union-attr]
+    raise RuntimeError("ROUTER_MODULES not found in app/api/fastapi_app.py")
+
+
+def bench_routers(runs: int) -> int:
+    """Cold-import each router in its own interpreter (median of *runs*)."""
+
+    rows: list[tuple[str, float, list[str]]] = []
+    for module in _router_modules():
+        samples = []
+        heavy: list[str] = []
+        for _ in range(runs):
+            payload = json.loads(
+                _run_snippet(_ROUTER_SNIPPET.format(module=module, heavy=HEAVY_MODULES), module, {})
+            )
+            samples.append(float(payload["seconds"]))
+            heavy = payload["heavy"]
+        rows.append((module, statistics.median(samples), heavy))
+
+    print(f"routers={len(rows)} runs={runs} (isolated cold import, shared deps counted per router)")
+    for module, median, heavy in sorted(rows, key=lambda row: -row[1]):
+        flag = f"  heavy={','.join(heavy)}" if heavy else ""
+        print(f"  {module:<40} median={median * 1000:8.1f} ms{flag}")
+    return 1 if any(heavy for _, _, heavy in rows) else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="app.api.fastapi_app")
+    parser.add_argument("--runs", type=int, default=None, help="Samples per variant (default 7; 3 with --routers).")
+    parser.add_argument("--warmup", type=int, default=1, help="Discarded runs per variant (fs cache).")
+    parser.add_argument(
+        "--routers",
+        action="store_true",
+        help="Time each API router module separately; exit 1 if one imports a heavy library.",
+    )
+    args = parser.parse_args()
+
+    if args.routers:
+        return bench_routers(max(1, args.runs or 3))
+
+    args.runs = args.runs or 7
+
+    print(f"module={args.module} runs={args.runs}")
+    results: dict[str, list[float]] = {}
+    for label, overrides in VARIANTS.items():
+        for _ in range(args.warmup):
+            _sample(args.module, overrides)
+        results[label] = [_sample(args.module, overrides) for _ in range(args.runs)]
+
+    baseline = statistics.median(next(iter(results.values())))
+    for label, samples in results.items():
+        median = statistics.median(samples)
+        print(
+            f"  {label:<24} median={median * 1000:8.1f} ms  min={min(samples) * 1000:8.1f} ms  "
+            f"delta={(median - baseline) * 1000:+8.1f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""End-to-end throughput benchmark: notes/s, latency percentiles, RSS, per-stage timings.
+
+Replays the golden corpus through ``/api/v1/process`` and
+``RegistryService.extract_fields`` with the deterministic stub LLM (see
+``ops/throughput_bench.py``). Each target runs in a fresh interpreter.
+
+The corpus defaults to the first golden extraction directory that has JSON
+files (``data/knowledge/golden_extractions_final``, ``..._scrubbed``,
+``golden_extractions``, ``golden_extractions_vNext/approved``). ``--corpus``
+also accepts a directory of ``*.txt`` notes.
+
+Baselines are plain result files. Save one on the release commit, then
+compare a later commit against it on the same machine; the exit code is 1
+when a gated metric regressed beyond ``--max-regression-pct``.
+
+Usage
+-----
+    # Record a baseline
+    python ops/tools/bench_throughput.py --save-baseline
+
+    # Compare the working tree against it (exit 1 on regression)
+    python ops/tools/bench_throughput.py --compare
+
+    # Quick run: one target, first 20 notes, per-stage allocations
+    python ops/tools/bench_throughput.py --target registry_extract --limit 20 --allocations
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.common.quality_gate_reports import datetime_now_iso  # noqa: E402
+from ops.throughput_bench import (  # noqa: E402
+    BENCH_SCHEMA_VERSION,
+    CORPUS_CANDIDATES,
+    TARGETS,
+    compare_results,
+    configure_bench_env,
+    default_corpus_dir,
+    environment_info,
+    format_comparison,
+    format_target,
+    load_bench_corpus,
+    run_target,
+)
+
+DEFAULT_BASELINE = ROOT / "reports" / "benchmarks" / "throughput_baseline.json"
+
+
+def _run_child(args: argparse.Namespace) -> int:
+    configure_bench_env(allocations=args.allocations)
+    corpus = load_bench_corpus(args.corpus, limit=args.limit)
+    result = run_target(args.child, corpus.items, warmup=args.warmup, repeat=args.repeat)
+    args.child_output.write_text(json.dumps(result), encoding="utf-8")
+    return 0
+
+
+def _spawn(target: str, args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory(prefix="procsuite-bench-") as tmp:
+        output = Path(tmp) / f"{target}.json"
+        command = [
+            sys.executable,
+            str(Path(__file__).resolve()),
+            "--child",
+            target,
+            "--child-output",
+            str(output),
+            "--corpus",
+            str(args.corpus),
+            "--warmup",
+            str(args.warmup),
+            "--repeat",
+            str(args.repeat),
+        ]
+        if args.limit:
+            command += ["--limit", str(args.limit)]
+        if args.allocations:
+            command.append("--allocations")
+        env = dict(os.environ)
+        env["PYTHONHASHSEED"] = "0"
+        proc = subprocess.run(
+            command,
+            cwd=ROOT,
+            env=env,
+            stdout=subprocess.DEVNULL if not args.verbose else None,
+            stderr=subprocess.PIPE if not args.verbose else None,
+            text=True,
+            check=False,
+        )
+        if proc.returncode != 0 or not output.exists():
+            tail = (proc.stderr or "").strip().splitlines()[-20:]
+            raise RuntimeError(f"Benchmark target {target} failed:\n" + "\n".join(tail))
+        return json.loads(output.read_text(encoding="utf-8"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", type=Path, default=None, help="Golden JSON or *.txt note directory")
+    parser.add_argument("--limit", type=int, default=None, help="Replay only the first N notes")
+    parser.add_argument(
+        "--target", action="append", choices=TARGETS, help="Target to run (repeatable; default all)"
+    )
+    parser.add_argument("--warmup", type=int, default=2, help="Notes run once before the measured pass")
+    parser.add_argument("--repeat", type=int, default=1, help="Passes over the corpus")
+    parser.add_argument(
+        "--allocations",
+        action="store_true",
+        help="Trace per-stage allocations (slows the run; not comparable with untraced runs)",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Write the result JSON here")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Write the result to --baseline")
+    parser.add_argument("--compare", action="store_true", help="Compare against --baseline")
+    parser.add_argument("--max-regression-pct", type=float, default=10.0)
+    parser.add_argument("--max-rss-regression-pct", type=float, default=10.0)
+    parser.add_argument("--verbose", action="store_true", help="Show pipeline logs from the targets")
+    parser.add_argument("--child", choices=TARGETS, help=argparse.SUPPRESS)
+    parser.add_argument("--child-output", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.corpus is None:
+        args.corpus = default_corpus_dir()
+        if args.corpus is None:
+            print(
+                "ERROR: no golden corpus found; pass --corpus. Looked in: "
+                + ", ".join(str(path) for path in CORPUS_CANDIDATES),
+                file=sys.stderr,
+            )
+            return 2
+    if args.child:
+        return _run_child(args)
+
+    corpus = load_bench_corpus(args.corpus, limit=args.limit)
+    if not corpus.items:
+        print(f"ERROR: no notes found in {args.corpus}", file=sys.stderr)
+        return 2
+
+    print(
+        f"corpus={args.corpus} notes={len(corpus.items)} warmup={args.warmup} repeat={args.repeat}"
+    )
+    if corpus.skipped_files:
+        print(
+            f"WARNING: partial corpus, skipped {len(corpus.skipped_files)} unreadable file(s): "
+            + ", ".join(corpus.skipped_files[:10])
+        )
+    result = {
+        "schema_version": BENCH_SCHEMA_VERSION,
+        "created_at": datetime_now_iso(),
+        "environment": environment_info(),
+        "corpus": {
+            "path": str(args.corpus),
+            "notes": len(corpus.items),
+            "skipped_files": len(corpus.skipped_files),
+            "skipped_file_names": corpus.skipped_files,
+            "fingerprint": corpus.fingerprint,
+            "warmup": args.warmup,
+            "repeat": args.repeat,
+        },
+        "targets": {},
+    }
+    for target in args.target or TARGETS:
+        result["targets"][target] = _spawn(target, args)
+        print(format_target(result["targets"][target]))
+
+    comparison = None
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"ERROR: baseline {args.baseline} not found (run with --save-baseline)", file=sys.stderr)
+            return 2
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        comparison = compare_results(
+            result,
+            baseline,
+            max_regression_pct=args.max_regression_pct,
+            max_rss_regression_pct=args.max_rss_regression_pct,
+        )
+        result["comparison"] = comparison
+        print(format_comparison(comparison))
+
+    paths = [args.output] if args.output else []
+    if args.save_baseline:
+        paths.append(args.baseline)
+    for path in paths:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+        print(f"wrote {path}")
+
+    return 1 if comparison and comparison["regressions"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
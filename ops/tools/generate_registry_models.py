@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Generate static Pydantic models for the registry JSON schema.
+
+`app.registry.schema.v2_dynamic` builds the nested RegistryRecord models from
+IP_Registry.json with `create_model` at import time. This script runs that
+builder once and writes the equivalent class definitions to
+`app/registry/schema/v2_generated.py`, which is checked in and imported
+instead whenever its embedded schema fingerprint matches the live schema.
+
+Usage
+-----
+    # Regenerate after editing data/knowledge/IP_Registry.json
+    python ops/tools/generate_registry_models.py
+
+    # CI: exit non-zero if the checked-in module is stale
+    python ops/tools/generate_registry_models.py --check
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import types
+import typing
+from pathlib import Path
+from typing import Any, Literal, Union
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# The generator must always introspect the dynamically-built models.
+os.environ["REGISTRY_SCHEMA_STATIC_MODELS"] = "0"
+
+from pydantic import BaseModel  # noqa: E402
+
+from app.registry.schema import v2_dynamic  # noqa: E402
+
+OUTPUT_PATH = ROOT / "app" / "registry" / "schema" / "v2_generated.py"
+
+_HEADER = '''"""Static registry models generated from the registry JSON schema.
+
+DO NOT EDIT: regenerate with `python ops/tools/generate_registry_models.py`.
+`app.registry.schema.v2_dynamic` only uses these classes when
+SCHEMA_FINGERPRINT matches the live schema; otherwise it builds the same
+models dynamically. Core schemas are deferred and built once as part of the
+concrete RegistryRecord instead of once per nested class.
+"""
+
+# ruff: noqa: E501
+
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict
+'''
+
+
+def _literal(value: Any) -> str:
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    return repr(value)
+
+
+class _Renderer:
+    def __init__(self, generated: dict[type[BaseModel], str]) -> None:
+        self._generated = generated
+        self.imports: dict[str, set[str]] = {}
+
+    def render(self, tp: Any) -> str:
+        if tp is type(None):
+            return "None"
+        if tp is Any:
+            return "Any"
+        if tp in (str, int, float, bool):
+            return tp.__name__
+        if isinstance(tp, type) and issubclass(tp, BaseModel):
+            name = self._generated.get(tp)
+            if name is not None:
+                return name
+            self.imports.setdefault(tp.__module__, set()).add(tp.__qualname__)
+            return tp.__qualname__
+
+        origin = typing.get_origin(tp)
+        args = typing.get_args(tp)
+        if origin is Literal:
+            return "Literal[" + ", ".join(_literal(arg) for arg in args) + "]"
+        if origin in (Union, types.UnionType):
+            return " | ".join(self.render(arg) for arg in args)
+        if origin is list:
+            return f"list[{self.render(args[0])}]"
+        if origin is dict:
+            return f"dict[{self.render(args[0])}, {self.render(args[1])}]"
+        raise TypeError(f"Unsupported annotation in registry model: {tp!r}")
+
+
+def render_module() -> str:
+    models = dict(v2_dynamic._MODEL_CACHE)
+    names: dict[type[BaseModel], str] = {}
+    seen: dict[str, tuple[str, ...]] = {}
+    for path, model in models.items():
+        name = model.__name__
+        if name in seen:
+            raise RuntimeError(
+                f"Generated model name {name!r} is used by both {seen[name]} and {path}"
+            )
+        seen[name] = path
+        names[model] = name
+
+    renderer = _Renderer(names)
+    class_blocks: list[str] = []
+    for model in models.values():
+        lines = [
+            f"class {names[model]}(BaseModel):",
+            '    model_config = ConfigDict(extra="ignore", defer_build=True)',
+            "",
+        ]
+        for field_name, field in model.model_fields.items():
+            lines.append(f"    {field_name}: {renderer.render(field.annotation)} = None")
+        class_blocks.append("\n".join(lines))
+
+    mapping_lines = ["MODELS_BY_PATH: dict[tuple[str, ...], type[BaseModel]] = {"]
+    for path, model in models.items():
+        key = "(" + ", ".join(_literal(part) for part in path) + ("," if len(path) == 1 else "") + ")"
+        mapping_lines.append(f"    {key}: {names[model]},")
+    mapping_lines.append("}")
+
+    import_lines = []
+    for module in sorted(renderer.imports):
+        symbols = ", ".join(sorted(renderer.imports[module]))
+        import_lines.append(f"from {module} import {symbols}")
+
+    header = _HEADER
+    if import_lines:
+        header += "\n" + "\n".join(import_lines) + "\n"
+    blocks = [
+        header,
+        f'SCHEMA_FINGERPRINT = "{v2_dynamic.registry_schema_fingerprint()}"\n',
+        *(block + "\n" for block in class_blocks),
+        "\n".join(mapping_lines) + "\n",
+    ]
+    return "\n\n".join(blocks)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Do not write; exit 1 if the output file differs from the generated source.",
+    )
+    args = parser.parse_args()
+
+    source = render_module()
+    if args.check:
+        current = args.output.read_text(encoding="utf-8") if args.output.exists() else ""
+        if current != source:
+            print(f"{args.output} is stale; rerun ops/tools/generate_registry_models.py", file=sys.stderr)
+            return 1
+        print(f"{args.output} is up to date.")
+        return 0
+
+    args.output.write_text(source, encoding="utf-8")
+    print(f"Wrote {len(v2_dynamic._MODEL_CACHE)} models to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Report RSS/PSS/USS per gunicorn worker (Linux /proc).
+
+RSS counts shared copy-on-write pages in every worker; PSS divides them
+between the processes that map them, and USS is what a worker alone costs.
+The sum of PSS is the real footprint, and the mean worker USS is roughly what
+one more worker would add.
+
+Usage
+-----
+    # Uses the pid file written by ops/gunicorn_conf.py
+    python ops/tools/gunicorn_worker_memory.py
+
+    python ops/tools/gunicorn_worker_memory.py --master-pid 1234 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.infra.preload import process_memory  # noqa: E402
+
+
+def _child_pids(pid: int) -> list[int]:
+    children: list[int] = []
+    for task in Path(f"/proc/{pid}/task").glob("*/children"):
+        try:
+            children.extend(int(part) for part in task.read_text().split())
+        except OSError:
+            continue
+    return sorted(set(children))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--master-pid", type=int, default=None)
+    parser.add_argument(
+        "--pidfile",
+        type=Path,
+        default=Path(os.getenv("GUNICORN_PID_FILE", "/tmp/procsuite-gunicorn.pid")),
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    args = parser.parse_args()
+
+    master = args.master_pid
+    if master is None:
+        try:
+            master = int(args.pidfile.read_text().strip())
+        except (OSError, ValueError):
+            print(f"ERROR: no --master-pid and unreadable pid file {args.pidfile}", file=sys.stderr)
+            return 1
+
+    rows = [{"role": "master", "pid": master, **process_memory(master)}]
+    rows.extend(
+        {"role": "worker", "pid": pid, **process_memory(pid)} for pid in _child_pids(master)
+    )
+    workers = [row for row in rows if row["role"] == "worker"]
+    totals = {
+        "workers": len(workers),
+        "total_pss_mb": round(sum(row.get("pss_mb", 0.0) for row in rows), 1),
+        "mean_worker_uss_mb": round(
+            sum(row.get("uss_mb", 0.0) for row in workers) / len(workers), 1
+        )
+        if workers
+        else 0.0,
+    }
+
+    if args.json:
+        print(json.dumps({"processes": rows, "totals": totals}, indent=2))
+        return 0
+
+    print(f"{'role':<8} {'pid':>8} {'rss_mb':>9} {'pss_mb':>9} {'uss_mb':>9} {'shared_mb':>10}")
+    for row in rows:
+        print(
+            f"{row['role']:<8} {row['pid']:>8} {row.get('rss_mb', 0.0):>9.1f} "
+            f"{row.get('pss_mb', 0.0):>9.1f} {row.get('uss_mb', 0.0):>9.1f} "
+            f"{row.get('shared_mb', 0.0):>10.1f}"
+        )
+    print(
+        f"workers={totals['workers']} total_pss_mb={totals['total_pss_mb']:.1f} "
+        f"mean_worker_uss_mb={totals['mean_worker_uss_mb']:.1f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
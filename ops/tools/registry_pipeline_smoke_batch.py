@@ -7,10 +7,15 @@ pipeline smoke test on each, and saves all output to a text file.
 Supported note formats in --notes-dir:
 - *.json: dict of note_id->note_text (we pick the first non "_syn_" key)
 - *.txt: one note per file
+
+``--all --workers N --jsonl PATH`` runs the whole directory on N workers
+forked from a warmed process, streams per-note results to JSONL (resumable by
+note hash) and prints throughput and per-stage latency percentiles.
 """
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
 import random
@@ -41,6 +46,18 @@ from app.registry.processing.navigation_fiducials import (  # noqa: E402
 )
 from app.registry.schema import RegistryRecord  # noqa: E402
 from app.registry.self_correction.keyword_guard import scan_for_omissions  # noqa: E402
+from observability.stage_profiler import StageProfiler  # noqa: E402
+from ops.batch_runner import BatchItem, run_batch  # noqa: E402
+
+# Built once by _warm_service(); forked workers inherit it.
+_SERVICE: RegistryService | None = None
+
+
+def _get_service() -> RegistryService:
+    global _SERVICE
+    if _SERVICE is None:
+        _SERVICE = RegistryService()
+    return _SERVICE
 
 
 def _collect_performed_flags(record_data: dict[str, Any]) -> set[str]:
@@ -198,8 +215,15 @@ def _format_self_correction_diagnostics(result) -> str:
     return "".join(lines)
 
 
-def _run_smoke_test(note_text: str, note_id: str, self_correct: bool = False) -> str:
+def _run_smoke_test(
+    note_text: str,
+    note_id: str,
+    self_correct: bool = False,
+    profiler: StageProfiler | None = None,
+) -> str:
     """Run smoke test on a single note and return formatted output."""
+    if profiler is None:
+        profiler = StageProfiler("batch.registry_smoke", emit_metrics=False)
     output_lines = []
     output_lines.append("=" * 80)
     output_lines.append(f"NOTE: {note_id}")
@@ -207,21 +231,22 @@ def _run_smoke_test(note_text: str, note_id: str, self_correct: bool = False) ->
     output_lines.append("")
 
     try:
-        masked = mask_offset_preserving(note_text)
+        masked = profiler.run("mask_offset_preserving", mask_offset_preserving, note_text)
 
-        service = RegistryService()
-        record, warnings, meta = service.extract_record(note_text)
+        service = _get_service()
+        record, warnings, meta = profiler.run("extract_record", service.extract_record, note_text)
 
         before_flags = _collect_performed_flags(record.model_dump())
 
-        seed = run_deterministic_extractors(masked)
+        seed = profiler.run("run_deterministic_extractors", run_deterministic_extractors, masked)
         record_data = record.model_dump()
-        record_data, uplifted = _apply_seed_uplift(record_data, seed, masked)
+        with profiler.stage("apply_seed_uplift"):
+            record_data, uplifted = _apply_seed_uplift(record_data, seed, masked)
         uplifted_flags = set(uplifted)
         after_flags = _collect_performed_flags(record_data)
 
         record_after = RegistryRecord(**record_data)
-        omission_warnings = scan_for_omissions(masked, record_after)
+        omission_warnings = profiler.run("scan_for_omissions", scan_for_omissions, masked, record_after)
 
         output_lines.append(_format_list("Performed flags (extract_record)", before_flags))
         output_lines.append(_format_list("Performed flags added by deterministic uplift", uplifted_flags))
@@ -232,7 +257,7 @@ def _run_smoke_test(note_text: str, note_id: str, self_correct: bool = False) ->
         if self_correct:
             os.environ.setdefault("REGISTRY_SELF_CORRECT_ENABLED", "1")
             try:
-                result = service.extract_fields(note_text)
+                result = profiler.run("extract_fields", service.extract_fields, note_text)
             except Exception as exc:
                 output_lines.append(f"SELF_CORRECT_ERROR: {exc}\n")
             else:
@@ -262,6 +287,27 @@ def _run_smoke_test(note_text: str, note_id: str, self_correct: bool = False) ->
     return "".join(output_lines)
 
 
+def _warm_service(warm_note: str | None, self_correct: bool) -> None:
+    """Build the service once and run one note so lazy models load before fork."""
+    from app.infra.nlp_warmup import should_skip_warmup, warm_heavy_resources_sync
+
+    if not should_skip_warmup():
+        warm_heavy_resources_sync()
+    _get_service()
+    if warm_note:
+        _run_smoke_test(warm_note, "warmup", self_correct)
+
+
+def _process_note(note_id: str, note_text: str, *, self_correct: bool) -> dict[str, Any]:
+    profiler = StageProfiler("batch.registry_smoke", emit_metrics=False)
+    report = _run_smoke_test(note_text, note_id, self_correct, profiler)
+    return {
+        "status": "ok" if "STATUS: SUCCESS" in report else "failed",
+        "report": report,
+        "stage_timings": profiler.summary(),
+    }
+
+
 def _load_notes_from_directory(notes_dir: Path) -> dict[str, str]:
     """Load notes from JSON and/or TXT files in a directory.
 
@@ -357,8 +403,50 @@ def main() -> int:
         action="store_true",
         help="Allow real LLM calls (disables stub/offline defaults).",
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Process every note in --notes-dir instead of a random sample",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes forked after warm-up (default: 1, in-process)",
+    )
+    parser.add_argument(
+        "--start-method",
+        choices=("fork", "spawn", "forkserver"),
+        default="fork",
+        help="multiprocessing start method (default: fork)",
+    )
+    parser.add_argument(
+        "--jsonl",
+        type=Path,
+        default=None,
+        help="Stream one JSON result per note here; re-runs resume by note hash",
+    )
+    parser.add_argument(
+        "--no-resume",
+        dest="resume",
+        action="store_false",
+        help="Overwrite --jsonl instead of skipping notes already completed there",
+    )
     args = parser.parse_args()
 
+    if args.workers > 1:
+        # ORT thread pools created during warm-up do not survive fork, so an
+        # exported thread count must not leak through here.
+        os.environ["ORT_INTRA_OP_NUM_THREADS"] = "1"
+        os.environ["ORT_INTER_OP_NUM_THREADS"] = "1"
+        from app.infra.preload import ort_fork_safe
+
+        if args.start_method == "fork" and not ort_fork_safe():
+            print("ERROR: ORT session profile is not single-threaded; refusing to fork", file=sys.stderr)
+            return 2
+    if args.self_correct:
+        os.environ.setdefault("REGISTRY_SELF_CORRECT_ENABLED", "1")
+
     # Set up environment
     if args.real_llm:
         os.environ.setdefault("REGISTRY_USE_STUB_LLM", "0")
@@ -388,10 +476,14 @@ def main() -> int:
         random.seed(args.seed)
         print(f"Using random seed: {args.seed}", file=sys.stderr)
 
-    count = min(args.count, len(all_notes))
-    selected_notes = random.sample(list(all_notes.items()), count)
-    
-    print(f"Selected {count} random notes for testing", file=sys.stderr)
+    if args.all:
+        selected_notes = list(all_notes.items())
+        count = len(selected_notes)
+    else:
+        count = min(args.count, len(all_notes))
+        selected_notes = random.sample(list(all_notes.items()), count)
+
+    print(f"Selected {count} notes for testing", file=sys.stderr)
 
     # Determine output file
     if args.output:
@@ -423,17 +515,34 @@ def main() -> int:
         success_count = 0
         failed_count = 0
 
-        for i, (note_id, note_text) in enumerate(selected_notes, 1):
-            print(f"[{i}/{count}] Testing {note_id}...", file=sys.stderr)
-            result = _run_smoke_test(note_text, note_id, args.self_correct)
-            f.write(result)
+        def _write_report(record: dict[str, Any]) -> None:
+            nonlocal success_count, failed_count
+            report = record.get("report")
+            if report is None:
+                report = f"NOTE: {record['note_id']}\nERROR: {record.get('error')}\nSTATUS: FAILED\n"
+            f.write(report)
             f.flush()
-
-            if "STATUS: SUCCESS" in result:
+            if record["status"] == "ok":
                 success_count += 1
             else:
                 failed_count += 1
 
+        stats = run_batch(
+            [BatchItem(note_id, note_text) for note_id, note_text in selected_notes],
+            functools.partial(_process_note, self_correct=args.self_correct),
+            warm=functools.partial(
+                _warm_service,
+                selected_notes[0][1] if selected_notes else None,
+                args.self_correct,
+            ),
+            workers=args.workers,
+            output=args.jsonl,
+            resume=args.resume,
+            start_method=args.start_method,
+            on_record=_write_report,
+        )
+        count = stats.processed
+
         # Write summary
         f.write("=" * 80 + "\n")
         f.write("SUMMARY\n")
@@ -441,11 +550,15 @@ def main() -> int:
         f.write(f"Total notes tested: {count}\n")
         f.write(f"Successful: {success_count}\n")
         f.write(f"Failed: {failed_count}\n")
-        f.write(f"Success rate: {success_count/count*100:.1f}%\n")
+        if count > 0:
+            f.write(f"Success rate: {success_count/count*100:.1f}%\n")
+        f.write("\n")
+        f.write(stats.report() + "\n")
         f.write("=" * 80 + "\n")
 
     print(f"\nCompleted! Results saved to: {output_path}", file=sys.stderr)
     print(f"Summary: {success_count} successful, {failed_count} failed", file=sys.stderr)
+    print(stats.report(), file=sys.stderr)
 
     return 0 if failed_count == 0 else 1
 
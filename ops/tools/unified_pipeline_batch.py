@@ -3,10 +3,22 @@
 
 This script randomly selects N notes from data/granular annotations/notes_text,
 runs the full unified pipeline (same as UI at /ui/), and saves results to a text file.
+
+For full-corpus re-runs (after a KB or model bump) use ``--all --workers N
+--jsonl PATH``: services and models are warmed once, N workers are forked
+from the warmed process (see ``ops/batch_runner.py``), results stream to JSONL
+and a re-run with the same JSONL resumes by note hash. Throughput and
+per-stage latency percentiles are printed at the end.
+
+Usage
+-----
+    python ops/tools/unified_pipeline_batch.py --count 20 --seed 7
+    python ops/tools/unified_pipeline_batch.py --all --workers 8 --jsonl out/unified.jsonl
 """
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
 import random
@@ -48,6 +60,8 @@ from app.registry.application.registry_service import (  # noqa: E402
     RegistryService,
 )
 from config.settings import CoderSettings  # noqa: E402
+from observability.stage_profiler import StageProfiler  # noqa: E402
+from ops.batch_runner import BatchItem, run_batch  # noqa: E402
 
 
 def _load_notes_from_directory(notes_dir: Path) -> dict[str, str]:
@@ -76,6 +90,7 @@ def _run_unified_pipeline(
     *,
     include_financials: bool = True,
     explain: bool = True,
+    include_stage_timings: bool = False,
 ) -> UnifiedProcessResponse:
     """Run the unified pipeline (same as /api/v1/process endpoint).
     
@@ -84,16 +99,19 @@ def _run_unified_pipeline(
     import time
     
     start_time = time.time()
+    profiler = StageProfiler("batch.unified_pipeline", emit_metrics=False)
     
     # PHI redaction (if not already scrubbed)
     # For batch testing, we'll treat notes as already scrubbed to match UI behavior
     # when user submits via PHI redactor
-    redaction = apply_phi_redaction(note_text, phi_scrubber)
+    with profiler.stage("phi_redaction"):
+        redaction = apply_phi_redaction(note_text, phi_scrubber)
     scrubbed_text = redaction.text
     
     # Step 1: Registry extraction (synchronous call)
     try:
-        extraction_result = registry_service.extract_fields(scrubbed_text)
+        with profiler.stage("extract_fields"):
+            extraction_result = registry_service.extract_fields(scrubbed_text)
     except Exception as exc:
         if isinstance(exc, LLMError) and "429" in str(exc):
             raise Exception("Upstream LLM rate limited") from exc
@@ -105,7 +123,9 @@ def _run_unified_pipeline(
         from app.registry.schema import RegistryRecord
         record = RegistryRecord.model_validate(extraction_result.mapped_fields)
     
-    codes, rationales, derivation_warnings = derive_all_codes_with_meta(record)
+    codes, rationales, derivation_warnings = profiler.run(
+        "derive_all_codes_with_meta", derive_all_codes_with_meta, record
+    )
     
     # Build suggestions with confidence and rationale
     suggestions = []
@@ -183,7 +203,9 @@ def _run_unified_pipeline(
     all_warnings = deduped_warnings
     
     # Build evidence payload
-    evidence_payload = build_v3_evidence_payload(record=record, codes=codes)
+    evidence_payload = profiler.run(
+        "build_v3_evidence_payload", build_v3_evidence_payload, record=record, codes=codes
+    )
     if not explain and not evidence_payload:
         evidence_payload = {}
     
@@ -201,6 +223,17 @@ def _run_unified_pipeline(
     
     # Build response
     registry_payload = record.model_dump(exclude_none=True)
+
+    debug_payload = None
+    if include_stage_timings:
+        # Top-level stages first, then the extraction-first passes nested in extract_fields.
+        debug_payload = {
+            "stage_timings": profiler.summary()
+            + [
+                {**stage, "stage": f"extract_fields/{stage['stage']}"}
+                for stage in (getattr(extraction_result, "stage_timings", None) or [])
+            ]
+        }
     
     return UnifiedProcessResponse(
         registry=registry_payload,
@@ -219,7 +252,49 @@ def _run_unified_pipeline(
         policy_version="extraction_first_v1",
         processing_time_ms=round(processing_time_ms, 2),
         review_status=review_status,
+        debug=debug_payload,
+    )
+
+
+# Populated by _warm_services() in the parent; forked workers inherit it.
+_SERVICES: tuple[RegistryService, CodingService, Any] | None = None
+
+
+def _warm_services(warm_note: str | None = None) -> None:
+    """Load services/models once and push one note through to prime lazy state."""
+    global _SERVICES
+    from app.infra.nlp_warmup import should_skip_warmup, warm_heavy_resources_sync
+
+    if not should_skip_warmup():
+        warm_heavy_resources_sync()
+    _SERVICES = (get_registry_service(), get_coding_service(), get_phi_scrubber())
+    if warm_note:
+        try:
+            _run_unified_pipeline(warm_note, *_SERVICES)
+        except Exception as exc:  # noqa: BLE001
+            print(f"Warning: warm-up note failed: {exc}", file=sys.stderr)
+
+
+def _process_note(
+    note_id: str,
+    note_text: str,
+    *,
+    include_financials: bool,
+    explain: bool,
+) -> dict[str, Any]:
+    if _SERVICES is None:
+        _warm_services()
+    assert _SERVICES is not None
+    result = _run_unified_pipeline(
+        note_text,
+        *_SERVICES,
+        include_financials=include_financials,
+        explain=explain,
+        include_stage_timings=True,
     )
+    stage_timings = (result.debug or {}).get("stage_timings", [])
+    result.debug = None
+    return {"result": result.model_dump(exclude_none=True), "stage_timings": stage_timings}
 
 
 def main() -> int:
@@ -279,7 +354,53 @@ def main() -> int:
         action="store_true",
         help="Allow real LLM calls (disables stub/offline defaults).",
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Process every note in --notes-dir (in filename order) instead of a random sample",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes forked after warm-up (default: 1, in-process)",
+    )
+    parser.add_argument(
+        "--start-method",
+        choices=("fork", "spawn", "forkserver"),
+        default="fork",
+        help="multiprocessing start method; fork shares warmed models copy-on-write (default: fork)",
+    )
+    parser.add_argument(
+        "--jsonl",
+        type=Path,
+        default=None,
+        help="Stream one JSON result per note here; re-runs resume by note hash",
+    )
+    parser.add_argument(
+        "--no-resume",
+        dest="resume",
+        action="store_false",
+        help="Overwrite --jsonl instead of skipping notes already completed there",
+    )
+    parser.add_argument(
+        "--stats-json",
+        type=Path,
+        default=None,
+        help="Write throughput/latency percentiles as JSON",
+    )
     args = parser.parse_args()
+
+    if args.workers > 1:
+        # ORT thread pools created during warm-up do not survive fork, so an
+        # exported thread count must not leak through here.
+        os.environ["ORT_INTRA_OP_NUM_THREADS"] = "1"
+        os.environ["ORT_INTER_OP_NUM_THREADS"] = "1"
+        from app.infra.preload import ort_fork_safe
+
+        if args.start_method == "fork" and not ort_fork_safe():
+            print("ERROR: ORT session profile is not single-threaded; refusing to fork", file=sys.stderr)
+            return 2
     
     # Set up environment
     if args.real_llm:
@@ -311,10 +432,14 @@ def main() -> int:
         random.seed(args.seed)
         print(f"Using random seed: {args.seed}", file=sys.stderr)
     
-    count = min(args.count, len(all_notes))
-    selected_notes = random.sample(list(all_notes.items()), count)
-    
-    print(f"Selected {count} random notes for testing", file=sys.stderr)
+    if args.all:
+        selected_notes = list(all_notes.items())
+        count = len(selected_notes)
+        print(f"Selected all {count} notes", file=sys.stderr)
+    else:
+        count = min(args.count, len(all_notes))
+        selected_notes = random.sample(list(all_notes.items()), count)
+        print(f"Selected {count} random notes for testing", file=sys.stderr)
     
     # Determine output file
     if args.output:
@@ -323,32 +448,37 @@ def main() -> int:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_path = ROOT / f"unified_pipeline_batch_{timestamp}.txt"
     
-    # Initialize services
+    # Warm services once, then run (optionally in forked workers)
     print("Initializing services...", file=sys.stderr)
-    registry_service = get_registry_service()
-    coding_service = get_coding_service()
-    phi_scrubber = get_phi_scrubber()
-    
-    # Run unified pipeline on each note
     print(f"Running unified pipeline on {count} notes...", file=sys.stderr)
     print(f"Output will be saved to: {output_path}", file=sys.stderr)
     
+    notes_by_id = dict(selected_notes)
     all_results = []
-    for i, (note_id, note_text) in enumerate(selected_notes, 1):
-        print(f"[{i}/{count}] Processing {note_id}...", file=sys.stderr)
-        try:
-            result = _run_unified_pipeline(
-                note_text,
-                registry_service,
-                coding_service,
-                phi_scrubber,
-                include_financials=args.include_financials,
-                explain=args.explain,
-            )
-            all_results.append((note_id, note_text, result, None))
-        except Exception as exc:
-            print(f"  ERROR: {exc}", file=sys.stderr)
-            all_results.append((note_id, note_text, None, str(exc)))
+
+    def _collect(record: dict[str, Any]) -> None:
+        note_id = record["note_id"]
+        if record["status"] == "ok":
+            all_results.append((note_id, notes_by_id[note_id], record.get("result"), None))
+        else:
+            print(f"  ERROR: {record.get('error')}", file=sys.stderr)
+            all_results.append((note_id, notes_by_id[note_id], None, record.get("error")))
+
+    stats = run_batch(
+        [BatchItem(note_id, note_text) for note_id, note_text in selected_notes],
+        functools.partial(
+            _process_note, include_financials=args.include_financials, explain=args.explain
+        ),
+        warm=functools.partial(_warm_services, selected_notes[0][1] if selected_notes else None),
+        workers=args.workers,
+        output=args.jsonl,
+        resume=args.resume,
+        start_method=args.start_method,
+        on_record=_collect,
+    )
+    order = {note_id: index for index, (note_id, _) in enumerate(selected_notes)}
+    all_results.sort(key=lambda entry: order[entry[0]])
+    count = len(all_results)
     
     # Write output file
     with open(output_path, "w", encoding="utf-8") as f:
@@ -395,9 +525,7 @@ def main() -> int:
             else:
                 f.write("RESULTS (JSON):\n")
                 f.write("-" * 80 + "\n")
-                # Convert Pydantic model to dict and serialize
-                result_dict = result.model_dump(exclude_none=True)
-                f.write(json.dumps(result_dict, indent=2, ensure_ascii=False))
+                f.write(json.dumps(result, indent=2, ensure_ascii=False))
                 f.write("\n")
                 f.write("-" * 80 + "\n")
                 f.write("\n")
@@ -415,10 +543,15 @@ def main() -> int:
         f.write(f"Failed: {failed_count}\n")
         if count > 0:
             f.write(f"Success rate: {success_count/count*100:.1f}%\n")
+        f.write("\n")
+        f.write(stats.report() + "\n")
         f.write("=" * 80 + "\n")
     
     print(f"\nCompleted! Results saved to: {output_path}", file=sys.stderr)
     print(f"Summary: {success_count} successful, {failed_count} failed", file=sys.stderr)
+    print(stats.report(), file=sys.stderr)
+    if args.stats_json:
+        args.stats_json.write_text(json.dumps(stats.to_dict(), indent=2), encoding="utf-8")
     
     return 0 if failed_count == 0 else 1
 
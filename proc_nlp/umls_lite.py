@@ -14,7 +14,8 @@ Usage
         print(c.cui, c.preferred_name, c.score)
 
 The map file is loaded lazily on first call and cached for the process
-lifetime (~2-5 MB memory vs ~1 GB for scispaCy UMLS linker).
+lifetime (~2-5 MB memory vs ~1 GB for scispaCy UMLS linker). A token trie and
+a trigram substring index are derived from it once, on first use.
 """
 
 from __future__ import annotations
@@ -76,22 +77,78 @@ def _load_map() -> Dict[str, Any]:
     return data
 
 
+_TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z0-9\-]{1,}")
+_TOKEN_FULL_RE = re.compile(r"[a-z][a-z0-9\-]{1,}")
+
+# Key marking a terminal trie node; tokens never start with "\0".
+_TERMINAL = "\0"
+
+_SUBSTRING_GRAM = 3
+
+
 def _tokenize(text: str) -> List[str]:
     """Split text into lowercase word tokens."""
-    return re.findall(r"[a-z][a-z0-9\-]{1,}", text.lower())
+    return [token for token, _, _ in _tokenize_with_offsets(text)]
 
 
-def _ngrams(tokens: List[str], max_n: int = 4) -> List[Tuple[str, int, int]]:
-    """Generate n-grams from tokens with approximate character spans.
+def _tokenize_with_offsets(text: str) -> List[Tuple[str, int, int]]:
+    """Split text into lowercase word tokens with exact (start, end) offsets into *text*."""
+    return [(m.group(0).lower(), m.start(), m.end()) for m in _TOKEN_RE.finditer(text)]
 
-    Returns (ngram_text, approx_start_char, approx_end_char).
+
+class _LiteIndex:
+    """Lookup structures derived once from the IP UMLS map.
+
+    - ``trie``: nested token dicts; a node's ``_TERMINAL`` entry holds the CUIs of
+      the term spelled by the path from the root. Drives single-pass longest-match
+      linking in :func:`umls_link_lite`.
+    - ``grams``: character trigram -> ordinals of terms containing it. Lets
+      :func:`search_terms` verify only terms that share every trigram of the query.
     """
-    results = []
-    for n in range(min(max_n, len(tokens)), 0, -1):
-        for i in range(len(tokens) - n + 1):
-            phrase = " ".join(tokens[i : i + n])
-            results.append((phrase, i, i + n))
-    return results
+
+    def __init__(self, term_index: Dict[str, List[str]]) -> None:
+        self.terms: List[Tuple[str, List[str]]] = list(term_index.items())
+        self.trie: Dict[str, Any] = {}
+        self.grams: Dict[str, List[int]] = {}
+
+        for ordinal, (term, cuis) in enumerate(self.terms):
+            tokens = term.split()
+            if tokens and all(_TOKEN_FULL_RE.fullmatch(tok) for tok in tokens):
+                node = self.trie
+                for tok in tokens:
+                    node = node.setdefault(tok, {})
+                existing = node.setdefault(_TERMINAL, [])
+                existing.extend(cui for cui in cuis if cui not in existing)
+
+            for gram in {term[i : i + _SUBSTRING_GRAM] for i in range(len(term) - _SUBSTRING_GRAM + 1)}:
+                self.grams.setdefault(gram, []).append(ordinal)
+
+    def candidate_ordinals(self, query: str) -> Optional[List[int]]:
+        """Return ordinals (ascending) of terms that may contain *query*.
+
+        Returns None when the query is too short to use the trigram index.
+        """
+        if len(query) < _SUBSTRING_GRAM:
+            return None
+        postings = []
+        for gram in {query[i : i + _SUBSTRING_GRAM] for i in range(len(query) - _SUBSTRING_GRAM + 1)}:
+            hits = self.grams.get(gram)
+            if not hits:
+                return []
+            postings.append(hits)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for hits in postings[1:]:
+            candidates.intersection_update(hits)
+            if not candidates:
+                return []
+        return sorted(candidates)
+
+
+@lru_cache(maxsize=1)
+def _get_index() -> _LiteIndex:
+    """Build the token trie and substring index once per loaded map (cached)."""
+    return _LiteIndex(_load_map().get("term_index", {}))
 
 
 def umls_link_lite(
@@ -102,12 +159,14 @@ def umls_link_lite(
     """Return UMLS concepts matched from the pre-built IP concept map.
 
     This is a lightweight alternative to proc_nlp.umls_linker.umls_link().
-    It performs exact term-index lookup using n-grams extracted from the input.
+    It walks the tokens once, left to right, taking the longest term in the
+    token trie that starts at each position (greedy, non-overlapping), so cost
+    is linear in note length and offsets are exact.
 
     Parameters
     ----------
     text : str
-        Free-text clinical snippet to link.
+        Free-text clinical snippet or full note to link.
     allowed_semtypes : set[str] | None
         Semantic types to accept. Defaults to the standard IP set.
     max_concepts : int
@@ -116,67 +175,70 @@ def umls_link_lite(
     Returns
     -------
     list[UmlsConcept]
-        Matched concepts sorted by descending score (longer matches score higher).
+        Matched concepts sorted by descending score (longer matches score higher);
+        ``start_char``/``end_char`` index into *text* and ``text`` is that slice.
     """
-    clean = (text or "").strip()
-    if not clean:
+    if not (text or "").strip():
         return []
 
     semtype_filter = allowed_semtypes or _ALLOWED_SEMTYPES
-    data = _load_map()
-    term_index: Dict[str, List[str]] = data.get("term_index", {})
-    concepts_db: Dict[str, Dict[str, Any]] = data.get("concepts", {})
-
-    if not term_index:
+    concepts_db: Dict[str, Dict[str, Any]] = _load_map().get("concepts", {})
+    trie = _get_index().trie
+    if not trie:
         return []
 
-    tokens = _tokenize(clean)
-    ngrams = _ngrams(tokens)
+    def _allowed(cuis: List[str]) -> List[Tuple[str, Dict[str, Any]]]:
+        allowed = []
+        for cui in cuis:
+            concept_data = concepts_db.get(cui)
+            if concept_data and semtype_filter.intersection(concept_data.get("semtypes", [])):
+                allowed.append((cui, concept_data))
+        return allowed
 
+    tokens = _tokenize_with_offsets(text)
     seen_cuis: Set[str] = set()
     results: List[UmlsConcept] = []
 
-    # Try to find character positions for matched terms
-    text_lower = clean.lower()
-
-    for phrase, tok_start, tok_end in ngrams:
-        if len(results) >= max_concepts:
-            break
-
-        cuis = term_index.get(phrase)
-        if not cuis:
+    i = 0
+    while i < len(tokens):
+        node = trie
+        best_end = -1
+        best: List[Tuple[str, Dict[str, Any]]] = []
+        for j in range(i, len(tokens)):
+            node = node.get(tokens[j][0])
+            if node is None:
+                break
+            cuis = node.get(_TERMINAL)
+            if cuis:
+                allowed = _allowed(cuis)
+                if allowed:
+                    best_end, best = j, allowed
+
+        if best_end < 0:
+            i += 1
             continue
 
-        # Find actual character span in the original text
-        char_start = text_lower.find(phrase)
-        char_end = char_start + len(phrase) if char_start >= 0 else -1
-
-        for cui in cuis:
+        n_tokens = best_end - i + 1
+        # Score: longer phrase matches get higher scores
+        score = round(min(1.0, n_tokens / 4.0 + 0.5), 3)
+        start_char = tokens[i][1]
+        end_char = tokens[best_end][2]
+        for cui, concept_data in best:
             if cui in seen_cuis:
                 continue
-            concept_data = concepts_db.get(cui)
-            if not concept_data:
-                continue
-
-            concept_semtypes = set(concept_data.get("semtypes", []))
-            if not concept_semtypes.intersection(semtype_filter):
-                continue
-
             seen_cuis.add(cui)
-            # Score: longer phrase matches get higher scores
-            score = min(1.0, len(phrase.split()) / 4.0 + 0.5)
-
             results.append(
                 UmlsConcept(
                     cui=cui,
-                    score=round(score, 3),
+                    score=score,
                     semtypes=tuple(concept_data.get("semtypes", [])),
                     preferred_name=concept_data.get("name", ""),
-                    text=phrase,
-                    start_char=max(char_start, 0),
-                    end_char=max(char_end, 0),
+                    text=text[start_char:end_char],
+                    start_char=start_char,
+                    end_char=end_char,
                 )
             )
+        i = best_end + 1
 
     results.sort(key=lambda c: c.score, reverse=True)
     return results[:max_concepts]
@@ -194,13 +256,16 @@ def lookup_cui(cui: str) -> Optional[Dict[str, Any]]:
 def search_terms(query: str, limit: int = 10) -> List[Tuple[str, List[str]]]:
     """Search the term index for entries containing the query string.
 
-    Returns list of (term, [CUI, ...]) tuples.
+    Returns list of (term, [CUI, ...]) tuples in term-index order.
     """
-    data = _load_map()
-    term_index = data.get("term_index", {})
+    index = _get_index()
     query_lower = query.strip().lower()
+    ordinals = index.candidate_ordinals(query_lower)
+    if ordinals is None:
+        ordinals = range(len(index.terms))
     matches = []
-    for term, cuis in term_index.items():
+    for ordinal in ordinals:
+        term, cuis = index.terms[ordinal]
         if query_lower in term:
             matches.append((term, cuis))
             if len(matches) >= limit:
@@ -0,0 +1,96 @@
+"""Vectorized threshold search must select what a per-label sklearn search selects."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from sklearn.metrics import f1_score
+
+from ml.lib.ml_coder.registry_training import optimize_label_thresholds
+
+
+class FixedProbaModel:
+    def __init__(self, proba) -> None:
+        self.proba = proba
+
+    def predict_proba(self, texts):
+        return self.proba
+
+
+def _reference_grid_thresholds(proba, y_true, labels, grid_points=17):
+    """The per-label f1_score loop optimize_label_thresholds replaced."""
+    thresholds = {}
+    for idx, label in enumerate(labels):
+        y_label = y_true[:, idx]
+        if y_label.sum() == 0:
+            thresholds[label] = 0.5
+            continue
+        best_thresh, best_f1 = 0.5, -1.0
+        for t in np.linspace(0.1, 0.9, grid_points):
+            f1 = f1_score(y_label, (proba[:, idx] >= t).astype(int), zero_division=0)
+            if f1 > best_f1:
+                best_f1, best_thresh = f1, float(t)
+        thresholds[label] = best_thresh
+    return thresholds
+
+
+def _inputs(seed: int, n_samples: int = 120, n_labels: int = 6, decimals: int | None = None):
+    rng = np.random.default_rng(seed)
+    y_true = (rng.random((n_samples, n_labels)) < 0.3).astype(int)
+    y_true[:, -1] = 0  # one label without positives
+    proba = np.clip(0.55 * y_true + 0.6 * rng.random((n_samples, n_labels)), 0.0, 1.0)
+    if decimals is not None:
+        proba = np.round(proba, decimals)  # plenty of tied scores
+    labels = [f"label_{i}" for i in range(n_labels)]
+    return proba, y_true, labels
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("decimals", [None, 1, 2])
+def test_grid_mode_matches_sklearn_search(seed, decimals):
+    proba, y_true, labels = _inputs(seed, decimals=decimals)
+    texts = [""] * len(proba)
+
+    actual = optimize_label_thresholds(FixedProbaModel(proba), texts, y_true, labels)
+
+    expected = _reference_grid_thresholds(proba, y_true, labels)
+    assert actual == pytest.approx(expected)
+
+
+def test_grid_mode_accepts_list_style_predict_proba():
+    proba, y_true, labels = _inputs(7, decimals=2)
+    per_label = [np.column_stack([1.0 - proba[:, i], proba[:, i]]) for i in range(len(labels))]
+
+    actual = optimize_label_thresholds(FixedProbaModel(per_label), [""] * len(proba), y_true, labels)
+
+    assert actual == pytest.approx(_reference_grid_thresholds(proba, y_true, labels))
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("decimals", [None, 2])
+def test_exact_mode_finds_the_best_cut_point(seed, decimals):
+    proba, y_true, labels = _inputs(seed, n_samples=80, decimals=decimals)
+
+    actual = optimize_label_thresholds(
+        FixedProbaModel(proba), [""] * len(proba), y_true, labels, mode="exact"
+    )
+
+    for idx, label in enumerate(labels):
+        if y_true[:, idx].sum() == 0:
+            assert actual[label] == 0.5
+            continue
+        candidates = np.unique(proba[:, idx])
+        scores = [f1_score(y_true[:, idx], proba[:, idx] >= t, zero_division=0) for t in candidates]
+        best = max(scores)
+        assert actual[label] in candidates
+        assert f1_score(y_true[:, idx], proba[:, idx] >= actual[label]) == pytest.approx(best)
+        # Ties resolve to the lowest threshold.
+        assert actual[label] == pytest.approx(
+            min(t for t, s in zip(candidates, scores) if s == pytest.approx(best))
+        )
+
+
+def test_unknown_mode_is_rejected():
+    proba, y_true, labels = _inputs(0)
+    with pytest.raises(ValueError):
+        optimize_label_thresholds(FixedProbaModel(proba), [""] * len(proba), y_true, labels, mode="x")
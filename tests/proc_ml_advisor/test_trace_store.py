@@ -0,0 +1,135 @@
+"""Segment rotation and index reload for the ML advisor trace store."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+
+from app.proc_ml_advisor.schemas import CodingTrace
+from app.proc_ml_advisor.trace_store import TraceStore
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _trace(i: int, **overrides) -> CodingTrace:
+    values = {
+        "trace_id": f"trc-{i:03d}",
+        "timestamp": BASE_TIME + timedelta(minutes=i),
+        "source": "api.code_with_advisor" if i % 2 else "batch",
+        "autocode_codes": ["31622"],
+        "advisor_candidate_codes": ["31622", "31653"] if i % 3 == 0 else ["31622"],
+        "advisor_disagreements": ["31653"] if i % 3 == 0 else [],
+        "final_codes": ["31622"],
+    }
+    values.update(overrides)
+    return CodingTrace(**values)
+
+
+def _segments(store: TraceStore) -> list[str]:
+    return sorted(path.name for path in store.directory.glob("coding_traces.0*.jsonl"))
+
+
+def test_rotates_by_size_and_reads_across_segments(tmp_path):
+    store = TraceStore(tmp_path / "coding_traces.jsonl", segment_max_bytes=1)
+    for i in range(3):
+        store.append(_trace(i))
+
+    # Every segment is over 1 byte after one trace, so each append rotates.
+    assert _segments(store) == [
+        "coding_traces.000001.jsonl",
+        "coding_traces.000002.jsonl",
+        "coding_traces.000003.jsonl",
+    ]
+    traces, total = store.list(limit=10)
+    assert total == 3
+    assert [t.trace_id for t in traces] == ["trc-002", "trc-001", "trc-000"]
+    assert store.get("trc-001").timestamp == BASE_TIME + timedelta(minutes=1)
+
+
+def test_rotates_by_age(tmp_path, monkeypatch):
+    store = TraceStore(
+        tmp_path / "coding_traces.jsonl", segment_max_bytes=0, segment_max_age_seconds=60
+    )
+    clock = [1_000.0]
+    monkeypatch.setattr("app.proc_ml_advisor.trace_store.time.time", lambda: clock[0])
+    store.append(_trace(0, timestamp=datetime.fromtimestamp(clock[0], UTC)))
+    store.append(_trace(1, timestamp=datetime.fromtimestamp(clock[0], UTC)))
+    assert _segments(store) == ["coding_traces.000001.jsonl"]
+
+    clock[0] += 61
+    store.append(_trace(2))
+    assert _segments(store) == ["coding_traces.000001.jsonl", "coding_traces.000002.jsonl"]
+
+
+def test_reload_matches_writer_view(tmp_path):
+    path = tmp_path / "coding_traces.jsonl"
+    writer = TraceStore(path, segment_max_bytes=600)
+    for i in range(8):
+        writer.append(_trace(i))
+    assert len(_segments(writer)) > 1
+
+    reader = TraceStore(path, segment_max_bytes=600)
+    for source in (None, "batch"):
+        for flag in (None, True, False):
+            expected = writer.list(limit=3, offset=1, source=source, has_disagreements=flag)
+            actual = reader.list(limit=3, offset=1, source=source, has_disagreements=flag)
+            assert [t.trace_id for t in actual[0]] == [t.trace_id for t in expected[0]]
+            assert actual[1] == expected[1]
+    assert reader.metrics() == writer.metrics()
+    assert reader.metrics().total_traces == 8
+    assert b"".join(reader.export_lines()) == b"".join(writer.export_lines())
+
+
+def test_reader_follows_appends_from_another_store(tmp_path):
+    path = tmp_path / "coding_traces.jsonl"
+    writer = TraceStore(path, segment_max_bytes=1)
+    reader = TraceStore(path, segment_max_bytes=1)
+    writer.append(_trace(0))
+    assert reader.list(limit=10)[1] == 1
+
+    writer.append(_trace(1))
+    assert reader.get("trc-001") is not None
+    assert reader.metrics().total_traces == 2
+
+    # The reader joins the newest segment rather than reusing an old one.
+    reader.append(_trace(2))
+    assert len(_segments(reader)) == 3
+    assert writer.list(limit=10)[1] == 3
+
+
+def test_legacy_file_is_indexed_once_and_left_untouched(tmp_path):
+    path = tmp_path / "coding_traces.jsonl"
+    legacy = [_trace(i) for i in range(3)]
+    path.write_text(
+        "".join(t.model_dump_json() + "\n" for t in legacy) + "not json\n", encoding="utf-8"
+    )
+    before = path.read_bytes()
+
+    store = TraceStore(path)
+    assert store.list(limit=10)[1] == 3
+    store.append(_trace(3))
+    assert path.read_bytes() == before
+
+    index_lines = (tmp_path / "coding_traces.index.jsonl").read_text().splitlines()
+    assert len(index_lines) == 4
+    reloaded = TraceStore(path)
+    assert reloaded.list(limit=10)[1] == 4
+    assert len((tmp_path / "coding_traces.index.jsonl").read_text().splitlines()) == 4
+    assert {json.loads(line)["seg"] for line in index_lines} == {
+        "coding_traces.jsonl",
+        "coding_traces.000001.jsonl",
+    }
+
+
+def test_segment_bytes_missing_from_index_are_indexed_on_load(tmp_path):
+    path = tmp_path / "coding_traces.jsonl"
+    writer = TraceStore(path)
+    writer.append(_trace(0))
+    # Simulate a crash between the segment write and the index write.
+    segment = tmp_path / "coding_traces.000001.jsonl"
+    with open(segment, "a", encoding="utf-8") as handle:
+        handle.write(_trace(1).model_dump_json() + "\n")
+
+    reloaded = TraceStore(path)
+    assert reloaded.get("trc-001") is not None
+    assert reloaded.list(limit=10)[1] == 2
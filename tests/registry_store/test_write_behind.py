@@ -0,0 +1,166 @@
+"""Write-behind registry run persistence against in-memory SQLite."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.infra.db import create_tuned_engine
+from app.registry_store import write_behind
+from app.registry_store.models import RegistryCaseRecord, RegistryRun
+from app.registry_store.write_behind import (
+    CaseRecordUpdate,
+    PendingRegistryRun,
+    RegistryRunWriter,
+    get_registry_run_writer,
+    persist_registry_runs,
+    shutdown_registry_run_writers,
+)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_tuned_engine("sqlite://", name="test_registry_store")
+    tables = [RegistryRun.__table__, RegistryCaseRecord.__table__]
+    RegistryRun.metadata.create_all(engine, tables=tables)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    yield factory
+    engine.dispose()
+
+
+class CountingSessionFactory:
+    """Session factory that records how many transactions the writer opened."""
+
+    def __init__(self, factory) -> None:
+        self._factory = factory
+        self._lock = threading.Lock()
+        self.sessions = 0
+
+    def __call__(self):
+        with self._lock:
+            self.sessions += 1
+        return self._factory()
+
+
+def _pending(note: str | None = "scrubbed note", case: uuid.UUID | None = None, version: str = "v3"):
+    run_id = uuid.uuid4()
+    item = PendingRegistryRun(
+        run_values={
+            "id": run_id,
+            "created_at": datetime.now(UTC),
+            "note_text": note,
+            "note_sha256": hashlib.sha256((note or "").encode()).hexdigest(),
+            "schema_version": version,
+            "pipeline_config": {},
+            "raw_response_json": {"run": str(run_id)},
+            "needs_manual_review": False,
+            "review_status": "new",
+        }
+    )
+    if case is not None:
+        item.case_update = CaseRecordUpdate(
+            registry_uuid=case, registry_json={"run": str(run_id)}, schema_version=version
+        )
+    return item
+
+
+def _run_count(factory) -> int:
+    with factory() as db:
+        return db.scalar(select(func.count()).select_from(RegistryRun))
+
+
+def test_writer_commits_queued_runs_in_one_batch(session_factory):
+    counting = CountingSessionFactory(session_factory)
+    writer = RegistryRunWriter(counting, batch_size=8, flush_interval_s=1.0)
+    items = [_pending(f"note {i}") for i in range(5)]
+    try:
+        futures = [writer.submit(item) for item in items]
+        ids = [future.result(timeout=5) for future in futures]
+    finally:
+        writer.shutdown()
+
+    assert ids == [item.run_values["id"] for item in items]
+    assert counting.sessions == 1
+    assert _run_count(session_factory) == 5
+
+
+def test_writer_splits_batches_at_batch_size(session_factory):
+    counting = CountingSessionFactory(session_factory)
+    writer = RegistryRunWriter(counting, batch_size=2, flush_interval_s=1.0)
+    try:
+        futures = [writer.submit(_pending(f"note {i}")) for i in range(5)]
+        for future in futures:
+            future.result(timeout=5)
+    finally:
+        writer.shutdown()
+
+    assert counting.sessions == 3
+    assert _run_count(session_factory) == 5
+
+
+def test_failed_row_does_not_drop_the_rest_of_its_batch(session_factory):
+    counting = CountingSessionFactory(session_factory)
+    writer = RegistryRunWriter(counting, batch_size=8, flush_interval_s=1.0)
+    good = [_pending("first"), _pending("second")]
+    bad = _pending(note=None)  # note_text is NOT NULL
+    try:
+        futures = [writer.submit(item) for item in (good[0], bad, good[1])]
+        assert futures[0].result(timeout=5) == good[0].run_values["id"]
+        assert futures[2].result(timeout=5) == good[1].run_values["id"]
+        with pytest.raises(Exception):
+            futures[1].result(timeout=5)
+    finally:
+        writer.shutdown()
+
+    # One failed batch transaction, then one retry per run.
+    assert counting.sessions == 4
+    with session_factory() as db:
+        stored = set(db.scalars(select(RegistryRun.id)))
+    assert stored == {item.run_values["id"] for item in good}
+
+
+def test_case_record_version_increments_within_and_across_batches(session_factory):
+    case = uuid.uuid4()
+    first = [_pending("a", case=case), _pending("b", case=case)]
+    with session_factory() as db:
+        persist_registry_runs(db, first)
+    last = _pending("c", case=case, version="v4")
+    with session_factory() as db:
+        persist_registry_runs(db, [last])
+
+    with session_factory() as db:
+        record = db.get(RegistryCaseRecord, case)
+        assert record.version == 3
+        assert record.source_run_id == last.run_values["id"]
+        assert record.schema_version == "v4"
+        assert record.registry_json == {"run": str(last.run_values["id"])}
+
+
+def test_persist_rolls_back_the_whole_batch_on_failure(session_factory):
+    with session_factory() as db:
+        with pytest.raises(Exception):
+            persist_registry_runs(db, [_pending("ok"), _pending(note=None)])
+    assert _run_count(session_factory) == 0
+
+
+def test_shutdown_flushes_pending_runs(session_factory, monkeypatch):
+    # A long flush interval keeps the batch open until the shutdown sentinel arrives.
+    monkeypatch.setenv("REGISTRY_RUNS_WRITE_FLUSH_MS", "60000")
+    monkeypatch.setattr(write_behind, "_writers", {})
+    writer = get_registry_run_writer("sqlite://", session_factory)
+    futures = [writer.submit(_pending(f"note {i}")) for i in range(3)]
+    assert not any(future.done() for future in futures)
+
+    shutdown_registry_run_writers(timeout_s=5)
+
+    assert all(future.done() and future.exception() is None for future in futures)
+    assert _run_count(session_factory) == 3
+    assert write_behind._writers == {}
+    with pytest.raises(write_behind.RegistryRunQueueFull):
+        writer.submit(_pending("late"))